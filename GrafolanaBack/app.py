@@ -16,12 +16,23 @@ from GrafolanaBack.domain.transaction.services.transaction_parser_service import
 from GrafolanaBack.domain.spam.service import SpamService
 from GrafolanaBack.domain.spam.model import Creator
 from GrafolanaBack.domain.infrastructure.db.migration_service import check_and_run_migrations
+from GrafolanaBack.domain.infrastructure.db.session import begin_unit_of_work, end_unit_of_work, get_pool_metrics
+from GrafolanaBack.domain.caching.negative_cache import negative_cache
+from GrafolanaBack.domain.performance.parser_profiler import get_profile_totals
 from GrafolanaBack.domain.transaction.services.transaction_service import TransactionService
+from GrafolanaBack.domain.transaction.services.transaction_archive_service import start_archive_mover
+from GrafolanaBack.domain.transaction.services.transaction_retry_service import start_transaction_retrier
+from GrafolanaBack.domain.transaction.repositories.retry_queue_repository import TransactionRetryRepository
+from GrafolanaBack.domain.transaction.repositories.structure_repository import TransactionStructureRepository
+from GrafolanaBack.domain.transaction.utils.graph_templates import GRAPH_PAYLOAD_FULL, GRAPH_PAYLOAD_TEMPLATES
 from solders.signature import Signature
 from solders.pubkey import Pubkey
 
 CORS_DOMAIN = os.getenv("CORS_DOMAIN")
 PORT = int(os.getenv("PORT", 5000))
+# Number of signatures returned by /api/transactions/by_structure, by default and at most
+STRUCTURE_QUERY_DEFAULT_LIMIT = 1000
+STRUCTURE_QUERY_MAX_LIMIT = 10000
 
 app = Flask(__name__)
 application = app  # For WSGI compatibility
@@ -48,12 +59,23 @@ def after_request(response):
     response.headers.add('Access-Control-Allow-Credentials', 'true')
     return response
 
+# Share one database connection between all repository calls of a request
+@app.before_request
+def open_unit_of_work():
+    begin_unit_of_work()
+
+@app.teardown_request
+def close_unit_of_work(exception=None):
+    end_unit_of_work(exception)
+
 compress = Compress()
 compress.init_app(app)
 
 start_price_updater()  # Start the price updater in a separate thread
+start_archive_mover()  # Move rarely read transactions to the cold archive in the background
 
 transaction_service = TransactionService()
+start_transaction_retrier(transaction_service)  # Retry fetches that exhausted all endpoints in the background
 transaction_parser_service = TransactionParserService()
 spam_service = SpamService()
 
@@ -108,7 +130,7 @@ def get_transaction_graph_data_from_signature():
         return jsonify({"error": "Invalid transaction signature"}), 400
 
     # Get the graph data
-    graph_data = transaction_parser_service.get_transaction_graph_data(tx_signature)
+    graph_data = transaction_parser_service.get_transaction_graph_data(tx_signature, profile=bool(request.json.get('profile', False)))
     
     return jsonify(graph_data)
 
@@ -124,8 +146,12 @@ def get_wallet_graph_data_from_address():
     except ValueError:
         return jsonify({"error": "Invalid account address"}), 400
 
+    graph_payload = request.json.get('graph_payload', GRAPH_PAYLOAD_FULL)
+    if graph_payload not in (GRAPH_PAYLOAD_FULL, GRAPH_PAYLOAD_TEMPLATES):
+        return jsonify({"error": "Invalid graph payload"}), 400
+
     # Get the graph data
-    graph_data = transaction_parser_service.get_account_graph_data(account_address)
+    graph_data = transaction_parser_service.get_account_graph_data(account_address, profile=bool(request.json.get('profile', False)), graph_payload=graph_payload)
     
     return jsonify(graph_data)
 
@@ -141,14 +167,51 @@ def get_block_graph_data_from_slot():
     except ValueError:
         return jsonify({"error": "Invalid block slot"}), 400
 
+    graph_payload = request.json.get('graph_payload', GRAPH_PAYLOAD_FULL)
+    if graph_payload not in (GRAPH_PAYLOAD_FULL, GRAPH_PAYLOAD_TEMPLATES):
+        return jsonify({"error": "Invalid graph payload"}), 400
+
     # Get the graph data
-    graph_data = transaction_parser_service.get_block_graph(slot_number)
+    graph_data = transaction_parser_service.get_block_graph(slot_number, profile=bool(request.json.get('profile', False)), graph_payload=graph_payload)
 
     if graph_data.get('Error'):
         return jsonify({"error": graph_data['Error']}), 400
     
     return jsonify(graph_data)
 
+@app.route('/api/db/pool_metrics', methods=['GET'])
+def get_db_pool_metrics():
+    return jsonify(get_pool_metrics())
+
+@app.route('/api/cache/negative_stats', methods=['GET'])
+def get_negative_cache_stats():
+    return jsonify(negative_cache.get_stats())
+
+@app.route('/api/parser/profile', methods=['GET'])
+def get_parser_profile_totals():
+    return jsonify(get_profile_totals())
+
+@app.route('/api/transactions/by_structure', methods=['GET'])
+def get_transactions_by_structure():
+    structure_fingerprint = request.args.get('structure_fingerprint')
+    # None when the limit is not an integer
+    limit = request.args.get('limit', type=int)
+
+    if not structure_fingerprint:
+        return jsonify({"error": "No structure fingerprint provided"}), 400
+
+    if 'limit' not in request.args:
+        limit = STRUCTURE_QUERY_DEFAULT_LIMIT
+    elif limit is None or limit <= 0:
+        return jsonify({"error": "Invalid limit"}), 400
+    limit = min(limit, STRUCTURE_QUERY_MAX_LIMIT)
+
+    return jsonify({"signatures": TransactionStructureRepository.get_signatures_by_structure(structure_fingerprint, limit)})
+
+@app.route('/api/transactions/retry_queue', methods=['GET'])
+def get_transaction_retry_queue_size():
+    return jsonify({"pending": TransactionRetryRepository.count()})
+
 # Metadata API Endpoints
 @app.route('/api/metadata/get_mints_info', methods=['POST'])
 def get_mints_info_from_addresses():
@@ -0,0 +1,152 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Namespaces of the cached lookups
+TRANSACTION_NAMESPACE = "transaction"
+MINT_NAMESPACE = "mint"
+METADATA_URI_NAMESPACE = "metadata_uri"
+
+# Why a lookup failed. The reason selects how long the failure is remembered:
+# a transaction that is not finalized yet will show up shortly, a malformed address never will
+NOT_FINALIZED = "not_finalized"
+NOT_FOUND = "not_found"
+INVALID = "invalid"
+ERROR = "error"
+
+DEFAULT_TTLS = {
+    NOT_FINALIZED: int(os.getenv("NEGATIVE_CACHE_NOT_FINALIZED_TTL", "30")),
+    NOT_FOUND: int(os.getenv("NEGATIVE_CACHE_NOT_FOUND_TTL", "3600")),
+    INVALID: int(os.getenv("NEGATIVE_CACHE_INVALID_TTL", "86400")),
+    ERROR: int(os.getenv("NEGATIVE_CACHE_ERROR_TTL", "60")),
+}
+NEGATIVE_CACHE_MAX_ENTRIES = int(os.getenv("NEGATIVE_CACHE_MAX_ENTRIES", "100000"))
+
+@dataclass(frozen=True)
+class NegativeEntry:
+    reason: str
+    expires_at: float
+
+
+class NegativeCache:
+    """
+    In-memory cache of failed lookups (missing signatures, invalid mints, dead metadata URIs)
+    so that repeated requests for bad input are answered without another RPC or HTTP round trip.
+
+    Entries expire after a TTL that depends on the failure reason, and the oldest entries
+    are evicted once max_entries is reached.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, int]] = None,
+        max_entries: int = NEGATIVE_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_entries = max_entries
+        # Source of the current time in seconds, entries expire against it
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], NegativeEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._recorded: Dict[Tuple[str, str], int] = {}
+        self._evictions = 0
+
+    def record(self, namespace: str, key: str, reason: str, ttl: Optional[int] = None):
+        """
+        Remember that a lookup failed.
+
+        Args:
+            namespace: Kind of lookup (TRANSACTION_NAMESPACE, MINT_NAMESPACE, METADATA_URI_NAMESPACE)
+            key: Looked up value (signature, mint address, URI)
+            reason: Failure reason (NOT_FINALIZED, NOT_FOUND, INVALID, ERROR)
+            ttl: Optional TTL in seconds overriding the reason's default
+        """
+        ttl = self.ttls[reason] if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries.pop((namespace, key), None)
+            self._entries[(namespace, key)] = NegativeEntry(reason, self._clock() + ttl)
+            self._recorded[(namespace, reason)] = self._recorded.get((namespace, reason), 0) + 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get(self, namespace: str, key: str) -> Optional[NegativeEntry]:
+        """
+        Returns the failure recorded for a lookup, or None if it should be attempted.
+        """
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is not None and entry.expires_at <= self._clock():
+                del self._entries[(namespace, key)]
+                entry = None
+            if entry is None:
+                self._misses[namespace] = self._misses.get(namespace, 0) + 1
+            else:
+                self._hits[namespace] = self._hits.get(namespace, 0) + 1
+            return entry
+
+    def filter(self, namespace: str, keys: Iterable[str]) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Split keys into the ones to look up and the ones with a recorded failure.
+
+        Returns:
+            Tuple[List[str], Dict[str, str]]: Keys to look up, and failure reason by skipped key
+        """
+        to_lookup = []
+        skipped = {}
+        for key in keys:
+            entry = self.get(namespace, key)
+            if entry is None:
+                to_lookup.append(key)
+            else:
+                skipped[key] = entry.reason
+        return to_lookup, skipped
+
+    def discard(self, namespace: str, key: str):
+        """Forget a recorded failure, e.g. once the value has been found"""
+        with self._lock:
+            self._entries.pop((namespace, key), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Returns per namespace the live entries by reason, hits, misses and recorded failures by reason
+        """
+        now = self._clock()
+        with self._lock:
+            stats: Dict[str, Dict] = {}
+
+            def namespace_stats(namespace: str) -> Dict:
+                return stats.setdefault(namespace, {"entries": {}, "hits": 0, "misses": 0, "recorded": {}})
+
+            for (namespace, _), entry in self._entries.items():
+                if entry.expires_at > now:
+                    entries = namespace_stats(namespace)["entries"]
+                    entries[entry.reason] = entries.get(entry.reason, 0) + 1
+            for namespace, hits in self._hits.items():
+                namespace_stats(namespace)["hits"] = hits
+            for namespace, misses in self._misses.items():
+                namespace_stats(namespace)["misses"] = misses
+            for (namespace, reason), count in self._recorded.items():
+                namespace_stats(namespace)["recorded"][reason] = count
+
+            return {
+                "namespaces": stats,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self._evictions,
+            }
+
+
+negative_cache = NegativeCache()
@@ -0,0 +1,82 @@
+import asyncio
+import weakref
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from GrafolanaBack.domain.infrastructure.db.session import (
+    SQLITE_BACKEND,
+    configure_sqlite_connection,
+    get_database_url,
+    get_db_backend,
+    get_engine_options,
+)
+
+# asyncpg connections belong to the event loop that opened them, so each loop gets its own engine
+_engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncEngine]" = weakref.WeakKeyDictionary()
+_session_factories: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, async_sessionmaker]" = weakref.WeakKeyDictionary()
+
+def get_async_database_url() -> str:
+    """
+    Builds the async database URL from the same environment variables as the sync engine
+    (asyncpg for PostgreSQL, aiosqlite for the embedded SQLite backend)
+    """
+    if get_db_backend() == SQLITE_BACKEND:
+        return get_database_url().replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return get_database_url().replace("postgresql://", "postgresql+asyncpg://", 1)
+
+def get_async_engine_options() -> Dict[str, Any]:
+    """
+    Builds the async engine pool options from the sync engine options.
+    asyncpg takes the statement timeout as a server setting instead of a libpq option.
+    """
+    options = get_engine_options()
+    # Async engines use their own adapted queue pool
+    options['poolclass'] = AsyncAdaptedQueuePool
+    connect_args = options.pop('connect_args', None)
+    if get_db_backend() == SQLITE_BACKEND:
+        options['connect_args'] = connect_args
+    elif connect_args:
+        statement_timeout = connect_args['options'].split('=', 1)[1]
+        options['connect_args'] = {'server_settings': {'statement_timeout': statement_timeout}}
+    return options
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Returns the async engine of the running event loop, creating it on first use
+    """
+    loop = asyncio.get_running_loop()
+    engine = _engines.get(loop)
+    if engine is None:
+        engine = create_async_engine(get_async_database_url(), **get_async_engine_options())
+        if engine.dialect.name == SQLITE_BACKEND:
+            event.listen(engine.sync_engine, 'connect', configure_sqlite_connection)
+        _engines[loop] = engine
+    return engine
+
+def get_async_session() -> AsyncSession:
+    """
+    Returns a new async database session bound to the engine of the running event loop.
+    Use it as an async context manager so the connection is released when done:
+
+        async with get_async_session() as session:
+            ...
+    """
+    loop = asyncio.get_running_loop()
+    factory = _session_factories.get(loop)
+    if factory is None:
+        factory = async_sessionmaker(get_async_engine(), expire_on_commit=False)
+        _session_factories[loop] = factory
+    return factory()
+
+async def dispose_async_engine():
+    """
+    Close every pooled connection of the running event loop's async engine
+    """
+    loop = asyncio.get_running_loop()
+    engine = _engines.pop(loop, None)
+    _session_factories.pop(loop, None)
+    if engine is not None:
+        await engine.dispose()
@@ -2,30 +2,13 @@ from typing import Optional
 import os
 import sys
 import importlib.util
-from urllib.parse import quote_plus
 from alembic import command
 from alembic.config import Config
 from sqlalchemy import inspect
 from sqlalchemy.exc import OperationalError
-from GrafolanaBack.domain.infrastructure.db.session import engine
+from GrafolanaBack.domain.infrastructure.db.session import get_database_url, get_engine
 from GrafolanaBack.domain.logging.logging import logger
 
-def get_database_url() -> str:
-    """
-    Builds the database URL from environment variables or uses default values for development.
-    This should match the logic in migrations/env.py
-    """
-    db_user = os.environ.get('DB_USER', 'grafolana')
-    db_password = os.environ.get('DB_PASSWORD', 'grafolana_dev')
-    db_host = os.environ.get('DB_HOST', 'localhost')
-    db_port = os.environ.get('DB_PORT', '5432')
-    db_name = os.environ.get('DB_NAME', 'grafolana')
-    
-    # Safely quote the password to handle special characters
-    quoted_password = quote_plus(db_password)
-    
-    return f"postgresql://{db_user}:{quoted_password}@{db_host}:{db_port}/{db_name}"
-
 def get_alembic_config() -> Config:
     """Create Alembic configuration programmatically without relying on alembic.ini file."""
     # Get the directory where migrations are located
@@ -46,10 +29,17 @@ def get_alembic_config() -> Config:
     return config
 
 def check_and_run_migrations() -> None:
-    """Check if database exists and run migrations if needed."""
+    """
+    Check if database exists and run migrations if needed.
+    Skipped when RUN_MIGRATIONS_ON_STARTUP is set to false (e.g. migrations run by the deployment).
+    """
+    if os.environ.get('RUN_MIGRATIONS_ON_STARTUP', 'true').lower() != 'true':
+        logger.info("Skipping database migrations (RUN_MIGRATIONS_ON_STARTUP=false).")
+        return
+
     try:
         # Try to connect to the database
-        inspector = inspect(engine)
+        inspector = inspect(get_engine())
         
         # Check if any tables exist
         tables_exist = len(inspector.get_table_names()) > 0
@@ -0,0 +1,87 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """
+    Process-wide counters describing how the database connection pool is used.
+
+    Tracks how long callers wait to check out a connection and how close the pool
+    is to exhaustion, so pool sizing can be tuned from real traffic.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PoolMetrics, cls).__new__(cls)
+            cls._instance._lock = threading.Lock()
+            cls._instance.clear()
+        return cls._instance
+
+    def clear(self):
+        with self._lock:
+            self.checkouts = 0
+            self.checkout_timeouts = 0
+            self.total_wait_time = 0.0
+            self.max_wait_time = 0.0
+            self.max_checked_out = 0
+
+    def record_checkout(self, wait_time: float, checked_out: int):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+            self.max_checked_out = max(self.max_checked_out, checked_out)
+
+    def record_timeout(self, wait_time: float):
+        with self._lock:
+            self.checkout_timeouts += 1
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def get_stats(self, pool: QueuePool) -> Dict[str, Any]:
+        """
+        Build a snapshot of the pool state and of the checkout counters.
+
+        Args:
+            pool: The engine pool to inspect
+
+        Returns:
+            Dictionary with the current pool occupancy, saturation and checkout wait statistics
+        """
+        capacity = pool.size() + max(pool._max_overflow, 0)
+        checked_out = pool.checkedout()
+        with self._lock:
+            return {
+                'pool_size': pool.size(),
+                'max_overflow': pool._max_overflow,
+                'checked_out': checked_out,
+                'checked_in': pool.checkedin(),
+                'overflow': pool.overflow(),
+                'saturation': checked_out / capacity if capacity > 0 else 0.0,
+                'max_checked_out': self.max_checked_out,
+                'max_saturation': self.max_checked_out / capacity if capacity > 0 else 0.0,
+                'checkouts': self.checkouts,
+                'checkout_timeouts': self.checkout_timeouts,
+                'avg_checkout_wait_ms': (self.total_wait_time / self.checkouts * 1000) if self.checkouts else 0.0,
+                'max_checkout_wait_ms': self.max_wait_time * 1000,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that records checkout wait time and occupancy in PoolMetrics.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            PoolMetrics().record_timeout(time.perf_counter() - start)
+            raise
+        PoolMetrics().record_checkout(time.perf_counter() - start, self.checkedout())
+        return connection
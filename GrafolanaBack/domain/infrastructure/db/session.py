@@ -1,16 +1,46 @@
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.ext.declarative import declarative_base
 import os
+import threading
+from typing import Any, Dict
 from urllib.parse import quote_plus
 
+from GrafolanaBack.domain.infrastructure.db.pool_metrics import InstrumentedQueuePool, PoolMetrics
+from GrafolanaBack.domain.logging.logging import logger
+from GrafolanaBack.utils.path_utils import find_backend_root
+
 Base = declarative_base()
 
+# Supported storage backends: a PostgreSQL server or an embedded SQLite file (WAL mode)
+POSTGRESQL_BACKEND = 'postgresql'
+SQLITE_BACKEND = 'sqlite'
+
+def get_db_backend() -> str:
+    """
+    Returns the configured storage backend (DB_BACKEND), PostgreSQL by default
+    """
+    backend = os.environ.get('DB_BACKEND', POSTGRESQL_BACKEND).lower()
+    if backend not in (POSTGRESQL_BACKEND, SQLITE_BACKEND):
+        raise ValueError(f"Unsupported DB_BACKEND '{backend}', expected '{POSTGRESQL_BACKEND}' or '{SQLITE_BACKEND}'")
+    return backend
+
+def get_sqlite_path() -> str:
+    """
+    Returns the SQLite database file path (SQLITE_PATH), grafolana.db in the backend folder by default
+    """
+    return os.environ.get('SQLITE_PATH', str(find_backend_root() / 'grafolana.db'))
+
 # Get database connection parameters from environment variables or use defaults
 def get_database_url():
     """
     Builds the database URL from environment variables or uses default values for development
     """
+    if get_db_backend() == SQLITE_BACKEND:
+        return f"sqlite:///{get_sqlite_path()}"
+
     db_user = os.environ.get('DB_USER', 'grafolana')
     db_password = os.environ.get('DB_PASSWORD', 'grafolana_dev')
     db_host = os.environ.get('DB_HOST', 'localhost')
@@ -22,23 +52,200 @@ def get_database_url():
     
     return f"postgresql://{db_user}:{quoted_password}@{db_host}:{db_port}/{db_name}"
 
-# Create engine
-engine = create_engine(get_database_url())
+def get_engine_options() -> Dict[str, Any]:
+    """
+    Builds the connection pool options from environment variables or uses default values
+    """
+    options = {
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', '10')),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', '20')),
+        'pool_timeout': float(os.environ.get('DB_POOL_TIMEOUT', '30')),
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', '1800')),
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true',
+    }
+
+    if get_db_backend() == SQLITE_BACKEND:
+        # Connections are shared across the worker threads through the pool;
+        # the timeout is how long a writer waits for the database lock
+        options['connect_args'] = {
+            'check_same_thread': False,
+            'timeout': float(os.environ.get('SQLITE_BUSY_TIMEOUT', '30')),
+        }
+        return options
 
-# Create session factory
-Session = scoped_session(sessionmaker(bind=engine))
+    # Server-side statement timeout in milliseconds, 0 disables it
+    statement_timeout = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', '0'))
+    if statement_timeout > 0:
+        options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+
+    return options
+
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    """
+    Switch every new SQLite connection to WAL mode so readers never block the writer
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+# Engine is created on first use so importing this module does not require a database driver
+_engine: Engine = None
+_engine_lock = threading.Lock()
+
+# Create session factory (bound to the engine on first use)
+session_factory = sessionmaker()
+Session = scoped_session(session_factory)
+
+def get_engine() -> Engine:
+    """
+    Returns the engine of the configured storage backend, creating it on first use
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                new_engine = create_engine(get_database_url(), **get_engine_options())
+                if new_engine.dialect.name == SQLITE_BACKEND:
+                    event.listen(new_engine, 'connect', configure_sqlite_connection)
+                event.listen(new_engine, 'handle_error', _mark_failed_unit_of_work)
+                session_factory.configure(bind=new_engine)
+                _engine = new_engine
+    return _engine
+
+def __getattr__(name):
+    # Keep `from ...session import engine` working with the lazily created engine
+    if name == 'engine':
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Per-thread unit of work state (one connection shared by every repository call of a request)
+_unit_of_work = threading.local()
+
+def _mark_failed_unit_of_work(exception_context):
+    """
+    Remember that a statement failed on the unit of work connection of this thread.
+    On PostgreSQL the failure aborts the shared transaction until it is rolled back.
+    """
+    if getattr(_unit_of_work, 'depth', 0) > 0 and exception_context.connection is _unit_of_work.connection:
+        _unit_of_work.failed = True
+
+def _rollback_failed_unit_of_work():
+    """
+    Roll back the shared session after a failed statement, so the next repository calls of
+    the unit of work run in a new transaction. Changes already committed by repositories are kept.
+    """
+    if getattr(_unit_of_work, 'failed', False):
+        _unit_of_work.failed = False
+        logger.warning("Rolling back the unit of work transaction after a failed statement")
+        Session().rollback()
 
 def get_session():
     """
-    Returns a new database session
+    Returns the database session of the current thread.
+    Inside a unit of work, this is the session bound to the unit of work connection,
+    which is checked out on the first call.
     """
+    get_engine()
+    if getattr(_unit_of_work, 'depth', 0) > 0 and _unit_of_work.connection is None:
+        _unit_of_work.connection = get_engine().connect()
+        # Objects keep their loaded state across the commits of the unit of work,
+        # as they would once detached by a regular close
+        Session.registry.set(session_factory(bind=_unit_of_work.connection, expire_on_commit=False))
+    _rollback_failed_unit_of_work()
     return Session()
 
 def close_session(session):
     """
-    Closes the session
+    Closes the session.
+    Inside a unit of work, the session and its connection stay open until the unit of
+    work ends; the shared transaction is only rolled back if a statement failed.
     """
+    if getattr(_unit_of_work, 'depth', 0) > 0:
+        _rollback_failed_unit_of_work()
+        return
     session.close()
+
+def begin_unit_of_work():
+    """
+    Start a unit of work on the current thread.
+
+    Every repository call made on this thread until end_unit_of_work() shares a single
+    pooled connection through get_session(). The connection is only checked out on the
+    first get_session() call, so units of work that never reach the database cost nothing.
+    Nested calls are reference counted and share the outer unit of work.
+    """
+    depth = getattr(_unit_of_work, 'depth', 0)
+    if depth == 0:
+        # Discard any session left over on this thread before binding a new one
+        Session.remove()
+        _unit_of_work.connection = None
+        _unit_of_work.failed = False
+    _unit_of_work.depth = depth + 1
+
+def end_unit_of_work(exception: BaseException = None):
+    """
+    End the unit of work of the current thread.
+
+    Pending changes are committed, or rolled back if an exception is given, then the
+    session is closed and the connection is returned to the pool.
+
+    Args:
+        exception: The exception that aborted the unit of work, if any
+    """
+    depth = getattr(_unit_of_work, 'depth', 0)
+    if depth == 0:
+        return
+    _unit_of_work.depth = depth - 1
+    if depth > 1:
+        return
+
+    connection = _unit_of_work.connection
+    _unit_of_work.connection = None
+    _unit_of_work.failed = False
+    if connection is None:
+        # The database was never used
+        return
+
+    session = Session()
+    try:
+        if exception is None:
+            session.commit()
+        else:
+            session.rollback()
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Error ending unit of work: {e}")
+    finally:
+        Session.remove()
+        connection.close()
+
+@contextmanager
+def unit_of_work():
+    """
+    Context manager running its block inside a unit of work.
+
+    Example:
+        with unit_of_work():
+            TransactionRepository.get_transaction(signature)
+            MintRepository.get_mints_by_addresses(addresses)
+    """
+    begin_unit_of_work()
+    try:
+        yield
+    except BaseException as e:
+        end_unit_of_work(e)
+        raise
+    else:
+        end_unit_of_work()
+
+def get_pool_metrics() -> Dict[str, Any]:
+    """
+    Returns the connection pool occupancy, saturation and checkout wait statistics
+    """
+    return PoolMetrics().get_stats(get_engine().pool)
     
 def init_db():
     """
@@ -51,4 +258,4 @@ def init_db():
     from ...spam.model import SpamModel
 
     # Create all tables
-    Base.metadata.create_all(engine)
\ No newline at end of file
+    Base.metadata.create_all(get_engine())
\ No newline at end of file
@@ -23,6 +23,18 @@ class CompressedJSON(TypeDecorator):
         super().__init__(*args, **kwargs)
         self.compression_level = compression_level
 
+    def serialize(self, value) -> bytes:
+        """
+        Convert a Python object (dict/list) to the UTF-8 encoded JSON bytes that get compressed.
+        """
+        return json.dumps(value).encode('utf-8')
+
+    def compress(self, byte_string: bytes) -> bytes:
+        """
+        Compress JSON bytes returned by serialize() into the stored column value.
+        """
+        return zlib.compress(byte_string, self.compression_level)
+
     def process_bind_param(self, value, dialect):
         """
         Executed when sending data TO the database.
@@ -31,10 +43,7 @@ class CompressedJSON(TypeDecorator):
         """
         if value is not None:
             try:
-                json_string = json.dumps(value)
-                byte_string = json_string.encode('utf-8')
-                compressed_data = zlib.compress(byte_string, self.compression_level)
-                return compressed_data
+                return self.compress(self.serialize(value))
             except Exception as e:
                 # Handle potential errors during serialization/compression
                 logger.error(f"Error compressing JSON: {e}")
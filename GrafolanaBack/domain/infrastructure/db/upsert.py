@@ -0,0 +1,44 @@
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def build_upsert(
+    session: Session,
+    model: Any,
+    rows: List[Dict[str, Any]],
+    index_elements: List[str],
+    update_columns: Optional[List[str]] = None
+):
+    """
+    Build a dialect specific INSERT ... ON CONFLICT statement for the session's backend.
+
+    Both PostgreSQL and SQLite support the same ON CONFLICT clause, so repositories can
+    write bulk upserts once and run them on either storage backend.
+
+    Args:
+        session: Session used to detect the backend dialect
+        model: Mapped model class to insert into
+        rows: List of column/value dictionaries
+        index_elements: Columns of the unique constraint the conflict is detected on
+        update_columns: Columns to overwrite on conflict, None to keep existing rows untouched
+
+    Returns:
+        The insert statement, ready to be executed by the session
+    """
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == 'postgresql':
+        insert = postgresql.insert
+    elif dialect_name == 'sqlite':
+        insert = sqlite.insert
+    else:
+        raise ValueError(f"Bulk upsert is not supported for dialect '{dialect_name}'")
+
+    statement = insert(model).values(rows)
+    if not update_columns:
+        return statement.on_conflict_do_nothing(index_elements=index_elements)
+    return statement.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={column: statement.excluded[column] for column in update_columns}
+    )
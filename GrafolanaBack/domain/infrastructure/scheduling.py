@@ -0,0 +1,73 @@
+import atexit
+import os
+import tempfile
+from typing import Callable, Optional
+
+import portalocker  # Cross-platform file locking
+
+from GrafolanaBack.domain.logging.logging import logger
+
+def start_locked_interval_job(
+    job_id: str,
+    func: Callable[[], None],
+    on_shutdown: Optional[Callable[[], None]] = None,
+    **interval
+) -> bool:
+    """
+    Run a background job at a fixed interval in a single process.
+
+    Like the SOL price updater, a cross-platform file lock ensures only one
+    instance runs even when Flask reloads in debug mode or several workers start.
+
+    Args:
+        job_id: Job name, also used for the lock file name
+        func: Function run at every interval
+        on_shutdown: Optional function run when the process exits
+        **interval: APScheduler interval trigger arguments (e.g. minutes=5)
+
+    Returns:
+        bool: True if the job was started in this process
+    """
+    lock_file = os.path.join(tempfile.gettempdir(), f'{job_id}.lock')
+    lock_handle = None
+
+    try:
+        lock_handle = open(lock_file, 'w')
+        try:
+            portalocker.lock(lock_handle, portalocker.LOCK_EX | portalocker.LOCK_NB)
+        except portalocker.exceptions.LockException:
+            logger.debug(f"{job_id} is already running in another process")
+            lock_handle.close()
+            return False
+
+        from apscheduler.schedulers.background import BackgroundScheduler
+
+        scheduler = BackgroundScheduler()
+        scheduler.add_job(func=func, trigger="interval", id=job_id, **interval)
+
+        logger.info(f"Starting {job_id} scheduler")
+        scheduler.start()
+
+        def cleanup() -> None:
+            logger.info(f"Shutting down {job_id} scheduler")
+            scheduler.shutdown()
+            if on_shutdown is not None:
+                on_shutdown()
+            try:
+                portalocker.unlock(lock_handle)
+            except Exception:
+                pass
+            lock_handle.close()
+            try:
+                os.remove(lock_file)
+            except OSError:
+                pass
+
+        atexit.register(cleanup)
+        return True
+
+    except Exception as e:
+        logger.error(f"Error starting {job_id}: {str(e)}")
+        if lock_handle:
+            lock_handle.close()
+        return False
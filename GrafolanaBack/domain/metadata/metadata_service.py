@@ -7,9 +7,13 @@ remain independent from the core transaction analysis logic.
 """
 from typing import List, Dict, Optional, Any
 
+from solders.pubkey import Pubkey
+
+from GrafolanaBack.domain.caching.negative_cache import INVALID, MINT_NAMESPACE, NOT_FOUND, negative_cache
+
 # Import token metadata components
 from GrafolanaBack.domain.metadata.spl_token.parsers.mint_metadata_parser import get_mints_info_dto
-from GrafolanaBack.domain.metadata.spl_token.models.classes import MintDTO
+from GrafolanaBack.domain.metadata.spl_token.models.classes import Mint, MintDTO, MintMapper
 from GrafolanaBack.domain.metadata.spl_token.repositories.mint_repository import MintRepository
 from GrafolanaBack.domain.metadata.spl_token.parsers.token_list_parser import TOKEN_LIST
 
@@ -41,6 +45,8 @@ class MetadataService:
         Get metadata for a list of token mint addresses.
         
         First checks TOKEN_LIST, then the database, then fetches any missing information from the blockchain.
+        Invalid addresses and mints without an account get empty metadata and are remembered in
+        the negative cache, so repeated requests for them do not reach the blockchain again.
         """
         if not mint_addresses:
             return []
@@ -77,12 +83,36 @@ class MetadataService:
         if not final_missing:
             return result
         
+        # Skip the mints whose lookup recently failed, and malformed addresses
+        final_missing, skipped = negative_cache.filter(MINT_NAMESPACE, final_missing)
+        unknown_addresses = list(skipped)
+        valid_missing = []
+        for addr in final_missing:
+            try:
+                Pubkey.from_string(addr)
+                valid_missing.append(addr)
+            except ValueError:
+                negative_cache.record(MINT_NAMESPACE, addr, INVALID)
+                unknown_addresses.append(addr)
+        
+        # Same empty metadata as a fetch returns for a mint without account
+        result.extend(MintMapper.to_dto(Mint(mint_address=addr)) for addr in unknown_addresses)
+        
         # Fetch remaining missing mints from blockchain
-        fetched_mints = get_mints_info_dto(final_missing)
+        fetched_mints = get_mints_info_dto(valid_missing) if valid_missing else []
+        
+        # Mints without an initialized account are not stored, so they are fetched
+        # again once their negative cache entry expires
+        existing_mints = []
+        for mint in fetched_mints:
+            if mint.is_initialized:
+                existing_mints.append(mint)
+            else:
+                negative_cache.record(MINT_NAMESPACE, mint.mint_address, NOT_FOUND)
         
         # Store the fetched mints in the database
-        if fetched_mints:
-            MintRepository.create_or_update_mints(fetched_mints)
+        if existing_mints:
+            MintRepository.create_or_update_mints(existing_mints)
         
         # Add fetched mints to our result
         result.extend(fetched_mints)
@@ -0,0 +1,82 @@
+"""
+Registry of the known programs, compiled once at import from SYSTEM_PROGRAMS and SWAP_PROGRAMS.
+
+The registry is immutable: frozen address sets, read-only maps and metadata.
+It is built before the parser worker processes are forked, which then share it
+instead of rebuilding it.
+"""
+from dataclasses import dataclass
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional
+
+from GrafolanaBack.domain.metadata.program.system_programs import SYSTEM_PROGRAMS
+from GrafolanaBack.domain.transaction.config.dex_programs.dex_program_struct import DESCRIPTION, ICON, LABEL, PROGRAM_ADDRESS, WEBSITE
+from GrafolanaBack.domain.transaction.config.dex_programs.swap_programs import SWAP_PROGRAMS, SwapInstructionMatcher, SwapPrograms
+
+class ProgramKind(str, Enum):
+    """Classification of a known program"""
+    SYSTEM = "SYSTEM"
+    SWAP = "SWAP"
+    ROUTER = "ROUTER"
+
+@dataclass(frozen=True)
+class ProgramRegistry:
+    system_program_addresses: FrozenSet[str]
+    swap_program_addresses: FrozenSet[str]
+    program_addresses: FrozenSet[str]
+    program_kinds: Mapping[str, ProgramKind]
+    swap_matchers: Mapping[str, SwapInstructionMatcher]
+    metadata: Mapping[str, Mapping[str, Any]]
+
+    def is_program(self, address: str) -> bool:
+        """Whether the address is a known system or swap program"""
+        return address in self.program_addresses
+
+    def get_kind(self, address: str) -> Optional[ProgramKind]:
+        return self.program_kinds.get(address)
+
+    def get_swap_matcher(self, address: str) -> Optional[SwapInstructionMatcher]:
+        return self.swap_matchers.get(address)
+
+    def get_metadata(self, address: str) -> Optional[Dict[str, Any]]:
+        """Copy of the program's metadata (label, icon, website, description)"""
+        metadata = self.metadata.get(address)
+        return dict(metadata) if metadata is not None else None
+
+    # Mapping proxies can't be pickled, rebuild the registry from its sources instead
+    def __reduce__(self):
+        return (_get_program_registry, ())
+
+def build_program_registry(system_programs: Dict[str, dict], swap_programs: SwapPrograms) -> ProgramRegistry:
+    """
+    Compile the system and swap program definitions into a ProgramRegistry.
+    Swap programs take precedence over system programs with the same address.
+    """
+    program_kinds = {program[PROGRAM_ADDRESS]: ProgramKind.SYSTEM for program in system_programs.values()}
+    metadata = {address: MappingProxyType(dict(program)) for address, program in system_programs.items()}
+    for address, swap_program in swap_programs.get_map().items():
+        program_kinds[address] = ProgramKind.ROUTER if swap_program.router else ProgramKind.SWAP
+        metadata[address] = MappingProxyType({
+            PROGRAM_ADDRESS: address,
+            LABEL: swap_program.label,
+            ICON: swap_program.icon,
+            WEBSITE: swap_program.website,
+            DESCRIPTION: swap_program.description,
+        })
+
+    system_program_addresses = frozenset(program[PROGRAM_ADDRESS] for program in system_programs.values())
+    swap_program_addresses = frozenset(swap_programs.get_map())
+    return ProgramRegistry(
+        system_program_addresses=system_program_addresses,
+        swap_program_addresses=swap_program_addresses,
+        program_addresses=system_program_addresses | swap_program_addresses,
+        program_kinds=MappingProxyType(program_kinds),
+        swap_matchers=MappingProxyType({address: swap_programs.get_matcher(address) for address in swap_program_addresses}),
+        metadata=MappingProxyType(metadata),
+    )
+
+def _get_program_registry() -> ProgramRegistry:
+    return PROGRAM_REGISTRY
+
+PROGRAM_REGISTRY = build_program_registry(SYSTEM_PROGRAMS, SWAP_PROGRAMS)
@@ -1,20 +1,6 @@
 from typing import List
-from GrafolanaBack.domain.transaction.config.dex_programs.dex_program_struct import DESCRIPTION, ICON, LABEL, PROGRAM_ADDRESS, WEBSITE
-from GrafolanaBack.domain.transaction.config.dex_programs.swap_programs import SWAP_PROGRAMS
 from GrafolanaBack.domain.caching.cache_utils import cache
-from .system_programs import SYSTEM_PROGRAMS 
-
-programs_metadata_map = SYSTEM_PROGRAMS
-
-for swap_program_address, swap_program in SWAP_PROGRAMS.get_map().items():
-    program_metadata = {
-        PROGRAM_ADDRESS: swap_program_address,
-        LABEL:  swap_program.label,
-        ICON: swap_program.icon,
-        WEBSITE: swap_program.website,
-        DESCRIPTION: swap_program.description,
-    }
-    programs_metadata_map[swap_program_address] = program_metadata
+from .program_registry import PROGRAM_REGISTRY
 
 
 def get_program_metadatas(program_addresses: List[str]) -> List[str]:
@@ -56,8 +42,8 @@ def _get_program_metadatas(program_tuples: tuple) -> List[str]:
     result = []
     
     for address in program_addresses:
-        if address in programs_metadata_map:
-            result.append(programs_metadata_map[address])
+        if (metadata := PROGRAM_REGISTRY.get_metadata(address)) is not None:
+            result.append(metadata)
     
     return result
 
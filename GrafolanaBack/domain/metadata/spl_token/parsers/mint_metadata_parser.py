@@ -12,6 +12,7 @@ from base64 import b64decode
 
 from GrafolanaBack.domain.metadata.spl_token.models.classes import IPv4Resolver, MintDTO, MintMapper, OffchainMetadata, Mint, MintInfo
 from GrafolanaBack.domain.metadata.spl_token.parsers.metaplex_metadata_parser import MetaplexMetadataParser
+from GrafolanaBack.domain.caching.negative_cache import ERROR, INVALID, METADATA_URI_NAMESPACE, NOT_FOUND, negative_cache
 from GrafolanaBack.domain.logging.logging import logger
 
 from dotenv import load_dotenv
@@ -130,6 +131,11 @@ class SolanaTokenFetcher:
         Returns:
             OffchainMetadata object or None if fetching fails
         """
+        # Dead or broken URIs are not requested again until their negative cache entry expires
+        if negative_cache.get(METADATA_URI_NAMESPACE, uri) is not None:
+            return None
+        original_uri = uri
+
         if not self.http_session:
             # Create an IPv4-only session if not already created
             if self.ipv4_only:
@@ -151,6 +157,9 @@ class SolanaTokenFetcher:
             async with self.http_session.get(uri, timeout=10) as response:
                 if response.status != 200:
                     logger.error(f"Failed to fetch metadata from {uri}: {response.status}")
+                    # Server errors and rate limiting are transient, other statuses mean the document is gone
+                    reason = ERROR if response.status >= 500 or response.status == 429 else NOT_FOUND
+                    negative_cache.record(METADATA_URI_NAMESPACE, original_uri, reason)
                     return None
                     
                 data = await response.json()
@@ -169,8 +178,14 @@ class SolanaTokenFetcher:
                     extensions=data.get('extensions', {})
                 )
                 
-        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+        except (aiohttp.ContentTypeError, aiohttp.InvalidURL, json.JSONDecodeError, AttributeError) as e:
+            # The URI does not point to a JSON metadata document
+            logger.error(f"Invalid off-chain metadata at {uri}: {str(e)}")
+            negative_cache.record(METADATA_URI_NAMESPACE, original_uri, INVALID)
+            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Error fetching off-chain metadata from {uri}: {str(e)}")
+            negative_cache.record(METADATA_URI_NAMESPACE, original_uri, ERROR)
             return None
 
     async def fetch_multiple_tokens(self, mint_addresses: List[str]) -> List[Mint]:
@@ -0,0 +1,101 @@
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+
+from GrafolanaBack.domain.infrastructure.db.async_session import get_async_session
+from GrafolanaBack.domain.metadata.spl_token.models.models import MintModel
+from GrafolanaBack.domain.metadata.spl_token.models.classes import MintDTO
+from GrafolanaBack.domain.logging.logging import mint_logger
+
+class AsyncMintRepository:
+    """Asyncio counterpart of MintRepository for mint token metadata operations"""
+
+    @staticmethod
+    async def create_or_update_mints(mint_dtos: List[MintDTO]) -> List[MintDTO]:
+        """
+        Batch create or update multiple mint token metadata entries
+
+        Args:
+            mint_dtos: List of MintDTO objects to save
+
+        Returns:
+            List[MintDTO]: The saved MintDTO objects
+        """
+        if not mint_dtos:
+            return []
+
+        async with get_async_session() as session:
+            try:
+                result = []
+
+                mint_addresses = [dto.mint_address for dto in mint_dtos]
+                existing_mints = (await session.scalars(
+                    select(MintModel).where(MintModel.mint_address.in_(mint_addresses))
+                )).all()
+                existing_mint_dict = {mint.mint_address: mint for mint in existing_mints}
+
+                for dto in mint_dtos:
+                    if dto.mint_address in existing_mint_dict:
+                        existing_mint = existing_mint_dict[dto.mint_address]
+                        mint_model = MintModel.from_dto(dto)
+                        for key, value in mint_model.__dict__.items():
+                            if key != '_sa_instance_state' and key != 'created_at' and key != 'mint_address':
+                                setattr(existing_mint, key, value)
+                        result.append(existing_mint.to_dto())
+                    else:
+                        session.add(MintModel.from_dto(dto))
+                        result.append(dto)
+
+                await session.commit()
+                return result
+            except Exception as e:
+                await session.rollback()
+                mint_logger.error(f"Error in batch creating/updating mints: {str(e)}")
+                raise
+
+    @staticmethod
+    async def get_mint_by_address(mint_address: str) -> Optional[MintDTO]:
+        """
+        Get mint metadata by address
+
+        Args:
+            mint_address: The mint address to look up
+
+        Returns:
+            Optional[MintDTO]: The mint metadata if found, None otherwise
+        """
+        async with get_async_session() as session:
+            try:
+                mint_model = await session.scalar(
+                    select(MintModel).where(MintModel.mint_address == mint_address)
+                )
+                if mint_model:
+                    return mint_model.to_dto()
+                return None
+            except Exception as e:
+                mint_logger.error(f"Error getting mint {mint_address}: {str(e)}")
+                return None
+
+    @staticmethod
+    async def get_mints_by_addresses(mint_addresses: List[str]) -> Dict[str, MintDTO]:
+        """
+        Get multiple mints by their addresses
+
+        Args:
+            mint_addresses: List of mint addresses to look up
+
+        Returns:
+            Dict[str, MintDTO]: Dictionary mapping mint addresses to their MintDTO objects
+        """
+        if not mint_addresses:
+            return {}
+
+        async with get_async_session() as session:
+            try:
+                mint_models = (await session.scalars(
+                    select(MintModel).where(MintModel.mint_address.in_(mint_addresses))
+                )).all()
+                return {model.mint_address: model.to_dto() for model in mint_models}
+            except Exception as e:
+                mint_logger.error(f"Error fetching multiple mints: {str(e)}")
+                return {}
@@ -0,0 +1,125 @@
+"""
+Memory and allocation benchmark of account versioning.
+
+Replays the account versioning of a large router transaction (every hop of the
+route credits a pool or user account, which gets a new version) with the current
+slotted models and cheap clones, and with the previous models that deep copied
+each version.
+
+    python -m GrafolanaBack.domain.performance.account_version_benchmark --accounts 200 --transfers 20000
+"""
+import argparse
+import copy
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from GrafolanaBack.domain.transaction.models.account import AccountType
+from GrafolanaBack.domain.transaction.repositories.account_repository import AccountRepository
+
+SIGNATURE = "4" * 88
+
+@dataclass
+class LegacyAccount:
+    """Account model before slots and copy on write authorities"""
+    address: str
+    type: AccountType = AccountType.UNKNOWN
+    mint_address: str = None
+    is_pool: bool = False
+    authorities: List[str] = field(default_factory=list)
+    metadata: Optional[Dict] = field(default_factory=dict)
+
+@dataclass
+class LegacyAccountVersion:
+    """AccountVersion model before slots"""
+    version: int
+    account: LegacyAccount
+    transaction_signature: str
+    owner: Optional[str]
+    balance_token: int
+    balance_lamport: int
+
+class LegacyAccountRepository(AccountRepository):
+    """AccountRepository deep copying versions, as it did before AccountVersion.clone"""
+
+    def create_account(self, transaction_signature, address, mint_address, account_type=AccountType.UNKNOWN,
+                       owner=None, balance_token=0, balance_lamport=0):
+        address_id = self.address_table.get_id(address)
+        account = LegacyAccount(address=address, mint_address=mint_address, type=account_type)
+        self.accounts[address_id] = account
+        initial_version = LegacyAccountVersion(0, account, transaction_signature, owner, balance_token, balance_lamport)
+        self.account_versions[address_id] = [initial_version]
+        return initial_version
+
+    def add_authority(self, address, authority):
+        account = self.get_account(address)
+        if authority not in account.authorities:
+            account.authorities.append(authority)
+
+    def new_account_version(self, address):
+        account_version = self.get_versions(address)[-1]
+        new_account_version = copy.deepcopy(account_version)
+        new_account_version.version += 1
+        new_account_version.account = account_version.account
+        self.get_versions(address).append(new_account_version)
+        return new_account_version
+
+def replay_router_transaction(repository: AccountRepository, accounts: int, transfers: int, seed: int = 0) -> AccountRepository:
+    """
+    Create the accounts of a router transaction, then version them for each transfer.
+
+    Args:
+        repository: Repository to fill
+        accounts: Number of accounts in the transaction
+        transfers: Number of transfers, each creating a new version of its destination
+        seed: Seed of the random transfer destinations
+    """
+    rng = random.Random(seed)
+    addresses = [f"{index:044d}" for index in range(accounts)]
+    for address in addresses:
+        repository.create_account(SIGNATURE, address, mint_address="So11111111111111111111111111111111111111112",
+                                  account_type=AccountType.TOKEN_ACCOUNT, owner=addresses[0], balance_token=10**9)
+        repository.add_authority(address, addresses[0])
+    for _ in range(transfers):
+        destination = repository.new_account_version(rng.choice(addresses))
+        destination.balance_token += 1000
+    return repository
+
+def measure(build: Callable[[], AccountRepository]) -> Dict[str, float]:
+    """Time, peak and retained memory of building a repository"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    repository = build()
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del repository
+    return {"seconds": elapsed, "peak_bytes": peak, "retained_bytes": retained}
+
+def run_benchmark(accounts: int = 200, transfers: int = 20000) -> Dict[str, Dict[str, float]]:
+    """
+    Returns the measures of the current and legacy account versioning for the same transaction.
+    """
+    return {
+        "legacy": measure(lambda: replay_router_transaction(LegacyAccountRepository(), accounts, transfers)),
+        "current": measure(lambda: replay_router_transaction(AccountRepository(), accounts, transfers)),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--transfers", type=int, default=20000)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.accounts, args.transfers)
+    print(f"{'':10}{'time (ms)':>12}{'peak (KiB)':>14}{'retained (KiB)':>16}")
+    for name, result in results.items():
+        print(f"{name:10}{result['seconds'] * 1000:12.1f}{result['peak_bytes'] / 1024:14.0f}{result['retained_bytes'] / 1024:16.0f}")
+    legacy, current = results["legacy"], results["current"]
+    print(f"current uses {current['retained_bytes'] / legacy['retained_bytes']:.0%} of the legacy memory "
+          f"and runs {legacy['seconds'] / current['seconds']:.1f}x faster")
+
+if __name__ == "__main__":
+    main()
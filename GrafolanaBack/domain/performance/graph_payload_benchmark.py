@@ -0,0 +1,59 @@
+"""
+Benchmark of the graph data payload of a bot's account.
+
+Parses the transactions of a wallet repeating the same payments (as a bot does)
+and measures the size of their serialized graph data, with every node and link
+sent in full as before, and with the transactions of the same shape sent as
+templates. Prices are left out, they are the same in both payloads.
+
+    python -m GrafolanaBack.domain.performance.graph_payload_benchmark --transactions 1000 --transfers 5
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+from GrafolanaBack.domain.performance.parse_memory_benchmark import build_account_transactions
+from GrafolanaBack.domain.transaction.services.graph_service import GraphService
+from GrafolanaBack.domain.transaction.services.transaction_parser_service import TransactionParserService
+from GrafolanaBack.domain.transaction.utils.graph_templates import compress_graph_data
+
+def build_graph_data(transactions: int, transfers: int) -> Dict[str, Any]:
+    """Full graph data of the parsed transactions of one wallet"""
+    parser = TransactionParserService()
+    graph_data = GraphService._get_empty_graph_data()
+    for signature, encoded in build_account_transactions(transactions, transfers).items():
+        GraphService.set_graph_data(parser.parse_transaction_call_back(signature, encoded), graph_data)
+    return graph_data
+
+def measure(build_payload: Callable[[Dict[str, Any]], Dict[str, Any]], graph_data: Dict[str, Any]) -> Dict[str, float]:
+    start = time.perf_counter()
+    payload = json.dumps(build_payload(graph_data))
+    elapsed = time.perf_counter() - start
+    return {"seconds": elapsed, "bytes": len(payload)}
+
+def run_benchmark(transactions: int = 1000, transfers: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    Returns the measures of the full and templated payloads of the same graph data.
+    """
+    graph_data = build_graph_data(transactions, transfers)
+    return {
+        "legacy": measure(lambda data: data, graph_data),
+        "current": measure(compress_graph_data, graph_data),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, default=1000)
+    parser.add_argument("--transfers", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.transactions, args.transfers)
+    print(f"{'':10}{'time (ms)':>12}{'size (KiB)':>12}")
+    for name, result in results.items():
+        print(f"{name:10}{result['seconds'] * 1000:12.1f}{result['bytes'] / 1024:12.1f}")
+    legacy, current = results["legacy"], results["current"]
+    print(f"templated payload is {legacy['bytes'] / current['bytes']:.1f}x smaller")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark of the isomorphic transactions grouping.
+
+Groups the cyclic graphs of many transactions, most of them relabeled copies
+of a few transaction shapes (as in a block, where most transactions are
+transfers and swaps through the same programs), with GraphService, which only
+compares the graphs of a bucket, and the previous way, comparing every
+ungrouped pair and scanning the groups for membership before each comparison.
+
+    python -m GrafolanaBack.domain.performance.isomorphism_benchmark --transactions 1000
+"""
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+import networkx as nx
+from networkx import Graph
+
+from GrafolanaBack.domain.transaction.services.graph_service import GraphService
+
+def build_graphs(transactions: int, shapes: int = 20, seed: int = 0) -> Dict[str, Graph]:
+    """Cyclic graphs by signature, relabeled copies of random shapes, one in ten of them random"""
+    rng = random.Random(seed)
+
+    def random_graph() -> Graph:
+        nodes = rng.randint(2, 10)
+        graph = Graph()
+        for _ in range(rng.randint(1, nodes * 2)):
+            graph.add_edge(rng.randrange(nodes), rng.randrange(nodes))
+        return graph
+
+    templates = [random_graph() for _ in range(shapes)]
+    graphs = {}
+    for index in range(transactions):
+        template = random_graph() if rng.random() < 0.1 else rng.choice(templates)
+        addresses = list(template.nodes())
+        rng.shuffle(addresses)
+        graphs[f"signature{index}"] = nx.relabel_nodes(
+            template, {node: f"account{index}_{address}" for node, address in zip(template.nodes(), addresses)}
+        )
+    return graphs
+
+def group_isomorphic_graphs_legacy(graphs: Dict[str, Graph]) -> Dict[str, int]:
+    isomorphic_groups: Dict[int, List[str]] = {}
+    group_by_signature: Dict[str, int] = {}
+    group_id = 0
+    for sig_a, graph_a in graphs.items():
+        if any(sig_a in group for group in isomorphic_groups.values()):
+            continue
+        group_id += 1
+        isomorphic_groups[group_id] = [sig_a]
+        for sig_b, graph_b in graphs.items():
+            if sig_a == sig_b or any(sig_b in group for group in isomorphic_groups.values()):
+                continue
+            if nx.is_isomorphic(graph_a, graph_b):
+                isomorphic_groups[group_id].append(sig_b)
+                group_by_signature[sig_a] = group_id
+                group_by_signature[sig_b] = group_id
+    return group_by_signature
+
+def measure(group: Callable[[Dict[str, Graph]], Dict[str, int]], graphs: Dict[str, Graph]) -> Dict[str, float]:
+    start = time.perf_counter()
+    groups = group(graphs)
+    elapsed = time.perf_counter() - start
+    return {"seconds": elapsed, "grouped": len(groups), "groups": len(set(groups.values()))}
+
+def run_benchmark(transactions: int = 1000) -> Dict[str, Dict[str, float]]:
+    """
+    Returns the measures of the legacy and bucketed groupings of the same graphs.
+    """
+    graphs = build_graphs(transactions)
+    return {
+        "legacy": measure(group_isomorphic_graphs_legacy, graphs),
+        "current": measure(GraphService.group_isomorphic_graphs, graphs),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, default=1000)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.transactions)
+    print(f"{'':10}{'time (ms)':>12}{'grouped':>10}{'groups':>8}")
+    for name, result in results.items():
+        print(f"{name:10}{result['seconds'] * 1000:12.1f}{result['grouped']:10}{result['groups']:8}")
+    legacy, current = results["legacy"], results["current"]
+    print(f"bucketed grouping is {legacy['seconds'] / current['seconds']:.1f}x faster")
+
+if __name__ == "__main__":
+    main()
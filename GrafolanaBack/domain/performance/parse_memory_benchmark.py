@@ -0,0 +1,148 @@
+"""
+Memory benchmark of the parse results kept for a large account graph.
+
+Parses the transactions of a busy wallet (each one sending lamports to many
+accounts, directly and through inner instructions) and measures the memory
+retained by the parse results until the graph data is serialized: compacted
+contexts, as parsed now, against uncompacted contexts kept along with their
+solders transactions, as get_transactions used to keep them.
+
+    python -m GrafolanaBack.domain.performance.parse_memory_benchmark --transactions 1000 --transfers 20
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.transaction_status import EncodedConfirmedTransactionWithStatusMeta
+
+from GrafolanaBack.domain.transaction.services.transaction_parser_service import TransactionParserService
+from GrafolanaBack.domain.transaction.utils.transaction_decoder import decode_encoded_transaction
+
+SYSTEM_PROGRAM = "11111111111111111111111111111111"
+ROUTER_PROGRAM = "MemoSq4gqABAXKb96qnH8TysNcWxMyWCqXgDLGmfcHr"
+LAMPORTS = 10**9
+
+def build_wallet_transaction_json(wallet: str, receivers: List[str], slot: int) -> Dict[str, Any]:
+    """
+    A transaction of the wallet paying every receiver once with a system transfer,
+    and once more through inner instructions of another program.
+    """
+    def transfer(receiver: str, stack_height) -> Dict[str, Any]:
+        return {
+            "program": "system",
+            "programId": SYSTEM_PROGRAM,
+            "parsed": {"type": "transfer", "info": {"source": wallet, "destination": receiver, "lamports": 1000}},
+            "stackHeight": stack_height,
+        }
+
+    addresses = [wallet, *receivers, SYSTEM_PROGRAM, ROUTER_PROGRAM]
+    return {
+        "slot": slot,
+        "blockTime": 1700000000 + slot,
+        "version": 0,
+        "transaction": {
+            "signatures": [str(Signature.new_unique())],
+            "message": {
+                "accountKeys": [
+                    {"pubkey": address, "writable": index <= len(receivers), "signer": index == 0, "source": "transaction"}
+                    for index, address in enumerate(addresses)
+                ],
+                "recentBlockhash": SYSTEM_PROGRAM,
+                "instructions": [transfer(receiver, None) for receiver in receivers] + [
+                    {"programId": ROUTER_PROGRAM, "accounts": [wallet, *receivers], "data": "3Bxs4", "stackHeight": None}
+                ],
+            },
+        },
+        "meta": {
+            "err": None,
+            "status": {"Ok": None},
+            "fee": 5000,
+            "preBalances": [LAMPORTS] + [0] * len(receivers) + [1, 1],
+            "postBalances": [LAMPORTS - 5000 - 2000 * len(receivers)] + [2000] * len(receivers) + [1, 1],
+            "innerInstructions": [{"index": len(receivers), "instructions": [transfer(receiver, 2) for receiver in receivers]}],
+            "logMessages": [],
+            "preTokenBalances": [],
+            "postTokenBalances": [],
+            "rewards": None,
+            "computeUnitsConsumed": 1000,
+        },
+    }
+
+def build_account_transactions(transactions: int, transfers: int) -> Dict[str, EncodedConfirmedTransactionWithStatusMeta]:
+    """Transactions of one wallet, each paying `transfers` accounts"""
+    wallet = str(Pubkey.new_unique())
+    receivers = [str(Pubkey.new_unique()) for _ in range(transfers * 4)]
+    return {
+        str(Signature.new_unique()): EncodedConfirmedTransactionWithStatusMeta.from_json(json.dumps(
+            build_wallet_transaction_json(wallet, receivers[slot % 4 * transfers:(slot % 4 + 1) * transfers], slot)
+        ))
+        for slot in range(transactions)
+    }
+
+def parse_legacy(parser: TransactionParserService, encoded_transactions: Dict[str, EncodedConfirmedTransactionWithStatusMeta]) -> Dict[str, Any]:
+    """Uncompacted contexts, each kept with its solders transaction"""
+    return {
+        signature: (encoded, parser.parse_transaction_input(
+            signature, decode_encoded_transaction(encoded.transaction, encoded.block_time, encoded.slot), compact=False
+        ))
+        for signature, encoded in encoded_transactions.items()
+    }
+
+def parse_compacted(parser: TransactionParserService, encoded_transactions: Dict[str, EncodedConfirmedTransactionWithStatusMeta]) -> Dict[str, Any]:
+    return {
+        signature: parser.parse_transaction_call_back(signature, encoded)
+        for signature, encoded in encoded_transactions.items()
+    }
+
+def measure(parse: Callable[[], Dict[str, Any]]) -> Dict[str, float]:
+    """Time, peak and retained memory of the parse results"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = parse()
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return {"seconds": elapsed, "peak_bytes": peak, "retained_bytes": retained}
+
+def run_benchmark(transactions: int = 1000, transfers: int = 20) -> Dict[str, Dict[str, float]]:
+    """
+    Returns the measures of the legacy and compacted parse results of the same account transactions.
+    The solders transactions are built beforehand, only what each mode keeps alive is counted.
+    """
+    parser = TransactionParserService()
+    encoded_transactions = build_account_transactions(transactions, transfers)
+    # Load the program registries before measuring
+    parse_compacted(parser, dict([next(iter(encoded_transactions.items()))]))
+
+    def legacy():
+        # The legacy mode kept its own solders transactions, decoded from the stored JSON
+        return parse_legacy(parser, {
+            signature: EncodedConfirmedTransactionWithStatusMeta.from_json(encoded.to_json())
+            for signature, encoded in encoded_transactions.items()
+        })
+
+    return {
+        "legacy": measure(legacy),
+        "current": measure(lambda: parse_compacted(parser, encoded_transactions)),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, default=1000)
+    parser.add_argument("--transfers", type=int, default=20)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.transactions, args.transfers)
+    print(f"{'':10}{'time (ms)':>12}{'peak (KiB)':>14}{'retained (KiB)':>16}")
+    for name, result in results.items():
+        print(f"{name:10}{result['seconds'] * 1000:12.1f}{result['peak_bytes'] / 1024:14.0f}{result['retained_bytes'] / 1024:16.0f}")
+    legacy, current = results["legacy"], results["current"]
+    print(f"compacted results use {current['retained_bytes'] / legacy['retained_bytes']:.0%} of the legacy memory")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Profiling of the transaction parser hot paths.
+
+A ParserProfile counts the calls and cumulative time of the parser steps, by category:
+    transaction     phases of TransactionParserService.parse_transaction_input
+    parser          InstructionParser classes that parsed an instruction
+    swap            swap programs and instructions matched by SwapParserService
+    swap_resolver   SwapResolverService phases
+
+Profiling is off by default. A request enables it for its own transactions, and
+PARSER_PROFILING_SAMPLE_RATE profiles a share of the other requests. The parser only
+records into the profile attached to a TransactionContext, so unprofiled transactions
+pay a single None check per step.
+
+Every profile is added to process-wide totals (see get_profile_totals) and logged.
+"""
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterable, List, Optional, Tuple
+
+from GrafolanaBack.domain.logging.logging import logger
+
+# Share of graph requests profiled without asking for it, from 0 (never) to 1 (always)
+PARSER_PROFILING_SAMPLE_RATE = float(os.getenv("PARSER_PROFILING_SAMPLE_RATE", "0"))
+
+TRANSACTION = "transaction"
+PARSER = "parser"
+SWAP = "swap"
+SWAP_RESOLVER = "swap_resolver"
+
+class ParserProfile:
+    """Call counts and cumulative seconds by (category, name)"""
+    __slots__ = ("counters",)
+
+    def __init__(self):
+        # (category, name) -> [calls, seconds]
+        self.counters: Dict[Tuple[str, str], List] = {}
+
+    def record(self, category: str, name: str, seconds: float) -> None:
+        counter = self.counters.get((category, name))
+        if counter is None:
+            self.counters[(category, name)] = [1, seconds]
+        else:
+            counter[0] += 1
+            counter[1] += seconds
+
+    @contextmanager
+    def measure(self, category: str, name: str):
+        """Record the time spent in the with block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(category, name, time.perf_counter() - start)
+
+    def merge(self, other: "ParserProfile") -> "ParserProfile":
+        """Add the counters of other to this profile"""
+        for key, (calls, seconds) in other.counters.items():
+            counter = self.counters.get(key)
+            if counter is None:
+                self.counters[key] = [calls, seconds]
+            else:
+                counter[0] += calls
+                counter[1] += seconds
+        return self
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        JSON friendly counters: {category: {name: {"calls": int, "total_ms": float}}},
+        names sorted by decreasing time.
+        """
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (category, name), (calls, seconds) in sorted(self.counters.items(), key=lambda item: -item[1][1]):
+            result.setdefault(category, {})[name] = {"calls": calls, "total_ms": round(seconds * 1000, 3)}
+        return result
+
+def measure(profile: Optional[ParserProfile], category: str, name: str) -> ContextManager:
+    """profile.measure(category, name), or a no-op context when profile is None"""
+    if profile is None:
+        return nullcontext()
+    return profile.measure(category, name)
+
+def should_profile(requested: bool = False) -> bool:
+    """Whether to profile a request: when asked for, or sampled at PARSER_PROFILING_SAMPLE_RATE"""
+    return requested or (PARSER_PROFILING_SAMPLE_RATE > 0 and random.random() < PARSER_PROFILING_SAMPLE_RATE)
+
+def merge_profiles(profiles: Iterable[Optional[ParserProfile]]) -> ParserProfile:
+    """Merge the profiles of the transactions of a request, ignoring missing ones"""
+    merged = ParserProfile()
+    for profile in profiles:
+        if profile is not None:
+            merged.merge(profile)
+    return merged
+
+_totals = ParserProfile()
+_totals_lock = threading.Lock()
+
+def report_profile(profile: ParserProfile, transactions: int) -> None:
+    """Metrics sink: add a request's profile to the process totals and log it"""
+    with _totals_lock:
+        _totals.merge(profile)
+    logger.info(f"Parser profile of {transactions} transactions: {json.dumps(profile.to_dict())}")
+
+def get_profile_totals() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Counters of every profile reported by this process"""
+    with _totals_lock:
+        return _totals.to_dict()
@@ -0,0 +1,82 @@
+"""
+Micro-benchmark of program address lookups.
+
+Classifies the accounts of many transactions as programs or not, as
+AccountFactory.build_accounts_from_transaction does: with the compiled
+PROGRAM_REGISTRY, and the previous way, rebuilding the program address
+lists for every transaction and scanning them for every account.
+
+    python -m GrafolanaBack.domain.performance.program_registry_benchmark --transactions 10000 --accounts 40
+"""
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+from solders.pubkey import Pubkey
+
+from GrafolanaBack.domain.metadata.program.program_registry import PROGRAM_REGISTRY
+from GrafolanaBack.domain.metadata.program.system_programs import SYSTEM_PROGRAMS
+from GrafolanaBack.domain.transaction.config.dex_programs.dex_program_struct import PROGRAM_ADDRESS
+from GrafolanaBack.domain.transaction.config.dex_programs.swap_programs import SWAP_PROGRAMS
+
+def build_transactions(transactions: int, accounts: int, seed: int = 0) -> List[List[str]]:
+    """Account addresses of each transaction, about one in eight of them a known program"""
+    rng = random.Random(seed)
+    programs = sorted(PROGRAM_REGISTRY.program_addresses)
+    wallets = [str(Pubkey.new_unique()) for _ in range(accounts * 10)]
+    return [
+        [rng.choice(programs) if rng.random() < 0.125 else rng.choice(wallets) for _ in range(accounts)]
+        for _ in range(transactions)
+    ]
+
+def count_programs_legacy(transactions: List[List[str]]) -> int:
+    count = 0
+    for addresses in transactions:
+        swap_addresses = [swap_program.program_address for swap_program in SWAP_PROGRAMS.get_map().values()]
+        system_program_addresses = [system_program[PROGRAM_ADDRESS] for system_program in SYSTEM_PROGRAMS.values()]
+        for address in addresses:
+            if address in swap_addresses or address in system_program_addresses:
+                count += 1
+    return count
+
+def count_programs(transactions: List[List[str]]) -> int:
+    count = 0
+    for addresses in transactions:
+        for address in addresses:
+            if PROGRAM_REGISTRY.is_program(address):
+                count += 1
+    return count
+
+def measure(count: Callable[[List[List[str]]], int], transactions: List[List[str]]) -> Dict[str, float]:
+    start = time.perf_counter()
+    programs = count(transactions)
+    elapsed = time.perf_counter() - start
+    lookups = sum(len(addresses) for addresses in transactions)
+    return {"seconds": elapsed, "programs": programs, "ns_per_lookup": elapsed * 1e9 / lookups}
+
+def run_benchmark(transactions: int = 10000, accounts: int = 40) -> Dict[str, Dict[str, float]]:
+    """
+    Returns the measures of the legacy and registry lookups over the same transactions.
+    """
+    addresses = build_transactions(transactions, accounts)
+    return {
+        "legacy": measure(count_programs_legacy, addresses),
+        "current": measure(count_programs, addresses),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, default=10000)
+    parser.add_argument("--accounts", type=int, default=40)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.transactions, args.accounts)
+    print(f"{'':10}{'time (ms)':>12}{'ns/lookup':>12}{'programs':>10}")
+    for name, result in results.items():
+        print(f"{name:10}{result['seconds'] * 1000:12.1f}{result['ns_per_lookup']:12.1f}{result['programs']:10}")
+    legacy, current = results["legacy"], results["current"]
+    print(f"the registry is {legacy['seconds'] / current['seconds']:.1f}x faster")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Benchmark and regression corpus of SwapResolverService.resolve_swap.
+
+Builds transactions with random swap transfer graphs (the user paying pools,
+pools paying back the user, and noise transfers between the swap's accounts)
+and resolves their swaps with the current single pass resolver and with the
+previous one, which built a NetworkX subgraph, traversed it with
+single_source_shortest_path and scanned its edges again for amount_out and
+the key bounds. Both resolvers must produce the same swaps and graphs.
+
+    python -m GrafolanaBack.domain.performance.swap_resolution_benchmark --transactions 2000
+"""
+import argparse
+import gc
+import random
+import time
+from typing import Any, Dict, List, Tuple, Type
+
+import networkx as nx
+
+from GrafolanaBack.domain.transaction.models.account import AccountVertex
+from GrafolanaBack.domain.transaction.models.graph import TransactionGraph, TransferProperties, TransferType
+from GrafolanaBack.domain.transaction.models.swap import Swap, TransferAccountAddresses
+from GrafolanaBack.domain.transaction.models.transaction_context import TransactionContext
+from GrafolanaBack.domain.transaction.repositories.account_repository import AccountRepository
+from GrafolanaBack.domain.transaction.services.graph_builder_service import GraphBuilderService
+from GrafolanaBack.domain.transaction.services.swap_resolver_service import SwapResolverService
+
+PROGRAM = "swap_program"
+ADDRESSES = [f"account{index}" for index in range(8)]
+
+class LegacySwapResolverService(SwapResolverService):
+    """resolve_swap as it was before the single pass resolution"""
+
+    def resolve_swap(self, transaction_context: TransactionContext, swap: Swap) -> bool:
+        subgraph = transaction_context.graph.create_subgraph_for_swap(swap)
+
+        user_source_vertices = [v for v in subgraph.nodes() if v.address == swap.get_user_source()]
+        user_dest_vertices = [v for v in subgraph.nodes() if v.address == swap.get_user_destination()]
+        user_source_vertex = min(user_source_vertices, key=lambda v: v.version) if user_source_vertices else None
+        user_dest_vertex = max(user_dest_vertices, key=lambda v: v.version) if user_dest_vertices else None
+        if (user_source_vertex is None) or (user_dest_vertex is None):
+            return False
+
+        swap_pools: List[AccountVertex] = []
+        if isinstance(swap.pool_addresses, TransferAccountAddresses):
+            swap_pools.extend([v for v in subgraph.nodes() if v.address == swap.pool_addresses.destination])
+            swap_pools.extend([v for v in subgraph.nodes() if v.address == swap.pool_addresses.source])
+        else:
+            swap_pools = [v for v in subgraph.nodes() if v.address in swap.pool_addresses]
+        pool_dest_vertices = []
+        pool_source_vertices = []
+
+        paths_from_user_source = nx.single_source_shortest_path(subgraph, user_source_vertex)
+        paths_to_user_dest = nx.single_source_shortest_path(subgraph.reverse(copy=False), user_dest_vertex)
+
+        for pool in swap_pools:
+            self.accountRepository.get_account(pool.address).is_pool = True
+            if pool in paths_from_user_source:
+                pool_dest_vertices.append(pool)
+            if pool in paths_to_user_dest:
+                pool_source_vertices.append(pool)
+
+        pool_dest_vertex = max(pool_dest_vertices, key=lambda v: v.version) if pool_dest_vertices else None
+        pool_source_vertex = min(pool_source_vertices, key=lambda v: v.version) if pool_source_vertices else None
+        if (pool_dest_vertex is None) or (pool_source_vertex is None):
+            return False
+
+        path_a = paths_from_user_source[pool_dest_vertex]
+        if len(path_a) < 2:
+            return False
+        _, _, data = transaction_context.graph.get_last_transfer(path_a, subgraph)
+        amount_in = sum(edge_data["amount_destination"] for edge_data in data.values())
+        swap_transfer_key = int(list(data.keys())[0]) + 5
+
+        path_b = paths_to_user_dest[pool_source_vertex][::-1]
+        if len(path_b) < 2:
+            return False
+        _, _, data = transaction_context.graph.get_first_transfer(path_b, subgraph)
+        real_swap_amount_out = sum(edge_data["amount_source"] for edge_data in data.values())
+
+        amount_out = 0
+        for source, destination, data in subgraph.edges(data=True):
+            if source.address == swap.user_addresses.destination and destination.address != swap.user_addresses.destination:
+                amount_out -= data["amount_source"]
+            if destination.address == swap.user_addresses.destination and source.address != swap.user_addresses.destination:
+                amount_out += data["amount_source"]
+        swap.fee = real_swap_amount_out - amount_out
+
+        transaction_context.graph.add_edge(pool_dest_vertex, pool_source_vertex, TransferProperties(
+            TransferType.SWAP, swap.program_address, amount_in, amount_out,
+            swap_id=swap.id, swap_parent_id=swap.id, parent_router_swap_id=swap.parent_router_swap_id,
+        ), key=swap_transfer_key)
+
+        swap_program_account = GraphBuilderService.prepare_swap_program_account(
+            transaction_context=transaction_context,
+            program_address=swap.program_address,
+        )
+        swap.program_account_vertex = swap_program_account.get_vertex()
+
+        swap_incoming_transfer_key = min([int(key) for _, _, key in subgraph.edges(keys=True)]) if len(subgraph.edges(keys=True)) > 0 else 0
+        swap_outgoing_transfer_key = max([int(key) for _, _, key in subgraph.edges(keys=True)]) if len(subgraph.edges(keys=True)) > 0 else 0
+
+        transaction_context.graph.add_edge(user_source_vertex, swap_program_account.get_vertex(), TransferProperties(
+            TransferType.SWAP_INCOMING, swap.program_address, amount_in, amount_in,
+            swap_id=swap.id, swap_parent_id=swap.id, parent_router_swap_id=swap.parent_router_swap_id,
+        ), key=swap_incoming_transfer_key + 1)
+        transaction_context.graph.add_edge(swap_program_account.get_vertex(), user_dest_vertex, TransferProperties(
+            TransferType.SWAP_OUTGOING, swap.program_address, amount_out, amount_out,
+            swap_id=swap.id, swap_parent_id=swap.id, parent_router_swap_id=swap.parent_router_swap_id,
+        ), key=swap_outgoing_transfer_key - 1)
+        return True
+
+def build_swap_context(seed: int, graph_class: Type[TransactionGraph] = TransactionGraph) -> TransactionContext:
+    """
+    A transaction with two swaps of account0 for account1, one through the pools account2/account3,
+    one through the pools account4 to account6, each with a random graph of transfers
+    """
+    rng = random.Random(seed)
+    signature = f"signature{seed}"
+    repository = AccountRepository()
+    for address in [*ADDRESSES, PROGRAM]:
+        repository.create_account(signature, address, None)
+    context = TransactionContext(
+        slot=seed, transaction_signature=signature, graph=graph_class(), account_repository=repository,
+        signer_wallets={ADDRESSES[0]}, blocktime=0, fee=5000, fee_payer=ADDRESSES[0],
+        compute_units_consumed=0, instructions=[],
+    )
+    user_addresses = TransferAccountAddresses(ADDRESSES[0], ADDRESSES[1])
+    for pool_addresses in (TransferAccountAddresses(ADDRESSES[3], ADDRESSES[2]), tuple(ADDRESSES[4:7])):
+        swap = context.add_swap(False, PROGRAM, "Program", "swap", user_addresses, pool_addresses, None)
+        pools = list(pool_addresses)
+
+        def transfer(source: str, source_version: int, destination: str, destination_version: int) -> None:
+            amount = rng.randrange(1, 1000)
+            context.graph.add_edge(
+                AccountVertex(source, source_version, signature),
+                AccountVertex(destination, destination_version, signature),
+                TransferProperties(
+                    TransferType.TRANSFER, PROGRAM, amount, amount - rng.randrange(2),
+                    swap_parent_id=swap.id, parent_router_swap_id=swap.parent_router_swap_id,
+                )
+            )
+
+        for _ in range(rng.randrange(1, 3)):
+            transfer(ADDRESSES[0], 0, rng.choice(pools), 1)
+            transfer(rng.choice(pools), 1, ADDRESSES[1], 2)
+        for _ in range(rng.randrange(8)):
+            source, destination = rng.sample([*ADDRESSES[:2], *pools, ADDRESSES[7]], 2)
+            transfer(source, rng.randrange(3), destination, rng.randrange(3))
+    return context
+
+def summarize_resolution(context: TransactionContext) -> Tuple[Any, ...]:
+    """What the swap resolution changes: the graph, the resolved swaps and the pool accounts"""
+    return (
+        context.graph.get_edges(),
+        [(swap.id, swap.fee, swap.program_account_vertex) for swap in context.swaps],
+        {account.address: account.is_pool for account in context.account_repository.get_all_accounts()},
+    )
+
+def resolve(resolver_class: Type[SwapResolverService], contexts: List[TransactionContext]) -> Dict[str, float]:
+    # Like timeit, keep garbage collections of the objects left by earlier work out of the measure
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for context in contexts:
+            resolver_class(context.account_repository).resolve_swap_paths(context)
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+    swaps = sum(len(context.swaps) for context in contexts)
+    return {"seconds": elapsed, "resolved_swaps": swaps, "us_per_transaction": elapsed * 1e6 / len(contexts)}
+
+def run_benchmark(transactions: int = 2000, graph_class: Type[TransactionGraph] = TransactionGraph) -> Dict[str, Dict[str, float]]:
+    """
+    Returns the measures of the legacy and current resolvers over the same transactions.
+    """
+    results = {}
+    for name, resolver_class in (("legacy", LegacySwapResolverService), ("current", SwapResolverService)):
+        results[name] = resolve(resolver_class, [build_swap_context(seed, graph_class) for seed in range(transactions)])
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.transactions)
+    print(f"{'':10}{'time (ms)':>12}{'us/tx':>10}{'swaps':>8}")
+    for name, result in results.items():
+        print(f"{name:10}{result['seconds'] * 1000:12.1f}{result['us_per_transaction']:10.1f}{result['resolved_swaps']:8}")
+    legacy, current = results["legacy"], results["current"]
+    print(f"the single pass resolver is {legacy['seconds'] / current['seconds']:.1f}x faster")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select
+
+from GrafolanaBack.domain.prices.models import SOLPrice
+from GrafolanaBack.domain.prices.repository import PRICE_UPSERT_BATCH_SIZE
+from GrafolanaBack.domain.infrastructure.db.async_session import get_async_session
+from GrafolanaBack.domain.infrastructure.db.upsert import build_upsert
+
+
+class AsyncSOLPriceRepository:
+    """
+    Asyncio counterpart of SOLPriceRepository.
+    """
+
+    async def bulk_set_prices(self, prices: List[Tuple[int, float]]) -> None:
+        """
+        Inserts multiple SOL price records into the database with bulk upserts.
+        Timestamps already stored are left untouched.
+
+        :param prices: List of tuples containing (timestamp, price)
+        """
+        if not prices:
+            return
+
+        rows = [{"timestamp": timestamp, "price": price} for timestamp, price in prices]
+
+        async with get_async_session() as session:
+            try:
+                for start in range(0, len(rows), PRICE_UPSERT_BATCH_SIZE):
+                    await session.execute(build_upsert(
+                        session, SOLPrice, rows[start:start + PRICE_UPSERT_BATCH_SIZE], index_elements=["timestamp"]
+                    ))
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def bulk_get_prices(self, start_time: int, end_time: int) -> List[SOLPrice]:
+        """
+        Retrieves SOL prices within a specified time range.
+
+        :param start_time: Start timestamp in milliseconds
+        :param end_time: End timestamp in milliseconds
+        :return: List of SOLPrice objects within the specified range
+        """
+        async with get_async_session() as session:
+            return list((await session.scalars(
+                select(SOLPrice).where(
+                    SOLPrice.timestamp >= start_time,
+                    SOLPrice.timestamp <= end_time
+                )
+            )).all())
+
+    async def get_latest_price(self) -> Optional[SOLPrice]:
+        """
+        Retrieves the most recent SOL price from the database.
+
+        :return: The most recent SOLPrice object or None if no prices exist
+        """
+        async with get_async_session() as session:
+            return await session.scalar(
+                select(SOLPrice).order_by(SOLPrice.timestamp.desc()).limit(1)
+            )
+
+    async def get_price_at_timestamp(self, timestamp: int) -> Optional[SOLPrice]:
+        """
+        Retrieves the SOL price at a specific timestamp.
+        If an exact match isn't found, returns the closest earlier price.
+
+        :param timestamp: Timestamp in milliseconds
+        :return: SOLPrice object at or before the specified timestamp, or None if no earlier price exists
+        """
+        async with get_async_session() as session:
+            return await session.scalar(
+                select(SOLPrice).where(
+                    SOLPrice.timestamp <= timestamp
+                ).order_by(SOLPrice.timestamp.desc()).limit(1)
+            )
+
+    async def get_prices_by_timestamps(self, timestamps: List[int]) -> List[SOLPrice]:
+        """
+        Retrieves SOL prices for a specific set of timestamps.
+
+        :param timestamps: List of timestamps in milliseconds to retrieve prices for
+        :return: List of SOLPrice objects matching the requested timestamps
+        """
+        if not timestamps:
+            return []
+
+        async with get_async_session() as session:
+            return list((await session.scalars(
+                select(SOLPrice).where(SOLPrice.timestamp.in_(timestamps))
+            )).all())
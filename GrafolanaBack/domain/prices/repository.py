@@ -1,24 +1,43 @@
 from typing import List, Tuple, Optional
-from sqlalchemy.orm import Session
 from GrafolanaBack.domain.prices.models import SOLPrice
-from GrafolanaBack.domain.infrastructure.db.session import get_session
+from GrafolanaBack.domain.infrastructure.db.session import get_session, close_session
+from GrafolanaBack.domain.infrastructure.db.upsert import build_upsert
+
+# Number of rows per INSERT ... ON CONFLICT statement (keeps SQLite under its bind parameter limit)
+PRICE_UPSERT_BATCH_SIZE = 5000
 
 
 class SOLPriceRepository:
-    def __init__(self) -> None:
-        self.session: Session = get_session()
+    """
+    Repository for SOL prices.
+    Each call uses its own session (or the current unit of work) and releases it when done,
+    so long-lived instances do not hold a pooled connection.
+    """
 
     def bulk_set_prices(self, prices: List[Tuple[int, float]]) -> None:
         """
-        Inserts multiple SOL price records into the database using modern SQLAlchemy patterns.
+        Inserts multiple SOL price records into the database with bulk upserts.
+        Timestamps already stored are left untouched.
         
         :param prices: List of tuples containing (timestamp, price)
         """
-        # Create SOLPrice objects
-        price_objects = [SOLPrice(timestamp=timestamp, price=price) for timestamp, price in prices]
+        if not prices:
+            return
+
+        rows = [{"timestamp": timestamp, "price": price} for timestamp, price in prices]
         
-        self.session.add_all(price_objects)
-        self.session.commit()
+        session = get_session()
+        try:
+            for start in range(0, len(rows), PRICE_UPSERT_BATCH_SIZE):
+                session.execute(build_upsert(
+                    session, SOLPrice, rows[start:start + PRICE_UPSERT_BATCH_SIZE], index_elements=["timestamp"]
+                ))
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            close_session(session)
 
     def bulk_get_prices(self, start_time: int, end_time: int) -> List[SOLPrice]:
         """
@@ -28,10 +47,14 @@ class SOLPriceRepository:
         :param end_time: End timestamp in milliseconds
         :return: List of SOLPrice objects within the specified range
         """
-        return self.session.query(SOLPrice).filter(
-            SOLPrice.timestamp >= start_time,
-            SOLPrice.timestamp <= end_time
-        ).all()
+        session = get_session()
+        try:
+            return session.query(SOLPrice).filter(
+                SOLPrice.timestamp >= start_time,
+                SOLPrice.timestamp <= end_time
+            ).all()
+        finally:
+            close_session(session)
         
     def get_latest_price(self) -> Optional[SOLPrice]:
         """
@@ -39,7 +62,11 @@ class SOLPriceRepository:
         
         :return: The most recent SOLPrice object or None if no prices exist
         """
-        return self.session.query(SOLPrice).order_by(SOLPrice.timestamp.desc()).first()
+        session = get_session()
+        try:
+            return session.query(SOLPrice).order_by(SOLPrice.timestamp.desc()).first()
+        finally:
+            close_session(session)
 
     def get_price_at_timestamp(self, timestamp: int) -> Optional[SOLPrice]:
         """
@@ -49,9 +76,13 @@ class SOLPriceRepository:
         :param timestamp: Timestamp in milliseconds
         :return: SOLPrice object at or before the specified timestamp, or None if no earlier price exists
         """
-        return self.session.query(SOLPrice).filter(
-            SOLPrice.timestamp <= timestamp
-        ).order_by(SOLPrice.timestamp.desc()).first()
+        session = get_session()
+        try:
+            return session.query(SOLPrice).filter(
+                SOLPrice.timestamp <= timestamp
+            ).order_by(SOLPrice.timestamp.desc()).first()
+        finally:
+            close_session(session)
 
     def get_prices_by_timestamps(self, timestamps: List[int]) -> List[SOLPrice]:
         """
@@ -64,6 +95,10 @@ class SOLPriceRepository:
         if not timestamps:
             return []
         
-        return self.session.query(SOLPrice).filter(
-            SOLPrice.timestamp.in_(timestamps)
-        ).all()
\ No newline at end of file
+        session = get_session()
+        try:
+            return session.query(SOLPrice).filter(
+                SOLPrice.timestamp.in_(timestamps)
+            ).all()
+        finally:
+            close_session(session)
\ No newline at end of file
@@ -1,12 +1,10 @@
 import os
 from typing import Dict, List, Optional, Tuple, Union
 import requests
-from sqlalchemy.orm import Session
 
 from GrafolanaBack.domain.prices.models import SOLPrice
 from GrafolanaBack.domain.prices.repository import SOLPriceRepository
 from GrafolanaBack.domain.prices.sol_price_utils import round_timestamp_to_minute
-from GrafolanaBack.domain.infrastructure.db.session import get_session
 from GrafolanaBack.domain.logging.logging import logger
 
 # Create a persistent session for reuse to avoid connection overhead
@@ -24,11 +22,8 @@ class SOLPriceService:
     def __init__(self) -> None:
         """
         Initialize the SOL price service.
-        
-        Args:
-            db_session: SQLAlchemy session for database access
+        The repository manages its own sessions, so no connection is held by the service.
         """
-        self.db_session: Session = get_session()
         self.repository: SOLPriceRepository = SOLPriceRepository()
         # Cache for prices fetched during the current request
         self.price_cache: Dict[int, float] = {}
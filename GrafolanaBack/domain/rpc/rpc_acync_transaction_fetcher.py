@@ -1,9 +1,12 @@
 import asyncio
 import os
+import tempfile
 import time
-from typing import List, Dict, Callable, Any, Optional, TypedDict, Set
+from contextlib import contextmanager
+from typing import Iterator, List, Dict, Callable, Any, Optional, TypedDict, Set
 from threading import Lock, Thread
 
+import portalocker  # Cross-platform file locking
 from solders.signature import Signature
 from solana.rpc.async_api import AsyncClient
 from solana.exceptions import SolanaRpcException
@@ -52,6 +55,31 @@ class RateLimiter:
             logger.debug("wait_time", wait_time)
             await asyncio.sleep(wait_time)
 
+# Every fetch holds a shared lock on this file while it runs, so any worker process of the host
+# can tell whether a fetch is running anywhere by trying to lock the file exclusively
+FETCH_ACTIVITY_LOCK_FILE = os.path.join(tempfile.gettempdir(), 'rpc_fetcher_activity.lock')
+
+@contextmanager
+def fetch_activity() -> Iterator[None]:
+    """
+    Mark a fetch as running, for is_fetch_running() calls of every process of the host.
+    """
+    with open(FETCH_ACTIVITY_LOCK_FILE, 'a') as lock_handle:
+        # Closing the file releases the lock
+        portalocker.lock(lock_handle, portalocker.LOCK_SH)
+        yield
+
+def is_fetch_running() -> bool:
+    """
+    Tells whether a fetch is running in any process of the host (see fetch_activity).
+    """
+    with open(FETCH_ACTIVITY_LOCK_FILE, 'a') as lock_handle:
+        try:
+            portalocker.lock(lock_handle, portalocker.LOCK_EX | portalocker.LOCK_NB)
+        except portalocker.exceptions.LockException:
+            return True
+        return False
+
 class SolanaTransactionFetcher:
     """
     Persistent class for efficiently fetching Solana transactions.
@@ -200,7 +228,10 @@ class SolanaTransactionFetcher:
                             logger.warning(f"[Dispatcher]: All workers have failed for {sig_str} - giving up")
                             
                             with self._lock:
-                                self.results_dict[sig_str] = None  # No data available
+                                # Keep the last RPC error so callers can tell failing endpoints
+                                # from a transaction that no endpoint has (None)
+                                if not isinstance(self.results_dict.get(sig_str), Exception):
+                                    self.results_dict[sig_str] = None  # No data available
                             
                             # Complete the request
                             if completion_event:
@@ -467,22 +498,85 @@ class SolanaTransactionFetcher:
         local_results: Dict[Signature, Any] = {}
         completion_events = {sig: asyncio.Event() for sig in transaction_signatures}
         
-        # Submit requests to the queue
-        for sig in transaction_signatures:
-            asyncio.run_coroutine_threadsafe(
-                self.request_queue.put((sig, result_callback, completion_events[sig], 0, callback_params)),
+        with fetch_activity():
+            # Submit requests to the queue
+            for sig in transaction_signatures:
+                asyncio.run_coroutine_threadsafe(
+                    self.request_queue.put((sig, result_callback, completion_events[sig], 0, callback_params)),
+                    self.loop
+                )
+            
+            # Wait for all completions
+            future = asyncio.run_coroutine_threadsafe(
+                self._wait_for_completion(transaction_signatures_strings, transaction_signatures, completion_events, local_results),
                 self.loop
             )
-        
-        # Wait for all completions
-        future = asyncio.run_coroutine_threadsafe(
-            self._wait_for_completion(transaction_signatures_strings, transaction_signatures, completion_events, local_results),
-            self.loop
-        )
-        
-        # Get the results
-        return future.result()
+            
+            # Get the results
+            return future.result()
     
+    async def fetch_transactions(
+        self,
+        transaction_signatures: List[Signature],
+        result_callback: Optional[Callable[[Signature, Optional[Any], Optional[Exception], Optional[Any]], Any]] = None,
+        callback_params: Optional[Any] = None,
+    ) -> Dict[str, Any]:
+        """
+        Coroutine version of getMultipleTransactions.
+
+        Must be awaited on the fetcher's own event loop (see run_coroutine), which lets
+        callers interleave other awaitables, such as async database reads, with RPC fetches.
+
+        Args:
+            transaction_signatures: A list of transaction signature
+            result_callback: An optional function to be called for each result (see getMultipleTransactions)
+            callback_params: Optional parameters to pass to the result_callback function.
+
+        Returns:
+            A dictionary mapping each signature string to its fetched/processed result
+            or an Exception object if an error occurred.
+        """
+        if not self.endpoints_config:
+            raise ValueError("No RPC endpoints configured in .env file or environment. Cannot proceed.")
+        if not transaction_signatures:
+            return {}
+
+        transaction_signatures_strings = [str(sig) for sig in transaction_signatures]
+        local_results: Dict[Signature, Any] = {}
+        completion_events = {sig: asyncio.Event() for sig in transaction_signatures}
+
+        with fetch_activity():
+            for sig in transaction_signatures:
+                await self.request_queue.put((sig, result_callback, completion_events[sig], 0, callback_params))
+
+            return await self._wait_for_completion(transaction_signatures_strings, transaction_signatures, completion_events, local_results)
+
+    def is_idle(self) -> bool:
+        """
+        Tells whether no fetch is queued or in flight, so low priority work can use the endpoints
+        without slowing down user requests.
+
+        Fetches of the other worker processes are seen through the shared activity lock file,
+        which only covers the processes of this host.
+        """
+        with self.dispatcher_lock:
+            in_flight = len(self.tx_failed_workers)
+        # worker_queues only exists once the workers have started
+        queued = self.request_queue.qsize() + sum(queue.qsize() for queue in getattr(self, 'worker_queues', {}).values())
+        return in_flight == 0 and queued == 0 and not is_fetch_running()
+
+    def run_coroutine(self, coroutine) -> Any:
+        """
+        Run a coroutine on the fetcher's event loop from another thread and wait for its result.
+
+        Args:
+            coroutine: The coroutine to run
+
+        Returns:
+            The value returned by the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
     async def _wait_for_completion(
         self, 
         transaction_signatures: List[str],
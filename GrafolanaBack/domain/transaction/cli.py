@@ -0,0 +1,75 @@
+"""
+Command-line interface for bulk loading and exporting stored transactions.
+
+Usage:
+    python -m GrafolanaBack.domain.transaction.cli import dump.jsonl.gz [more dumps...] [--workers N]
+    python -m GrafolanaBack.domain.transaction.cli export transactions.seg [--start-slot S] [--end-slot E] [--no-archive]
+
+Dump formats are selected by file extension:
+    .jsonl / .jsonl.gz / .jsonl.bz2 / .jsonl.xz   One transaction per line
+    .seg / .gtx                                    Raw compressed blobs (archive segment layout)
+"""
+
+import argparse
+import os
+import sys
+from dotenv import load_dotenv
+from GrafolanaBack.utils.path_utils import find_backend_root
+# Use the same database settings as the backend
+load_dotenv(dotenv_path=find_backend_root() / '.env')
+
+from ..infrastructure.db.migration_service import check_and_run_migrations
+from .services.transaction_dump_service import export_transactions, import_transactions
+
+def main():
+    parser = argparse.ArgumentParser(description='Transaction store bulk import/export CLI')
+    subparsers = parser.add_subparsers(dest='command', help='Command to run')
+
+    # Import command
+    import_parser = subparsers.add_parser('import', help='Bulk load transactions from dumps, skipping stored ones')
+    import_parser.add_argument('paths', nargs='+', help='Dump files to load')
+    import_parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                               help='Number of parallel compression workers')
+    import_parser.add_argument('--batch-size', type=int, default=1000, help='Transactions per batch')
+
+    # Export command
+    export_parser = subparsers.add_parser('export', help='Export stored transactions to a dump')
+    export_parser.add_argument('path', help='Output dump file')
+    export_parser.add_argument('--start-slot', type=int, help='First slot to export (inclusive)')
+    export_parser.add_argument('--end-slot', type=int, help='Last slot to export (inclusive)')
+    export_parser.add_argument('--no-archive', action='store_true',
+                               help='Only export the transactions stored in the database, not the archived ones')
+
+    args = parser.parse_args()
+
+    if args.command in ('import', 'export'):
+        # A new deployment may be seeded before the app has ever started
+        check_and_run_migrations()
+
+    if args.command == 'import':
+        missing = [path for path in args.paths if not os.path.exists(path)]
+        if missing:
+            print(f"Dump files not found: {', '.join(missing)}", file=sys.stderr)
+            sys.exit(1)
+        try:
+            stats = import_transactions(args.paths, workers=args.workers, batch_size=args.batch_size)
+        except Exception as e:
+            print(f"Error importing transactions: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Read {stats['read']} transactions: {stats['imported']} imported, "
+              f"{stats['duplicates']} already stored, {stats['invalid']} invalid")
+
+    elif args.command == 'export':
+        try:
+            count = export_transactions(args.path, start_slot=args.start_slot, end_slot=args.end_slot,
+                                        include_archive=not args.no_archive)
+        except Exception as e:
+            print(f"Error exporting transactions: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Exported {count} transactions to {args.path}")
+
+    else:
+        parser.print_help()
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,6 @@
 from dataclasses import dataclass
 import struct
-from typing import List, NamedTuple
-
-import base58
+from typing import List, NamedTuple, Optional
 
 from GrafolanaBack.domain.transaction.models.graph import TransferType
 from GrafolanaBack.domain.transaction.models.swap import Swap, TransferAccountAddresses
@@ -15,7 +13,11 @@ class InferedTransfer(NamedTuple):
     
 @dataclass
 class NativeSolTransferInference:
-    def infer(self,swap_instruction: Parsed_Instruction, swap: Swap) -> InferedTransfer:
+    def infer(self,swap_instruction: Parsed_Instruction, swap: Swap, instruction_bytes: Optional[bytes] = None) -> InferedTransfer:
+        """
+        Infer the SOL transfer of a swap.
+        instruction_bytes is the swap instruction data already decoded by the swap parser, if available.
+        """
         raise NotImplementedError()
 
 @dataclass
@@ -28,19 +30,18 @@ class InnerInstructionSolTransferInference(NativeSolTransferInference):
     Use the program address and discriminator to find the instruction.
     Infer the amount of SOL transferred from the instruction data with a format string to unpack the data.
     """
-    def infer(self, swap_instruction: Parsed_Instruction, swap: Swap) -> InferedTransfer:
+    def infer(self, swap_instruction: Parsed_Instruction, swap: Swap, instruction_bytes: Optional[bytes] = None) -> InferedTransfer:
         # Parse swap's inner_instructions
         for instruction in swap_instruction.inner_instructions:
             # Search for program_id
             if instruction.program_address==self.program_address:
                 # Prepare discriminator to match for
                 discriminator_str = self.discriminator
-                instruction_bytes = decode_instruction_data(instruction.data)
+                data_bytes = decode_instruction_data(instruction.data)
                 # Get discriminator from instruction
-                instruction_discriminator = decode_discriminator(instruction_bytes, int(len(discriminator_str)/2))
+                instruction_discriminator = decode_discriminator(data_bytes, int(len(discriminator_str)/2))
 
                 if instruction_discriminator == discriminator_str:
-                    data_bytes = base58.b58decode(instruction.data)
                     _, sol_amount = struct.unpack(self.format_str, data_bytes[:struct.calcsize(self.format_str)])
 
                     return InferedTransfer(TransferType.NATIVE_SOL,
@@ -55,8 +56,8 @@ class SwapInstructionSolTransferInference(NativeSolTransferInference):
     Infer SOL transfer from swap instruction
     Infer the amount of SOL transferred from the instruction data with a format string to unpack the data.
     """
-    def infer(self, swap_instruction: Parsed_Instruction, swap: Swap) -> InferedTransfer:
-        data_bytes = base58.b58decode(swap_instruction.data)
+    def infer(self, swap_instruction: Parsed_Instruction, swap: Swap, instruction_bytes: Optional[bytes] = None) -> InferedTransfer:
+        data_bytes = instruction_bytes if instruction_bytes is not None else decode_instruction_data(swap_instruction.data)
         _, sol_amount = struct.unpack(self.format_str, data_bytes[:struct.calcsize(self.format_str)])
 
         return InferedTransfer(TransferType.NATIVE_SOL,
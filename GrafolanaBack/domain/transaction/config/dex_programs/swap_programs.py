@@ -1,9 +1,11 @@
 from typing import Optional, List, Dict, Tuple
 from dataclasses import dataclass
+import re
 
 from GrafolanaBack.domain.transaction.config.constants import BURN, MINTTO
 from GrafolanaBack.domain.transaction.config.dex_programs.dex_program_struct import *
 from GrafolanaBack.domain.transaction.config.dex_programs.sol_infer import InnerInstructionSolTransferInference, NativeSolTransferInference, SwapInstructionSolTransferInference
+from GrafolanaBack.domain.transaction.utils.instruction_utils import get_discriminator
 
 
 # # DEAD
@@ -2146,6 +2148,72 @@ class SwapProgram:
     description: Optional[str] = None
  
 
+class SwapInstructionMatcher:
+    """
+    Instruction parse params of a swap program compiled for lookup by
+    (discriminator bytes, number of accounts).
+
+    Matches like checking every param in order against the hex encoded instruction data:
+    the first param whose discriminator, accounts length, terminator and byte value all
+    match wins. Params whose discriminator is not lowercase hex of whole bytes never
+    matched the hex encoded data and are left out.
+    """
+    _HEX_DISCRIMINATOR = re.compile(r"^(?:[0-9a-f]{2})+$")
+
+    def __init__(self, program: SwapProgram):
+        self.program = program
+        # (discriminator, accounts length or None) -> [(param order, param)]
+        self._index: Dict[Tuple[bytes, Optional[int]], List[Tuple[int, InstructionParseParam]]] = {}
+        discriminator_lengths = set()
+        for order, param in enumerate(program.instruction_parse_param):
+            discriminator = get_discriminator(param.instruction_name) if param.instruction_name is not None else param.discriminator
+            if not isinstance(discriminator, str) or not self._HEX_DISCRIMINATOR.match(discriminator):
+                continue
+            discriminator_bytes = bytes.fromhex(discriminator)
+            discriminator_lengths.add(len(discriminator_bytes))
+            self._index.setdefault((discriminator_bytes, param.accounts_length), []).append((order, param))
+        self._discriminator_lengths = sorted(discriminator_lengths)
+
+    @staticmethod
+    def _hex_digit(instruction_bytes: bytes, position: int) -> Optional[str]:
+        """Character at position in instruction_bytes.hex(), without encoding the whole data"""
+        if position < 0:
+            position += 2 * len(instruction_bytes)
+        if position < 0 or position >= 2 * len(instruction_bytes):
+            return None
+        byte = instruction_bytes[position // 2]
+        return "%x" % (byte & 0x0F if position % 2 else byte >> 4)
+
+    def match(self, instruction_bytes: bytes, accounts_length: int) -> Optional[InstructionParseParam]:
+        """
+        Find the parse param of an instruction.
+
+        Args:
+            instruction_bytes: Decoded instruction data
+            accounts_length: Number of accounts of the instruction
+
+        Returns:
+            The first matching param, or None if the instruction is not a known swap
+        """
+        candidates = []
+        for length in self._discriminator_lengths:
+            prefix = instruction_bytes[:length]
+            candidates.extend(self._index.get((prefix, accounts_length), ()))
+            candidates.extend(self._index.get((prefix, None), ()))
+        if len(candidates) > 1:
+            candidates.sort(key=lambda candidate: candidate[0])
+
+        for _, param in candidates:
+            if param.terminator is not None and self._hex_digit(instruction_bytes, -1) != param.terminator:
+                continue
+            if param.byte_value is not None:
+                position, value = param.byte_value
+                if self._hex_digit(instruction_bytes, position) != value:
+                    continue
+            return param
+        return None
+
+
 # Define the SwapPrograms class with typed attributes
 class SwapPrograms:
     # Explicitly annotated attributes for each SWAP program
@@ -2216,11 +2284,13 @@ class SwapPrograms:
 
     def __init__(self, programs_dict: Dict[str, dict]):
         self.__program_map__: Dict[str, SwapProgram] = {}
+        self.__matcher_map__: Dict[str, SwapInstructionMatcher] = {}
         for swap_name, program_data in programs_dict.items():
             program_obj = self._create_program_object(program_data)
             # Set the attribute dynamically, but with type hints already defined
             setattr(self, swap_name, program_obj)
             self.__program_map__[program_data[PROGRAM_ADDRESS]] = program_obj
+            self.__matcher_map__[program_data[PROGRAM_ADDRESS]] = SwapInstructionMatcher(program_obj)
     def _create_program_object(self, program_data: dict) -> SwapProgram:
         instruction_parse_params = [
             InstructionParseParam(
@@ -2258,5 +2328,8 @@ class SwapPrograms:
     def get_map(self) -> Dict[str, SwapProgram]:
         return self.__program_map__
 
+    def get_matcher(self, program_address: str) -> Optional[SwapInstructionMatcher]:
+        return self.__matcher_map__.get(program_address)
+
 # Instantiate the class
 SWAP_PROGRAMS = SwapPrograms(swap_programs_data)
\ No newline at end of file
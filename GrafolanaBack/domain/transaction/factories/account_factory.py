@@ -1,13 +1,11 @@
 from typing import Dict, List, Optional, Set
-from solders.transaction_status import UiTransactionTokenBalance
 
-from GrafolanaBack.domain.metadata.program.system_programs import SYSTEM_PROGRAMS
-from GrafolanaBack.domain.transaction.config.dex_programs.dex_program_struct import PROGRAM_ADDRESS
-from GrafolanaBack.domain.transaction.config.dex_programs.swap_programs import SWAP_PROGRAMS
+from GrafolanaBack.domain.metadata.program.program_registry import PROGRAM_REGISTRY
 from GrafolanaBack.domain.transaction.models.account import Account, AccountType, AccountVersion
 from GrafolanaBack.domain.transaction.repositories.account_repository import AccountRepository
 from GrafolanaBack.domain.transaction.config.constants import FEE, SOL, WRAPPED_SOL_ADDRESS
 from GrafolanaBack.domain.transaction.models.transaction_context import TransactionContext
+from GrafolanaBack.domain.transaction.utils.transaction_decoder import TokenBalance
 
 
 class AccountFactory:
@@ -46,8 +44,8 @@ class AccountFactory:
     
     def build_accounts_from_transaction(
             repo: AccountRepository,
-            pre_token_balances: List[UiTransactionTokenBalance],
-            post_token_balances: List[UiTransactionTokenBalance],
+            pre_token_balances: List[TokenBalance],
+            post_token_balances: List[TokenBalance],
             pre_balances: List[int],
             account_addresses: List[str],
             signer_wallets: Set[str],
@@ -65,18 +63,15 @@ class AccountFactory:
         """
         mints: Set[str] = set()
 
-        swap_addresses = [ swap_program.program_address for swap_program in SWAP_PROGRAMS.get_map().values() ]
-        system_program_addresses = [ system_program[PROGRAM_ADDRESS] for system_program in SYSTEM_PROGRAMS.values()]
-
         # Process pre_token_balances
         for pre_token_balance in pre_token_balances:
             account_index = pre_token_balance.account_index
             if account_index < len(account_addresses):
                 address = account_addresses[account_index]
-                mint = str(pre_token_balance.mint)
+                mint = pre_token_balance.mint
                 mints.add(mint)
-                owner = str(pre_token_balance.owner) if hasattr(pre_token_balance, 'owner') and pre_token_balance.owner else None
-                amount = pre_token_balance.ui_token_amount.amount
+                owner = pre_token_balance.owner
+                amount = pre_token_balance.amount
                 
                 # Create account if it doesn't exist
                 if not repo.get_account(address):
@@ -122,7 +117,7 @@ class AccountFactory:
                 mint_account.mint_address = mint
 
         for account in repo.get_all_accounts():
-            if account.address in swap_addresses or account.address in system_program_addresses:
+            if PROGRAM_REGISTRY.is_program(account.address):
                 account.type = AccountType.PROGRAM_ACCOUNT
             
 
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 from enum import Enum, auto
 from solders.pubkey import Pubkey
@@ -19,20 +19,30 @@ class AccountType(str, Enum):
     PROGRAM_ACCOUNT = "PROGRAM_ACCOUNT"
     UNKNOWN = "UNKNOWN"
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     """
     Represents an account on the Solana blockchain.
     
     Accounts can hold tokens (SPL tokens) or SOL, and may represent 
     various entities like wallets, token accounts, pools, etc.
+
+    An Account is shared by all its versions. Authorities are an immutable tuple
+    replaced on write, so accounts without authorities share the empty tuple.
     """
     address: str
     type: AccountType = AccountType.UNKNOWN
     mint_address: str = None
     is_pool: bool = False
-    authorities: List[str] = field(default_factory=list)
-    metadata: Optional[Dict] = field(default_factory=dict)
+    authorities: Tuple[str, ...] = ()
+    metadata: Optional[Dict] = None
+
+    def add_authority(self, authority: str) -> bool:
+        """Add an authority to the account, returns False if it was already there"""
+        if authority in self.authorities:
+            return False
+        self.authorities = self.authorities + (authority,)
+        return True
     
     @property
     def is_token_account(self) -> bool:
@@ -49,13 +59,14 @@ class Account:
         """Check if this is a special system account (burn, mint, fee)"""
         return self.type in (AccountType.BURN_ACCOUNT, AccountType.MINTTO_ACCOUNT, AccountType.FEE_ACCOUNT)
 
-@dataclass
+@dataclass(slots=True)
 class AccountVersion:
     """
     Represents a specific version of an account at a point in time.
     
     The Solana blockchain doesn't have the concept of versions, but for transaction
     analysis, we need to track how account states change during a transaction.
+    Only the owner and balances belong to a version, the Account is shared.
     """
     version: int
     account: Account
@@ -79,6 +90,25 @@ class AccountVersion:
         """Get the account type"""
         return self.account.type
     
+    def clone(self, version: Optional[int] = None) -> AccountVersion:
+        """
+        Copy this version, sharing its Account.
+        
+        Args:
+            version: Version number of the copy, the same as this version if None
+        
+        Returns:
+            A new AccountVersion with the same owner and balances
+        """
+        return AccountVersion(
+            version=self.version if version is None else version,
+            account=self.account,
+            transaction_signature=self.transaction_signature,
+            owner=self.owner,
+            balance_token=self.balance_token,
+            balance_lamport=self.balance_lamport
+        )
+
     def get_vertex(self) -> AccountVertex:
         """Get a graph vertex representation of this account version"""
         return AccountVertex(self.account.address, self.version, self.transaction_signature)
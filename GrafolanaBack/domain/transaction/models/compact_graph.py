@@ -0,0 +1,419 @@
+from __future__ import annotations
+from array import array
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import networkx as nx
+
+from GrafolanaBack.domain.transaction.models.account import AccountVertex
+from GrafolanaBack.domain.transaction.models.graph import TransactionGraph, TransferProperties, TransferType
+from GrafolanaBack.domain.transaction.utils.address_table import AddressTable
+
+# TransferType <-> one byte code stored per edge
+TRANSFER_TYPES: Tuple[TransferType, ...] = tuple(TransferType)
+TRANSFER_TYPE_CODES: Dict[TransferType, int] = {transfer_type: code for code, transfer_type in enumerate(TRANSFER_TYPES)}
+
+# Stored in the swap id columns for edges without that swap id
+NO_SWAP = -1
+# Stored in the source column of removed edges
+REMOVED = -1
+# Stored in the program address column of edges without a program address
+NO_ADDRESS = -1
+
+class CompactTransactionGraph(TransactionGraph):
+    """
+    Transaction graph with the same interface as TransactionGraph, without NetworkX.
+
+    Vertices are numbered in insertion order and edges are stored column-wise:
+    parallel arrays for endpoints, keys, transfer type codes, program address ids
+    (see AddressTable) and swap ids, and lists for amounts. Each vertex only keeps
+    the lists of its outgoing and incoming edge ids. Edge data dicts are only built
+    when edges are read, so a transfer costs a few dozen bytes instead of the
+    several hundred of a NetworkX edge.
+
+    Edges are returned in the order NetworkX would return them, so both engines
+    produce the same graph data. There is no underlying NetworkX `graph`: read the
+    graph through get_nodes() and get_edges().
+    """
+
+    def __init__(self, address_table: Optional[AddressTable] = None):
+        """Initialize an empty transaction graph, sharing the address table of its account repository if given"""
+        self.address_table = address_table if address_table is not None else AddressTable()
+        self._next_key = 10  # Starting key value for edges
+        self._order: Optional[Dict[AccountVertex, int]] = {}
+        self._next_order = 0
+        self._cyclic = False
+
+        # Vertex id -> vertex (None once removed)
+        self._vertices: List[Optional[AccountVertex]] = []
+        self._vertex_ids: Dict[AccountVertex, int] = {}
+        # Vertex id -> ids of its outgoing / incoming edges
+        self._out_edges: List[List[int]] = []
+        self._in_edges: List[List[int]] = []
+        self._edge_count = 0
+
+        # Edge columns, indexed by edge id
+        self._sources = array('q')
+        self._targets = array('q')
+        self._keys = array('q')
+        self._transfer_types = array('B')
+        self._program_address_ids = array('q')
+        self._amounts_source: List[int] = []
+        self._amounts_destination: List[int] = []
+        self._swap_ids = array('q')
+        self._swap_parent_ids = array('q')
+        self._parent_router_swap_ids = array('q')
+        self._init_indexes()
+
+    def _get_vertex_id(self, vertex: AccountVertex) -> int:
+        vertex_id = self._vertex_ids.get(vertex)
+        if vertex_id is None:
+            vertex_id = len(self._vertices)
+            self._vertex_ids[vertex] = vertex_id
+            self._vertices.append(vertex)
+            self._out_edges.append([])
+            self._in_edges.append([])
+            self._index_node(vertex)
+        return vertex_id
+
+    def add_node(self, vertex: AccountVertex) -> None:
+        """
+        Add an account vertex to the graph if it doesn't already exist.
+
+        Args:
+            vertex: The account vertex to add
+        """
+        if vertex not in self._vertex_ids:
+            self._get_vertex_id(vertex)
+            self._append_to_order(vertex)
+
+    def has_node(self, vertex: AccountVertex) -> bool:
+        """
+        Check if an account vertex exists in the graph.
+
+        Args:
+            vertex: The account vertex to check
+
+        Returns:
+            True if the vertex exists, False otherwise
+        """
+        return vertex in self._vertex_ids
+
+    def get_nodes(self) -> List[AccountVertex]:
+        """
+        Get all account vertices of the graph, in insertion order.
+
+        Returns:
+            List of account vertices
+        """
+        return [vertex for vertex in self._vertices if vertex is not None]
+
+    def number_of_nodes(self) -> int:
+        """Number of account vertices in the graph"""
+        return len(self._vertex_ids)
+
+    def number_of_edges(self) -> int:
+        """Number of transfers in the graph"""
+        return self._edge_count
+
+    def add_edge(self,
+                source: AccountVertex,
+                target: AccountVertex,
+                transfer_properties: TransferProperties,
+                key:int = None) -> int:
+        """
+        Add an edge between two account vertices.
+
+        Args:
+            source: The source account vertex
+            target: The target account vertex
+            edge_properties: Properties of the edge
+
+        Returns:
+            The key of the new edge
+        """
+        # Generate a key if not provided
+        if key is None:
+            key = self._next_key
+            self._next_key += 10
+
+        self._add_edge(
+            source,
+            target,
+            key,
+            transfer_properties.transfer_type,
+            transfer_properties.program_address,
+            transfer_properties.amount_source,
+            transfer_properties.amount_destination,
+            transfer_properties.swap_id,
+            transfer_properties.swap_parent_id,
+            transfer_properties.parent_router_swap_id,
+        )
+        self._order_edge(source, target)
+
+        return key
+
+    def _add_edge(self,
+                  source: AccountVertex,
+                  target: AccountVertex,
+                  key: int,
+                  transfer_type: TransferType,
+                  program_address: Optional[str],
+                  amount_source: int,
+                  amount_destination: int,
+                  swap_id: Optional[int],
+                  swap_parent_id: Optional[int],
+                  parent_router_swap_id: Optional[int]) -> None:
+        source_id = self._get_vertex_id(source)
+        target_id = self._get_vertex_id(target)
+        transfer_type_code = TRANSFER_TYPE_CODES[transfer_type]
+
+        # Like NetworkX, adding an existing (source, target, key) edge updates its data,
+        # swap ids missing from the new transfer are kept
+        for edge_id in self._out_edges[source_id]:
+            if self._targets[edge_id] == target_id and self._keys[edge_id] == key:
+                self._unindex_edge(edge_id, self._indexed_values(edge_id))
+                self._transfer_types[edge_id] = transfer_type_code
+                self._program_address_ids[edge_id] = self._get_address_id(program_address)
+                self._amounts_source[edge_id] = amount_source
+                self._amounts_destination[edge_id] = amount_destination
+                if swap_id is not None:
+                    self._swap_ids[edge_id] = swap_id
+                if swap_parent_id is not None:
+                    self._swap_parent_ids[edge_id] = swap_parent_id
+                if parent_router_swap_id is not None:
+                    self._parent_router_swap_ids[edge_id] = parent_router_swap_id
+                self._index_edge(edge_id, self._indexed_values(edge_id))
+                return
+
+        edge_id = len(self._sources)
+        self._sources.append(source_id)
+        self._targets.append(target_id)
+        self._keys.append(key)
+        self._transfer_types.append(transfer_type_code)
+        self._program_address_ids.append(self._get_address_id(program_address))
+        self._amounts_source.append(amount_source)
+        self._amounts_destination.append(amount_destination)
+        self._swap_ids.append(NO_SWAP if swap_id is None else swap_id)
+        self._swap_parent_ids.append(NO_SWAP if swap_parent_id is None else swap_parent_id)
+        self._parent_router_swap_ids.append(NO_SWAP if parent_router_swap_id is None else parent_router_swap_id)
+        self._out_edges[source_id].append(edge_id)
+        self._in_edges[target_id].append(edge_id)
+        self._edge_count += 1
+        self._index_edge(edge_id, self._indexed_values(edge_id))
+
+    def _get_address_id(self, address: Optional[str]) -> int:
+        return NO_ADDRESS if address is None else self.address_table.get_id(address)
+
+    def _get_address(self, address_id: int) -> Optional[str]:
+        return None if address_id == NO_ADDRESS else self.address_table.get_address(address_id)
+
+    def _edge_data(self, edge_id: int) -> Dict[str, Any]:
+        """Edge data dict, as TransferProperties.to_dict builds it for NetworkX"""
+        data = {
+            "transfer_type": TRANSFER_TYPES[self._transfer_types[edge_id]],
+            "program_address": self._get_address(self._program_address_ids[edge_id]),
+            "amount_source": self._amounts_source[edge_id],
+            "amount_destination": self._amounts_destination[edge_id],
+        }
+        if self._swap_ids[edge_id] != NO_SWAP:
+            data["swap_id"] = self._swap_ids[edge_id]
+        if self._swap_parent_ids[edge_id] != NO_SWAP:
+            data["swap_parent_id"] = self._swap_parent_ids[edge_id]
+        if self._parent_router_swap_ids[edge_id] != NO_SWAP:
+            data["parent_router_swap_id"] = self._parent_router_swap_ids[edge_id]
+        return data
+
+    def _indexed_values(self, edge_id: int) -> Dict[str, Any]:
+        """Values of the INDEXED_EDGE_PROPERTIES of an edge"""
+        swap_parent_id = self._swap_parent_ids[edge_id]
+        parent_router_swap_id = self._parent_router_swap_ids[edge_id]
+        return {
+            "transfer_type": TRANSFER_TYPES[self._transfer_types[edge_id]],
+            "swap_parent_id": None if swap_parent_id == NO_SWAP else swap_parent_id,
+            "parent_router_swap_id": None if parent_router_swap_id == NO_SWAP else parent_router_swap_id,
+        }
+
+    def _iter_edge_ids(self) -> Iterator[int]:
+        """
+        Edge ids in NetworkX MultiDiGraph.edges order: by source vertex, then by target
+        vertex in the order it was first linked from the source, then by insertion.
+        """
+        targets = self._targets
+        for edge_ids in self._out_edges:
+            if len(edge_ids) < 2:
+                yield from edge_ids
+                continue
+            by_target: Dict[int, List[int]] = {}
+            for edge_id in edge_ids:
+                by_target.setdefault(targets[edge_id], []).append(edge_id)
+            for target_edge_ids in by_target.values():
+                yield from target_edge_ids
+
+    def _get_edge(self, edge_id: int) -> Tuple[AccountVertex, AccountVertex, int, Dict[str, Any]]:
+        return (self._vertices[self._sources[edge_id]], self._vertices[self._targets[edge_id]], self._keys[edge_id], self._edge_data(edge_id))
+
+    def _iter_edges(self) -> Iterator[Tuple[AccountVertex, AccountVertex, int, Dict[str, Any]]]:
+        return map(self._get_edge, self._iter_edge_ids())
+
+    def get_edge_data(self, source: AccountVertex, target: AccountVertex) -> Dict[int, Dict[str, Any]]:
+        """
+        Get data for all edges between source and target.
+
+        Args:
+            source: The source account vertex
+            target: The target account vertex
+
+        Returns:
+            Dictionary mapping edge keys to edge data
+        """
+        source_id = self._vertex_ids.get(source)
+        target_id = self._vertex_ids.get(target)
+        if source_id is None or target_id is None:
+            return {}
+        return {
+            self._keys[edge_id]: self._edge_data(edge_id)
+            for edge_id in self._out_edges[source_id]
+            if self._targets[edge_id] == target_id
+        }
+
+    def _successors(self, vertex: AccountVertex):
+        targets = self._targets
+        vertices = self._vertices
+        # Distinct successors, like MultiDiGraph.successors
+        return [vertices[target_id] for target_id in dict.fromkeys(targets[edge_id] for edge_id in self._out_edges[self._vertex_ids[vertex]])]
+
+    def _predecessors(self, vertex: AccountVertex):
+        sources = self._sources
+        vertices = self._vertices
+        return [vertices[source_id] for source_id in dict.fromkeys(sources[edge_id] for edge_id in self._in_edges[self._vertex_ids[vertex]])]
+
+    def _topological_sort(self):
+        # Kahn's algorithm on vertex ids
+        in_degrees = {vertex_id: len(self._in_edges[vertex_id]) for vertex_id in self._vertex_ids.values()}
+        ready = deque(vertex_id for vertex_id, degree in in_degrees.items() if degree == 0)
+        ordered = []
+        while ready:
+            vertex_id = ready.popleft()
+            ordered.append(self._vertices[vertex_id])
+            for edge_id in self._out_edges[vertex_id]:
+                target_id = self._targets[edge_id]
+                in_degrees[target_id] -= 1
+                if in_degrees[target_id] == 0:
+                    ready.append(target_id)
+        if len(ordered) != len(in_degrees):
+            raise nx.NetworkXUnfeasible("Graph contains a cycle")
+        return ordered
+
+    def _shortest_path_parents(self, source_id: int, target_id: int) -> Optional[Dict[int, int]]:
+        """Breadth first search from source, returns the parent of each visited vertex id or None if target is unreachable"""
+        parents = {source_id: source_id}
+        queue = deque([source_id])
+        while queue:
+            vertex_id = queue.popleft()
+            if vertex_id == target_id:
+                return parents
+            for edge_id in self._out_edges[vertex_id]:
+                next_id = self._targets[edge_id]
+                if next_id not in parents:
+                    parents[next_id] = vertex_id
+                    queue.append(next_id)
+        return None
+
+    def _get_existing_vertex_id(self, vertex: AccountVertex) -> int:
+        vertex_id = self._vertex_ids.get(vertex)
+        if vertex_id is None:
+            raise nx.NodeNotFound(f"Node {vertex} is not in the graph")
+        return vertex_id
+
+    def _search_path(self, source: AccountVertex, target: AccountVertex) -> bool:
+        source_id = self._get_existing_vertex_id(source)
+        target_id = self._get_existing_vertex_id(target)
+        return self._shortest_path_parents(source_id, target_id) is not None
+
+    def get_shortest_path(self, source: AccountVertex, target: AccountVertex) -> List[AccountVertex]:
+        """
+        Find the shortest path between two vertices.
+
+        Args:
+            source: The source account vertex
+            target: The target account vertex
+
+        Returns:
+            List of account vertices forming the path
+
+        Raises:
+            nx.NetworkXNoPath if no path exists
+        """
+        source_id = self._get_existing_vertex_id(source)
+        target_id = self._get_existing_vertex_id(target)
+        parents = self._shortest_path_parents(source_id, target_id)
+        if parents is None:
+            raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+        path = [target_id]
+        while path[-1] != source_id:
+            path.append(parents[path[-1]])
+        return [self._vertices[vertex_id] for vertex_id in reversed(path)]
+
+    def isolate_nodes(self) -> List[AccountVertex]:
+        """
+        Find and return isolated nodes in the graph.
+
+        Returns:
+            List of isolated account vertices
+        """
+        return [
+            vertex for vertex, vertex_id in self._vertex_ids.items()
+            if not self._out_edges[vertex_id] and not self._in_edges[vertex_id]
+        ]
+
+    def remove_nodes(self, nodes: List[AccountVertex]) -> None:
+        """
+        Remove nodes from the graph.
+
+        Args:
+            nodes: List of account vertices to remove
+        """
+        for node in nodes:
+            vertex_id = self._vertex_ids.pop(node, None)
+            if vertex_id is None:
+                continue
+            self._unindex_node(node)
+            removed_edges = set(self._out_edges[vertex_id]) | set(self._in_edges[vertex_id])
+            for edge_id in removed_edges:
+                self._unindex_edge(edge_id, self._indexed_values(edge_id))
+                source_id, target_id = self._sources[edge_id], self._targets[edge_id]
+                if source_id != vertex_id:
+                    self._out_edges[source_id].remove(edge_id)
+                if target_id != vertex_id:
+                    self._in_edges[target_id].remove(edge_id)
+                self._sources[edge_id] = REMOVED
+            self._edge_count -= len(removed_edges)
+            self._vertices[vertex_id] = None
+            self._out_edges[vertex_id] = []
+            self._in_edges[vertex_id] = []
+        self._unorder_nodes(nodes)
+
+    def add_graph(self, graph: TransactionGraph) -> None:
+        """
+        Add another transaction graph to this graph.
+
+        Args:
+            graph: The transaction graph to add
+        """
+        for vertex in graph.get_nodes():
+            self._get_vertex_id(vertex)
+        for source, target, key, data in graph.get_edges():
+            self._add_edge(
+                source,
+                target,
+                key,
+                data["transfer_type"],
+                data.get("program_address"),
+                data.get("amount_source", 0),
+                data.get("amount_destination", 0),
+                data.get("swap_id"),
+                data.get("swap_parent_id"),
+                data.get("parent_router_swap_id"),
+            )
+        self._order = None
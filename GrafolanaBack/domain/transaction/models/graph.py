@@ -1,4 +1,5 @@
 from __future__ import annotations
+import os
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional, Set, Tuple, Any, Generic, TypeVar
@@ -8,10 +9,20 @@ from networkx import Graph
 
 from GrafolanaBack.domain.transaction.models.account import AccountVertex
 from GrafolanaBack.domain.transaction.models.swap import Swap
+from GrafolanaBack.domain.transaction.utils.address_table import AddressTable
 from GrafolanaBack.domain.logging.logging import logger
 
 T = TypeVar('T')
 
+# Edge data properties indexed by TransactionGraph, so the edges of a swap or of a
+# transfer type are found without scanning the graph
+INDEXED_EDGE_PROPERTIES = ("transfer_type", "swap_parent_id", "parent_router_swap_id")
+
+# Graph engine backing transaction graphs:
+#  - "networkx": NetworkX MultiDiGraph keyed by AccountVertex
+#  - "compact": integer vertex ids and edge attributes in parallel arrays, see compact_graph.py
+GRAPH_ENGINE = os.getenv("GRAPH_ENGINE", "networkx").lower()
+
 class TransferType(str, Enum):
     """Types of edges that can exist in the transaction graph"""
     TRANSFER = "TRANSFER"
@@ -85,13 +96,32 @@ class TransactionGraph:
     
     This class wraps NetworkX's MultiDiGraph to provide a domain-specific
     interface for working with transaction graphs.
+
+    The graph builder keeps the graph acyclic (a new account version is created
+    instead of closing a cycle), so a topological order of the vertices is
+    maintained as edges are added. has_path uses it to answer most cycle checks
+    without a traversal. Vertices are also indexed by address id (see AddressTable) and
+    edges by the INDEXED_EDGE_PROPERTIES values, so per swap lookups only touch the swap's edges.
+    Mutations must go through this class to keep the order and indexes valid.
     """
     graph: nx.MultiDiGraph
     
-    def __init__(self):
-        """Initialize an empty transaction graph"""
+    def __init__(self, address_table: Optional[AddressTable] = None):
+        """Initialize an empty transaction graph, sharing the address table of its account repository if given"""
+        self.address_table = address_table if address_table is not None else AddressTable()
         self.graph = nx.MultiDiGraph(directed=True)
         self._next_key = 10  # Starting key value for edges
+        # Topological rank of each vertex, None until rebuilt or while the graph has a cycle
+        self._order: Optional[Dict[AccountVertex, int]] = {}
+        self._next_order = 0
+        self._cyclic = False
+        self._init_indexes()
+
+    def _init_indexes(self) -> None:
+        # Address id -> vertices with that address, in insertion order
+        self._address_index: Dict[int, Dict[AccountVertex, None]] = {}
+        # Indexed property -> value -> edges with that value, in insertion order
+        self._edge_index: Dict[str, Dict[Any, Dict[Any, None]]] = {prop: {} for prop in INDEXED_EDGE_PROPERTIES}
     
     def add_node(self, vertex: AccountVertex) -> None:
         """
@@ -102,6 +132,8 @@ class TransactionGraph:
         """
         if not self.graph.has_node(vertex):
             self.graph.add_node(vertex)
+            self._index_node(vertex)
+            self._append_to_order(vertex)
     
     def has_node(self, vertex: AccountVertex) -> bool:
         """
@@ -114,6 +146,23 @@ class TransactionGraph:
             True if the vertex exists, False otherwise
         """
         return self.graph.has_node(vertex)
+
+    def get_nodes(self) -> List[AccountVertex]:
+        """
+        Get all account vertices of the graph, in insertion order.
+        
+        Returns:
+            List of account vertices
+        """
+        return list(self.graph.nodes())
+
+    def number_of_nodes(self) -> int:
+        """Number of account vertices in the graph"""
+        return self.graph.number_of_nodes()
+
+    def number_of_edges(self) -> int:
+        """Number of transfers in the graph"""
+        return self.graph.number_of_edges()
     
     def has_path(self, source: AccountVertex, target: AccountVertex) -> bool:
         """
@@ -126,8 +175,192 @@ class TransactionGraph:
         Returns:
             True if a path exists, False otherwise
         """
+        order = self._get_order()
+        if order is None or source not in order or target not in order:
+            return self._search_path(source, target)
+        if source == target:
+            return True
+
+        # Every edge goes forward in the topological order, so a path from source
+        # to target can only go through vertices ranked between them
+        target_rank = order[target]
+        if order[source] > target_rank:
+            return False
+        visited = {source}
+        stack = [source]
+        while stack:
+            for successor in self._successors(stack.pop()):
+                if successor == target:
+                    return True
+                if successor not in visited and order[successor] < target_rank:
+                    visited.add(successor)
+                    stack.append(successor)
+        return False
+
+    def _get_order(self) -> Optional[Dict[AccountVertex, int]]:
+        """
+        Returns the topological rank of each vertex, or None if the graph has a cycle.
+        """
+        if self._order is not None and len(self._order) != self.number_of_nodes():
+            # Nodes were added or removed on self.graph directly
+            self._order = None
+        if self._order is None and not self._cyclic:
+            try:
+                self._order = {vertex: rank for rank, vertex in enumerate(self._topological_sort())}
+                self._next_order = len(self._order)
+            except nx.NetworkXUnfeasible:
+                self._cyclic = True
+        return self._order
+
+    # Traversal primitives used by the topological order index, overridden by other graph engines
+
+    def _successors(self, vertex: AccountVertex):
+        return self.graph.successors(vertex)
+
+    def _predecessors(self, vertex: AccountVertex):
+        return self.graph.predecessors(vertex)
+
+    def _topological_sort(self):
+        return nx.topological_sort(self.graph)
+
+    def _search_path(self, source: AccountVertex, target: AccountVertex) -> bool:
         return nx.has_path(self.graph, source, target)
+
+    def _append_to_order(self, vertex: AccountVertex) -> None:
+        if self._order is not None and vertex not in self._order:
+            self._order[vertex] = self._next_order
+            self._next_order += 1
+
+    def _reorder_for_edge(self, source: AccountVertex, target: AccountVertex) -> None:
+        """
+        Restore the topological order after adding an edge from source to target
+        (Pearce-Kelly): only the vertices ranked between target and source are moved.
+        """
+        order = self._order
+        source_rank, target_rank = order[source], order[target]
+        if source_rank < target_rank:
+            return
+
+        # Vertices reachable from target that are ranked before source
+        forward = []
+        visited = {target}
+        stack = [target]
+        while stack:
+            vertex = stack.pop()
+            forward.append(vertex)
+            for successor in self._successors(vertex):
+                if successor == source:
+                    # The edge closed a cycle, has_path falls back to networkx
+                    self._order = None
+                    self._cyclic = True
+                    return
+                if successor not in visited and order[successor] < source_rank:
+                    visited.add(successor)
+                    stack.append(successor)
+
+        # Vertices reaching source that are ranked after target
+        backward = []
+        visited = {source}
+        stack = [source]
+        while stack:
+            vertex = stack.pop()
+            backward.append(vertex)
+            for predecessor in self._predecessors(vertex):
+                if predecessor not in visited and order[predecessor] > target_rank:
+                    visited.add(predecessor)
+                    stack.append(predecessor)
+
+        # Reuse the same ranks, placing everything that reaches source before everything target reaches
+        backward.sort(key=order.__getitem__)
+        forward.sort(key=order.__getitem__)
+        ranks = sorted(order[vertex] for vertex in backward + forward)
+        for vertex, rank in zip(backward + forward, ranks):
+            order[vertex] = rank
+
+    def _order_edge(self, source: AccountVertex, target: AccountVertex) -> None:
+        """Update the topological order for a new edge"""
+        if self._order is not None:
+            self._append_to_order(source)
+            self._append_to_order(target)
+            self._reorder_for_edge(source, target)
+
+    def _unorder_nodes(self, nodes: List[AccountVertex]) -> None:
+        """Update the topological order for removed nodes"""
+        if self._cyclic:
+            # The cycle may be gone, check again on the next has_path
+            self._cyclic = False
+            self._order = None
+        elif self._order is not None:
+            for node in nodes:
+                self._order.pop(node, None)
     
+    def _index_node(self, vertex: AccountVertex) -> None:
+        self._address_index.setdefault(self.address_table.get_id(vertex.address), {})[vertex] = None
+
+    def _unindex_node(self, vertex: AccountVertex) -> None:
+        address_id = self.address_table.find_id(vertex.address)
+        vertices = self._address_index.get(address_id)
+        if vertices is not None:
+            vertices.pop(vertex, None)
+            if not vertices:
+                del self._address_index[address_id]
+
+    def _index_edge(self, edge: Any, data: Dict[str, Any]) -> None:
+        """
+        Add an edge to the property indexes.
+
+        Args:
+            edge: Reference of the edge for the graph engine, (source, target, key) for NetworkX
+            data: Edge data
+        """
+        for prop, index in self._edge_index.items():
+            value = data.get(prop)
+            if value is not None:
+                index.setdefault(value, {})[edge] = None
+
+    def _unindex_edge(self, edge: Any, data: Dict[str, Any]) -> None:
+        for prop, index in self._edge_index.items():
+            value = data.get(prop)
+            edges = index.get(value) if value is not None else None
+            if edges is not None:
+                edges.pop(edge, None)
+                if not edges:
+                    del index[value]
+
+    def _get_indexed_edges(self, filters: Dict[str, Any]) -> Optional[List[Any]]:
+        """
+        Returns the references of the edges matching the most selective indexed filter,
+        or None if no filter is on an indexed property.
+        """
+        candidates = None
+        for prop, value in filters.items():
+            if prop in self._edge_index and value is not None:
+                edges = self._edge_index[prop].get(value, {})
+                if candidates is None or len(edges) < len(candidates):
+                    candidates = edges
+        return None if candidates is None else list(candidates)
+
+    # Edge access primitives used by the indexed queries, overridden by other graph engines
+
+    def _get_edge(self, edge: Tuple[AccountVertex, AccountVertex, int]) -> Tuple[AccountVertex, AccountVertex, int, Dict[str, Any]]:
+        source, target, key = edge
+        return (source, target, key, self.graph[source][target][key])
+
+    def _iter_edges(self):
+        return self.graph.edges(data=True, keys=True)
+
+    def _add_edge_data(self, source: AccountVertex, target: AccountVertex, key: int, data: Dict[str, Any]) -> None:
+        """Add an edge with its data, keeping the indexes up to date"""
+        existing = self.graph.get_edge_data(source, target, key)
+        if existing is not None:
+            # NetworkX updates the data of an existing edge
+            self._unindex_edge((source, target, key), existing)
+        for vertex in (source, target):
+            if not self.graph.has_node(vertex):
+                self._index_node(vertex)
+        self.graph.add_edge(source, target, key=key, **data)
+        self._index_edge((source, target, key), self.graph[source][target][key])
+
     def add_edge(self, 
                 source: AccountVertex, 
                 target: AccountVertex, 
@@ -150,12 +383,9 @@ class TransactionGraph:
             self._next_key += 10
         
         # Add the edge
-        self.graph.add_edge(
-            source, 
-            target, 
-            key=key,
-            **transfer_properties.to_dict()
-        )
+        self._add_edge_data(source, target, key, transfer_properties.to_dict())
+
+        self._order_edge(source, target)
         
         return key
     
@@ -175,6 +405,9 @@ class TransactionGraph:
     def get_edges(self, **filters) -> List[Tuple[AccountVertex, AccountVertex, int, Dict[str, Any]]]:
         """
         Get edges from the graph, optionally filtered by properties.
+
+        Edges filtered on an indexed property come from the index, in the order
+        they were added, other edges are in graph order.
         
         Args:
             **filters: Edge data properties to filter by
@@ -183,12 +416,20 @@ class TransactionGraph:
             List of (source, target, key, data) tuples
         """
         if not filters:
-            return list(self.graph.edges(data=True, keys=True))
-        
+            return list(self._iter_edges())
+
+        indexed_edges = self._get_indexed_edges(filters)
+        edges = self._iter_edges() if indexed_edges is None else map(self._get_edge, indexed_edges)
         return [
-            (u, v, k, data) for u, v, k, data in self.graph.edges(data=True, keys=True)
+            (u, v, k, data) for u, v, k, data in edges
             if all(data.get(key) == value for key, value in filters.items())
         ]
+
+    def _build_subgraph(self, prop: str, value: Any) -> MultiDiGraph:
+        """NetworkX graph of the edges whose indexed property equals value"""
+        subgraph = nx.MultiDiGraph(directed=True)
+        subgraph.add_edges_from(map(self._get_edge, self._edge_index[prop].get(value, ())))
+        return subgraph
     
     def get_subgraph_by_swap_id(self, swap_id: int) -> nx.MultiDiGraph:
         """
@@ -200,12 +441,7 @@ class TransactionGraph:
         Returns:
             NetworkX MultiDiGraph containing only the relevant edges
         """
-        swap_edges = [
-            (u, v, k) for u, v, k, data in self.graph.edges(data=True, keys=True) 
-            if data.get('swap_parent_id') == swap_id
-        ]
-        
-        return self.graph.edge_subgraph(swap_edges)
+        return self._build_subgraph('swap_parent_id', swap_id)
     
     def get_shortest_path(self, source: AccountVertex, target: AccountVertex) -> List[AccountVertex]:
         """
@@ -233,7 +469,7 @@ class TransactionGraph:
         Returns:
             List of AccountVertex objects with the given address
         """
-        return [v for v in self.graph.nodes() if v.address == address]
+        return list(self._address_index.get(self.address_table.find_id(address), ()))
     
     def isolate_nodes(self) -> List[AccountVertex]:
         """
@@ -251,7 +487,16 @@ class TransactionGraph:
         Args:
             nodes: List of account vertices to remove
         """
+        for node in nodes:
+            if not self.graph.has_node(node):
+                continue
+            self._unindex_node(node)
+            for source, target, key, data in self.graph.out_edges(node, keys=True, data=True):
+                self._unindex_edge((source, target, key), data)
+            for source, target, key, data in self.graph.in_edges(node, keys=True, data=True):
+                self._unindex_edge((source, target, key), data)
         self.graph.remove_nodes_from(nodes)
+        self._unorder_nodes(nodes)
     
     # def to_dict(self) -> Dict[str, Any]:
     #     """
@@ -325,16 +570,22 @@ class TransactionGraph:
         # Determine which field to filter by based on swap.router property
         filter_field = 'parent_router_swap_id' if swap.router else 'swap_parent_id'
         
-        # Get all edges with this swap using the appropriate field
-        swap_edges = [(u, v, k) for u, v, k, data in self.graph.edges(data=True, keys=True) 
-                    if data.get(filter_field) == swap.id]
+        # Build a new graph from the indexed edges of this swap
+        subgraph = self._build_subgraph(filter_field, swap.id)
         
-        if not swap_edges:
+        if subgraph.number_of_edges() == 0:
             logger.warning(f"No edges found for swap {swap.id}")
             return
         
-        # Create a new subgraph with just these edges
-        return MultiDiGraph.edge_subgraph(self.graph, swap_edges)
+        return subgraph
+    
+    def get_swap_edges(self, swap: Swap) -> List[Tuple[AccountVertex, AccountVertex, int, Dict[str, Any]]]:
+        """
+        The edges of create_subgraph_for_swap, as (source, target, key, data) in the order
+        they were added, without building a NetworkX graph.
+        """
+        filter_field = 'parent_router_swap_id' if swap.router else 'swap_parent_id'
+        return list(map(self._get_edge, self._edge_index[filter_field].get(swap.id, ())))
     
     @staticmethod
     def get_last_transfer(path: Dict, graph: MultiDiGraph)-> Tuple[AccountVertex,AccountVertex,Dict]:
@@ -351,7 +602,38 @@ class TransactionGraph:
         Args:
             graph: The transaction graph to add
         """
-        nx.union(self.graph, graph.graph, self.graph)
+        for vertex in graph.get_nodes():
+            if not self.graph.has_node(vertex):
+                self.graph.add_node(vertex)
+                self._index_node(vertex)
+        for source, target, key, data in graph.get_edges():
+            self._add_edge_data(source, target, key, data)
+        self._order = None
+
+    def release_order(self) -> None:
+        """
+        Release the topological order once the graph is built.
+        It is rebuilt on the next has_path call.
+        """
+        self._order = None
+        self._next_order = 0
+        self._cyclic = False
+
+def create_transaction_graph(address_table: Optional[AddressTable] = None) -> TransactionGraph:
+    """
+    Create an empty transaction graph backed by the engine selected with GRAPH_ENGINE.
+    
+    Args:
+        address_table: Address table shared with the transaction's account repository, a new one if None
+    
+    Returns:
+        A TransactionGraph, or a CompactTransactionGraph when GRAPH_ENGINE is "compact"
+    """
+    if GRAPH_ENGINE == "compact":
+        # Imported here: compact_graph extends TransactionGraph
+        from GrafolanaBack.domain.transaction.models.compact_graph import CompactTransactionGraph
+        return CompactTransactionGraph(address_table)
+    return TransactionGraph(address_table)
 
 class GraphWorkspace:
     """
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 
 from requests import Session
 from GrafolanaBack.domain.transaction.models.account import AccountVersion
-from GrafolanaBack.domain.transaction.models.graph import TransactionGraph, TransferProperties, TransferType
+from GrafolanaBack.domain.transaction.models.graph import TransactionGraph, TransferProperties, TransferType, create_transaction_graph
 from GrafolanaBack.domain.transaction.models.transaction_context import TransactionContext
 from GrafolanaBack.domain.rpc.rpc_connection_utils import client
 from GrafolanaBack.domain.rpc.rpc_web_api import get_block_signatures
@@ -13,14 +13,14 @@ class Graphspace:
     """
     Class representing a graphspace which is a collection of transaction contexts 
     with their respective graphs merged into a single graph and accounts linked together.
-    
+    The merged graph numbers the addresses of all the transactions in its own address table.
     """
     transaction_contexts: Dict[str, TransactionContext]
     graph: TransactionGraph
 
     def __init__(self, transaction_contexts: Dict[str, TransactionContext]):
         self.transaction_contexts = transaction_contexts
-        self.graph = TransactionGraph()
+        self.graph = create_transaction_graph()
         self._build_graph()
 
     def _get_transaction_signatures_from_slot(self, slot: int) -> Optional[List[str]]:
@@ -33,7 +33,8 @@ class Graphspace:
         """
         Build the transaction graph from the transaction contexts.
         
-        This method iterates through all transaction contexts and adds their graphs to the main graph.
+        This method iterates through all transaction contexts and adds their graphs to the main graph,
+        which uses the engine selected with GRAPH_ENGINE (compact arrays with GRAPH_ENGINE=compact).
         """
         # # First, we need to order the transactions contexts chronologically
         # # Some transactions may share the same slot, 
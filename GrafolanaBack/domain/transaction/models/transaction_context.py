@@ -4,6 +4,7 @@ from GrafolanaBack.domain.transaction.models.graph import TransactionGraph
 from GrafolanaBack.domain.transaction.models.swap import Swap, TransferAccountAddresses
 from GrafolanaBack.domain.transaction.repositories.account_repository import AccountRepository
 from GrafolanaBack.domain.logging.logging import logger
+from GrafolanaBack.domain.performance.parser_profiler import ParserProfile
 from GrafolanaBack.domain.transaction.utils.instruction_utils import Parsed_Instruction
 
 class TransactionContext:
@@ -28,7 +29,11 @@ class TransactionContext:
     swap_id_counter: int
     instructions: List[Parsed_Instruction]
     isomorphic_group: int = None
+    # Shared by transactions with isomorphic graphs, computed at parse time (GraphService.structure_fingerprint)
+    structure_fingerprint: Optional[str] = None
     err: str = None
+    # Set when the transaction is parsed with profiling
+    profile: Optional[ParserProfile] = None
     
     def __init__(
         self,
@@ -43,6 +48,7 @@ class TransactionContext:
         compute_units_consumed: int,
         instructions: List[Parsed_Instruction],
         err: str = None,
+        profile: Optional[ParserProfile] = None,
     ):
         self.slot = slot
         self.transaction_signature = transaction_signature
@@ -59,7 +65,16 @@ class TransactionContext:
         self.swap_id_counter = 0
         self.err = err
         self.instructions = instructions
+        self.profile = profile
         
+    def compact(self) -> None:
+        """
+        Release what is only needed while parsing: the instruction tree and the graph's
+        topological order. The graph, accounts and swaps read by GraphService are kept.
+        """
+        self.instructions = []
+        self.graph.release_order()
+
     def compute_priority_fee(self, micro_lamport: int) -> None:
         """
         Calculate the priority fee based on compute units consumed.
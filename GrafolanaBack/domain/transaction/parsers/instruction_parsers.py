@@ -13,6 +13,11 @@ from GrafolanaBack.domain.logging.logging import logger
 class InstructionParser(ABC):
     """Base class for instruction parsers using the Strategy pattern."""
     
+    # (program name or address, parsed instruction type) pairs routed to this parser by
+    # InstructionParserService. Use None as type for instructions the RPC does not parse.
+    # Parsers without keys are tried on every instruction.
+    dispatch_keys: Tuple[Tuple[str, Optional[str]], ...] = ()
+    
     @abstractmethod
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         """Check if this parser can parse the given instruction."""
@@ -27,6 +32,8 @@ class InstructionParser(ABC):
 class SystemTransferParser(InstructionParser):
     """Parser for System Program transfer instructions."""
     
+    dispatch_keys = (("system", "transfer"),)
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "system" and 
                 instruction.parsed is not None and 
@@ -80,6 +87,8 @@ class SystemTransferParser(InstructionParser):
 class TokenTransferParser(InstructionParser):
     """Parser for Token Program transfer instructions."""
     
+    dispatch_keys = (("spl-token", "transfer"),)
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "spl-token" and 
                 instruction.parsed is not None and 
@@ -136,6 +145,8 @@ class TokenTransferParser(InstructionParser):
 class TokenTransferCheckedParser(InstructionParser):
     """Parser for Token Program transferChecked instructions."""
     
+    dispatch_keys = (("spl-token", "transferChecked"),)
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "spl-token" and 
                 instruction.parsed is not None and 
@@ -196,6 +207,8 @@ class TokenTransferCheckedParser(InstructionParser):
 class CreateAccountParser(InstructionParser):
     """Parser for System Program createAccount instructions."""
     
+    dispatch_keys = (("system", "createAccountWithSeed"), ("system", "createAccount"))
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "system" and 
                 instruction.parsed is not None and 
@@ -246,6 +259,8 @@ class CreateAccountParser(InstructionParser):
 class CloseAccountParser(InstructionParser):
     """Parser for Token Program closeAccount instructions."""
     
+    dispatch_keys = (("spl-token", "closeAccount"),)
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "spl-token" and 
                 instruction.parsed is not None and 
@@ -300,6 +315,8 @@ class CloseAccountParser(InstructionParser):
 class BurnParser(InstructionParser):
     """Parser for Token Program burn instructions."""
     
+    dispatch_keys = (("spl-token", "burn"),)
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "spl-token" and 
                 instruction.parsed is not None and 
@@ -327,6 +344,8 @@ class BurnParser(InstructionParser):
 class MintToParser(InstructionParser):
     """Parser for Token Program mintTo instructions."""
     
+    dispatch_keys = (("spl-token", "mintTo"),)
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "spl-token" and 
                 instruction.parsed is not None and 
@@ -353,6 +372,8 @@ class MintToParser(InstructionParser):
 class SyncNativeParser(InstructionParser):
     """Parser for Token Program syncNative instructions (converts lamports to wrapped SOL)."""
     
+    dispatch_keys = (("spl-token", "syncNative"),)
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "spl-token" and 
                 instruction.parsed is not None and 
@@ -362,7 +383,7 @@ class SyncNativeParser(InstructionParser):
         account_address = str(instruction.parsed["info"]["account"])
 
         mint_address = WRAPPED_SOL_ADDRESS
-        account_version = context.account_repository.account_versions.get(account_address)[-1]
+        account_version = context.account_repository.get_versions(account_address)[-1]
         account_version.account.mint_address = mint_address
         account_version.account.type = AccountType.TOKEN_ACCOUNT
 
@@ -374,6 +395,8 @@ class SyncNativeParser(InstructionParser):
 class InitializeParser(InstructionParser):
     """Parser for Token Program syncNative instructions (converts lamports to wrapped SOL)."""
     
+    dispatch_keys = (("spl-token", "initializeAccount"), ("spl-token", "initializeAccount2"), ("spl-token", "initializeAccount3"))
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "spl-token" and 
                 instruction.parsed is not None and 
@@ -384,7 +407,7 @@ class InitializeParser(InstructionParser):
         mint_address = str(instruction.parsed["info"]["mint"])
         owner = str(instruction.parsed["info"]["owner"])
 
-        account_version = context.account_repository.account_versions.get(account_address)[-1]
+        account_version = context.account_repository.get_versions(account_address)[-1]
         account_version.account.mint_address = mint_address
         account_version.account.type = AccountType.TOKEN_ACCOUNT
 
@@ -398,6 +421,8 @@ class InitializeParser(InstructionParser):
 class InitializeMintParser(InstructionParser):
     """Parser for Token Program initializeMint instruction (Initialize a Token Mint Account)."""
     
+    dispatch_keys = (("spl-token", "initializeMint"), ("spl-token", "initializeMint2"))
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "spl-token" and 
                 instruction.parsed is not None and 
@@ -406,7 +431,7 @@ class InitializeMintParser(InstructionParser):
     def parse(self, instruction: Parsed_Instruction, context: TransactionContext, swap_parent_id: int = None, parent_router_swap_id: int = None) -> None:
         mint_account_address = str(instruction.parsed["info"]["mint"])
 
-        account_version = context.account_repository.account_versions.get(mint_account_address)[-1]
+        account_version = context.account_repository.get_versions(mint_account_address)[-1]
         account_version.account.mint_address = mint_account_address
         account_version.account.type = AccountType.TOKEN_MINT_ACCOUNT
         
@@ -415,6 +440,8 @@ class InitializeMintParser(InstructionParser):
 class SystemAssignParser(InstructionParser):
     """Parser for System Program assign instructions."""
     
+    dispatch_keys = (("system", "assign"),)
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "system" and 
                 instruction.parsed is not None and 
@@ -424,7 +451,7 @@ class SystemAssignParser(InstructionParser):
         account_address = str(instruction.parsed["info"]["account"])
         program_owner = str(instruction.parsed["info"]["owner"])
         if program_owner == STAKE_PROGRAM:
-            context.account_repository.accounts.get(account_address).type = AccountType.STAKE_ACCOUNT
+            context.account_repository.get_account(account_address).type = AccountType.STAKE_ACCOUNT
             
         # No transfers involved in assign
         return True
@@ -432,6 +459,8 @@ class SystemAssignParser(InstructionParser):
 class StakeInitializeParser(InstructionParser):
     """Parser for Stake Program initialize instructions."""
     
+    dispatch_keys = (("stake", "initialize"),)
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "stake" and 
                 instruction.parsed is not None and 
@@ -441,7 +470,7 @@ class StakeInitializeParser(InstructionParser):
         stakeAccount_address = str(instruction.parsed["info"]["stakeAccount"])
         withdrawer_address = str(instruction.parsed["info"]["authorized"]["withdrawer"])
 
-        context.account_repository.accounts.get(stakeAccount_address).type = AccountType.STAKE_ACCOUNT
+        context.account_repository.get_account(stakeAccount_address).type = AccountType.STAKE_ACCOUNT
         context.account_repository.update_owner_in_all_versions(address = stakeAccount_address,
                                                                         owner = withdrawer_address)
             
@@ -451,6 +480,8 @@ class StakeInitializeParser(InstructionParser):
 class StakeWithdrawParser(InstructionParser):
     """Parser for Stake Program withdraw instructions."""
     
+    dispatch_keys = (("stake", "withdraw"),)
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "stake" and 
                 instruction.parsed is not None and 
@@ -499,6 +530,8 @@ class StakeWithdrawParser(InstructionParser):
 class StakeSplitParser(InstructionParser):
     """Parser for Stake Program split instructions."""
     
+    dispatch_keys = (("stake", "split"),)
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "stake" and 
                 instruction.parsed is not None and 
@@ -552,6 +585,8 @@ class StakeSplitParser(InstructionParser):
 class StakeAuthorizeParser(InstructionParser):
     """Parser for Stake Program authorize instructions."""
     
+    dispatch_keys = (("stake", "authorize"),)
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "stake" and 
                 instruction.parsed is not None and 
@@ -595,6 +630,8 @@ class StakeAuthorizeParser(InstructionParser):
 class AssociatedTokenAccountCreateParser(InstructionParser):
     """Parser for Associated Token Account Program create instructions."""
     
+    dispatch_keys = (("spl-associated-token-account", "create"), ("spl-associated-token-account", "createIdempotent"))
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         return (instruction.program_name == "spl-associated-token-account" and 
                 instruction.parsed is not None and 
@@ -607,7 +644,7 @@ class AssociatedTokenAccountCreateParser(InstructionParser):
         wallet = str(instruction.parsed["info"]["wallet"])
         
         # update mint if not known yet
-        new_account = context.account_repository.accounts.get(new_account_address)
+        new_account = context.account_repository.get_account(new_account_address)
         new_account.mint_address = mint_address
         new_account.type = AccountType.TOKEN_ACCOUNT
 
@@ -621,6 +658,8 @@ class AssociatedTokenAccountCreateParser(InstructionParser):
 class ComputeBudgetSetComputeUnitPriceParser(InstructionParser):
     """Parser for Compute Budget Program instructions."""
     
+    dispatch_keys = ((COMPUTE_BUDGET_PROGRAM, None),)
+    
     def can_parse(self, instruction: Parsed_Instruction) -> bool:
         if instruction.program_address == COMPUTE_BUDGET_PROGRAM:
             instruction_bytes = decode_instruction_data(instruction.data)
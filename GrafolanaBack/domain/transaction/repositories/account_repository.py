@@ -1,6 +1,6 @@
-import copy
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from GrafolanaBack.domain.transaction.models.account import Account, AccountTransaction, AccountType, AccountVersion, AccountVertex
+from GrafolanaBack.domain.transaction.utils.address_table import AddressTable
 
 class AccountRepository:
     """
@@ -10,26 +10,34 @@ class AccountRepository:
     1. Creating new accounts
     2. Tracking account versions
     3. Managing account balances and state changes
+
+    Accounts and their versions are stored under the ids of their addresses in the
+    address table, which the transaction's graph shares.
     """
     
-    def __init__(self):
-        self.accounts: Dict[str, Account] = {}
-        self.account_versions: Dict[str, List[AccountVersion]] = {}
+    def __init__(self, address_table: Optional[AddressTable] = None):
+        self.address_table = address_table if address_table is not None else AddressTable()
+        self.accounts: Dict[int, Account] = {}
+        self.account_versions: Dict[int, List[AccountVersion]] = {}
     
     def get_account(self, address: str) -> Optional[Account]:
         """Get an account by its address"""
-        return self.accounts.get(address)
+        return self.accounts.get(self.address_table.find_id(address))
+    
+    def get_versions(self, address: str) -> Optional[List[AccountVersion]]:
+        """Get all versions of an account, oldest first"""
+        return self.account_versions.get(self.address_table.find_id(address))
     
     def get_latest_version(self, address: str) -> Optional[AccountVersion]:
         """Get the latest version of an account"""
-        versions = self.account_versions.get(address)
+        versions = self.get_versions(address)
         if versions:
             return versions[-1]
         return None
     
     def get_version(self, address: str, version: int) -> Optional[AccountVersion]:
         """Get a specific version of an account"""
-        versions = self.account_versions.get(address)
+        versions = self.get_versions(address)
         if 0 <= version < len(versions):
             return versions[version]
         return None
@@ -47,7 +55,8 @@ class AccountRepository:
                       balance_token: int = 0, 
                       balance_lamport: int = 0) -> AccountVersion:
         """Create a new account and its initial version"""
-        if address in self.accounts:
+        address_id = self.address_table.get_id(address)
+        if address_id in self.accounts:
             # Account already exists, return None
             return None
         
@@ -57,7 +66,7 @@ class AccountRepository:
             type=account_type
         )
         
-        self.accounts[address] = account
+        self.accounts[address_id] = account
         
         initial_version = AccountVersion(
             version=0,
@@ -68,24 +77,22 @@ class AccountRepository:
             balance_lamport=balance_lamport
         )
         
-        self.account_versions[address] = [initial_version]
+        self.account_versions[address_id] = [initial_version]
         return initial_version
     
     def new_account_version(self, address: str) -> Optional[AccountVersion]:
         """Create a new version of an existing account"""
-        if (account_version := self.account_versions.get(address)[-1]):
-            new_account_version = copy.deepcopy(account_version)
-            new_account_version.version += 1
-            # Make sure the new version has the same account object
-            new_account_version.account = account_version.account
-            self.account_versions.get(address).append(new_account_version)
+        versions = self.get_versions(address)
+        if (account_version := versions[-1]):
+            new_account_version = account_version.clone(version=account_version.version + 1)
+            versions.append(new_account_version)
             return new_account_version
         else:
             return None
     
     def update_owner_in_all_versions(self, address: str, owner: str) -> bool:
         """Update the owner in all versions of an account if not set"""
-        versions = self.account_versions.get(address, [])
+        versions = self.get_versions(address)
         if not versions:
             return False
         
@@ -106,11 +113,10 @@ class AccountRepository:
         """Add an authority to an account"""
         if authority:
             account = self.get_account(address)
-            if not account or authority in account.authorities:
+            if not account:
                 return False
             
-            account.authorities.append(authority)
-            return True
+            return account.add_authority(authority)
     
     def get_all_accounts(self) -> List[Account]:
         """Get all accounts in the repository"""
@@ -119,7 +125,7 @@ class AccountRepository:
     def get_all_vertices(self) -> List[AccountVertex]:
         """Get all account vertices in the repository"""
         vertices = []
-        for address, versions in self.account_versions.items():
+        for versions in self.account_versions.values():
             for version in versions:
                 vertices.append(version.get_vertex())
         return vertices
@@ -135,15 +141,20 @@ class AccountRepository:
     
     def get_all_addresses(self) -> List[str]:
         """Get all account addresses in the repository"""
-        return list(self.accounts.keys())
+        return [self.address_table.get_address(address_id) for address_id in self.accounts]
+    
+    def iter_account_versions(self) -> Iterator[Tuple[str, List[AccountVersion]]]:
+        """Iterate over the addresses of the accounts with their versions, oldest first"""
+        for address_id, versions in self.account_versions.items():
+            yield self.address_table.get_address(address_id), versions
     
     def get_all_accountTransactions(self) -> List[AccountTransaction]:
         """Get all account transactions in the repository"""
         account_transactions = []
         account: Account
-        for address, account in self.accounts.items():
+        for account in self.accounts.values():
             account_transactions.append(AccountTransaction(
-                address=address,
+                address=account.address,
                 mint_address=account.mint_address,
                 type=account.type
             ).to_dict())
@@ -152,7 +163,7 @@ class AccountRepository:
     def get_pre_state_accounts(self) -> List[AccountVersion]:
         """Get all accounts in their initial state (version 0)"""
         pre_state = []
-        for address, versions in self.account_versions.items():
+        for versions in self.account_versions.values():
             if versions:
                 pre_state.append(versions[0])
         return pre_state
@@ -160,7 +171,7 @@ class AccountRepository:
     def get_post_state_accounts(self) -> List[AccountVersion]:
         """Get all accounts in their final state (latest version)"""
         post_state = []
-        for address, versions in self.account_versions.items():
+        for versions in self.account_versions.values():
             if versions:
                 post_state.append(versions[-1])
         return post_state
\ No newline at end of file
@@ -0,0 +1,203 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+
+from ..models.transaction import SolanaTransaction
+from .transaction_archive import get_transaction_archive
+from .transaction_repository import RAW_TRANSACTION_UPDATE_COLUMNS, RAW_TRANSACTIONS_TABLE, TRANSACTION_DB_CHUNK_SIZE, access_tracker
+from GrafolanaBack.domain.infrastructure.db.async_session import get_async_session
+from GrafolanaBack.domain.infrastructure.db.upsert import build_upsert
+from GrafolanaBack.domain.logging.logging import logger
+
+class AsyncTransactionRepository:
+    """
+    Asyncio counterpart of TransactionRepository.
+
+    Uses SQLAlchemy's asyncio extension so that database reads can be awaited
+    from an event loop (e.g. the RPC fetcher loop) and overlap with RPC calls
+    instead of blocking a worker thread.
+    """
+
+    @staticmethod
+    async def save_transaction(transaction_signature: str, transaction_json: Dict[str, Any]) -> bool:
+        """
+        Save a Solana transaction to the database.
+        An existing transaction is overwritten.
+
+        Args:
+            transaction_signature: The unique signature of the transaction
+            transaction_json: The full transaction data as JSON
+
+        Returns:
+            bool: True if saved successfully, False otherwise
+        """
+        row = SolanaTransaction.build_row(transaction_signature, transaction_json, int(time.time()))
+        async with get_async_session() as session:
+            try:
+                await session.execute(build_upsert(
+                    session,
+                    RAW_TRANSACTIONS_TABLE,
+                    [row],
+                    index_elements=["transaction_signature"],
+                    update_columns=RAW_TRANSACTION_UPDATE_COLUMNS
+                ))
+                await session.commit()
+                return True
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Error saving transaction {transaction_signature}: {e}")
+                return False
+
+    @staticmethod
+    async def get_transaction(transaction_signature: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a transaction by its signature.
+
+        Args:
+            transaction_signature: The unique signature of the transaction
+
+        Returns:
+            Optional[Dict[str, Any]]: The transaction data as JSON or None if not found
+        """
+        archive = get_transaction_archive()
+        async with get_async_session() as session:
+            try:
+                transaction = await session.get(SolanaTransaction, transaction_signature)
+                if transaction:
+                    if archive is not None:
+                        access_tracker.record([transaction_signature])
+                    return transaction.transaction_json
+                if archive is not None:
+                    # Segment and index reads are blocking file I/O
+                    return await asyncio.get_running_loop().run_in_executor(None, archive.get, transaction_signature)
+                return None
+            except Exception as e:
+                logger.error(f"Error retrieving transaction {transaction_signature}: {e}")
+                return None
+
+    @staticmethod
+    async def get_transactions_by_signatures(transaction_signatures: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve multiple transactions by their signatures.
+
+        Args:
+            transaction_signatures: List of transaction signatures
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Dictionary mapping transaction signatures to their data
+        """
+        result = {}
+        try:
+            async for signature, transaction_json in AsyncTransactionRepository.iter_transactions_by_signatures(transaction_signatures):
+                result[signature] = transaction_json
+        except Exception:
+            # Logged by iter_transactions_by_signatures, the transactions read so far are returned
+            pass
+        return result
+
+    @staticmethod
+    async def iter_transactions_by_signatures(
+        transaction_signatures: List[str],
+        chunk_size: Optional[int] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream transactions by their signatures, one chunk of signatures at a time.
+        Signatures missing from the database fall through to the transaction archive when enabled,
+        whose blocking reads run in the default executor of the event loop.
+
+        Args:
+            transaction_signatures: List of transaction signatures
+            chunk_size: Number of signatures per query (defaults to TRANSACTION_DB_CHUNK_SIZE)
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: (transaction signature, transaction data) for each stored transaction
+        """
+        if not transaction_signatures:
+            return
+
+        chunk_size = chunk_size or TRANSACTION_DB_CHUNK_SIZE
+        signatures = list(dict.fromkeys(transaction_signatures))
+        archive = get_transaction_archive()
+
+        async with get_async_session() as session:
+            try:
+                for start in range(0, len(signatures), chunk_size):
+                    chunk = signatures[start:start + chunk_size]
+                    statement = select(SolanaTransaction).where(
+                        SolanaTransaction.transaction_signature.in_(chunk)
+                    ).execution_options(yield_per=chunk_size)
+
+                    found_signatures = []
+                    async for tx in await session.stream_scalars(statement):
+                        found_signatures.append(tx.transaction_signature)
+                        yield tx.transaction_signature, tx.transaction_json
+                        session.expunge(tx)
+
+                    if archive is not None:
+                        access_tracker.record(found_signatures)
+                        found = set(found_signatures)
+                        archived = await asyncio.get_running_loop().run_in_executor(
+                            None, archive.get_many, [sig for sig in chunk if sig not in found]
+                        )
+                        for signature, transaction_json in archived.items():
+                            yield signature, transaction_json
+            except Exception as e:
+                logger.error(f"Error streaming transactions: {e}")
+                raise
+
+    @staticmethod
+    async def get_transactions_by_slot_range(
+        start_slot: int,
+        end_slot: int,
+        fee_payer: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve locally stored transactions whose slot is within [start_slot, end_slot].
+        Archived transactions are not returned: the archive is only indexed by signature.
+
+        Args:
+            start_slot: First slot of the range (inclusive)
+            end_slot: Last slot of the range (inclusive)
+            fee_payer: Optional fee payer address to filter on
+            limit: Optional maximum number of transactions to return
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Dictionary mapping transaction signatures to their data, ordered by slot
+        """
+        result = {}
+        async with get_async_session() as session:
+            try:
+                statement = select(SolanaTransaction).where(
+                    SolanaTransaction.slot >= start_slot,
+                    SolanaTransaction.slot <= end_slot
+                )
+                if fee_payer is not None:
+                    statement = statement.where(SolanaTransaction.fee_payer == fee_payer)
+                statement = statement.order_by(SolanaTransaction.slot)
+                if limit is not None:
+                    statement = statement.limit(limit)
+
+                for tx in (await session.scalars(statement)).all():
+                    result[tx.transaction_signature] = tx.transaction_json
+                return result
+            except Exception as e:
+                logger.error(f"Error retrieving transactions for slots {start_slot}-{end_slot}: {e}")
+                return result
+
+    @staticmethod
+    async def count_transactions() -> int:
+        """
+        Count the total number of transactions in the database.
+
+        Returns:
+            int: The number of transactions
+        """
+        async with get_async_session() as session:
+            try:
+                return await session.scalar(select(func.count()).select_from(SolanaTransaction))
+            except Exception as e:
+                logger.error(f"Error counting transactions: {e}")
+                return 0
@@ -0,0 +1,193 @@
+import time
+from typing import Dict, List, Optional, Set
+
+from ..models.transaction import TransactionRetry
+from .transaction_repository import TRANSACTION_DB_CHUNK_SIZE, TRANSACTION_UPSERT_BATCH_SIZE
+from GrafolanaBack.domain.infrastructure.db.session import get_session, close_session
+from GrafolanaBack.domain.infrastructure.db.upsert import build_upsert
+from GrafolanaBack.domain.logging.logging import logger
+
+class TransactionRetryRepository:
+    """
+    Repository for the durable queue of signatures waiting for a background retry.
+    """
+
+    @staticmethod
+    def enqueue(failed_lookups: Dict[str, Optional[str]], next_attempt_at: int) -> bool:
+        """
+        Add signatures to the retry queue. Signatures already queued keep their schedule.
+
+        Args:
+            failed_lookups: Signature mapped to the last error message (None if no endpoint had it)
+            next_attempt_at: Unix timestamp of the first retry
+
+        Returns:
+            bool: True if saved successfully, False otherwise
+        """
+        if not failed_lookups:
+            return True
+
+        now = int(time.time())
+        rows = [
+            {
+                "transaction_signature": signature,
+                "attempts": 0,
+                "next_attempt_at": next_attempt_at,
+                "last_error": error,
+                "created_at": now,
+            }
+            for signature, error in failed_lookups.items()
+        ]
+
+        session = get_session()
+        try:
+            for start in range(0, len(rows), TRANSACTION_UPSERT_BATCH_SIZE):
+                session.execute(build_upsert(
+                    session,
+                    TransactionRetry,
+                    rows[start:start + TRANSACTION_UPSERT_BATCH_SIZE],
+                    index_elements=["transaction_signature"]
+                ))
+            session.commit()
+            return True
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error queuing {len(rows)} transactions for retry: {e}")
+            return False
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def get_due(now: int, limit: int) -> List[TransactionRetry]:
+        """
+        Retrieve the queued signatures whose retry time has come, oldest schedule first.
+
+        Args:
+            now: Current unix timestamp
+            limit: Maximum number of entries to return
+
+        Returns:
+            List[TransactionRetry]: The due queue entries (detached from the session)
+        """
+        session = get_session()
+        try:
+            entries = session.query(TransactionRetry).filter(
+                TransactionRetry.next_attempt_at <= now
+            ).order_by(TransactionRetry.next_attempt_at).limit(limit).all()
+            for entry in entries:
+                session.expunge(entry)
+            return entries
+        except Exception as e:
+            logger.error(f"Error retrieving due transaction retries: {e}")
+            return []
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def reschedule(transaction_signature: str, attempts: int, next_attempt_at: int, last_error: Optional[str]) -> bool:
+        """
+        Record a failed retry and schedule the next one.
+
+        Args:
+            transaction_signature: The queued signature
+            attempts: Number of retries done so far
+            next_attempt_at: Unix timestamp of the next retry
+            last_error: Error message of the failed retry
+
+        Returns:
+            bool: True if updated successfully, False otherwise
+        """
+        session = get_session()
+        try:
+            session.query(TransactionRetry).filter(
+                TransactionRetry.transaction_signature == transaction_signature
+            ).update({
+                TransactionRetry.attempts: attempts,
+                TransactionRetry.next_attempt_at: next_attempt_at,
+                TransactionRetry.last_error: last_error,
+            }, synchronize_session=False)
+            session.commit()
+            return True
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error rescheduling transaction retry {transaction_signature}: {e}")
+            return False
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def remove(transaction_signatures: List[str]) -> int:
+        """
+        Remove signatures from the retry queue.
+
+        Args:
+            transaction_signatures: Signatures to remove
+
+        Returns:
+            int: The number of removed entries
+        """
+        if not transaction_signatures:
+            return 0
+
+        removed = 0
+        session = get_session()
+        try:
+            for start in range(0, len(transaction_signatures), TRANSACTION_DB_CHUNK_SIZE):
+                chunk = transaction_signatures[start:start + TRANSACTION_DB_CHUNK_SIZE]
+                removed += session.query(TransactionRetry).filter(
+                    TransactionRetry.transaction_signature.in_(chunk)
+                ).delete(synchronize_session=False)
+            session.commit()
+            return removed
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error removing transaction retries: {e}")
+            return 0
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def get_pending_signatures(transaction_signatures: List[str]) -> Set[str]:
+        """
+        Tell which of the given signatures are waiting in the retry queue.
+
+        Args:
+            transaction_signatures: Signatures to check
+
+        Returns:
+            Set[str]: The queued signatures
+        """
+        pending = set()
+        if not transaction_signatures:
+            return pending
+
+        session = get_session()
+        try:
+            for start in range(0, len(transaction_signatures), TRANSACTION_DB_CHUNK_SIZE):
+                chunk = transaction_signatures[start:start + TRANSACTION_DB_CHUNK_SIZE]
+                pending.update(signature for signature, in session.query(TransactionRetry.transaction_signature).filter(
+                    TransactionRetry.transaction_signature.in_(chunk)
+                ))
+            return pending
+        except Exception as e:
+            logger.error(f"Error retrieving pending transaction retries: {e}")
+            return pending
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def count() -> int:
+        """
+        Count the signatures waiting in the retry queue.
+
+        Returns:
+            int: The number of queued signatures
+        """
+        session = get_session()
+        try:
+            return session.query(TransactionRetry).count()
+        except Exception as e:
+            logger.error(f"Error counting transaction retries: {e}")
+            return 0
+        finally:
+            close_session(session)
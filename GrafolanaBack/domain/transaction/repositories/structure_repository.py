@@ -0,0 +1,106 @@
+from typing import Dict, List, Optional, Tuple
+
+from ..models.transaction import TransactionStructure
+from .transaction_repository import TRANSACTION_DB_CHUNK_SIZE, TRANSACTION_UPSERT_BATCH_SIZE
+from GrafolanaBack.domain.infrastructure.db.session import get_session, close_session
+from GrafolanaBack.domain.infrastructure.db.upsert import build_upsert
+from GrafolanaBack.domain.logging.logging import logger
+
+class TransactionStructureRepository:
+    """
+    Repository for the structure fingerprints of parsed transactions.
+    """
+
+    @staticmethod
+    def save_structure_fingerprints(structures: Dict[str, Tuple[str, Optional[int]]]) -> bool:
+        """
+        Store structure fingerprints, replacing the ones already stored for the same signatures.
+
+        Args:
+            structures: (structure fingerprint, slot) by transaction signature
+
+        Returns:
+            bool: True if saved successfully, False otherwise
+        """
+        if not structures:
+            return True
+
+        rows = [
+            {"transaction_signature": signature, "structure_fingerprint": fingerprint, "slot": slot}
+            for signature, (fingerprint, slot) in structures.items()
+        ]
+
+        session = get_session()
+        try:
+            for start in range(0, len(rows), TRANSACTION_UPSERT_BATCH_SIZE):
+                session.execute(build_upsert(
+                    session,
+                    TransactionStructure,
+                    rows[start:start + TRANSACTION_UPSERT_BATCH_SIZE],
+                    index_elements=["transaction_signature"],
+                    update_columns=["structure_fingerprint", "slot"]
+                ))
+            session.commit()
+            return True
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error saving {len(rows)} structure fingerprints: {e}")
+            return False
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def get_structure_fingerprints(transaction_signatures: List[str]) -> Dict[str, str]:
+        """
+        Retrieve the stored structure fingerprints of transactions.
+
+        Args:
+            transaction_signatures: List of transaction signatures
+
+        Returns:
+            Dict[str, str]: Structure fingerprint by signature, for the signatures that have one
+        """
+        fingerprints = {}
+        session = get_session()
+        try:
+            for start in range(0, len(transaction_signatures), TRANSACTION_DB_CHUNK_SIZE):
+                chunk = transaction_signatures[start:start + TRANSACTION_DB_CHUNK_SIZE]
+                fingerprints.update(session.query(
+                    TransactionStructure.transaction_signature,
+                    TransactionStructure.structure_fingerprint
+                ).filter(
+                    TransactionStructure.transaction_signature.in_(chunk)
+                ).all())
+            return fingerprints
+        except Exception as e:
+            logger.error(f"Error retrieving structure fingerprints: {e}")
+            return fingerprints
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def get_signatures_by_structure(structure_fingerprint: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Retrieve the signatures of the parsed transactions with a structure fingerprint, most recent first.
+
+        Args:
+            structure_fingerprint: Fingerprint returned with the graph data of a transaction
+            limit: Optional maximum number of signatures to return
+
+        Returns:
+            List[str]: Transaction signatures
+        """
+        session = get_session()
+        try:
+            query = session.query(TransactionStructure.transaction_signature).filter(
+                TransactionStructure.structure_fingerprint == structure_fingerprint
+            ).order_by(TransactionStructure.slot.desc())
+            if limit is not None:
+                query = query.limit(limit)
+
+            return [row.transaction_signature for row in query.all()]
+        except Exception as e:
+            logger.error(f"Error retrieving signatures for structure {structure_fingerprint}: {e}")
+            return []
+        finally:
+            close_session(session)
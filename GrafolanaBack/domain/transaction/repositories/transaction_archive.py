@@ -0,0 +1,457 @@
+import atexit
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from GrafolanaBack.domain.logging.logging import logger
+from GrafolanaBack.utils.path_utils import find_backend_root
+
+TRANSACTION_ARCHIVE_ENABLED = os.getenv("TRANSACTION_ARCHIVE_ENABLED", "false").lower() == "true"
+TRANSACTION_ARCHIVE_DIR = os.getenv("TRANSACTION_ARCHIVE_DIR", str(find_backend_root() / "archive"))
+# A segment is sealed and a new one started once it grows past this size
+ARCHIVE_SEGMENT_MAX_BYTES = int(os.getenv("ARCHIVE_SEGMENT_MAX_BYTES", str(256 * 1024 * 1024)))
+# Every process reading transactions writes the access times it collected at this interval
+ACCESS_TIME_FLUSH_SECONDS = float(os.getenv("ACCESS_TIME_FLUSH_SECONDS", "60"))
+
+# Segment record: signature length, blob length, then the signature and the zlib compressed JSON blob
+RECORD_HEADER = struct.Struct("<HI")
+# Index entry: signature key, record offset in the segment, record length
+INDEX_ENTRY = struct.Struct("<16sQI")
+
+SEGMENT_FILE_PATTERN = re.compile(r"^segment_(\d{6})\.seg$")
+
+def signature_key(signature: str) -> bytes:
+    """Fixed-width key of a signature in the segment indexes"""
+    return hashlib.blake2b(signature.encode("utf-8"), digest_size=16).digest()
+
+def pack_record(signature: str, blob: bytes) -> bytes:
+    """Serialize a transaction into the segment record layout"""
+    signature_bytes = signature.encode("utf-8")
+    return RECORD_HEADER.pack(len(signature_bytes), len(blob)) + signature_bytes + blob
+
+def iter_records(file: BinaryIO) -> Iterator[Tuple[str, bytes]]:
+    """
+    Read the records of a segment file (or of a dump written in the same layout) sequentially.
+
+    Yields:
+        Tuple[str, bytes]: (signature, zlib compressed JSON blob)
+    """
+    while True:
+        header = file.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            # End of file, or a record whose write was interrupted
+            return
+        signature_length, blob_length = RECORD_HEADER.unpack(header)
+        signature = file.read(signature_length)
+        blob = file.read(blob_length)
+        if len(blob) < blob_length:
+            return
+        yield signature.decode("utf-8"), blob
+
+
+class SegmentIndex:
+    """
+    Sorted, fixed-width index of the records of one segment.
+    The index file is memory mapped and searched with a binary search.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._file_id: Optional[Tuple[int, int]] = None
+        self.count = 0
+        self._open()
+
+    @staticmethod
+    def _stat_file_id(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size
+
+    def _open(self):
+        self.close()
+        self._file_id = self._stat_file_id(self.path)
+        if self._file_id is not None and self._file_id[1] > 0:
+            self._file = open(self.path, "rb")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.count = len(self._mmap) // INDEX_ENTRY.size
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.count = 0
+
+    def reload_if_replaced(self):
+        """Map the index file again if another process replaced it since it was opened"""
+        if self._stat_file_id(self.path) != self._file_id:
+            self._open()
+
+    def _key_at(self, position: int) -> bytes:
+        start = position * INDEX_ENTRY.size
+        return self._mmap[start:start + 16]
+
+    def find(self, key: bytes) -> Optional[Tuple[int, int]]:
+        """
+        Look up a signature key.
+
+        Returns:
+            (offset, length) of the record in the segment, or None if not indexed
+        """
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self._key_at(low) == key:
+            _, offset, length = INDEX_ENTRY.unpack_from(self._mmap, low * INDEX_ENTRY.size)
+            return offset, length
+        return None
+
+    def entries(self) -> Dict[bytes, Tuple[int, int]]:
+        return {
+            key: (offset, length)
+            for key, offset, length in (
+                INDEX_ENTRY.unpack_from(self._mmap, position * INDEX_ENTRY.size)
+                for position in range(self.count)
+            )
+        }
+
+    def merge(self, new_entries: Dict[bytes, Tuple[int, int]]):
+        """
+        Merge new entries into the index and atomically replace the index file.
+        Newer entries win over existing ones for the same key.
+        """
+        entries = self.entries()
+        entries.update(new_entries)
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as tmp_file:
+            for key in sorted(entries):
+                offset, length = entries[key]
+                tmp_file.write(INDEX_ENTRY.pack(key, offset, length))
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+
+        # The mapping must be released before the file can be replaced on every platform
+        self.close()
+        os.replace(tmp_path, self.path)
+        self._open()
+
+
+class TransactionArchive:
+    """
+    Cold tier for stored transactions made of append-only, compressed segment files.
+
+    Records hold the same zlib compressed JSON blob as the CompressedJSON column, so
+    transactions move between tiers without being recompressed. Each segment has a
+    memory-mapped signature index; lookups search the newest segment first.
+    """
+
+    def __init__(self, directory: str = TRANSACTION_ARCHIVE_DIR, segment_max_bytes: int = ARCHIVE_SEGMENT_MAX_BYTES):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self._lock = threading.RLock()
+        self._indexes: Dict[int, SegmentIndex] = {}
+        self._readers: Dict[int, Any] = {}
+        self._directory_mtime: Optional[int] = None
+        self._scanned_at = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        self.active_segment_id = 1
+        self._refresh()
+        if self.active_segment_id not in self._indexes:
+            self._indexes[self.active_segment_id] = SegmentIndex(self._index_path(self.active_segment_id))
+
+    def _refresh(self):
+        """
+        Pick up the segments added and the indexes replaced by another process.
+        Both rename files into the archive directory, which changes its modification time.
+        The directory is scanned again while that time is within a second of the last scan,
+        as timestamps are too coarse to order changes made in the same tick.
+        """
+        directory_mtime = os.stat(self.directory).st_mtime_ns
+        if directory_mtime == self._directory_mtime and directory_mtime < self._scanned_at - 1_000_000_000:
+            return
+        self._directory_mtime = directory_mtime
+        self._scanned_at = time.time_ns()
+
+        for index in self._indexes.values():
+            index.reload_if_replaced()
+        for file_name in os.listdir(self.directory):
+            match = SEGMENT_FILE_PATTERN.match(file_name)
+            if match and int(match.group(1)) not in self._indexes:
+                segment_id = int(match.group(1))
+                self._indexes[segment_id] = SegmentIndex(self._index_path(segment_id))
+        self.active_segment_id = max(self._indexes, default=self.active_segment_id)
+
+    def _segment_path(self, segment_id: int) -> str:
+        return os.path.join(self.directory, f"segment_{segment_id:06d}.seg")
+
+    def _index_path(self, segment_id: int) -> str:
+        return os.path.join(self.directory, f"segment_{segment_id:06d}.idx")
+
+    def append(self, records: Iterable[Tuple[str, bytes]]) -> int:
+        """
+        Append transactions to the active segment.
+        Data is fsynced before the index is updated, so an indexed record is always readable.
+
+        Args:
+            records: (signature, zlib compressed JSON blob) pairs
+
+        Returns:
+            int: The number of records appended
+        """
+        count = 0
+        with self._lock:
+            self._refresh()
+            pending_entries: Dict[bytes, Tuple[int, int]] = {}
+            segment_file = open(self._segment_path(self.active_segment_id), "ab")
+            try:
+                for signature, blob in records:
+                    offset = segment_file.tell()
+                    segment_file.write(pack_record(signature, blob))
+                    pending_entries[signature_key(signature)] = (offset, segment_file.tell() - offset)
+                    count += 1
+
+                    if segment_file.tell() >= self.segment_max_bytes:
+                        # Seal the full segment and continue in a new one
+                        self._commit_segment(segment_file, pending_entries)
+                        pending_entries = {}
+                        self.active_segment_id += 1
+                        self._indexes[self.active_segment_id] = SegmentIndex(self._index_path(self.active_segment_id))
+                        segment_file = open(self._segment_path(self.active_segment_id), "ab")
+
+                self._commit_segment(segment_file, pending_entries)
+            finally:
+                segment_file.close()
+        return count
+
+    def _commit_segment(self, segment_file, pending_entries: Dict[bytes, Tuple[int, int]]):
+        segment_file.flush()
+        os.fsync(segment_file.fileno())
+        if pending_entries:
+            self._indexes[self.active_segment_id].merge(pending_entries)
+        # The reader handle of the active segment may be behind the new data
+        reader = self._readers.pop(self.active_segment_id, None)
+        if reader is not None:
+            reader.close()
+
+    def get_raw(self, signature: str) -> Optional[bytes]:
+        """
+        Look up the compressed blob of a transaction.
+
+        Args:
+            signature: Transaction signature
+
+        Returns:
+            Optional[bytes]: The zlib compressed JSON blob or None if not archived
+        """
+        key = signature_key(signature)
+        signature_bytes = signature.encode("utf-8")
+        with self._lock:
+            self._refresh()
+            for segment_id in sorted(self._indexes, reverse=True):
+                location = self._indexes[segment_id].find(key)
+                if location is None:
+                    continue
+                offset, length = location
+                reader = self._readers.get(segment_id)
+                if reader is None:
+                    reader = open(self._segment_path(segment_id), "rb")
+                    self._readers[segment_id] = reader
+                reader.seek(offset)
+                record = reader.read(length)
+
+                signature_length, blob_length = RECORD_HEADER.unpack_from(record)
+                start = RECORD_HEADER.size
+                # Guard against key collisions
+                if record[start:start + signature_length] != signature_bytes:
+                    continue
+                start += signature_length
+                return record[start:start + blob_length]
+        return None
+
+    def get(self, signature: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve an archived transaction.
+
+        Args:
+            signature: Transaction signature
+
+        Returns:
+            Optional[Dict[str, Any]]: The transaction data as JSON or None if not archived
+        """
+        blob = self.get_raw(signature)
+        if blob is None:
+            return None
+        try:
+            return json.loads(zlib.decompress(blob).decode("utf-8"))
+        except (zlib.error, json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.error(f"Error decompressing archived transaction {signature}: {e}")
+            return None
+
+    def get_many(self, signatures: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve several archived transactions.
+
+        Args:
+            signatures: Transaction signatures
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Dictionary mapping archived signatures to their data
+        """
+        result = {}
+        for signature in signatures:
+            transaction_json = self.get(signature)
+            if transaction_json is not None:
+                result[signature] = transaction_json
+        return result
+
+    def iter_raw(self) -> Iterator[Tuple[str, bytes]]:
+        """
+        Stream every archived transaction as its compressed blob, newest segment first.
+        Only the record that lookups return is yielded for a signature archived several times,
+        and records whose index update was interrupted are skipped.
+
+        Yields:
+            Tuple[str, bytes]: (signature, zlib compressed JSON blob)
+        """
+        with self._lock:
+            self._refresh()
+            segment_ids = sorted(self._indexes, reverse=True)
+        seen = set()
+        for segment_id in segment_ids:
+            index = self._indexes[segment_id]
+            try:
+                segment_file = open(self._segment_path(segment_id), "rb")
+            except FileNotFoundError:
+                continue
+            with segment_file:
+                offset = 0
+                for signature, blob in iter_records(segment_file):
+                    length = RECORD_HEADER.size + len(signature.encode("utf-8")) + len(blob)
+                    key = signature_key(signature)
+                    with self._lock:
+                        location = index.find(key)
+                    if location == (offset, length) and key not in seen:
+                        seen.add(key)
+                        yield signature, blob
+                    offset += length
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh()
+            segment_bytes = sum(
+                os.path.getsize(self._segment_path(segment_id))
+                for segment_id in self._indexes
+                if os.path.exists(self._segment_path(segment_id))
+            )
+            return {
+                "segments": len(self._indexes),
+                "indexed_transactions": sum(index.count for index in self._indexes.values()),
+                "segment_bytes": segment_bytes,
+            }
+
+    def close(self):
+        with self._lock:
+            for reader in self._readers.values():
+                reader.close()
+            self._readers.clear()
+            for index in self._indexes.values():
+                index.close()
+
+
+class TransactionAccessTracker:
+    """
+    Collects the signatures of stored transactions read since the last flush.
+    Access times are written to the database in bulk by a background thread of the
+    reading process, so reads never pay for an UPDATE and no process loses its reads.
+    """
+
+    def __init__(self, flush: Callable[[List[str]], Any], flush_interval_seconds: float = ACCESS_TIME_FLUSH_SECONDS):
+        """
+        Args:
+            flush: Function writing the access times of the given signatures
+            flush_interval_seconds: Interval between two flushes of the background thread
+        """
+        self._flush = flush
+        self.flush_interval_seconds = flush_interval_seconds
+        self._lock = threading.Lock()
+        self._signatures: Set[str] = set()
+        # Process that started the flusher thread; a forked process starts its own
+        self._flusher_pid: Optional[int] = None
+
+    def record(self, signatures: Iterable[str]):
+        with self._lock:
+            self._signatures.update(signatures)
+            if self._flusher_pid != os.getpid():
+                self._start_flusher()
+
+    def drain(self) -> List[str]:
+        with self._lock:
+            signatures = list(self._signatures)
+            self._signatures.clear()
+        return signatures
+
+    def flush(self) -> int:
+        """
+        Write the access times collected since the last flush.
+
+        Returns:
+            int: The number of transactions whose access time was updated
+        """
+        signatures = self.drain()
+        if not signatures:
+            return 0
+        return self._flush(signatures)
+
+    def _start_flusher(self):
+        self._flusher_pid = os.getpid()
+        thread = threading.Thread(target=self._run_flusher, name="access-time-flusher", daemon=True)
+        thread.start()
+        # Persist the reads made since the last flush
+        atexit.register(self._safe_flush)
+
+    def _run_flusher(self):
+        while True:
+            time.sleep(self.flush_interval_seconds)
+            self._safe_flush()
+
+    def _safe_flush(self):
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Error flushing transaction access times: {e}")
+
+
+_archive: Optional[TransactionArchive] = None
+_archive_lock = threading.Lock()
+
+def get_transaction_archive() -> Optional[TransactionArchive]:
+    """
+    Returns the process-wide transaction archive, or None when the cold tier is disabled
+    """
+    global _archive
+    if not TRANSACTION_ARCHIVE_ENABLED:
+        return None
+    if _archive is None:
+        with _archive_lock:
+            if _archive is None:
+                _archive = TransactionArchive()
+    return _archive
@@ -1,8 +1,38 @@
-from typing import Dict, List, Optional, Any
+import csv
+import io
+import os
+import time
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from sqlalchemy import BigInteger, Boolean, Integer, LargeBinary, String, column, func, table, text, type_coerce
 from ..models.transaction import SolanaTransaction
+from .transaction_archive import TransactionAccessTracker, get_transaction_archive
 from GrafolanaBack.domain.infrastructure.db.session import get_session, close_session
+from GrafolanaBack.domain.infrastructure.db.upsert import build_upsert
 from GrafolanaBack.domain.logging.logging import logger
 
+# Number of signatures per IN (...) query when streaming transactions out of the database
+TRANSACTION_DB_CHUNK_SIZE = int(os.getenv("TRANSACTION_DB_CHUNK_SIZE", "500"))
+
+# Number of rows per INSERT ... ON CONFLICT statement (keeps SQLite under its bind parameter limit)
+TRANSACTION_UPSERT_BATCH_SIZE = 100
+
+# solana_transactions with transaction_json as plain bytes, used to load blobs that are already compressed
+RAW_TRANSACTIONS_TABLE = table(
+    'solana_transactions',
+    column('transaction_signature', String),
+    column('transaction_json', LargeBinary),
+    column('slot', BigInteger),
+    column('block_time', BigInteger),
+    column('fee_payer', String),
+    column('has_error', Boolean),
+    column('size', Integer),
+    column('stored_at', BigInteger),
+    column('last_accessed_at', BigInteger),
+)
+RAW_TRANSACTION_COLUMNS = [table_column.name for table_column in RAW_TRANSACTIONS_TABLE.columns]
+# Columns overwritten when a stored transaction is saved again (the original storage time is kept)
+RAW_TRANSACTION_UPDATE_COLUMNS = [name for name in RAW_TRANSACTION_COLUMNS if name not in ("transaction_signature", "stored_at")]
+
 class TransactionRepository:
     """
     Repository for managing Solana transactions storage and retrieval.
@@ -11,12 +41,14 @@ class TransactionRepository:
     1. Creating new transaction records
     2. Retrieving transactions by signature
     3. Batch retrieval of transactions
+    4. Querying stored transactions by slot, block time and fee payer
     """
     
     @staticmethod
     def save_transaction(transaction_signature: str, transaction_json: Dict[str, Any]) -> bool:
         """
         Save a Solana transaction to the database.
+        An existing transaction is overwritten.
         
         Args:
             transaction_signature: The unique signature of the transaction
@@ -25,30 +57,48 @@ class TransactionRepository:
         Returns:
             bool: True if saved successfully, False otherwise
         """
+        return TransactionRepository.save_transactions({transaction_signature: transaction_json})
+    
+    @staticmethod
+    def save_transactions(transactions: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Save multiple Solana transactions with bulk upserts.
+        Existing transactions are overwritten.
+        
+        Args:
+            transactions: Dictionary mapping transaction signatures to their full JSON data
+            
+        Returns:
+            bool: True if saved successfully, False otherwise
+        """
+        if not transactions:
+            return True
+
+        now = int(time.time())
+        rows = [
+            SolanaTransaction.build_row(signature, transaction_json, now)
+            for signature, transaction_json in transactions.items()
+        ]
+
         session = get_session()
         try:
-            # Check if transaction already exists
-            existing_transaction = session.query(SolanaTransaction).get(transaction_signature)
-            if existing_transaction:
-                # Update existing transaction
-                existing_transaction.transaction_json = transaction_json
-            else:
-                # Create new transaction record
-                transaction = SolanaTransaction(
-                    transaction_signature=transaction_signature,
-                    transaction_json=transaction_json
-                )
-                session.add(transaction)
-                
+            for start in range(0, len(rows), TRANSACTION_UPSERT_BATCH_SIZE):
+                session.execute(build_upsert(
+                    session,
+                    RAW_TRANSACTIONS_TABLE,
+                    rows[start:start + TRANSACTION_UPSERT_BATCH_SIZE],
+                    index_elements=["transaction_signature"],
+                    update_columns=RAW_TRANSACTION_UPDATE_COLUMNS
+                ))
             session.commit()
             return True
         except Exception as e:
             session.rollback()
-            logger.error(f"Error saving transaction {transaction_signature}: {e}")
+            logger.error(f"Error saving {len(rows)} transactions: {e}")
             return False
         finally:
             close_session(session)
-    
+
     @staticmethod
     def get_transaction(transaction_signature: str) -> Optional[Dict[str, Any]]:
         """
@@ -60,11 +110,17 @@ class TransactionRepository:
         Returns:
             Optional[Dict[str, Any]]: The transaction data as JSON or None if not found
         """
+        archive = get_transaction_archive()
         session = get_session()
         try:
             transaction = session.query(SolanaTransaction).get(transaction_signature)
             if transaction:
+                if archive is not None:
+                    access_tracker.record([transaction_signature])
                 return transaction.transaction_json
+            if archive is not None:
+                # Fall through to the cold tier
+                return archive.get(transaction_signature)
             return None
         except Exception as e:
             logger.error(f"Error retrieving transaction {transaction_signature}: {e}")
@@ -85,24 +141,257 @@ class TransactionRepository:
         """
         if not transaction_signatures:
             return {}
-            
+
         result = {}
+        try:
+            for signature, transaction_json in TransactionRepository.iter_transactions_by_signatures(transaction_signatures):
+                result[signature] = transaction_json
+        except Exception:
+            # Logged by iter_transactions_by_signatures, the transactions read so far are returned
+            pass
+        return result
+
+    @staticmethod
+    def iter_transactions_by_signatures(
+        transaction_signatures: List[str],
+        chunk_size: Optional[int] = None,
+        raw: bool = False
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream transactions by their signatures, one chunk of signatures at a time.
+
+        Each chunk is queried with a bounded IN (...) list and read through a server-side
+        cursor, so rows are decompressed and yielded as they arrive instead of being
+        materialized all at once. Callers can start working on the first rows while
+        later chunks are still loading. When the cold tier is enabled, signatures missing
+        from the database are looked up in the transaction archive.
+
+        Args:
+            transaction_signatures: List of transaction signatures
+            chunk_size: Number of signatures per query (defaults to TRANSACTION_DB_CHUNK_SIZE)
+            raw: Yield the zlib compressed JSON blobs as stored, without decompressing them
+
+        Yields:
+            Tuple[str, Any]: (transaction signature, transaction data or compressed blob) for each stored transaction,
+                chunk by chunk in the caller's order (the order within a chunk is the database's)
+
+        Raises:
+            Exception: Database errors are logged and raised, the transactions yielded so far are valid
+        """
+        if not transaction_signatures:
+            return
+
+        chunk_size = chunk_size or TRANSACTION_DB_CHUNK_SIZE
+        # Drop duplicates while keeping the caller's order
+        signatures = list(dict.fromkeys(transaction_signatures))
+        archive = get_transaction_archive()
+
         session = get_session()
         try:
-            transactions = session.query(SolanaTransaction).filter(
-                SolanaTransaction.transaction_signature.in_(transaction_signatures)
-            ).all()
+            for start in range(0, len(signatures), chunk_size):
+                chunk = signatures[start:start + chunk_size]
+                transaction_column = (
+                    type_coerce(SolanaTransaction.transaction_json, LargeBinary) if raw
+                    else SolanaTransaction.transaction_json
+                )
+                query = session.query(
+                    SolanaTransaction.transaction_signature,
+                    transaction_column
+                ).filter(
+                    SolanaTransaction.transaction_signature.in_(chunk)
+                ).yield_per(chunk_size)
+
+                # Column rows are not tracked by the session, nothing is left to release after a chunk
+                found_signatures = []
+                for signature, transaction_json in query:
+                    found_signatures.append(signature)
+                    yield signature, bytes(transaction_json) if raw else transaction_json
+
+                if archive is not None:
+                    access_tracker.record(found_signatures)
+                    # Signatures missing from the hot tier fall through to the cold tier
+                    found = set(found_signatures)
+                    missing = [sig for sig in chunk if sig not in found]
+                    if raw:
+                        for signature in missing:
+                            blob = archive.get_raw(signature)
+                            if blob is not None:
+                                yield signature, blob
+                    else:
+                        for signature, transaction_json in archive.get_many(missing).items():
+                            yield signature, transaction_json
+        except Exception as e:
+            logger.error(f"Error streaming transactions: {e}")
+            raise
+        finally:
+            close_session(session)
+    
+    @staticmethod
+    def get_stored_signatures(transaction_signatures: List[str]) -> List[str]:
+        """
+        Tell which signatures are stored in the database, without loading the transactions.
+        
+        Args:
+            transaction_signatures: List of transaction signatures
             
-            for tx in transactions:
+        Returns:
+            List[str]: The stored signatures
+        """
+        stored = []
+        session = get_session()
+        try:
+            for start in range(0, len(transaction_signatures), TRANSACTION_DB_CHUNK_SIZE):
+                chunk = transaction_signatures[start:start + TRANSACTION_DB_CHUNK_SIZE]
+                stored.extend(signature for signature, in session.query(SolanaTransaction.transaction_signature).filter(
+                    SolanaTransaction.transaction_signature.in_(chunk)
+                ))
+            return stored
+        except Exception as e:
+            logger.error(f"Error checking stored transactions: {e}")
+            return stored
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def get_transactions_by_slot(slot: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve all locally stored transactions of a given slot.
+
+        Args:
+            slot: The slot number
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Dictionary mapping transaction signatures to their data
+        """
+        return TransactionRepository.get_transactions_by_slot_range(slot, slot)
+
+    @staticmethod
+    def get_transactions_by_slot_range(
+        start_slot: int,
+        end_slot: int,
+        fee_payer: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve locally stored transactions whose slot is within [start_slot, end_slot].
+        Archived transactions are not returned: the archive is only indexed by signature.
+
+        Args:
+            start_slot: First slot of the range (inclusive)
+            end_slot: Last slot of the range (inclusive)
+            fee_payer: Optional fee payer address to filter on
+            limit: Optional maximum number of transactions to return
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Dictionary mapping transaction signatures to their data, ordered by slot
+        """
+        result = {}
+        session = get_session()
+        try:
+            query = session.query(SolanaTransaction).filter(
+                SolanaTransaction.slot >= start_slot,
+                SolanaTransaction.slot <= end_slot
+            )
+            if fee_payer is not None:
+                query = query.filter(SolanaTransaction.fee_payer == fee_payer)
+            query = query.order_by(SolanaTransaction.slot)
+            if limit is not None:
+                query = query.limit(limit)
+
+            for tx in query.all():
                 result[tx.transaction_signature] = tx.transaction_json
-                
+
             return result
         except Exception as e:
-            logger.error(f"Error retrieving transactions: {e}")
+            logger.error(f"Error retrieving transactions for slots {start_slot}-{end_slot}: {e}")
             return result
         finally:
             close_session(session)
-    
+
+    @staticmethod
+    def get_transactions_by_time_range(
+        start_time: int,
+        end_time: int,
+        fee_payer: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve locally stored transactions whose block time is within [start_time, end_time].
+        Archived transactions are not returned: the archive is only indexed by signature.
+
+        Args:
+            start_time: Start of the window as a unix timestamp in seconds (inclusive)
+            end_time: End of the window as a unix timestamp in seconds (inclusive)
+            fee_payer: Optional fee payer address to filter on
+            limit: Optional maximum number of transactions to return
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Dictionary mapping transaction signatures to their data, ordered by block time
+        """
+        result = {}
+        session = get_session()
+        try:
+            query = session.query(SolanaTransaction).filter(
+                SolanaTransaction.block_time >= start_time,
+                SolanaTransaction.block_time <= end_time
+            )
+            if fee_payer is not None:
+                query = query.filter(SolanaTransaction.fee_payer == fee_payer)
+            query = query.order_by(SolanaTransaction.block_time, SolanaTransaction.slot)
+            if limit is not None:
+                query = query.limit(limit)
+
+            for tx in query.all():
+                result[tx.transaction_signature] = tx.transaction_json
+
+            return result
+        except Exception as e:
+            logger.error(f"Error retrieving transactions for time range {start_time}-{end_time}: {e}")
+            return result
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def get_signatures_by_fee_payer(
+        fee_payer: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Retrieve the signatures of locally stored transactions paid by an address,
+        most recent first, without loading the transaction blobs.
+        Archived transactions are not returned: the archive is only indexed by signature.
+
+        Args:
+            fee_payer: Fee payer address
+            start_time: Optional start of the window as a unix timestamp (inclusive)
+            end_time: Optional end of the window as a unix timestamp (inclusive)
+            limit: Optional maximum number of signatures to return
+
+        Returns:
+            List[str]: Transaction signatures
+        """
+        session = get_session()
+        try:
+            query = session.query(SolanaTransaction.transaction_signature).filter(
+                SolanaTransaction.fee_payer == fee_payer
+            )
+            if start_time is not None:
+                query = query.filter(SolanaTransaction.block_time >= start_time)
+            if end_time is not None:
+                query = query.filter(SolanaTransaction.block_time <= end_time)
+            query = query.order_by(SolanaTransaction.slot.desc())
+            if limit is not None:
+                query = query.limit(limit)
+
+            return [row.transaction_signature for row in query.all()]
+        except Exception as e:
+            logger.error(f"Error retrieving signatures for fee payer {fee_payer}: {e}")
+            return []
+        finally:
+            close_session(session)
+
     @staticmethod
     def delete_transaction(transaction_signature: str) -> bool:
         """
@@ -129,6 +418,232 @@ class TransactionRepository:
         finally:
             close_session(session)
     
+    @staticmethod
+    def touch_transactions(transaction_signatures: List[str], accessed_at: Optional[int] = None) -> int:
+        """
+        Record that transactions were read, which keeps them in the hot tier.
+        
+        Args:
+            transaction_signatures: Signatures of the transactions that were read
+            accessed_at: Access time as a unix timestamp (defaults to now)
+            
+        Returns:
+            int: The number of updated rows
+        """
+        if not transaction_signatures:
+            return 0
+
+        accessed_at = accessed_at or int(time.time())
+        updated = 0
+        session = get_session()
+        try:
+            for start in range(0, len(transaction_signatures), TRANSACTION_DB_CHUNK_SIZE):
+                chunk = transaction_signatures[start:start + TRANSACTION_DB_CHUNK_SIZE]
+                updated += session.query(SolanaTransaction).filter(
+                    SolanaTransaction.transaction_signature.in_(chunk)
+                ).update({SolanaTransaction.last_accessed_at: accessed_at}, synchronize_session=False)
+            session.commit()
+            return updated
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error recording transaction accesses: {e}")
+            return updated
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def get_archive_candidates(accessed_before: Optional[int], limit: int) -> List[Tuple[str, bytes, int]]:
+        """
+        Retrieve the least recently accessed transactions with their raw compressed blobs,
+        so they can be moved to the cold tier without being recompressed.
+        
+        Args:
+            accessed_before: Only return transactions last accessed before this unix timestamp (None for no limit)
+            limit: Maximum number of transactions to return
+            
+        Returns:
+            List[Tuple[str, bytes, int]]: (signature, zlib compressed JSON blob, uncompressed size) tuples
+        """
+        session = get_session()
+        try:
+            query = session.query(
+                SolanaTransaction.transaction_signature,
+                # Bypass CompressedJSON to get the stored bytes as they are
+                type_coerce(SolanaTransaction.transaction_json, LargeBinary),
+                SolanaTransaction.size
+            )
+            if accessed_before is not None:
+                query = query.filter(SolanaTransaction.last_accessed_at < accessed_before)
+            rows = query.order_by(SolanaTransaction.last_accessed_at).limit(limit).all()
+            return [(signature, bytes(blob), size or 0) for signature, blob, size in rows]
+        except Exception as e:
+            logger.error(f"Error retrieving archive candidates: {e}")
+            return []
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def get_hot_tier_size() -> int:
+        """
+        Sum of the uncompressed sizes of the transactions stored in the database.
+        
+        Returns:
+            int: Size in bytes
+        """
+        session = get_session()
+        try:
+            return session.query(func.coalesce(func.sum(SolanaTransaction.size), 0)).scalar()
+        except Exception as e:
+            logger.error(f"Error computing hot tier size: {e}")
+            return 0
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def delete_transactions(transaction_signatures: List[str]) -> int:
+        """
+        Delete multiple transactions from the database.
+        
+        Args:
+            transaction_signatures: Signatures of the transactions to delete
+            
+        Returns:
+            int: The number of deleted rows
+        """
+        if not transaction_signatures:
+            return 0
+
+        deleted = 0
+        session = get_session()
+        try:
+            for start in range(0, len(transaction_signatures), TRANSACTION_DB_CHUNK_SIZE):
+                chunk = transaction_signatures[start:start + TRANSACTION_DB_CHUNK_SIZE]
+                deleted += session.query(SolanaTransaction).filter(
+                    SolanaTransaction.transaction_signature.in_(chunk)
+                ).delete(synchronize_session=False)
+            session.commit()
+            return deleted
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error deleting transactions: {e}")
+            return 0
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def insert_raw_transactions(rows: List[Dict[str, Any]]) -> int:
+        """
+        Bulk insert transactions whose JSON is already zlib compressed in the CompressedJSON format.
+        Transactions that are already stored are skipped. PostgreSQL loads the rows with COPY
+        through a temporary table, SQLite with batched INSERT ... ON CONFLICT DO NOTHING.
+        
+        Args:
+            rows: Dictionaries with a value for each column of RAW_TRANSACTION_COLUMNS
+            
+        Returns:
+            int: The number of inserted transactions
+
+        Raises:
+            Exception: Database errors are logged and re-raised so bulk loads fail loudly
+        """
+        if not rows:
+            return 0
+
+        session = get_session()
+        try:
+            if session.get_bind().dialect.name == 'postgresql':
+                inserted = TransactionRepository._copy_raw_transactions(session, rows)
+            else:
+                inserted = 0
+                for start in range(0, len(rows), TRANSACTION_UPSERT_BATCH_SIZE):
+                    inserted += session.execute(build_upsert(
+                        session,
+                        RAW_TRANSACTIONS_TABLE,
+                        rows[start:start + TRANSACTION_UPSERT_BATCH_SIZE],
+                        index_elements=["transaction_signature"]
+                    )).rowcount
+            session.commit()
+            return inserted
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error inserting {len(rows)} raw transactions: {e}")
+            raise
+        finally:
+            close_session(session)
+
+    @staticmethod
+    def _copy_raw_transactions(session, rows: List[Dict[str, Any]]) -> int:
+        columns = ", ".join(RAW_TRANSACTION_COLUMNS)
+        session.execute(text(
+            "CREATE TEMP TABLE IF NOT EXISTS solana_transactions_import "
+            "(LIKE solana_transactions INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        ))
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([
+                # bytea hex input format
+                "\\x" + value.hex() if isinstance(value, bytes) else value
+                for value in (row[name] for name in RAW_TRANSACTION_COLUMNS)
+            ])
+        buffer.seek(0)
+
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY solana_transactions_import ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+        finally:
+            cursor.close()
+
+        return session.execute(text(
+            f"INSERT INTO solana_transactions ({columns}) "
+            f"SELECT {columns} FROM solana_transactions_import "
+            "ON CONFLICT (transaction_signature) DO NOTHING"
+        )).rowcount
+
+    @staticmethod
+    def iter_raw_transactions(
+        start_slot: Optional[int] = None,
+        end_slot: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> Iterator[Tuple[str, bytes]]:
+        """
+        Stream every stored transaction as its zlib compressed JSON blob, without decompressing it.
+        Rows are read in signature order with keyset pagination, one short session per batch.
+        
+        Args:
+            start_slot: Optional first slot to export (inclusive)
+            end_slot: Optional last slot to export (inclusive)
+            batch_size: Number of rows per query (defaults to TRANSACTION_DB_CHUNK_SIZE)
+            
+        Yields:
+            Tuple[str, bytes]: (transaction signature, zlib compressed JSON blob)
+        """
+        batch_size = batch_size or TRANSACTION_DB_CHUNK_SIZE
+        last_signature = None
+        while True:
+            session = get_session()
+            try:
+                query = session.query(
+                    SolanaTransaction.transaction_signature,
+                    type_coerce(SolanaTransaction.transaction_json, LargeBinary)
+                )
+                if start_slot is not None:
+                    query = query.filter(SolanaTransaction.slot >= start_slot)
+                if end_slot is not None:
+                    query = query.filter(SolanaTransaction.slot <= end_slot)
+                if last_signature is not None:
+                    query = query.filter(SolanaTransaction.transaction_signature > last_signature)
+                rows = query.order_by(SolanaTransaction.transaction_signature).limit(batch_size).all()
+            finally:
+                close_session(session)
+
+            if not rows:
+                return
+            for signature, blob in rows:
+                yield signature, bytes(blob)
+            last_signature = rows[-1][0]
+
     @staticmethod
     def count_transactions() -> int:
         """
@@ -144,4 +659,7 @@ class TransactionRepository:
             logger.error(f"Error counting transactions: {e}")
             return 0
         finally:
-            close_session(session)
\ No newline at end of file
+            close_session(session)
+
+# Reads served by this process, whose access times keep the transactions in the hot tier
+access_tracker = TransactionAccessTracker(TransactionRepository.touch_transactions)
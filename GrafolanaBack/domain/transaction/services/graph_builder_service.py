@@ -37,21 +37,21 @@ class GraphBuilderService:
         """
         # Try to find latest version in Graph
         account_version_source = None
-        for account_version in reversed(transaction_context.account_repository.account_versions.get(source_address)):
+        for account_version in reversed(transaction_context.account_repository.get_versions(source_address)):
             if transaction_context.graph.has_node(account_version.get_vertex()):
                 account_version_source = account_version
                 break
         
         # If none found then use most recent and add it to graph
         if account_version_source is None:
-            account_version_source = transaction_context.account_repository.account_versions.get(source_address)[-1]
+            account_version_source = transaction_context.account_repository.get_versions(source_address)[-1]
             transaction_context.graph.add_node(account_version_source.get_vertex())
 
         # If account version found is the latest, then add a new one for balance update
-        if account_version_source == account_version_source == transaction_context.account_repository.account_versions.get(source_address)[-1]:
+        if account_version_source == account_version_source == transaction_context.account_repository.get_versions(source_address)[-1]:
             account_version_souce_new_balance = transaction_context.account_repository.new_account_version(source_address)
         else:
-            account_version_souce_new_balance = transaction_context.account_repository.account_versions.get(source_address)[-1]
+            account_version_souce_new_balance = transaction_context.account_repository.get_versions(source_address)[-1]
 
         if mint_address:
             # update mint if not known yet
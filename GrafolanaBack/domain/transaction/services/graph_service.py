@@ -1,4 +1,5 @@
-from typing import Dict, List, Optional, Set, Tuple, Any
+import hashlib
+from typing import Callable, Dict, List, Optional, Set, Tuple, Any
 import networkx as nx
 from networkx import Graph
 from solders.pubkey import Pubkey
@@ -11,77 +12,142 @@ from GrafolanaBack.domain.transaction.config.constants import REFERENCE_COINS, S
 from GrafolanaBack.domain.transaction.models.graphspace import Graphspace
 from GrafolanaBack.domain.transaction.models.swap import TransferAccountAddresses
 from GrafolanaBack.domain.transaction.models.transaction_context import TransactionContext
+from GrafolanaBack.domain.transaction.utils.graph_templates import GRAPH_PAYLOAD_FULL, GRAPH_PAYLOAD_TEMPLATES, compress_graph_data
 from GrafolanaBack.domain.transaction.utils.utils import get_sol_price, get_token_price
 from GrafolanaBack.domain.logging.logging import logger
 
+# Prefix of the structure fingerprints, naming the invariant and the networkx release whose
+# Weisfeiler-Lehman hash it uses. Stored fingerprints with another prefix are computed again.
+# Bump the revision when the invariant or the graphs built by the parsers change
+STRUCTURE_FINGERPRINT_VERSION = "wl3r1-nx" + ".".join(nx.__version__.split(".")[:2])
+
 class GraphService:
     @staticmethod
     def analyse_isomorphic_transactions(graphspace: Graphspace) -> None:
         """
         Analyze isomorphic transactions in the graphspace and update the graph accordingly.
-        Compare all transactions together and check if they are isomorphic using the networkx library.
+        Group the transactions whose graphs are isomorphic using the networkx library.
         When 2 graphs are isomophic we define an isomorphic group for them and assign it to their respective transaction context.
-        Once a transaction context is assigned to a group, it won't be compared to other transactions
         
+        Transactions are bucketed by their structure fingerprint (computed at parse time, or here when
+        the context has none), cyclic graphs are only built for the transactions sharing their fingerprint.
+
         Args:
             graphspace: The graphspace containing transaction contexts
         """
+        contexts = graphspace.transaction_contexts
+        fingerprints: Dict[str, str] = {}
+        for sig, context in contexts.items():
+            if context.structure_fingerprint is None:
+                context.structure_fingerprint = GraphService.transaction_structure_fingerprint(context.graph)
+            fingerprints[sig] = context.structure_fingerprint
+
+        isomorphic_groups = GraphService.group_by_fingerprint(
+            fingerprints,
+            lambda sig: GraphService.convert_dag_to_cyclicgraph(contexts[sig].graph)
+        )
+        for sig, group_id in isomorphic_groups.items():
+            contexts[sig].isomorphic_group = group_id
+
+        logger.info(f"Isomorphic groups found: {len(set(isomorphic_groups.values()))}")
 
-        # Convert all transaction graphs to cyclic graphs into a new dict
-        cyclic_graphs: Dict[str, Graph] = {}
-        for sig, context in graphspace.transaction_contexts.items():
-            cyclic_graphs[sig] = GraphService.convert_dag_to_cyclicgraph(context.graph.graph)
-        
-        # Create a mapping of isomorphic groups
-        # This will be a dict of {group_id: [transaction_signatures]}
-        isomorphic_groups: Dict[int, List[str]] = {}
+    @staticmethod
+    def group_isomorphic_graphs(graphs: Dict[str, Graph]) -> Dict[str, int]:
+        """
+        Group isomorphic cyclic graphs, see group_by_fingerprint.
+
+        Args:
+            graphs: Cyclic graphs by transaction signature
+
+        Returns:
+            The group of every signature whose graph is isomorphic to at least another one
+        """
+        fingerprints = {sig: GraphService.structure_fingerprint(graph) for sig, graph in graphs.items()}
+        return GraphService.group_by_fingerprint(fingerprints, graphs.__getitem__)
+
+    @staticmethod
+    def group_by_fingerprint(fingerprints: Dict[str, str], get_graph: Callable[[str], Graph]) -> Dict[str, int]:
+        """
+        Group transactions with isomorphic cyclic graphs.
+
+        Transactions are bucketed by structure fingerprint, so nx.is_isomorphic only compares
+        graphs of the same bucket and transactions alone in their bucket need no graph. Every
+        transaction not grouped yet opens a group (numbered from 1 in the order of fingerprints)
+        with the transactions of its bucket isomorphic to it.
+
+        Args:
+            fingerprints: Structure fingerprint by transaction signature
+            get_graph: Returns the cyclic graph of a signature, called once per compared signature
+
+        Returns:
+            The group of every signature whose graph is isomorphic to at least another one
+        """
+        buckets: Dict[str, List[str]] = {}
+        for sig, fingerprint in fingerprints.items():
+            buckets.setdefault(fingerprint, []).append(sig)
+
+        graphs: Dict[str, Graph] = {}
+        def graph_of(sig: str) -> Graph:
+            graph = graphs.get(sig)
+            if graph is None:
+                graph = graphs[sig] = get_graph(sig)
+            return graph
+
+        group_by_signature: Dict[str, int] = {}
+        grouped: Set[str] = set()
         group_id = 0
-        
-        # Iterate through all transaction graphs and check for isomorphism
-        for sig_a, graph_a in cyclic_graphs.items():
+        for sig_a, fingerprint in fingerprints.items():
             # Skip if already assigned to a group
-            if any(sig_a in group for group in isomorphic_groups.values()):
+            if sig_a in grouped:
                 continue
             
             # Initialize a new group for this transaction
             group_id += 1
-            isomorphic_groups[group_id] = [sig_a]
+            grouped.add(sig_a)
 
-            # Compare with all other graphs
-            for sig_b, graph_b in cyclic_graphs.items():
-                if sig_a == sig_b or any(sig_b in group for group in isomorphic_groups.values()):
+            # Compare with the other graphs of the same bucket
+            bucket = buckets[fingerprint]
+            if len(bucket) == 1:
+                continue
+            for sig_b in bucket:
+                if sig_b in grouped:
                     continue
+                if nx.is_isomorphic(graph_of(sig_a), graph_of(sig_b)):
+                    grouped.add(sig_b)
+                    group_by_signature[sig_a] = group_id
+                    group_by_signature[sig_b] = group_id
 
-                # Check if the graphs are isomorphic
-                if nx.is_isomorphic(graph_a, graph_b):
-                    # logger.info(f"Transaction {sig_a} and {sig_b} are isomorphic.")
-                    isomorphic_groups[group_id].append(sig_b)
-                    graphspace.transaction_contexts[sig_a].isomorphic_group = group_id
-                    graphspace.transaction_contexts[sig_b].isomorphic_group = group_id
-
-
-
+        return group_by_signature
 
-        logger.info(f"Isomorphic groups found: {len(isomorphic_groups)}")
+    @staticmethod
+    def isomorphism_invariant(graph: Graph) -> Tuple[Any, ...]:
+        """
+        Value equal for isomorphic graphs: node and edge counts, degree sequence and
+        Weisfeiler-Lehman hash of the structure (is_isomorphic ignores addresses and edge data)
+        """
+        return (
+            graph.number_of_nodes(),
+            graph.number_of_edges(),
+            tuple(sorted(degree for _, degree in graph.degree())),
+            nx.weisfeiler_lehman_graph_hash(graph, iterations=3),
+        )
 
-        # for i, (sig_a, graph_a) in enumerate(transaction_graphs.items()):
-        #     if sig_a in isomorphic_groups:
-        #         continue
-        #     for j, (sig_b, graph_b) in enumerate(transaction_graphs.items()):
-        #         if sig_a == sig_b or sig_b in isomorphic_groups:
-        #             continue
-        #         # Check if the graphs are isomorphic
-        #         if nx.could_be_isomorphic(graph_a.graph, graph_b.graph):
-        #             logger.info(f"Transaction {sig_a} and {sig_b} are isomorphic.")
-        #             # If they are isomorphic, assign them to the same group
-        #             isomorphic_group_id = len(isomorphic_groups) + 1
-        #             isomorphic_groups[sig_a] = isomorphic_group_id
-        #             isomorphic_groups[sig_b] = isomorphic_group_id
-        #             transaction_contexts[sig_a].isomorphic_group = isomorphic_group_id
-        #             transaction_contexts[sig_b].isomorphic_group = isomorphic_group_id
+    @staticmethod
+    def structure_fingerprint(graph: Graph) -> str:
+        """
+        Hex digest of the isomorphism invariant of a cyclic graph, prefixed by STRUCTURE_FINGERPRINT_VERSION.
+        Stable across processes, it is stored to find the transactions with the same structure.
+        Isomorphic graphs share their fingerprint, rare non isomorphic ones may too.
+        """
+        digest = hashlib.blake2b(repr(GraphService.isomorphism_invariant(graph)).encode("utf-8"), digest_size=16).hexdigest()
+        return f"{STRUCTURE_FINGERPRINT_VERSION}:{digest}"
 
+    @staticmethod
+    def transaction_structure_fingerprint(graph: TransactionGraph) -> str:
+        """Structure fingerprint of a transaction graph"""
+        return GraphService.structure_fingerprint(GraphService.convert_dag_to_cyclicgraph(graph))
 
-    def convert_dag_to_cyclicgraph(dag: nx.MultiDiGraph) -> Graph:
+    def convert_dag_to_cyclicgraph(dag: TransactionGraph) -> Graph:
         """
         Convert a directed acyclic graph (DAG) by aggregating all links 
         that have same source adress and same target address into a single link.
@@ -96,7 +162,7 @@ class GraphService:
         source: AccountVertex
         target: AccountVertex
         # Iterate through all edges in the original graph
-        for source, target, data in dag.edges(data=True):
+        for source, target, _, data in dag.get_edges():
             key = f"{source.address}_{target.address}"
             # Check if the edge has already been seen
             if not key in seenLinks:
@@ -122,7 +188,7 @@ class GraphService:
 
         mint_price_map = {}
 
-        swap_edges = [(u, v, data) for u, v, data in context.graph.graph.edges(data=True) if data["transfer_type"] == TransferType.SWAP]
+        swap_edges = [(u, v, data) for u, v, _, data in context.graph.get_edges(transfer_type=TransferType.SWAP)]
 
         sol_usd_price = sol_price
         reference_prices = {mint: get_token_price(mint, sol_usd_price) for mint in REFERENCE_COINS}
@@ -144,8 +210,8 @@ class GraphService:
             made_progress = False
             iterations += 1
             for source,destination,data in swap_edges:
-                mint_source = context.account_repository.accounts.get(source.address).mint_address
-                mint_destination = context.account_repository.accounts.get(destination.address).mint_address
+                mint_source = context.account_repository.get_account(source.address).mint_address
+                mint_destination = context.account_repository.get_account(destination.address).mint_address
                 amount_source = data["amount_source"]
                 amount_destination = data["amount_destination"]
 
@@ -238,7 +304,7 @@ class GraphService:
         key: str
         data: dict
         # First get all edges and sort them by key
-        sorted_edges = sorted(context.graph.graph.edges(data=True, keys=True), key=lambda x: x[2])  # x[2] is the key
+        sorted_edges = sorted(context.graph.get_edges(), key=lambda x: x[2])  # x[2] is the key
 
         edges_data = []
 
@@ -289,7 +355,7 @@ class GraphService:
             List of dictionaries containing node data"""
         nodes_data = []
         # Process nodes from account_version_mapping
-        for address, versions in context.account_repository.account_versions.items():
+        for address, versions in context.account_repository.iter_account_versions():
             for version in versions:
                 account_vertex = AccountVertex(address, version.version, context.transaction_signature)
                 if context.graph.has_node(account_vertex):
@@ -334,6 +400,7 @@ class GraphService:
             "accounts" : context.account_repository.get_all_accountTransactions(),
             "mint_usd_price_ratio": {},
             "isomorphic_group": context.isomorphic_group,
+            "structure_fingerprint": context.structure_fingerprint,
             "timestamp": context.blocktime*1000,
             "err": context.err,
         }
@@ -382,13 +449,19 @@ class GraphService:
         return graph_data
 
     @staticmethod
-    def get_graph_data_from_graphspace(graphspace: Graphspace) -> Dict[str, Any]:
+    def get_graph_data_from_graphspace(
+        graphspace: Graphspace,
+        graph_payload: str = GRAPH_PAYLOAD_FULL,
+        stored_sol_prices: Optional[Dict[int, float]] = None
+    ) -> Dict[str, Any]:
         """
         Convert a graphspace to a graph for front end, with optimized parallel processing
         of price ratio calculations.
         
         Args:
             graphspace: The graphspace containing transaction contexts
+            graph_payload: GRAPH_PAYLOAD_TEMPLATES to send the transactions of the same shape as templates
+            stored_sol_prices: Optional SOL prices already read from the database, by minute timestamp (ms)
             
         Returns:
             Dictionary containing all graph data for frontend visualization
@@ -399,11 +472,15 @@ class GraphService:
         all_timestamps = [context.blocktime*1000 for context in graphspace.transaction_contexts.values()]
 
         sol_price_service = SOLPriceService()
+        if stored_sol_prices:
+            sol_price_service.price_cache.update(stored_sol_prices)
         sol_usd_price = sol_price_service.get_sol_prices_batch(all_timestamps)
         
         # Now build the graph data sequentially using the pre-computed price ratios
         for context in graphspace.transaction_contexts.values():
             GraphService.set_graph_data(context, graph_data)
             graph_data["transactions"][context.transaction_signature]["mint_usd_price_ratio"] = GraphService._derive_usd_price_ratio(context, sol_usd_price[context.blocktime*1000])
-     
+
+        if graph_payload == GRAPH_PAYLOAD_TEMPLATES:
+            return compress_graph_data(graph_data)
         return graph_data
\ No newline at end of file
@@ -1,5 +1,8 @@
+import time
 from typing import Dict, List, Optional, Set, Tuple, Any
 
+from GrafolanaBack.domain.performance.parser_profiler import PARSER, SWAP
+
 from GrafolanaBack.domain.transaction.models.swap import Swap
 from GrafolanaBack.domain.transaction.models.transaction_context import TransactionContext
 from GrafolanaBack.domain.transaction.parsers.instruction_parsers import (
@@ -17,12 +20,18 @@ class InstructionParserService:
     Service for parsing different types of Solana instructions.
     
     This service uses the Strategy pattern to dispatch parsing to specialized
-    parsers based on the instruction type.
+    parsers based on the instruction type. Parsers declaring dispatch keys are
+    indexed by (program name or address, parsed type), so each instruction only
+    reaches the parsers that can handle it; parsers without keys are tried on
+    every instruction after the indexed ones.
     """
     transfer_parsers: List[InstructionParser]
     
     def __init__(self):
-        self.transfer_parsers = [
+        self.transfer_parsers = []
+        self._dispatch_index: Dict[Tuple[str, Optional[str]], List[InstructionParser]] = {}
+        self._fallback_parsers: List[InstructionParser] = []
+        for parser in (
             SystemTransferParser(),
             TokenTransferParser(),
             TokenTransferCheckedParser(),
@@ -40,7 +49,39 @@ class InstructionParserService:
             SystemAssignParser(),
             InitializeMintParser(),
             InitializeParser(),
-        ]
+        ):
+            self.register_parser(parser)
+    
+    def register_parser(self, parser: InstructionParser, dispatch_keys: Optional[Tuple[Tuple[str, Optional[str]], ...]] = None):
+        """
+        Add a transfer parser.
+        
+        Args:
+            parser: The parser to add
+            dispatch_keys: (program name or address, parsed type) pairs routed to the parser,
+                           defaults to parser.dispatch_keys. Without keys the parser is tried
+                           on every instruction.
+        """
+        keys = parser.dispatch_keys if dispatch_keys is None else dispatch_keys
+        self.transfer_parsers.append(parser)
+        if not keys:
+            self._fallback_parsers.append(parser)
+            return
+        for key in keys:
+            self._dispatch_index.setdefault(key, []).append(parser)
+    
+    def get_candidate_parsers(self, instruction: Parsed_Instruction) -> List[InstructionParser]:
+        """
+        Returns the parsers that may handle an instruction, indexed ones first.
+        """
+        parsed = instruction.parsed
+        parsed_type = parsed.get("type") if isinstance(parsed, dict) else None
+        candidates = []
+        if instruction.program_name is not None:
+            candidates.extend(self._dispatch_index.get((instruction.program_name, parsed_type), ()))
+        candidates.extend(self._dispatch_index.get((instruction.program_address, parsed_type), ()))
+        candidates.extend(self._fallback_parsers)
+        return candidates
     
     def parse_transfer(self, instruction: Parsed_Instruction, context: TransactionContext, parent_swap_id: int = None, parent_router_swap_id: int = None) -> bool:
         """
@@ -55,10 +96,30 @@ class InstructionParserService:
         Returns:
             True if the instruction was parsed as a transfer, False otherwise
         """
-        for parser in self.transfer_parsers:
+        if context is not None and context.profile is not None:
+            return self._profile_parse_transfer(instruction, context, parent_swap_id, parent_router_swap_id)
+        for parser in self.get_candidate_parsers(instruction):
             if parser.can_parse(instruction):
                 return parser.parse(instruction, context, parent_swap_id, parent_router_swap_id)
         return False
     
+    def _profile_parse_transfer(self, instruction: Parsed_Instruction, context: TransactionContext, parent_swap_id: int = None, parent_router_swap_id: int = None) -> bool:
+        """parse_transfer recording the time spent by the matching parser class, or the lookup when none matches"""
+        start = time.perf_counter()
+        for parser in self.get_candidate_parsers(instruction):
+            if parser.can_parse(instruction):
+                parsed = parser.parse(instruction, context, parent_swap_id, parent_router_swap_id)
+                context.profile.record(PARSER, type(parser).__name__, time.perf_counter() - start)
+                return parsed
+        context.profile.record(PARSER, "unmatched", time.perf_counter() - start)
+        return False
+    
     def parse_swap(self, instruction: Parsed_Instruction, context: TransactionContext, parent_router_swap_id: int = None) -> Optional[Swap]:
-        return SwapParserService.parse_swap(instruction, context, parent_router_swap_id)
\ No newline at end of file
+        if context.profile is None:
+            return SwapParserService.parse_swap(instruction, context, parent_router_swap_id)
+        # Recorded by swap program and instruction
+        start = time.perf_counter()
+        swap = SwapParserService.parse_swap(instruction, context, parent_router_swap_id)
+        name = f"{swap.program_name}.{swap.instruction_name}" if swap else "unmatched"
+        context.profile.record(SWAP, name, time.perf_counter() - start)
+        return swap
\ No newline at end of file
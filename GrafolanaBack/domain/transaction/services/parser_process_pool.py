@@ -0,0 +1,166 @@
+import os
+import pickle
+import threading
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from solders.transaction_status import EncodedConfirmedTransactionWithStatusMeta
+
+from GrafolanaBack.domain.transaction.models.transaction_context import TransactionContext
+from GrafolanaBack.domain.transaction.utils.transaction_decoder import RAW_TRANSACTION_DECODER_ENABLED
+from GrafolanaBack.domain.logging.logging import logger
+
+# Parse transactions in worker processes instead of the TransactionService threads,
+# so parsing large account graphs is not serialized by the GIL
+PARSER_PROCESS_POOL_ENABLED = os.getenv("PARSER_PROCESS_POOL_ENABLED", "false").lower() == "true"
+# Number of parser processes (0 = one per CPU core)
+PARSER_PROCESS_WORKERS = int(os.getenv("PARSER_PROCESS_WORKERS", "0")) or os.cpu_count() or 1
+
+# Parser of the current worker process, built once by _init_worker
+_worker_parser = None
+
+def _init_worker():
+    """
+    Warm up a worker process: build the parsers once, so each transaction only pays
+    for its own parsing. The program registry is compiled at import, forked workers
+    inherit it from the parent process.
+    """
+    global _worker_parser
+    # Imported here: the parser service depends on TransactionService, which uses this module
+    from GrafolanaBack.domain.transaction.services.transaction_parser_service import TransactionParserService
+
+    # Only the stateless parsers: no transaction service, thread pool or database engine
+    _worker_parser = TransactionParserService(parse_only=True)
+
+def _warm_up(_: int) -> int:
+    return os.getpid()
+
+def parse_raw_transaction(signature: str, raw_transaction: bytes, compressed: bool) -> Optional[bytes]:
+    """
+    Parse a transaction in a worker process.
+
+    Args:
+        signature: Transaction signature
+        raw_transaction: Transaction JSON, zlib compressed as stored in the database if compressed is True
+        compressed: Whether raw_transaction is zlib compressed
+
+    Returns:
+        Optional[bytes]: The pickled TransactionContext, or None if the transaction could not be parsed
+    """
+    if _worker_parser is None:
+        # Parsing in the calling process, after the worker processes died
+        _init_worker()
+    transaction_json = zlib.decompress(raw_transaction) if compressed else raw_transaction
+    if RAW_TRANSACTION_DECODER_ENABLED:
+        context = _worker_parser.parse_raw_transaction_call_back(signature, transaction_json)
+    else:
+        encoded_transaction = EncodedConfirmedTransactionWithStatusMeta.from_json(transaction_json.decode("utf-8"))
+        context = _worker_parser.parse_transaction_call_back(signature, encoded_transaction)
+    if context is None:
+        return None
+    return pickle.dumps(context, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class ParserProcessPool:
+    """
+    Pool of warm worker processes parsing transactions into TransactionContext objects.
+
+    Workers receive the compressed transaction blobs as stored in the database and
+    send back pickled contexts, so only compact bytes cross the process boundary.
+    The processes are started on first use.
+    """
+
+    def __init__(self, workers: int = PARSER_PROCESS_WORKERS):
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+                # Start every worker now so the first request does not pay for the warm up
+                list(executor.map(_warm_up, range(self.workers)))
+                logger.info(f"Started {self.workers} transaction parser processes")
+                self._executor = executor
+            return self._executor
+
+    def submit(self, signature: str, raw_transaction: bytes, compressed: bool = True) -> "Future[Optional[bytes]]":
+        """
+        Queue a transaction for parsing.
+
+        Args:
+            signature: Transaction signature
+            raw_transaction: Transaction JSON bytes
+            compressed: Whether raw_transaction is zlib compressed
+
+        Returns:
+            Future of the pickled context, to be read with load_result
+        """
+        try:
+            return self._get_executor().submit(parse_raw_transaction, signature, raw_transaction, compressed)
+        except BrokenProcessPool:
+            self._discard_if_broken()
+            return self._get_executor().submit(parse_raw_transaction, signature, raw_transaction, compressed)
+
+    def get_result(self, future: "Future[Optional[bytes]]", signature: str, raw_transaction: bytes, compressed: bool = True) -> Optional[TransactionContext]:
+        """
+        Wait for a transaction queued with submit.
+        If the worker processes died before parsing it, the pool is restarted for the next
+        submissions and this transaction is parsed in the calling process instead.
+
+        Args:
+            future: Future returned by submit
+            signature, raw_transaction, compressed: The arguments given to submit
+
+        Returns:
+            Optional[TransactionContext]: The parsed context, or None if the transaction could not be parsed
+        """
+        try:
+            return self.load_result(future.result())
+        except BrokenProcessPool:
+            self._discard_if_broken()
+            return self.load_result(parse_raw_transaction(signature, raw_transaction, compressed))
+
+    def _discard_if_broken(self):
+        """Drop the executor if a worker died (e.g. killed for memory), a fresh one starts on the next submit"""
+        with self._lock:
+            if self._executor is None:
+                return
+            try:
+                # Raises BrokenProcessPool once the executor is broken
+                self._executor.submit(_warm_up, 0)
+                return
+            except BrokenProcessPool:
+                logger.error("Transaction parser processes died, restarting them")
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+
+    @staticmethod
+    def load_result(payload: Optional[bytes]) -> Optional[TransactionContext]:
+        """Unpickle a context returned by a worker"""
+        return pickle.loads(payload) if payload is not None else None
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+
+
+_parser_pool: Optional[ParserProcessPool] = None
+_parser_pool_lock = threading.Lock()
+
+def get_parser_process_pool() -> Optional[ParserProcessPool]:
+    """
+    Returns the shared parser process pool, or None when PARSER_PROCESS_POOL_ENABLED is false.
+    """
+    global _parser_pool
+    if not PARSER_PROCESS_POOL_ENABLED:
+        return None
+    with _parser_pool_lock:
+        if _parser_pool is None:
+            _parser_pool = ParserProcessPool()
+        return _parser_pool
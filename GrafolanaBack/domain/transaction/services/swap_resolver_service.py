@@ -1,4 +1,5 @@
 import networkx as nx
+from collections import deque
 from typing import Dict, List, Optional, Set, Tuple, Any
 
 from GrafolanaBack.domain.transaction.models.account import AccountVertex
@@ -7,6 +8,7 @@ from GrafolanaBack.domain.transaction.models.swap import Swap, TransferAccountAd
 from GrafolanaBack.domain.transaction.models.transaction_context import TransactionContext
 from GrafolanaBack.domain.transaction.repositories.account_repository import AccountRepository
 from GrafolanaBack.domain.logging.logging import logger
+from GrafolanaBack.domain.performance.parser_profiler import SWAP_RESOLVER, measure
 from GrafolanaBack.domain.transaction.services.graph_builder_service import GraphBuilderService
 
 class SwapResolverService:
@@ -37,15 +39,20 @@ class SwapResolverService:
         # For each swap, find paths between accounts
         swap: Swap
         # First resolve all swaps that are not router swaps
+        profile = transaction_context.profile
         for swap in transaction_context.swaps:
             if not swap.router:
-                if not self.resolve_swap(transaction_context, swap):
+                with measure(profile, SWAP_RESOLVER, "resolve_swap"):
+                    resolved = self.resolve_swap(transaction_context, swap)
+                if not resolved:
                     failed_swaps.append(swap.id)
         
         # Then resolve all router swaps using the path resolved from normal swaps
         for swap in transaction_context.swaps:
             if swap.router:
-                if not self.resolve_router_swap_paths(transaction_context, swap):
+                with measure(profile, SWAP_RESOLVER, "resolve_router_swap"):
+                    resolved = self.resolve_router_swap_paths(transaction_context, swap)
+                if not resolved:
                     failed_swaps.append(swap.id)
         
         # Remove failed swaps from the transaction context
@@ -164,12 +171,43 @@ class SwapResolverService:
         """
         Resolve a swap operation in the transaction graph.
         """
+        profile = transaction_context.profile
+
+        with measure(profile, SWAP_RESOLVER, "swap_edges"):
+            edges = transaction_context.graph.get_swap_edges(swap)
+        if not edges:
+            logger.warning(f"No edges found for swap {swap.id}, tx: {transaction_context.transaction_signature}")
+            return False
+
+        # Single pass over the swap's edges: adjacency for the traversals, amount_out and key bounds.
+        # amount_out sums the amount_source of the edges to swap.user_addresses.destination
+        # minus the edges from it, ignoring the edges where it is both source and destination
+        user_destination = swap.user_addresses.destination
+        vertices: Dict[AccountVertex, None] = {}
+        successors: Dict[AccountVertex, Dict[AccountVertex, Dict[int, Dict[str, Any]]]] = {}
+        predecessors: Dict[AccountVertex, Dict[AccountVertex, None]] = {}
+        amount_out = 0
+        min_key = max_key = int(edges[0][2])
+        source: AccountVertex
+        destination: AccountVertex
+        for source, destination, key, data in edges:
+            vertices[source] = None
+            vertices[destination] = None
+            successors.setdefault(source, {}).setdefault(destination, {})[key] = data
+            predecessors.setdefault(destination, {})[source] = None
+            if source.address == user_destination and destination.address != user_destination:
+                amount_out -= data["amount_source"]
+            if destination.address == user_destination and source.address != user_destination:
+                amount_out += data["amount_source"]
+            key = int(key)
+            if key < min_key:
+                min_key = key
+            elif key > max_key:
+                max_key = key
 
-        subgraph = transaction_context.graph.create_subgraph_for_swap(swap)
-        
         # Get all vertices with the relevant addresses
-        user_source_vertices = [v for v in subgraph.nodes() if v.address == swap.get_user_source()]
-        user_dest_vertices = [v for v in subgraph.nodes() if v.address == swap.get_user_destination()]
+        user_source_vertices = [v for v in vertices if v.address == swap.get_user_source()]
+        user_dest_vertices = [v for v in vertices if v.address == swap.get_user_destination()]
         
         # Find the best source and destination vertices
         # Usually the earliest version for source (before swap happens) and 
@@ -177,30 +215,36 @@ class SwapResolverService:
         user_source_vertex: AccountVertex = min(user_source_vertices, key=lambda v: v.version) if user_source_vertices else None
         user_dest_vertex: AccountVertex = max(user_dest_vertices, key=lambda v: v.version) if user_dest_vertices else None
         if (user_source_vertex is None) or (user_dest_vertex is None):
-            logger.error(f"user vertices not found for swap {swap.id}, source: {user_source_vertex.address}, destination: {user_dest_vertex.address}, tx: {transaction_context.transaction_signature}")
+            logger.error(f"user vertices not found for swap {swap.id}, source: {swap.get_user_source()}, destination: {swap.get_user_destination()}, tx: {transaction_context.transaction_signature}")
             return False
 
         swap_pools : List[AccountVertex]= []
         # If pools are stored as source/destination
         if isinstance(swap.pool_addresses, TransferAccountAddresses):
-            swap_pools.extend([v for v in subgraph.nodes() if v.address == swap.pool_addresses.destination])
-            swap_pools.extend([v for v in subgraph.nodes() if v.address == swap.pool_addresses.source])
+            swap_pools.extend([v for v in vertices if v.address == swap.pool_addresses.destination])
+            swap_pools.extend([v for v in vertices if v.address == swap.pool_addresses.source])
         # If pools are stored as a list of pools
         else:
-            swap_pools = [v for v in subgraph.nodes() if v.address in swap.pool_addresses]
+            swap_pools = [v for v in vertices if v.address in swap.pool_addresses]
         # Search through list of pool's addresses for paths:
         #  - from user_source 
         #  - to user_destination
         pool_dest_vertices = []
         pool_source_vertices = []
+
+        # One traversal from user_source and one back from user_destination give the
+        # reachability of every pool and the transfers ending and starting the swap paths
+        with measure(profile, SWAP_RESOLVER, "traversals"):
+            reached_from_user_source = self._traverse(successors, user_source_vertex)
+            reaching_user_dest = self._traverse(predecessors, user_dest_vertex)
         
         # Might not be perfect..
         for pool in swap_pools:
             # Set is_pool to True for all pools in the mapping
-            self.accountRepository.accounts.get(pool.address).is_pool = True
-            if nx.has_path(subgraph,user_source_vertex, pool):
+            self.accountRepository.get_account(pool.address).is_pool = True
+            if pool in reached_from_user_source:
                 pool_dest_vertices.append(pool)
-            if nx.has_path(subgraph,pool, user_dest_vertex):
+            if pool in reaching_user_dest:
                 pool_source_vertices.append(pool)
 
         pool_dest_vertex: AccountVertex = max(pool_dest_vertices, key=lambda v: v.version) if pool_dest_vertices else None
@@ -209,52 +253,23 @@ class SwapResolverService:
             logger.error(f"pool vertices not found for swap {swap.id}, source: {user_source_vertex.address}, destination: {user_dest_vertex.address}, tx: {transaction_context.transaction_signature}")
             return False
 
-        logger.debug(f"finding paths for: user_source_vertex: {user_source_vertex.address}, pool_dest_vertex: {pool_dest_vertex.address}")
-        # Find path from user_source to pool_destination
-        try:
-            path_a = nx.shortest_path(subgraph, user_source_vertex, pool_dest_vertex)
-            if len(path_a) < 2:
-                logger.error(f"path user -> pool too short for swap {swap.id}, source: {user_source_vertex.address}, destination: {pool_dest_vertex.address}, tx: {transaction_context.transaction_signature}")
-                return False
-            _ , _ , data = transaction_context.graph.get_last_transfer(path_a, subgraph)
-            amount_in = sum(edge_data["amount_destination"] for edge_data in data.values())
-            
-            # Create a new transfer key for the swap
-            # We take the key of the transfer before the swap, and add 1 to it
-            swap_transfer_key = int(list(data.keys())[0]) + 5
-
-        except nx.NetworkXNoPath:
-            # Handle case where path doesn't exist
-            logger.error(f"path doesn't exist for swap {swap.id}, source: {user_source_vertex.address}, destination: {pool_dest_vertex.address}, tx: {transaction_context.transaction_signature}")
+        # Last transfer of the shortest path from user_source to pool_destination
+        if pool_dest_vertex == user_source_vertex:
+            logger.error(f"path user -> pool too short for swap {swap.id}, source: {user_source_vertex.address}, destination: {pool_dest_vertex.address}, tx: {transaction_context.transaction_signature}")
             return False
+        data = successors[reached_from_user_source[pool_dest_vertex]][pool_dest_vertex]
+        amount_in = sum(edge_data["amount_destination"] for edge_data in data.values())
+        
+        # Create a new transfer key for the swap
+        # We take the key of the transfer before the swap, and add 1 to it
+        swap_transfer_key = int(next(iter(data))) + 5
 
-        logger.debug(f"finding paths for: pool_source_vertex: {pool_source_vertex.address}, user_dest_vertex: {user_dest_vertex.address}")
-        # Find path from pool_source to user_destination
-        try:
-            path_b = nx.shortest_path(subgraph, pool_source_vertex, user_dest_vertex)
-            if len(path_b) < 2:
-                logger.error(f"path pool -> user too short for swap {swap.id}, source: {pool_source_vertex.address}, destination: {user_dest_vertex.address}, tx: {transaction_context.transaction_signature}")
-                return False
-            _ , _ , data = transaction_context.graph.get_first_transfer(path_b, subgraph)
-            real_swap_amount_out = sum(edge_data["amount_source"] for edge_data in data.values())
-
-            # Calculate amount_out by summing the amount_source of all edges with swap.user_addresses.destination as destination 
-            # minus the sum of all edges with swap.user_addresses.destination as source
-            # don't count edges where swap.user_addresses.destination is both source and destination
-            amount_out = 0
-            source: AccountVertex
-            destination: AccountVertex
-            for source, destination, data in subgraph.edges(data=True):
-                if source.address==swap.user_addresses.destination and destination.address != swap.user_addresses.destination:
-                    amount_out -= data["amount_source"]
-                if destination.address==swap.user_addresses.destination and source.address != swap.user_addresses.destination:
-                    amount_out += data["amount_source"]
-                
-
-        except nx.NetworkXNoPath:
-            # Handle case where path doesn't exist
-            logger.error(f"path doesn't exist for swap {swap.id}, source: {pool_source_vertex.address}, destination: {user_dest_vertex.address}, tx: {transaction_context.transaction_signature}")
+        # First transfer of the shortest path from pool_source to user_destination
+        if pool_source_vertex == user_dest_vertex:
+            logger.error(f"path pool -> user too short for swap {swap.id}, source: {pool_source_vertex.address}, destination: {user_dest_vertex.address}, tx: {transaction_context.transaction_signature}")
             return False
+        data = successors[pool_source_vertex][reaching_user_dest[pool_source_vertex]]
+        real_swap_amount_out = sum(edge_data["amount_source"] for edge_data in data.values())
         
         swap.fee = real_swap_amount_out - amount_out
 
@@ -280,11 +295,9 @@ class SwapResolverService:
 
         swap.program_account_vertex = swap_program_account.get_vertex()
 
-        # get lower key of all the swap's edges
-        swap_incoming_transfer_key = min([int(key) for _,_,key in subgraph.edges(keys=True)]) if len(subgraph.edges(keys=True)) > 0 else 0
-
-        # get maximum key of all the swap's edges
-        swap_outgoing_transfer_key = max([int(key) for _,_,key in subgraph.edges(keys=True)]) if len(subgraph.edges(keys=True)) > 0 else 0
+        # lower and maximum keys of all the swap's edges
+        swap_incoming_transfer_key = min_key
+        swap_outgoing_transfer_key = max_key
 
         # Add virtual transfer from user source to swap_program_account 
         transaction_context.graph.add_edge(
@@ -320,6 +333,23 @@ class SwapResolverService:
 
         return True
 
+    @staticmethod
+    def _traverse(adjacency: Dict[AccountVertex, Dict[AccountVertex, Any]], root: AccountVertex) -> Dict[AccountVertex, Optional[AccountVertex]]:
+        """
+        Breadth first traversal from root. Maps every reached vertex to the vertex it was
+        first reached from (root to None), i.e. its predecessor on the shortest path
+        nx.single_source_shortest_path would return.
+        """
+        parents: Dict[AccountVertex, Optional[AccountVertex]] = {root: None}
+        queue = deque((root,))
+        while queue:
+            vertex = queue.popleft()
+            for neighbour in adjacency.get(vertex, ()):
+                if neighbour not in parents:
+                    parents[neighbour] = vertex
+                    queue.append(neighbour)
+        return parents
+
     def _calculate_amount_in_from_balance_changes(self, graph: TransactionGraph, swap: Swap) -> int:
         """
         Calculate amount sent to a swap by analyzing balance changes in accounts.
@@ -347,10 +377,9 @@ class SwapResolverService:
         amount_in = 0
         
         # Find all outgoing transfer edges from source account to non-source accounts
-        for u, v, k, data in graph.graph.edges(data=True, keys=True):
+        for u, v, k, data in graph.get_edges(swap_parent_id=swap.id):
             if u.address == swap.get_user_source() and v.address != swap.get_user_source():
-                if data.get("swap_parent_id") == swap.id:
-                    amount_in += data["amount_source"]
+                amount_in += data["amount_source"]
         
         return amount_in
     
@@ -381,9 +410,8 @@ class SwapResolverService:
         amount_out = 0
         
         # Find all incoming transfer edges to destination account from non-destination accounts
-        for u, v, k, data in graph.graph.edges(data=True, keys=True):
+        for u, v, k, data in graph.get_edges(swap_parent_id=swap.id):
             if v.address == swap.get_user_destination() and u.address != swap.get_user_destination():
-                if data.get("swap_parent_id") == swap.id:
-                    amount_out += data["amount_destination"]
+                amount_out += data["amount_destination"]
         
         return amount_out
\ No newline at end of file
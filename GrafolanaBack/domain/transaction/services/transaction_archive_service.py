@@ -0,0 +1,109 @@
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+from GrafolanaBack.domain.infrastructure.scheduling import start_locked_interval_job
+from GrafolanaBack.domain.logging.logging import logger
+from GrafolanaBack.domain.transaction.repositories.transaction_archive import TransactionArchive, get_transaction_archive
+from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository, access_tracker
+
+# Retention policy of the hot tier: transactions not read for this many days move to the archive
+HOT_TIER_MAX_AGE_DAYS = float(os.getenv("HOT_TIER_MAX_AGE_DAYS", "30"))
+# Once the stored transactions exceed this uncompressed size, the least recently read ones move to the archive (0 = unlimited)
+HOT_TIER_MAX_BYTES = int(os.getenv("HOT_TIER_MAX_BYTES", "0"))
+TRANSACTION_ARCHIVE_BATCH_SIZE = int(os.getenv("TRANSACTION_ARCHIVE_BATCH_SIZE", "1000"))
+ARCHIVE_MOVER_INTERVAL_MINUTES = int(os.getenv("ARCHIVE_MOVER_INTERVAL_MINUTES", "60"))
+
+
+def _move_batch(archive: TransactionArchive, accessed_before: Optional[int], batch_size: int) -> Tuple[int, int]:
+    """
+    Move one batch of the least recently read transactions from the database to the archive.
+    Rows are only deleted once the archive has durably written them.
+
+    Returns:
+        Tuple[int, int]: The number of moved transactions and their uncompressed size in bytes
+    """
+    candidates = TransactionRepository.get_archive_candidates(accessed_before, batch_size)
+    if not candidates:
+        return 0, 0
+
+    archive.append((signature, blob) for signature, blob, _ in candidates)
+    # Stop the run if the rows cannot be deleted, instead of archiving them over and over
+    deleted = TransactionRepository.delete_transactions([signature for signature, _, _ in candidates])
+    return deleted, sum(size for _, _, size in candidates)
+
+
+def archive_cold_transactions(
+    archive: Optional[TransactionArchive] = None,
+    max_age_days: float = HOT_TIER_MAX_AGE_DAYS,
+    max_bytes: int = HOT_TIER_MAX_BYTES,
+    batch_size: int = TRANSACTION_ARCHIVE_BATCH_SIZE
+) -> Dict[str, int]:
+    """
+    Apply the hot tier retention policy: move the transactions that have not been read
+    for max_age_days, then keep moving the least recently read ones while the hot tier
+    is larger than max_bytes.
+
+    Args:
+        archive: Archive to move transactions to (defaults to the process-wide archive)
+        max_age_days: Age limit of the hot tier in days (0 to disable the age policy)
+        max_bytes: Size limit of the hot tier in bytes (0 to disable the size policy)
+        batch_size: Number of transactions moved per batch
+
+    Returns:
+        Dict[str, int]: Number of moved transactions and the hot tier size after the run
+    """
+    archive = archive or get_transaction_archive()
+    if archive is None:
+        return {"moved": 0, "hot_tier_bytes": TransactionRepository.get_hot_tier_size()}
+
+    # Reads of this process since the last flush; other processes flush their own
+    access_tracker.flush()
+    moved = 0
+
+    if max_age_days > 0:
+        cutoff = int(time.time() - max_age_days * 86400)
+        while True:
+            count, _ = _move_batch(archive, cutoff, batch_size)
+            if not count:
+                break
+            moved += count
+
+    hot_tier_bytes = TransactionRepository.get_hot_tier_size()
+    if max_bytes > 0:
+        while hot_tier_bytes > max_bytes:
+            count, moved_bytes = _move_batch(archive, None, batch_size)
+            if not count:
+                break
+            moved += count
+            hot_tier_bytes -= moved_bytes
+
+    if moved:
+        logger.info(f"Moved {moved} transactions to the archive, hot tier is now {hot_tier_bytes} bytes")
+    return {"moved": moved, "hot_tier_bytes": hot_tier_bytes}
+
+
+def archive_mover_task() -> None:
+    """
+    Task moving cold transactions from the database to the archive.
+    """
+    try:
+        logger.info("Running transaction archive mover task")
+        archive_cold_transactions()
+    except Exception as e:
+        logger.error(f"Error in transaction archive mover task: {str(e)}")
+
+
+def start_archive_mover() -> None:
+    """
+    Start the background task moving cold transactions to the archive periodically.
+    Does nothing unless TRANSACTION_ARCHIVE_ENABLED is set.
+    """
+    if get_transaction_archive() is None:
+        return
+
+    start_locked_interval_job(
+        'transaction_archive_mover',
+        archive_mover_task,
+        minutes=ARCHIVE_MOVER_INTERVAL_MINUTES
+    )
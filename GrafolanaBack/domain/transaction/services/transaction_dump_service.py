@@ -0,0 +1,232 @@
+import bz2
+import gzip
+import json
+import lzma
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+from GrafolanaBack.domain.logging.logging import logger
+from GrafolanaBack.domain.transaction.models.transaction import SolanaTransaction
+from GrafolanaBack.domain.transaction.repositories.transaction_archive import TransactionArchive, get_transaction_archive, iter_records, pack_record
+from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository
+
+# Dumps are either JSON lines (optionally gzip/bz2/xz compressed) or "raw" files that use the
+# archive segment record layout and hold the stored zlib blobs as they are
+JSONL_FORMAT = "jsonl"
+RAW_FORMAT = "raw"
+RAW_EXTENSIONS = (".seg", ".gtx")
+
+_OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+def get_dump_format(path: str) -> str:
+    for extension in _OPENERS:
+        if path.endswith(extension):
+            path = path[:-len(extension)]
+    return RAW_FORMAT if path.endswith(RAW_EXTENSIONS) else JSONL_FORMAT
+
+def open_dump(path: str, mode: str) -> IO:
+    """
+    Open a dump file, transparently (de)compressing it according to its extension.
+
+    Args:
+        path: Dump file path
+        mode: 'r' or 'w'
+    """
+    binary = get_dump_format(path) == RAW_FORMAT
+    for extension, opener in _OPENERS.items():
+        if path.endswith(extension):
+            return opener(path, mode + ("b" if binary else "t"), encoding=None if binary else "utf-8")
+    return open(path, mode + ("b" if binary else ""), encoding=None if binary else "utf-8")
+
+def iter_dump(path: str) -> Iterator[Tuple[str, Any]]:
+    """
+    Read the entries of a dump without decoding them.
+
+    Yields:
+        ("jsonl", line) for JSON lines dumps, ("raw", (signature, blob)) for raw dumps
+    """
+    with open_dump(path, "r") as dump:
+        if get_dump_format(path) == RAW_FORMAT:
+            for record in iter_records(dump):
+                yield RAW_FORMAT, record
+        else:
+            for line in dump:
+                line = line.strip()
+                if line:
+                    yield JSONL_FORMAT, line
+
+def prepare_rows(entries: List[Tuple[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Turn dump entries into solana_transactions rows: compress JSON lines into the CompressedJSON
+    format and extract the indexed columns. Runs in the compression worker processes.
+
+    A JSON line is either an exported {"signature": ..., "transaction": ...} entry or a bare
+    transaction as returned by getTransaction, whose first signature is used.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], int]: The rows and the number of invalid entries
+    """
+    now = int(time.time())
+    rows = []
+    invalid = 0
+    for kind, entry in entries:
+        try:
+            if kind == RAW_FORMAT:
+                # The blob is stored as it is, its decompressed bytes give the size column
+                signature, blob = entry
+                serialized_json = zlib.decompress(blob)
+                transaction_json = json.loads(serialized_json.decode("utf-8"))
+                rows.append({
+                    "transaction_signature": signature,
+                    "transaction_json": blob,
+                    "stored_at": now,
+                    "last_accessed_at": now,
+                    **SolanaTransaction.extract_indexed_fields(transaction_json, serialized_json)
+                })
+            else:
+                transaction_json = json.loads(entry)
+                if "signature" in transaction_json:
+                    signature = transaction_json["signature"]
+                    transaction_json = transaction_json["transaction"]
+                else:
+                    signature = transaction_json["transaction"]["signatures"][0]
+                rows.append(SolanaTransaction.build_row(signature, transaction_json, now))
+        except Exception:
+            invalid += 1
+    return rows, invalid
+
+def _batched(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _prepared_batches(entries: Iterable[Tuple[str, Any]], batch_size: int, executor: Optional[Executor], max_pending: int):
+    if executor is None:
+        for batch in _batched(entries, batch_size):
+            yield prepare_rows(batch)
+        return
+
+    # Keep a bounded number of batches in flight so huge dumps are never fully loaded in memory
+    pending = deque()
+    for batch in _batched(entries, batch_size):
+        pending.append(executor.submit(prepare_rows, batch))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def import_transactions(paths: List[str], workers: int = 4, batch_size: int = 1000) -> Dict[str, int]:
+    """
+    Bulk load transactions from dumps into the transaction store.
+    Transactions that are already stored, or repeated in the dumps, are skipped.
+
+    Args:
+        paths: Dump files (JSON lines, optionally compressed, or raw dumps / archive segments)
+        workers: Number of compression worker processes (0 or 1 to compress in this process)
+        batch_size: Number of transactions per worker batch and per database load
+
+    Returns:
+        Dict[str, int]: Number of read, imported, duplicate and invalid transactions
+    """
+    stats = {"read": 0, "imported": 0, "duplicates": 0, "invalid": 0}
+    seen = set()
+
+    def entries():
+        for path in paths:
+            logger.info(f"Importing transactions from {path}")
+            for entry in iter_dump(path):
+                stats["read"] += 1
+                yield entry
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for rows, invalid in _prepared_batches(entries(), batch_size, executor, max_pending=workers * 2):
+            stats["invalid"] += invalid
+            unique_rows = []
+            for row in rows:
+                if row["transaction_signature"] not in seen:
+                    seen.add(row["transaction_signature"])
+                    unique_rows.append(row)
+            imported = TransactionRepository.insert_raw_transactions(unique_rows)
+            stats["imported"] += imported
+            stats["duplicates"] += len(rows) - imported
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    logger.info(f"Transaction import finished: {stats}")
+    return stats
+
+def iter_archived_transactions(
+    archive: TransactionArchive,
+    start_slot: Optional[int] = None,
+    end_slot: Optional[int] = None,
+    batch_size: int = 1000
+) -> Iterator[Tuple[str, bytes]]:
+    """
+    Stream the archived transactions that are not stored in the database anymore.
+    Archive records don't hold the slot, so blobs are only decompressed when a slot range is given.
+
+    Yields:
+        Tuple[str, bytes]: (transaction signature, zlib compressed JSON blob)
+    """
+    def in_range(blob: bytes) -> bool:
+        if start_slot is None and end_slot is None:
+            return True
+        slot = json.loads(zlib.decompress(blob).decode("utf-8")).get("slot")
+        return slot is not None and (start_slot is None or slot >= start_slot) and (end_slot is None or slot <= end_slot)
+
+    for batch in _batched(archive.iter_raw(), batch_size):
+        # A transaction read back into the database is exported from there
+        stored = set(TransactionRepository.get_stored_signatures([signature for signature, _ in batch]))
+        for signature, blob in batch:
+            if signature not in stored and in_range(blob):
+                yield signature, blob
+
+def export_transactions(
+    path: str,
+    start_slot: Optional[int] = None,
+    end_slot: Optional[int] = None,
+    include_archive: bool = True
+) -> int:
+    """
+    Export stored transactions to a dump that import_transactions can load on another instance.
+    Raw dumps copy the stored blobs as they are; JSON lines dumps hold one
+    {"signature": ..., "transaction": ...} object per line.
+    Transactions moved to the archive are exported after the database ones when the archive is enabled.
+
+    Args:
+        path: Output file, its extension selects the format (.seg/.gtx for raw) and compression (.gz/.bz2/.xz)
+        start_slot: Optional first slot to export (inclusive)
+        end_slot: Optional last slot to export (inclusive)
+        include_archive: Also export the archived transactions (ignored when the archive is disabled)
+
+    Returns:
+        int: The number of exported transactions
+    """
+    raw = get_dump_format(path) == RAW_FORMAT
+    sources = [TransactionRepository.iter_raw_transactions(start_slot, end_slot)]
+    archive = get_transaction_archive() if include_archive else None
+    if archive is not None:
+        sources.append(iter_archived_transactions(archive, start_slot, end_slot))
+
+    count = 0
+    with open_dump(path, "w") as dump:
+        for signature, blob in (record for source in sources for record in source):
+            if raw:
+                dump.write(pack_record(signature, blob))
+            else:
+                # The stored JSON text is copied without being parsed again
+                dump.write(f'{{"signature": {json.dumps(signature)}, "transaction": {zlib.decompress(blob).decode("utf-8")}}}\n')
+            count += 1
+
+    logger.info(f"Exported {count} transactions to {path}")
+    return count
@@ -1,6 +1,8 @@
 import copy
 import json
 import time
+from concurrent.futures import Future
+from functools import partial
 from typing import Dict, List, Optional, Set, Tuple, Any, cast
 
 from solders.signature import Signature
@@ -8,18 +10,29 @@ from solders.pubkey import Pubkey
 from solders.transaction_status import  EncodedConfirmedTransactionWithStatusMeta, EncodedTransactionWithStatusMeta
 
 from GrafolanaBack.domain.transaction.models.account import AccountType
-from GrafolanaBack.domain.transaction.models.graph import TransactionGraph
+from GrafolanaBack.domain.transaction.models.graph import TransactionGraph, create_transaction_graph
 from GrafolanaBack.domain.transaction.factories.account_factory import AccountFactory
 from GrafolanaBack.domain.transaction.services.instruction_parser_service import InstructionParserService
 from GrafolanaBack.domain.performance.timing_utils import timing_decorator
+from GrafolanaBack.domain.performance.parser_profiler import TRANSACTION, ParserProfile, measure, merge_profiles, report_profile, should_profile
 from GrafolanaBack.domain.transaction.models.transaction_context import TransactionContext
 from GrafolanaBack.domain.transaction.models.graphspace import Graphspace
 from GrafolanaBack.domain.transaction.repositories.account_repository import AccountRepository
 from GrafolanaBack.domain.transaction.services.graph_builder_service import GraphBuilderService
 from GrafolanaBack.domain.transaction.services.graph_service import GraphService
 from GrafolanaBack.domain.transaction.services.swap_resolver_service import SwapResolverService
-from GrafolanaBack.domain.transaction.services.transaction_service import TransactionService
-from GrafolanaBack.domain.transaction.utils.instruction_utils import Parsed_Instruction, get_instruction_call_stack
+from GrafolanaBack.domain.transaction.services.transaction_service import StoredMetadata, TransactionService
+from GrafolanaBack.domain.transaction.services.transaction_retry_service import get_pending_signatures
+from GrafolanaBack.domain.transaction.services.parser_process_pool import get_parser_process_pool
+from GrafolanaBack.domain.transaction.utils.address_table import AddressTable
+from GrafolanaBack.domain.transaction.utils.graph_templates import GRAPH_PAYLOAD_FULL
+from GrafolanaBack.domain.transaction.utils.instruction_utils import Parsed_Instruction
+from GrafolanaBack.domain.transaction.utils.transaction_decoder import (
+    RAW_TRANSACTION_DECODER_ENABLED,
+    TransactionInput,
+    decode_encoded_transaction,
+    decode_raw_transaction,
+)
 from GrafolanaBack.domain.caching.cache_utils import cache
 from GrafolanaBack.domain.rpc.rpc_connection_utils import client
 from GrafolanaBack.domain.rpc.rpc_web_api import get_block_transactions
@@ -33,101 +46,131 @@ class TransactionParserService:
     for different instruction types and building the transaction graph.
     """
     
-    def __init__(self):
+    def __init__(self, parse_only: bool = False):
+        """
+        Args:
+            parse_only: Only build the parsers, without the transaction service and the
+                parser process pool (for the parser worker processes)
+        """
         #self.account_repository = AccountRepository()
         self.instruction_parser_service = InstructionParserService()
         #self.swap_resolver_service = SwapResolverService(self.account_repository)
         self.graph_service = GraphService()  
-        self.transaction_service = TransactionService()
+        self.transaction_service: Optional[TransactionService] = None if parse_only else TransactionService()
+        self.parser_pool = None if parse_only else get_parser_process_pool()
     
     # @timing_decorator
-    def parse_transaction(self, transaction_signature: str, transaction: EncodedTransactionWithStatusMeta, block_time: int, slot: int) -> TransactionContext:
+    def parse_transaction(self, transaction_signature: str, transaction: EncodedTransactionWithStatusMeta, block_time: int, slot: int, profile: bool = False) -> TransactionContext:
         """
         Parse a transaction by its signature, building a graph representation of the transaction.
         
         Args:
             encoded_transaction: The encoded transaction to parse
+            profile: Record the parser hot paths in the context's profile
             
         Returns:
             A TransactionContext object containing the graph and all related transaction data
         """
+        if not profile:
+            return self.parse_transaction_input(transaction_signature, decode_encoded_transaction(transaction, block_time, slot))
+        parser_profile = ParserProfile()
+        with parser_profile.measure(TRANSACTION, "decode"):
+            transaction_input = decode_encoded_transaction(transaction, block_time, slot)
+        return self.parse_transaction_input(transaction_signature, transaction_input, parser_profile=parser_profile)
 
-        # Create an empty graph and repositories
-        graph = TransactionGraph()
+    def parse_transaction_input(self, transaction_signature: str, transaction_input: TransactionInput, compact: bool = True, parser_profile: Optional[ParserProfile] = None) -> TransactionContext:
+        """
+        Build the graph of a decoded transaction.
 
-        # Extract basic transaction info
-        # blocktime = encoded_transaction.block_time
-        # transaction = encoded_transaction.transaction
-        
-        # Extract account addresses and signers
-        accounts = transaction.transaction.message.account_keys
-        signer_wallets = {str(account.pubkey) for account in accounts if hasattr(account, 'signer') and account.signer}
-        account_addresses = [str(parsed_account.pubkey) for parsed_account in accounts]
-        fee_payer = str(accounts[0].pubkey)
-        
-        # Extract balance info
-        pre_token_balances = transaction.meta.pre_token_balances
-        post_token_balances = transaction.meta.post_token_balances
-        pre_balances = transaction.meta.pre_balances
-        post_balances = transaction.meta.post_balances
+        Args:
+            transaction_signature: The transaction signature
+            transaction_input: The transaction decoded by decode_encoded_transaction or decode_raw_transaction
+            compact: Release the instruction tree once the graph is built (see TransactionContext.compact)
+            parser_profile: Profile recording the parsing, kept as the context's profile
 
-        account_repository = AccountRepository()
+        Returns:
+            A TransactionContext object containing the graph and all related transaction data
+        """
+        # Create an empty graph and repositories, sharing the integer ids of the transaction's addresses
+        address_table = AddressTable()
+        graph = create_transaction_graph(address_table)
+        account_repository = AccountRepository(address_table)
         
         # Initialize accounts from balance info
-        AccountFactory.build_accounts_from_transaction(
-            account_repository,
-            pre_token_balances,
-            post_token_balances,
-            pre_balances,
-            account_addresses,
-            signer_wallets,
-            transaction_signature
-        )
-
-        err = transaction.meta.err.to_json() if transaction.meta.err else None
+        with measure(parser_profile, TRANSACTION, "accounts"):
+            AccountFactory.build_accounts_from_transaction(
+                account_repository,
+                transaction_input.pre_token_balances,
+                transaction_input.post_token_balances,
+                transaction_input.pre_balances,
+                transaction_input.account_addresses,
+                transaction_input.signer_wallets,
+                transaction_signature
+            )
 
-        # Parse instructions
-        instructions = get_instruction_call_stack(transaction)
+        err = transaction_input.err
+        instructions = transaction_input.instructions
         
         # Parse transaction context
         transaction_context = TransactionContext(
-            slot=slot,
+            slot=transaction_input.slot,
             transaction_signature=transaction_signature,
             graph=graph,
             account_repository=account_repository,
-            signer_wallets=signer_wallets,
-            blocktime=block_time,
-            fee=transaction.meta.fee,
-            fee_payer=fee_payer,
-            compute_units_consumed=transaction.meta.compute_units_consumed,
+            signer_wallets=transaction_input.signer_wallets,
+            blocktime=transaction_input.block_time,
+            fee=transaction_input.fee,
+            fee_payer=transaction_input.fee_payer,
+            compute_units_consumed=transaction_input.compute_units_consumed,
             err=err,
             instructions=instructions,
+            profile=parser_profile,
         )
 
         if err:
             logger.info(f"Transaction {transaction_signature} has an error: {err}")
+            self._set_structure_fingerprint(transaction_context)
+            if compact:
+                transaction_context.compact()
             return transaction_context
         
         # Process instructions to build the graph
-        self._process_instructions(instructions, transaction_context)
+        with measure(parser_profile, TRANSACTION, "instructions"):
+            self._process_instructions(instructions, transaction_context)
         
-        GraphBuilderService.add_fee_transfers(transaction_context)
+        with measure(parser_profile, TRANSACTION, "fee_transfers"):
+            GraphBuilderService.add_fee_transfers(transaction_context)
 
         swap_resolver_service = SwapResolverService(account_repository)
 
-        swap_resolver_service.resolve_swap_paths(transaction_context)
+        with measure(parser_profile, TRANSACTION, "swap_resolution"):
+            swap_resolver_service.resolve_swap_paths(transaction_context)
+
+        # Computed here, in the parser worker processes when they are enabled
+        self._set_structure_fingerprint(transaction_context)
+
+        # Contexts live until the graph data is serialized, keep only what GraphService reads
+        if compact:
+            transaction_context.compact()
         
         return transaction_context
     
+
+    @staticmethod
+    def _set_structure_fingerprint(context: TransactionContext) -> None:
+        """Fingerprint the structure of a parsed transaction's graph (see GraphService.structure_fingerprint)"""
+        with measure(context.profile, TRANSACTION, "structure_fingerprint"):
+            context.structure_fingerprint = GraphService.transaction_structure_fingerprint(context.graph)
     
     # @cache.memoize(name="transaction_parser_service.get_transaction_graph_data")
-    def get_transaction_graph_data(self, transaction_signature: str) -> Dict[str, Any]:
+    def get_transaction_graph_data(self, transaction_signature: str, profile: bool = False) -> Dict[str, Any]:
         """
         Get a JSON representation of a transaction graph that can be used by the frontend.
         
         Args:
             transaction_signature: The transaction signature
             user_wallet: The wallet address of the user viewing the transaction
+            profile: Add the parser profile of the transaction to the graph data, under "profile"
         
         Returns:
             Dictionary containing the graph data ready for frontend visualization
@@ -136,49 +179,99 @@ class TransactionParserService:
         # Fetch the transaction
         encoded_transaction = self.transaction_service.get_transaction(Signature.from_string(transaction_signature))
         if not encoded_transaction:
+            if get_pending_signatures([transaction_signature]):
+                logger.info(f"Transaction {transaction_signature} is queued for a retry")
+                return {"nodes": [], "links": [], "swaps": [], "fees": {"fee": 0, "priority_fee": 0}, "pending_transactions": [transaction_signature]}
             logger.error(f"Transaction {transaction_signature} not found")
             return None
         
-        graph_data = self.parse_and_get_graph_data(transaction_signature, encoded_transaction, {})
+        graph_data = self.parse_and_get_graph_data(transaction_signature, encoded_transaction, {}, profile=profile)
         
         return graph_data
     
-    def parse_and_get_graph_data(self, transaction_signature: str, encoded_transaction: EncodedConfirmedTransactionWithStatusMeta, error: Optional[Exception], w=None) -> Dict[str, Any]:
+    def parse_and_get_graph_data(self, transaction_signature: str, encoded_transaction: EncodedConfirmedTransactionWithStatusMeta, error: Optional[Exception], w=None, profile: bool = False) -> Dict[str, Any]:
+        profiled = should_profile(profile)
         # Parse the transaction and get the context
-        context = self.parse_transaction(transaction_signature, encoded_transaction.transaction, encoded_transaction.block_time, encoded_transaction.slot)
+        context = self.parse_transaction(transaction_signature, encoded_transaction.transaction, encoded_transaction.block_time, encoded_transaction.slot, profile=profiled)
         if not context:
             logger.error(f"Failed to parse transaction: {transaction_signature}")
             return {"nodes": [], "links": [], "swaps": [], "fees": {"fee": 0, "priority_fee": 0}}
+        self.transaction_service.save_structure_fingerprints({transaction_signature: context})
         
         # Use GraphService to generate the frontend-friendly format
         graph_data = self.graph_service.get_graph_data(context)
+        if profiled:
+            self._report_profile(graph_data, [context], profile)
 
         return graph_data
     
-    def parse_transaction_call_back(self, transaction_signature: str, encoded_transaction: EncodedConfirmedTransactionWithStatusMeta) -> TransactionContext:
+    def parse_transaction_call_back(self, transaction_signature: str, encoded_transaction: EncodedConfirmedTransactionWithStatusMeta, profile: bool = False) -> TransactionContext:
         # Parse the transaction and get the context
-        context = self.parse_transaction(transaction_signature, encoded_transaction.transaction, encoded_transaction.block_time, encoded_transaction.slot)
+        context = self.parse_transaction(transaction_signature, encoded_transaction.transaction, encoded_transaction.block_time, encoded_transaction.slot, profile=profile)
         return context
+
+    def parse_raw_transaction_call_back(self, transaction_signature: str, raw_transaction: bytes, profile: bool = False) -> TransactionContext:
+        """Parse a transaction from its raw JSON, without building solders objects"""
+        if not profile:
+            return self.parse_transaction_input(transaction_signature, decode_raw_transaction(raw_transaction))
+        parser_profile = ParserProfile()
+        with parser_profile.measure(TRANSACTION, "decode"):
+            transaction_input = decode_raw_transaction(raw_transaction)
+        return self.parse_transaction_input(transaction_signature, transaction_input, parser_profile=parser_profile)
+    
+    def _report_profile(self, graph_data: Dict[str, Any], contexts: List[TransactionContext], requested: bool) -> None:
+        """Send the merged profile of the contexts to the metrics sink, and to the response when requested"""
+        request_profile = merge_profiles(context.profile for context in contexts)
+        report_profile(request_profile, len(contexts))
+        if requested:
+            graph_data["profile"] = request_profile.to_dict()
     
-    def get_multiple_transactions_graph_data(self, transaction_signatures: List[str]) -> Dict[str, Any]:
+    def get_multiple_transactions_graph_data(self, transaction_signatures: List[str], profile: bool = False, graph_payload: str = GRAPH_PAYLOAD_FULL) -> Dict[str, Any]:
         """
         Get graph data for multiple transactions.
         
         Args:
             transaction_signatures: List of transaction signatures
+            profile: Add the merged parser profile of the transactions to the graph data, under "profile".
+                     Profiled transactions are parsed in this process rather than in the parser pool.
+            graph_payload: GRAPH_PAYLOAD_TEMPLATES to send the transactions of the same shape as templates
         
         Returns:
             Dictionary containing the graph data for all transactions
         """
+        profiled = should_profile(profile)
+        result_callback = self.parse_transaction_call_back
+        raw_result_callback = self.parse_raw_transaction_call_back if RAW_TRANSACTION_DECODER_ENABLED else None
+        parser_pool = self.parser_pool
+        if profiled:
+            result_callback = partial(result_callback, profile=True)
+            raw_result_callback = partial(raw_result_callback, profile=True) if raw_result_callback else None
+            parser_pool = None
+
         # now = int(time.monotonic() * 1000)
-        all_transaction_contex = self.transaction_service.get_transactions(transaction_signatures,self.parse_transaction_call_back)
+        stored_metadata = StoredMetadata()
+        all_transaction_contex = self.transaction_service.get_transactions(
+            transaction_signatures,
+            result_callback,
+            parser_pool=parser_pool,
+            raw_result_callback=raw_result_callback,
+            stored_metadata=stored_metadata
+        )
         # timeittook = int(time.monotonic() * 1000) - now
         # logger.info(f"Time taken to get_transactions & parse them: {timeittook} ms")
 
+        # Transactions that could not be fetched yet but are queued for a background retry
+        pending_transactions = get_pending_signatures(
+            [sig for sig, context in all_transaction_contex.items() if context is None]
+        )
+
         # Strip all_transaction_contex of transaction_context that are None
         all_transaction_contex = {sig: context for sig, context in all_transaction_contex.items() if context is not None}
         if not all_transaction_contex:
-            return {"nodes": [], "links": [], "swaps": [], "fees": {"fee": 0, "priority_fee": 0}}
+            return {"nodes": [], "links": [], "swaps": [], "fees": {"fee": 0, "priority_fee": 0}, "pending_transactions": pending_transactions}
+
+        # Lets the transactions be found by structure
+        self.transaction_service.save_structure_fingerprints(all_transaction_contex)
 
         
 
@@ -190,18 +283,23 @@ class TransactionParserService:
         self.graph_service.analyse_isomorphic_transactions(graphspace)
         
         # now = int(time.monotonic() * 1000)
-        graphdata = self.graph_service.get_graph_data_from_graphspace(graphspace)
+        graphdata = self.graph_service.get_graph_data_from_graphspace(graphspace, graph_payload, stored_metadata.sol_prices)
         # timeittook = int(time.monotonic() * 1000) - now
         # logger.info(f"Time taken to get_graph_data_from_graphspace: {timeittook} ms")
+        graphdata["pending_transactions"] = pending_transactions
+        if profiled:
+            self._report_profile(graphdata, list(all_transaction_contex.values()), profile)
         
         return graphdata
     
-    def get_account_graph_data(self, account_address: str) -> Dict[str, Any]:
+    def get_account_graph_data(self, account_address: str, profile: bool = False, graph_payload: str = GRAPH_PAYLOAD_FULL) -> Dict[str, Any]:
         """
         Get graph data for an account address.
         
         Args:
             account_address: The account address
+            profile: Add the parser profile of the account's transactions to the graph data
+            graph_payload: GRAPH_PAYLOAD_TEMPLATES to send the transactions of the same shape as templates
         
         Returns:
             Dictionary containing the graph data for the account
@@ -213,7 +311,7 @@ class TransactionParserService:
         # logger.info(f"Time taken to get_wallet_signatures: {timeittook} ms")
         
         # Get graph data for each transaction
-        all_graph_data = self.get_multiple_transactions_graph_data(transaction_signatures)
+        all_graph_data = self.get_multiple_transactions_graph_data(transaction_signatures, profile=profile, graph_payload=graph_payload)
 
         return all_graph_data
 
@@ -241,7 +339,8 @@ class TransactionParserService:
 
         return signatures
 
-    def get_block_graph(self, slot_number: int) -> Dict[str, Any]:
+    def get_block_graph(self, slot_number: int, profile: bool = False, graph_payload: str = GRAPH_PAYLOAD_FULL) -> Dict[str, Any]:
+        profiled = should_profile(profile)
         block = get_block_transactions(slot=slot_number)
         
         if not block:
@@ -257,7 +356,7 @@ class TransactionParserService:
         for transaction_json in block["result"]["transactions"]:
             transaction = EncodedTransactionWithStatusMeta.from_json(json.dumps(transaction_json))
             transaction_signature = transaction.transaction.signatures[0]
-            context = self.parse_transaction(str(transaction_signature), transaction, block["result"]["blockTime"], slot_number)
+            context = self.parse_transaction(str(transaction_signature), transaction, block["result"]["blockTime"], slot_number, profile=profiled)
             all_transaction_contex.update({transaction_signature: context})
 
         # Strip all_transaction_contex of transaction_context that are None
@@ -265,6 +364,9 @@ class TransactionParserService:
         if not all_transaction_contex:
             return {"nodes": [], "links": [], "swaps": [], "fees": {"fee": 0, "priority_fee": 0}}
 
+        # Lets the transactions be found by structure
+        self.transaction_service.save_structure_fingerprints(all_transaction_contex)
+
        # now = int(time.monotonic() * 1000)
         graphspace = Graphspace(all_transaction_contex)
         # timeittook = int(time.monotonic() * 1000) - now
@@ -273,9 +375,11 @@ class TransactionParserService:
         self.graph_service.analyse_isomorphic_transactions(graphspace)
         
         # now = int(time.monotonic() * 1000)
-        graphdata = self.graph_service.get_graph_data_from_graphspace(graphspace)
+        graphdata = self.graph_service.get_graph_data_from_graphspace(graphspace, graph_payload)
         # timeittook = int(time.monotonic() * 1000) - now
         # logger.info(f"Time taken to get_graph_data_from_graphspace: {timeittook} ms")
+        if profiled:
+            self._report_profile(graphdata, list(all_transaction_contex.values()), profile)
         
         return graphdata
 
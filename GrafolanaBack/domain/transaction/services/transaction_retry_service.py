@@ -0,0 +1,151 @@
+import os
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from GrafolanaBack.domain.caching.negative_cache import NOT_FOUND, TRANSACTION_NAMESPACE, negative_cache
+from GrafolanaBack.domain.infrastructure.scheduling import start_locked_interval_job
+from GrafolanaBack.domain.logging.logging import logger
+from GrafolanaBack.domain.rpc.rpc_acync_transaction_fetcher import fetcher
+from GrafolanaBack.domain.transaction.repositories.retry_queue_repository import TransactionRetryRepository
+from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository
+
+if TYPE_CHECKING:
+    from GrafolanaBack.domain.transaction.services.transaction_service import TransactionService
+
+# Signatures that every endpoint failed to return are queued and fetched again in the background
+TRANSACTION_RETRY_ENABLED = os.getenv("TRANSACTION_RETRY_ENABLED", "true").lower() == "true"
+TRANSACTION_RETRY_INTERVAL_SECONDS = int(os.getenv("TRANSACTION_RETRY_INTERVAL_SECONDS", "30"))
+TRANSACTION_RETRY_BATCH_SIZE = int(os.getenv("TRANSACTION_RETRY_BATCH_SIZE", "20"))
+# Exponential backoff: the delay doubles after every failed retry, up to the maximum delay
+TRANSACTION_RETRY_BASE_DELAY_SECONDS = int(os.getenv("TRANSACTION_RETRY_BASE_DELAY_SECONDS", "30"))
+TRANSACTION_RETRY_MAX_DELAY_SECONDS = int(os.getenv("TRANSACTION_RETRY_MAX_DELAY_SECONDS", "21600"))
+TRANSACTION_RETRY_MAX_ATTEMPTS = int(os.getenv("TRANSACTION_RETRY_MAX_ATTEMPTS", "10"))
+
+
+def get_retry_delay(attempts: int) -> int:
+    """
+    Delay in seconds before the next retry of a signature that already failed `attempts` retries
+    """
+    return min(TRANSACTION_RETRY_BASE_DELAY_SECONDS * 2 ** attempts, TRANSACTION_RETRY_MAX_DELAY_SECONDS)
+
+
+def enqueue_failed_lookups(failed_lookups: Dict[str, Optional[Exception]]) -> None:
+    """
+    Queue signatures that every endpoint failed to return for a background retry.
+
+    Args:
+        failed_lookups: Signature mapped to the RPC error, or None if no endpoint had it
+    """
+    if not TRANSACTION_RETRY_ENABLED or not failed_lookups:
+        return
+    TransactionRetryRepository.enqueue(
+        {signature: str(error) if error is not None else None for signature, error in failed_lookups.items()},
+        next_attempt_at=int(time.time()) + get_retry_delay(0)
+    )
+
+
+class TransactionRetryService:
+    """
+    Background retrier of the transaction retry queue.
+
+    Retries only run while no RPC fetcher of the host's worker processes is busy, so they
+    never compete with user requests for the endpoints' rate limits. The job itself runs in
+    the single process holding its lock (see start_locked_interval_job).
+    """
+
+    def __init__(self, transaction_service: "TransactionService"):
+        self.transaction_service = transaction_service
+
+    def retry_pending_transactions(self, now: Optional[int] = None, batch_size: int = TRANSACTION_RETRY_BATCH_SIZE) -> Dict[str, int]:
+        """
+        Retry one batch of due signatures. Fetched transactions are stored and leave the queue,
+        failed ones are rescheduled with exponential backoff until TRANSACTION_RETRY_MAX_ATTEMPTS.
+
+        Args:
+            now: Current unix timestamp (defaults to now)
+            batch_size: Maximum number of signatures retried
+
+        Returns:
+            Dict[str, int]: Number of fetched, rescheduled and abandoned signatures
+        """
+        stats = {"fetched": 0, "rescheduled": 0, "abandoned": 0}
+        if not fetcher.is_idle():
+            logger.debug("RPC fetcher is busy, postponing transaction retries")
+            return stats
+
+        now = now or int(time.time())
+        due_entries = TransactionRetryRepository.get_due(now, batch_size)
+        if not due_entries:
+            return stats
+
+        signatures = [entry.transaction_signature for entry in due_entries]
+        # Transactions stored since they were queued (e.g. by a later request) are done
+        done = TransactionRepository.get_stored_signatures(signatures)
+        stats["fetched"] += len(done)
+
+        entries_to_fetch = [entry for entry in due_entries if entry.transaction_signature not in set(done)]
+        results = self.transaction_service.refetch_transactions(
+            [entry.transaction_signature for entry in entries_to_fetch]
+        ) if entries_to_fetch else {}
+
+        for entry in entries_to_fetch:
+            signature = entry.transaction_signature
+            result = results.get(signature)
+            if result is not None and not isinstance(result, Exception):
+                done.append(signature)
+                stats["fetched"] += 1
+                continue
+
+            attempts = entry.attempts + 1
+            if attempts >= TRANSACTION_RETRY_MAX_ATTEMPTS:
+                logger.warning(f"Giving up on transaction {signature} after {attempts} retries")
+                negative_cache.record(TRANSACTION_NAMESPACE, signature, NOT_FOUND)
+                done.append(signature)
+                stats["abandoned"] += 1
+            else:
+                TransactionRetryRepository.reschedule(
+                    signature,
+                    attempts,
+                    now + get_retry_delay(attempts),
+                    str(result) if result is not None else None
+                )
+                stats["rescheduled"] += 1
+
+        TransactionRetryRepository.remove(done)
+        logger.info(f"Transaction retries: {stats}")
+        return stats
+
+    def retry_task(self) -> None:
+        """
+        Task processing the transaction retry queue.
+        """
+        try:
+            self.retry_pending_transactions()
+        except Exception as e:
+            logger.error(f"Error in transaction retry task: {str(e)}")
+
+
+def start_transaction_retrier(transaction_service: "TransactionService") -> None:
+    """
+    Start the background task processing the transaction retry queue.
+    Does nothing when TRANSACTION_RETRY_ENABLED is false.
+    """
+    if not TRANSACTION_RETRY_ENABLED:
+        return
+
+    retry_service = TransactionRetryService(transaction_service)
+    start_locked_interval_job(
+        'transaction_retrier',
+        retry_service.retry_task,
+        seconds=TRANSACTION_RETRY_INTERVAL_SECONDS
+    )
+
+
+def get_pending_signatures(transaction_signatures: List[str]) -> List[str]:
+    """
+    Returns the signatures, among the given ones, that are waiting in the retry queue
+    """
+    if not TRANSACTION_RETRY_ENABLED or not transaction_signatures:
+        return []
+    pending = TransactionRetryRepository.get_pending_signatures(transaction_signatures)
+    return [signature for signature in transaction_signatures if signature in pending]
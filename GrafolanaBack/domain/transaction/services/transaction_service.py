@@ -1,20 +1,59 @@
+import asyncio
 import json
+import os
 import threading
 import time
-from typing import Dict, List, Optional, Union, Any, Callable
-from concurrent.futures import ThreadPoolExecutor
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple, Union, Any, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from solders.pubkey import Pubkey
 from solders.signature import Signature
-from solders.transaction_status import EncodedConfirmedTransactionWithStatusMeta
+from solders.transaction_status import EncodedConfirmedTransactionWithStatusMeta, TransactionConfirmationStatus
 from sqlalchemy.exc import SQLAlchemyError
 
-from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository
+from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository, TRANSACTION_DB_CHUNK_SIZE
+from GrafolanaBack.domain.transaction.repositories.async_transaction_repository import AsyncTransactionRepository
+from GrafolanaBack.domain.transaction.repositories.structure_repository import TransactionStructureRepository
+from GrafolanaBack.domain.metadata.spl_token.models.classes import MintDTO
+from GrafolanaBack.domain.metadata.spl_token.repositories.async_mint_repository import AsyncMintRepository
+from GrafolanaBack.domain.prices.async_repository import AsyncSOLPriceRepository
+from GrafolanaBack.domain.prices.sol_price_utils import round_timestamp_to_minute
+from GrafolanaBack.domain.caching.negative_cache import (
+    ERROR,
+    INVALID,
+    NOT_FINALIZED,
+    NOT_FOUND,
+    TRANSACTION_NAMESPACE,
+    negative_cache,
+)
+from GrafolanaBack.domain.transaction.services.transaction_retry_service import enqueue_failed_lookups
+from GrafolanaBack.domain.transaction.services.parser_process_pool import ParserProcessPool
+from GrafolanaBack.domain.transaction.models.transaction_context import TransactionContext
 from GrafolanaBack.domain.rpc.rpc_connection_utils import client
 from GrafolanaBack.domain.rpc.rpc_acync_transaction_fetcher import fetcher
 from GrafolanaBack.domain.performance.timing_utils import timing_decorator
 from GrafolanaBack.domain.logging.logging import logger
 
+# Read stored transactions through the asyncio driver on the fetcher event loop,
+# overlapping database reads with RPC fetches (requires asyncpg)
+ASYNC_DB_ENABLED = os.getenv("ASYNC_DB_ENABLED", "false").lower() == "true"
+
+# getSignatureStatuses accepts at most 256 signatures per request
+SIGNATURE_STATUSES_BATCH_SIZE = 256
+
+@dataclass
+class StoredMetadata:
+    """
+    Mint metadata and SOL prices read from the database by the async retrieval path,
+    while the transactions that reference them are being retrieved.
+    """
+    # Stored mint metadata of the token balances, by mint address
+    mints: Dict[str, MintDTO] = field(default_factory=dict)
+    # Stored SOL prices of the block times, by timestamp rounded to the minute (ms)
+    sol_prices: Dict[int, float] = field(default_factory=dict)
+
 class TransactionService:
     """
     Service for managing Solana transaction retrieval and storage.
@@ -51,6 +90,10 @@ class TransactionService:
         # Convert signature to string if it's a Signature object
         signature_str = str(signature)
 
+        # Lookups that recently failed are answered without touching the database or the RPC
+        if not self._filter_lookup_signatures([signature_str]):
+            return None
+
         #now = int(time.monotonic() * 1000)
         # First, try to get from database
         db_transaction = self.transaction_repository.get_transaction(signature_str)
@@ -72,6 +115,7 @@ class TransactionService:
             
             if transaction is None:
                 logger.warning(f"Transaction {signature_str} not found on RPC")
+                self._record_failed_lookups({signature_str: None})
                 return None
                 
             # Store the transaction in the database asynchronously
@@ -83,6 +127,7 @@ class TransactionService:
             
         except Exception as e:
             logger.error(f"Error fetching transaction {signature_str}: {str(e)}", exc_info=True)
+            self._record_failed_lookups({signature_str: e})
             return None
     
     # @timing_decorator
@@ -90,7 +135,10 @@ class TransactionService:
         self, 
         signatures: List[Union[str, Signature]],
         result_callback: Optional[Callable[[str, EncodedConfirmedTransactionWithStatusMeta, Optional[Any]], Any]] = None,
-        callback_params: Optional[Any] = None
+        callback_params: Optional[Any] = None,
+        parser_pool: Optional[ParserProcessPool] = None,
+        raw_result_callback: Optional[Callable[[str, bytes], Any]] = None,
+        stored_metadata: Optional[StoredMetadata] = None
     ) -> Dict[str, Optional[EncodedConfirmedTransactionWithStatusMeta]]:
         """
         Get multiple transactions by their signatures, checking the database first, then RPC if not found.
@@ -101,42 +149,71 @@ class TransactionService:
             result_callback: Optional callback function to process each transaction
                              Function receives (signature_str, transaction_data, callback_params)
             callback_params: Optional parameters to pass to the result_callback function
+            parser_pool: Optional parser process pool. When given, transactions are parsed in its
+                         worker processes instead of calling result_callback, and the parsed
+                         TransactionContext objects are returned
+            raw_result_callback: Optional callback processing stored transactions from their JSON bytes,
+                                 instead of result_callback on the deserialized transaction.
+                                 Function receives (signature_str, transaction_json_bytes)
+            stored_metadata: Optional StoredMetadata filled with the stored mints and SOL prices of
+                             the transactions (async path only, see get_transactions_async)
             
         Returns:
             Dictionary mapping signature strings to their transaction data or None if not found
         """
+        if parser_pool is not None:
+            return self._get_parsed_transactions(signatures, parser_pool)
+
+        if ASYNC_DB_ENABLED:
+            return fetcher.run_coroutine(
+                self.get_transactions_async(signatures, result_callback, callback_params, stored_metadata)
+            )
+
         # Convert all signatures to strings
         signature_strs = [str(sig) for sig in signatures]
         
         # Dictionary to store results
         results: Dict[str, Optional[EncodedConfirmedTransactionWithStatusMeta]] = {}
+        processed_results = {}
+        
+        # Signatures whose lookup recently failed are answered right away
+        lookup_signatures = self._filter_lookup_signatures(signature_strs)
+        for sig in signature_strs:
+            results[sig] = None
+            processed_results[sig] = None
+        
+        # Stream transactions already in the database chunk by chunk and hand each one
+        # to the thread pool right away, so deserialization and the callback (parsing)
+        # run while later chunks are still being loaded
+        futures_dict = {}
         
         #now = int(time.monotonic() * 1000)
-        # First, check which transactions are already in the database
-        db_transactions = self.transaction_repository.get_transactions_by_signatures(signature_strs)
+        raw = raw_result_callback is not None and result_callback is not None
+        try:
+            for sig, tx_json in self.transaction_repository.iter_transactions_by_signatures(lookup_signatures, raw=raw):
+                logger.debug(f"Transaction {sig[:10]}... found in database")
+                if raw:
+                    future = self.executor.submit(
+                        self._process_raw_db_transaction,
+                        sig, tx_json, raw_result_callback, processed_results
+                    )
+                else:
+                    future = self.executor.submit(
+                        self._transform_and_process_db_transaction,
+                        sig, tx_json, result_callback, callback_params, processed_results
+                    )
+                futures_dict[future] = sig
+        except Exception:
+            # Logged by the repository: the transactions not read yet are fetched from RPC
+            logger.warning("Database read interrupted, fetching the remaining transactions from RPC")
         #timeittook = int(time.monotonic() * 1000) - now
         #logger.info(f"Time taken to fetch transactions: {timeittook} ms")
 
-
         # Keep track of signatures that need to be fetched from RPC
+        found_signatures = set(futures_dict.values())
         missing_signatures = []
-
-        
-        # now = int(time.monotonic() * 1000)
-        # Create async tasks for processing transactions found in db
-        futures_dict = {}
-        
-        for sig in signature_strs:
-            if sig in db_transactions:
-                logger.debug(f"Transaction {sig[:10]}... found in database")
-                # Submit JSON transformation task to thread pool
-                future = self.executor.submit(
-                    self._transform_db_transaction_to_encoded, 
-                    sig, 
-                    db_transactions[sig]
-                )
-                futures_dict[future] = sig
-            else:
+        for sig in lookup_signatures:
+            if sig not in found_signatures:
                 logger.debug(f"Transaction {sig[:10]}... not found in database")
                 missing_signatures.append(sig)
         
@@ -148,66 +225,280 @@ class TransactionService:
             except Exception as e:
                 logger.error(f"Error transforming transaction {sig}: {str(e)}", exc_info=True)
                 results[sig] = None
-        
-        # timeittook = int(time.monotonic() * 1000) - now
-        # logger.info(f"Time taken to convert create transaction from JSON: {timeittook} ms")
+            if results[sig] is None:
+                processed_results[sig] = None
         
         if missing_signatures:
-            # Convert missing signatures to Signature objects for RPC
-            rpc_signatures = [Signature.from_string(sig) for sig in missing_signatures]
+            rpc_transactions = self._fetch_missing_transactions(missing_signatures)
+            results.update(rpc_transactions)
             
-            # Fetch missing transactions from RPC in batch
-            logger.debug(f"Fetching {len(missing_signatures)} transactions from RPC")
-            try:
-                # Use the batch RPC fetcher
-                rpc_results = fetcher.getMultipleTransactions(
-                    rpc_signatures,
-                    result_callback=self._process_fetched_transaction
-                )
-                
-                # Process RPC results
-                for sig_str, tx_data in rpc_results.items():
-                    if tx_data is not None and not isinstance(tx_data, Exception):
-                        results[sig_str] = tx_data
+            # Process RPC results with provided callback if one was provided
+            if result_callback is not None:
+                futures = []
+                for sig, tx_data in rpc_transactions.items():
+                    if tx_data is not None:
+                        future = self.executor.submit(
+                            self._process_callback,
+                            sig, tx_data, result_callback, callback_params, processed_results
+                        )
+                        futures.append(future)
                     else:
-                        results[sig_str] = None
-                        
-            except Exception as e:
-                logger.error(f"Error fetching multiple transactions: {str(e)}", exc_info=True)
-                # For any signatures we couldn't fetch, set to None
-                for sig in missing_signatures:
-                    if sig not in results:
-                        results[sig] = None
+                        processed_results[sig] = None
+                
+                # Wait for all futures to complete
+                for future in futures:
+                    future.result()  # This will re-raise any exceptions that occurred
         
-        # Process results with provided callback if one was provided
         if result_callback is not None:
-            processed_results = {}
-            futures = []
+            return processed_results
             
-            # now = int(time.monotonic() * 1000)
-            # Process each transaction with the callback asynchronously
-            for sig, tx_data in results.items():
-                if tx_data is not None:
-                    future = self.executor.submit(
-                        self._process_callback,
-                        sig, tx_data, result_callback, callback_params, processed_results
-                    )
-                    futures.append(future)
+        # Return the original results if no callback was provided
+        return results
+    
+    def _fetch_missing_transactions(self, missing_signatures: List[str]) -> Dict[str, Optional[EncodedConfirmedTransactionWithStatusMeta]]:
+        """
+        Fetch transactions missing from the database from RPC in batch, storing them and
+        recording the failed lookups.
+        
+        Args:
+            missing_signatures: Signatures not found in the database
+            
+        Returns:
+            Dictionary mapping each signature to the fetched transaction or None
+        """
+        # Convert missing signatures to Signature objects for RPC
+        rpc_signatures = [Signature.from_string(sig) for sig in missing_signatures]
+        
+        # Fetch missing transactions from RPC in batch
+        logger.debug(f"Fetching {len(missing_signatures)} transactions from RPC")
+        rpc_transactions: Dict[str, Optional[EncodedConfirmedTransactionWithStatusMeta]] = {}
+        try:
+            # Use the batch RPC fetcher
+            rpc_results = fetcher.getMultipleTransactions(
+                rpc_signatures,
+                result_callback=self._process_fetched_transaction
+            )
+            
+            # Process RPC results
+            failed_lookups = {}
+            for sig_str, tx_data in rpc_results.items():
+                if tx_data is not None and not isinstance(tx_data, Exception):
+                    rpc_transactions[sig_str] = tx_data
                 else:
-                    processed_results[sig] = None
+                    rpc_transactions[sig_str] = None
+                    failed_lookups[sig_str] = tx_data
+            self._record_failed_lookups(failed_lookups)
+                    
+        except Exception as e:
+            logger.error(f"Error fetching multiple transactions: {str(e)}", exc_info=True)
+        
+        # For any signatures we couldn't fetch, set to None
+        for sig in missing_signatures:
+            if sig not in rpc_transactions:
+                rpc_transactions[sig] = None
+        return rpc_transactions
+    
+    def _get_parsed_transactions(
+        self,
+        signatures: List[Union[str, Signature]],
+        parser_pool: ParserProcessPool
+    ) -> Dict[str, Optional[TransactionContext]]:
+        """
+        Process pool mode of get_transactions: stored transactions are streamed as their
+        compressed blobs straight to the parser processes, RPC-fetched ones as JSON bytes.
+        
+        Args:
+            signatures: List of transaction signatures (strings or Signature objects)
+            parser_pool: Parser process pool
             
-            # Wait for all futures to complete
-            for future in futures:
-                future.result()  # This will re-raise any exceptions that occurred
+        Returns:
+            Dictionary mapping signature strings to their parsed context or None
+        """
+        signature_strs = [str(sig) for sig in signatures]
+        parsed_results: Dict[str, Optional[TransactionContext]] = dict.fromkeys(signature_strs)
+        lookup_signatures = self._filter_lookup_signatures(signature_strs)
+        
+        # Future -> submit arguments, kept to parse in this process if the workers die
+        futures_dict = {}
+        try:
+            for sig, blob in self.transaction_repository.iter_transactions_by_signatures(lookup_signatures, raw=True):
+                futures_dict[parser_pool.submit(sig, blob)] = (sig, blob, True)
+        except Exception:
+            # Logged by the repository: the transactions not read yet are fetched from RPC
+            logger.warning("Database read interrupted, fetching the remaining transactions from RPC")
+        
+        found_signatures = {sig for sig, _, _ in futures_dict.values()}
+        missing_signatures = [sig for sig in lookup_signatures if sig not in found_signatures]
+        if missing_signatures:
+            for sig, tx_data in self._fetch_missing_transactions(missing_signatures).items():
+                if tx_data is not None:
+                    raw_transaction = tx_data.to_json().encode("utf-8")
+                    futures_dict[parser_pool.submit(sig, raw_transaction, compressed=False)] = (sig, raw_transaction, False)
+        
+        for future, (sig, raw_transaction, compressed) in futures_dict.items():
+            try:
+                parsed_results[sig] = parser_pool.get_result(future, sig, raw_transaction, compressed)
+            except Exception as e:
+                logger.error(f"Error parsing transaction {sig}: {str(e)}", exc_info=True)
+        
+        return parsed_results
+    
+    async def get_transactions_async(
+        self,
+        signatures: List[Union[str, Signature]],
+        result_callback: Optional[Callable[[str, EncodedConfirmedTransactionWithStatusMeta, Optional[Any]], Any]] = None,
+        callback_params: Optional[Any] = None,
+        stored_metadata: Optional[StoredMetadata] = None
+    ) -> Dict[str, Optional[EncodedConfirmedTransactionWithStatusMeta]]:
+        """
+        Async version of get_transactions, to be awaited on the fetcher event loop.
 
-            # timeittook = int(time.monotonic() * 1000) - now
-            # logger.info(f"Time taken to process all transaction: {timeittook} ms")
-                
-            return processed_results
+        Signatures are looked up in the database chunk by chunk with the async driver.
+        As soon as a chunk is read, its stored transactions are handed to the thread pool
+        and its missing signatures are sent to the RPC fetcher, so the RPC calls for one
+        chunk run while the next chunk is being read from the database.
+        The stored mints and SOL prices of each chunk are read the same way when
+        stored_metadata is given.
+        
+        Args:
+            signatures: List of transaction signatures (strings or Signature objects)
+            result_callback: Optional callback function to process each transaction
+            callback_params: Optional parameters to pass to the result_callback function
+            stored_metadata: Optional StoredMetadata to fill with the stored mints and SOL prices
             
-        # Return the original results if no callback was provided
+        Returns:
+            Dictionary mapping signature strings to their transaction data (or callback result) or None if not found
+        """
+        signature_strs = list(dict.fromkeys(str(sig) for sig in signatures))
+        loop = asyncio.get_running_loop()
+        
+        results: Dict[str, Optional[EncodedConfirmedTransactionWithStatusMeta]] = {}
+        processed_results = {}
+        db_futures = {}
+        rpc_tasks = []
+        metadata_tasks = []
+        
+        lookup_signatures = self._filter_lookup_signatures(signature_strs)
+        for start in range(0, len(lookup_signatures), TRANSACTION_DB_CHUNK_SIZE):
+            chunk = lookup_signatures[start:start + TRANSACTION_DB_CHUNK_SIZE]
+            db_transactions = await AsyncTransactionRepository.get_transactions_by_signatures(chunk)
+            
+            for sig, tx_json in db_transactions.items():
+                db_futures[sig] = loop.run_in_executor(
+                    self.executor,
+                    self._transform_and_process_db_transaction,
+                    sig, tx_json, result_callback, callback_params, processed_results
+                )
+            if stored_metadata is not None and db_transactions:
+                metadata_tasks.append(asyncio.ensure_future(self._read_stored_metadata(
+                    *self._metadata_keys(
+                        (tx_json.get("blockTime"), self._json_token_mints(tx_json)) for tx_json in db_transactions.values()
+                    ),
+                    stored_metadata
+                )))
+            
+            missing_signatures = [sig for sig in chunk if sig not in db_transactions]
+            if missing_signatures:
+                logger.debug(f"Fetching {len(missing_signatures)} transactions from RPC")
+                rpc_tasks.append(asyncio.ensure_future(fetcher.fetch_transactions(
+                    [Signature.from_string(sig) for sig in missing_signatures],
+                    result_callback=self._process_fetched_transaction
+                )))
+        
+        for sig, future in db_futures.items():
+            try:
+                results[sig] = await future
+            except Exception as e:
+                logger.error(f"Error transforming transaction {sig}: {str(e)}", exc_info=True)
+                results[sig] = None
+            if results[sig] is None:
+                processed_results[sig] = None
+        
+        callback_futures = []
+        failed_lookups = {}
+        fetched_transactions = []
+        for rpc_results in await asyncio.gather(*rpc_tasks, return_exceptions=True):
+            if isinstance(rpc_results, Exception):
+                logger.error(f"Error fetching multiple transactions: {str(rpc_results)}", exc_info=rpc_results)
+                continue
+            for sig, tx_data in rpc_results.items():
+                if tx_data is None or isinstance(tx_data, Exception):
+                    results[sig] = None
+                    processed_results[sig] = None
+                    failed_lookups[sig] = tx_data
+                    continue
+                results[sig] = tx_data
+                fetched_transactions.append(tx_data)
+                if result_callback is not None:
+                    callback_futures.append(loop.run_in_executor(
+                        self.executor,
+                        self._process_callback,
+                        sig, tx_data, result_callback, callback_params, processed_results
+                    ))
+        if stored_metadata is not None and fetched_transactions:
+            # Read while the fetched transactions are being processed
+            metadata_tasks.append(asyncio.ensure_future(self._read_stored_metadata(
+                *self._metadata_keys(
+                    (tx_data.block_time, self._encoded_token_mints(tx_data)) for tx_data in fetched_transactions
+                ),
+                stored_metadata
+            )))
+        await asyncio.gather(*callback_futures)
+        for metadata_result in await asyncio.gather(*metadata_tasks, return_exceptions=True):
+            if isinstance(metadata_result, Exception):
+                logger.error(f"Error reading stored mints and SOL prices: {str(metadata_result)}", exc_info=metadata_result)
+        if failed_lookups:
+            # Only caches the misses, their classification runs in the executor
+            self._record_failed_lookups(failed_lookups)
+        
+        # For any signatures we couldn't fetch, set to None
+        for sig in signature_strs:
+            if sig not in results:
+                results[sig] = None
+                processed_results[sig] = None
+        
+        if result_callback is not None:
+            return processed_results
         return results
     
+    @staticmethod
+    def _json_token_mints(tx_json: Dict[str, Any]) -> List[str]:
+        """Mints of the token balances of a transaction in its stored JSON form"""
+        meta = tx_json.get("meta") or {}
+        return [balance["mint"] for balance in (meta.get("preTokenBalances") or []) + (meta.get("postTokenBalances") or [])]
+
+    @staticmethod
+    def _encoded_token_mints(tx_data: EncodedConfirmedTransactionWithStatusMeta) -> List[str]:
+        """Mints of the token balances of a transaction fetched from RPC"""
+        meta = tx_data.transaction.meta
+        if meta is None:
+            return []
+        return [str(balance.mint) for balance in (meta.pre_token_balances or []) + (meta.post_token_balances or [])]
+
+    @staticmethod
+    def _metadata_keys(transactions: Iterable[Tuple[Optional[int], List[str]]]) -> Tuple[List[int], List[str]]:
+        """
+        Collect the SOL price timestamps (block times rounded to the minute, in ms) and the token
+        mints referenced by transactions, given as (block time, token mints) pairs.
+        """
+        timestamps = set()
+        mints = set()
+        for block_time, token_mints in transactions:
+            if block_time is not None:
+                timestamps.add(round_timestamp_to_minute(block_time * 1000))
+            mints.update(token_mints)
+        return list(timestamps), list(mints)
+
+    @staticmethod
+    async def _read_stored_metadata(timestamps: List[int], mints: List[str], stored_metadata: StoredMetadata) -> None:
+        """Read the stored SOL prices and mint metadata with the async repositories, concurrently"""
+        prices, stored_mints = await asyncio.gather(
+            AsyncSOLPriceRepository().get_prices_by_timestamps(timestamps),
+            AsyncMintRepository.get_mints_by_addresses(mints)
+        )
+        stored_metadata.sol_prices.update((price.timestamp, price.price) for price in prices)
+        stored_metadata.mints.update(stored_mints)
+
     def get_transactions_for_address(self, account_address: str, limit: int=1000) -> Dict[str, EncodedConfirmedTransactionWithStatusMeta | None]:
         """
         Get all transactions for a given address.
@@ -234,6 +525,131 @@ class TransactionService:
 
         return transactions
     
+    def refetch_transactions(self, signature_strs: List[str]) -> Dict[str, Union[EncodedConfirmedTransactionWithStatusMeta, Exception, None]]:
+        """
+        Fetch transactions from RPC again, bypassing the database and the negative cache.
+        Fetched transactions are stored like in get_transactions.
+        
+        Args:
+            signature_strs: Signatures to fetch
+            
+        Returns:
+            Dictionary mapping signatures to the fetched transaction, or to the RPC error / None on failure
+        """
+        if not signature_strs:
+            return {}
+        results = fetcher.getMultipleTransactions(
+            [Signature.from_string(sig) for sig in signature_strs],
+            result_callback=self._process_fetched_transaction
+        )
+        return {sig: results.get(sig) for sig in signature_strs}
+    
+    def _filter_lookup_signatures(self, signature_strs: List[str]) -> List[str]:
+        """
+        Drop the signatures whose lookup recently failed, as well as malformed ones
+        (which are recorded as invalid), keeping the caller's order without duplicates.
+        
+        Args:
+            signature_strs: Requested signatures
+            
+        Returns:
+            The signatures that have to be looked up
+        """
+        lookup_signatures, skipped = negative_cache.filter(TRANSACTION_NAMESPACE, dict.fromkeys(signature_strs))
+        if skipped:
+            logger.debug(f"Skipping {len(skipped)} signatures with a cached failed lookup")
+        
+        valid_signatures = []
+        for sig in lookup_signatures:
+            try:
+                Signature.from_string(sig)
+                valid_signatures.append(sig)
+            except ValueError:
+                logger.warning(f"Invalid transaction signature {sig}")
+                negative_cache.record(TRANSACTION_NAMESPACE, sig, INVALID)
+        return valid_signatures
+    
+    def _record_failed_lookups(self, failed_lookups: Dict[str, Optional[Exception]]) -> Optional[Future]:
+        """
+        Record signatures that could not be fetched from any endpoint in the negative cache.
+        RPC errors are remembered briefly; for signatures no endpoint returned, the signature
+        status tells whether the transaction is not finalized yet or permanently missing.
+        Transactions that may still be fetched later (RPC errors, not finalized yet) are
+        also queued for a background retry.
+
+        The signature statuses and the retry queue are handled by the executor, off the
+        request path. Until then, missing signatures are cached as not finalized, the
+        shortest TTL.
+        
+        Args:
+            failed_lookups: Signature mapped to the RPC error, or None if no endpoint had it
+
+        Returns:
+            Optional[Future]: The background classification, None if there was nothing to do
+        """
+        missing_signatures = []
+        retry_lookups = {}
+        for sig, error in failed_lookups.items():
+            if isinstance(error, Exception):
+                negative_cache.record(TRANSACTION_NAMESPACE, sig, ERROR)
+                retry_lookups[sig] = error
+            else:
+                negative_cache.record(TRANSACTION_NAMESPACE, sig, NOT_FINALIZED)
+                missing_signatures.append(sig)
+
+        if not missing_signatures and not retry_lookups:
+            return None
+        return self.executor.submit(self._classify_failed_lookups, missing_signatures, retry_lookups)
+
+    def _classify_failed_lookups(self, missing_signatures: List[str], retry_lookups: Dict[str, Optional[Exception]]):
+        """
+        Background part of _record_failed_lookups: cache the missing signatures with their
+        actual reason and queue the ones worth retrying.
+        """
+        try:
+            for sig, reason in self._classify_missing_signatures(missing_signatures).items():
+                negative_cache.record(TRANSACTION_NAMESPACE, sig, reason)
+                if reason != NOT_FOUND:
+                    retry_lookups[sig] = None
+
+            enqueue_failed_lookups(retry_lookups)
+        except Exception as e:
+            logger.error(f"Error recording failed transaction lookups: {str(e)}")
+    
+    def _classify_missing_signatures(self, signature_strs: List[str]) -> Dict[str, str]:
+        """
+        Tell apart transactions that are not finalized yet from the ones that do not exist.
+        A finalized transaction that no endpoint returned means the endpoints are lagging,
+        which is reported as ERROR.
+        
+        Args:
+            signature_strs: Signatures that no endpoint returned
+            
+        Returns:
+            Dictionary mapping each signature to NOT_FINALIZED, NOT_FOUND or ERROR
+        """
+        reasons = {}
+        for start in range(0, len(signature_strs), SIGNATURE_STATUSES_BATCH_SIZE):
+            chunk = signature_strs[start:start + SIGNATURE_STATUSES_BATCH_SIZE]
+            try:
+                statuses = client.get_signature_statuses(
+                    [Signature.from_string(sig) for sig in chunk],
+                    search_transaction_history=True
+                ).value
+            except Exception as e:
+                logger.error(f"Error fetching signature statuses: {str(e)}")
+                reasons.update({sig: ERROR for sig in chunk})
+                continue
+            
+            for sig, status in zip(chunk, statuses):
+                if status is None:
+                    reasons[sig] = NOT_FOUND
+                elif status.confirmation_status != TransactionConfirmationStatus.Finalized:
+                    reasons[sig] = NOT_FINALIZED
+                else:
+                    reasons[sig] = ERROR
+        return reasons
+    
     def _transform_db_transaction_to_encoded(
         self, 
         signature: str, 
@@ -256,6 +672,57 @@ class TransactionService:
             logger.error(f"Error transforming transaction {signature}: {str(e)}", exc_info=True)
             return None
     
+    def _transform_and_process_db_transaction(
+        self,
+        signature: str,
+        tx_json: dict,
+        result_callback: Optional[Callable],
+        callback_params: Optional[Any],
+        results_dict: Dict[str, Any]
+    ) -> Optional[EncodedConfirmedTransactionWithStatusMeta]:
+        """
+        Transform a database transaction and, if a callback is provided, process it right away.
+        
+        Args:
+            signature: Transaction signature
+            tx_json: Transaction data as JSON object
+            result_callback: Optional callback function to process the transaction
+            callback_params: Parameters for the callback
+            results_dict: Dictionary to update with the callback results
+            
+        Returns:
+            The callback result if a callback is provided, else EncodedConfirmedTransactionWithStatusMeta, or None on error
+        """
+        tx_data = self._transform_db_transaction_to_encoded(signature, tx_json)
+        if tx_data is not None and result_callback is not None:
+            self._process_callback(signature, tx_data, result_callback, callback_params, results_dict)
+            # Only the callback result is returned to the caller, do not keep the
+            # solders transaction alive in the futures until the whole batch is done
+            return results_dict[signature]
+        return tx_data
+    
+    def _process_raw_db_transaction(
+        self,
+        signature: str,
+        blob: bytes,
+        raw_result_callback: Callable,
+        results_dict: Dict[str, Any]
+    ) -> Optional[Any]:
+        """
+        Decompress a stored transaction blob and process its JSON bytes with the raw callback.
+        
+        Args:
+            signature: Transaction signature
+            blob: zlib compressed transaction JSON, as stored in the database
+            raw_result_callback: Callback receiving the transaction JSON bytes
+            results_dict: Dictionary to update with the callback results
+            
+        Returns:
+            The callback result, or None on error
+        """
+        self._process_callback(signature, zlib.decompress(blob), raw_result_callback, None, results_dict)
+        return results_dict[signature]
+    
     def _process_callback(
         self, 
         signature: str, 
@@ -348,12 +815,42 @@ class TransactionService:
         """
         try:
             self.transaction_repository.save_transaction(signature, tx_json)
+            negative_cache.discard(TRANSACTION_NAMESPACE, signature)
             logger.debug(f"Stored transaction {signature[:10]} in database")
         except SQLAlchemyError as e:
             logger.error(f"Database error storing transaction {signature}: {str(e)}", exc_info=True)
         except Exception as e:
             logger.error(f"Error storing transaction {signature}: {str(e)}", exc_info=True)
 
+    def save_structure_fingerprints(self, contexts: Dict[str, TransactionContext]) -> Optional[Future]:
+        """
+        Store the structure fingerprints computed when the transactions were parsed, in the background.
+        Only the fingerprints that are not stored yet, or stored by another fingerprint version, are written.
+        
+        Args:
+            contexts: Parsed transaction contexts by signature, with their fingerprint set
+            
+        Returns:
+            The future of the write, or None when there is nothing to store
+        """
+        structures = {
+            str(signature): (context.structure_fingerprint, context.slot)
+            for signature, context in contexts.items()
+            if context.structure_fingerprint is not None
+        }
+        if not structures:
+            return None
+        return self.executor.submit(self._save_new_structure_fingerprints, structures)
+
+    @staticmethod
+    def _save_new_structure_fingerprints(structures: Dict[str, Tuple[str, Optional[int]]]) -> bool:
+        stored_fingerprints = TransactionStructureRepository.get_structure_fingerprints(list(structures))
+        return TransactionStructureRepository.save_structure_fingerprints({
+            signature: structure
+            for signature, structure in structures.items()
+            if stored_fingerprints.get(signature) != structure[0]
+        })
+
     def cleanup(self):
         """
         Clean up resources used by this service.
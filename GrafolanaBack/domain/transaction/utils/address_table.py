@@ -0,0 +1,63 @@
+"""
+Integer ids of the account addresses met while building a transaction graph.
+
+An AddressTable is scoped to one parsed transaction, whose account repository and
+graph share it, or to one graphspace graph, and is released with them. Accounts and
+vertices are stored under compact integer ids, the address strings are only kept
+once in the table and read back for lookups by address and for serialization.
+"""
+import os
+from typing import Dict, List, Optional
+
+# Maximum number of addresses of one table, bounding the memory of a single graph
+ADDRESS_TABLE_MAX_SIZE = int(os.getenv("ADDRESS_TABLE_MAX_SIZE", "1000000"))
+
+class AddressTable:
+    """
+    Bidirectional mapping between addresses and the integer ids 0, 1, 2... given in the
+    order the addresses are added.
+    """
+    __slots__ = ("_ids", "_addresses", "max_size")
+
+    def __init__(self, max_size: int = ADDRESS_TABLE_MAX_SIZE):
+        self._ids: Dict[str, int] = {}
+        self._addresses: List[str] = []
+        self.max_size = max_size
+
+    def get_id(self, address: str) -> int:
+        """
+        Get the id of an address, adding the address to the table if needed.
+
+        Raises:
+            OverflowError: If the table already holds max_size addresses
+        """
+        address_id = self._ids.get(address)
+        if address_id is None:
+            address_id = len(self._addresses)
+            if address_id >= self.max_size:
+                raise OverflowError(f"Address table is full ({self.max_size} addresses)")
+            self._ids[address] = address_id
+            self._addresses.append(address)
+        return address_id
+
+    def find_id(self, address: str) -> Optional[int]:
+        """Get the id of an address, None if it is not in the table"""
+        return self._ids.get(address)
+
+    def get_address(self, address_id: int) -> str:
+        """Get the address of an id"""
+        return self._addresses[address_id]
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._ids
+
+    def __getstate__(self):
+        # The ids are rebuilt from the address list, so pickled contexts only carry the addresses once
+        return self._addresses, self.max_size
+
+    def __setstate__(self, state) -> None:
+        self._addresses, self.max_size = state
+        self._ids = {address: address_id for address_id, address in enumerate(self._addresses)}
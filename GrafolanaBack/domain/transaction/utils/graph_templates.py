@@ -0,0 +1,155 @@
+"""
+Template compression of graph data payloads.
+
+Bots repeat the same transaction hundreds of times: the nodes and links of their
+transactions only differ by a few values (amounts, balances, sometimes addresses).
+compress_graph_data moves the nodes and links of transactions with the same shape
+into a shared template, which holds the values common to all of them, while each
+transaction only keeps the values that differ:
+
+    "templates": [{"nodes": [{"constant": {...}, "varying": [field, ...]}, ...],
+                   "links": [{"constant": {...}, "varying": [field, ...]}, ...]}],
+    "templated_transactions": {signature: {"template": index,
+                                           "nodes": [[value, ...], ...],
+                                           "links": [[value, ...], ...]}}
+
+Template nodes are flattened (address and version instead of account_vertex) and
+template links reference their source and target by node index. Transactions with a
+unique shape keep their nodes and links in "nodes" and "links", and "graph_payload"
+tells which mode the graph data was sent in. expand_graph_data restores the full graph data.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+# Graph data modes of the graph requests
+GRAPH_PAYLOAD_FULL = "full"
+GRAPH_PAYLOAD_TEMPLATES = "templates"
+
+# Shape of a transaction: node and link field names, and link endpoints as node indexes
+Shape = Tuple[Tuple[Tuple[str, ...], ...], Tuple[Tuple[Any, ...], ...]]
+
+def _flatten_node(node: Dict[str, Any]) -> Dict[str, Any]:
+    flat = {field: value for field, value in node.items() if field != "account_vertex"}
+    flat["address"] = node["account_vertex"]["address"]
+    flat["version"] = node["account_vertex"]["version"]
+    return flat
+
+def _flatten_links(links: List[Dict[str, Any]], node_indexes: Dict[Tuple[str, str], int]) -> Optional[List[Dict[str, Any]]]:
+    """Links with their endpoints as node indexes, None when an endpoint is not a node"""
+    flat_links = []
+    for link in links:
+        source = node_indexes.get((link["source_account_vertex"]["address"], str(link["source_account_vertex"]["version"])))
+        target = node_indexes.get((link["target_account_vertex"]["address"], str(link["target_account_vertex"]["version"])))
+        if source is None or target is None:
+            return None
+        flat = {
+            field: value for field, value in link.items()
+            if field not in ("source_account_vertex", "target_account_vertex", "transaction_signature")
+        }
+        flat["source"] = source
+        flat["target"] = target
+        flat_links.append(flat)
+    return flat_links
+
+def _shape(nodes: List[Dict[str, Any]], links: List[Dict[str, Any]]) -> Shape:
+    return (
+        tuple(tuple(node) for node in nodes),
+        tuple((link["source"], link["target"], *link) for link in links),
+    )
+
+def _build_template(members: List[List[Dict[str, Any]]]) -> Tuple[List[Dict[str, Any]], List[List[List[Any]]]]:
+    """
+    Template entries of the items (nodes or links) at the same positions in every member,
+    and the varying values of each member.
+    """
+    template = []
+    for position, item in enumerate(members[0]):
+        constant, varying = {}, []
+        for field, value in item.items():
+            if all(member[position][field] == value for member in members):
+                constant[field] = value
+            else:
+                varying.append(field)
+        template.append({"constant": constant, "varying": varying})
+    values = [
+        [[member[position][field] for field in entry["varying"]] for position, entry in enumerate(template)]
+        for member in members
+    ]
+    return template, values
+
+def compress_graph_data(graph_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Move the nodes and links of the transactions sharing their shape into templates.
+
+    Args:
+        graph_data: Graph data as built by GraphService
+
+    Returns:
+        The graph data with "templates" and "templated_transactions"
+    """
+    nodes_by_transaction: Dict[str, List[Dict[str, Any]]] = {}
+    for node in graph_data["nodes"]:
+        nodes_by_transaction.setdefault(node["account_vertex"]["transaction_signature"], []).append(node)
+    links_by_transaction: Dict[str, List[Dict[str, Any]]] = {}
+    for link in graph_data["links"]:
+        links_by_transaction.setdefault(link["transaction_signature"], []).append(link)
+
+    # Transactions by shape, with their flattened nodes and links
+    shapes: Dict[Shape, List[Tuple[str, List[Dict[str, Any]], List[Dict[str, Any]]]]] = {}
+    for signature in graph_data["transactions"]:
+        nodes = [_flatten_node(node) for node in nodes_by_transaction.get(signature, ())]
+        node_indexes = {(node["address"], str(node["version"])): index for index, node in enumerate(nodes)}
+        links = _flatten_links(links_by_transaction.get(signature, ()), node_indexes)
+        if links is None or len(node_indexes) != len(nodes):
+            continue
+        shapes.setdefault(_shape(nodes, links), []).append((signature, nodes, links))
+
+    templates = []
+    templated_transactions = {}
+    for members in shapes.values():
+        if len(members) < 2:
+            continue
+        node_template, node_values = _build_template([nodes for _, nodes, _ in members])
+        link_template, link_values = _build_template([links for _, _, links in members])
+        for (signature, _, _), nodes, links in zip(members, node_values, link_values):
+            templated_transactions[signature] = {"template": len(templates), "nodes": nodes, "links": links}
+        templates.append({"nodes": node_template, "links": link_template})
+
+    compressed = {field: value for field, value in graph_data.items() if field not in ("nodes", "links")}
+    compressed["nodes"] = [node for node in graph_data["nodes"] if node["account_vertex"]["transaction_signature"] not in templated_transactions]
+    compressed["links"] = [link for link in graph_data["links"] if link["transaction_signature"] not in templated_transactions]
+    compressed["templates"] = templates
+    compressed["templated_transactions"] = templated_transactions
+    compressed["graph_payload"] = GRAPH_PAYLOAD_TEMPLATES
+    return compressed
+
+def _expand_items(template: List[Dict[str, Any]], values: List[List[Any]]) -> List[Dict[str, Any]]:
+    items = []
+    for entry, item_values in zip(template, values):
+        item = dict(entry["constant"])
+        item.update(zip(entry["varying"], item_values))
+        items.append(item)
+    return items
+
+def expand_graph_data(compressed: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Restore the graph data compressed by compress_graph_data.
+    Nodes and links of templated transactions come after the others.
+    """
+    graph_data = {field: value for field, value in compressed.items() if field not in ("templates", "templated_transactions", "graph_payload")}
+    graph_data["nodes"] = list(compressed["nodes"])
+    graph_data["links"] = list(compressed["links"])
+    for signature, transaction in compressed["templated_transactions"].items():
+        template = compressed["templates"][transaction["template"]]
+        nodes = _expand_items(template["nodes"], transaction["nodes"])
+        vertices = []
+        for node in nodes:
+            vertex = {"address": node.pop("address"), "version": node.pop("version"), "transaction_signature": signature}
+            node["account_vertex"] = vertex
+            vertices.append({**vertex, "version": str(vertex["version"])})
+            graph_data["nodes"].append(node)
+        for link in _expand_items(template["links"], transaction["links"]):
+            link["source_account_vertex"] = vertices[link.pop("source")]
+            link["target_account_vertex"] = vertices[link.pop("target")]
+            link["transaction_signature"] = signature
+            graph_data["links"].append(link)
+    return graph_data
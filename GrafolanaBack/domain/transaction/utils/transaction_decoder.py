@@ -0,0 +1,214 @@
+"""
+Decoding of getTransaction (jsonParsed) results into the input of the transaction parser.
+
+decode_encoded_transaction reads the solders objects, decode_raw_transaction reads the
+raw JSON bytes directly, without materializing solders objects. Both return the same
+TransactionInput, so either path can be checked against the other.
+"""
+import json
+import os
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Union
+
+from solders.transaction_status import EncodedTransactionWithStatusMeta
+
+from GrafolanaBack.domain.logging.logging import logger
+from GrafolanaBack.domain.transaction.utils.instruction_utils import Parsed_Instruction, get_instruction_call_stack
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parse stored transactions from their raw JSON with decode_raw_transaction,
+# skipping the solders objects (uses orjson, or the json module if it is missing)
+RAW_TRANSACTION_DECODER_ENABLED = os.getenv("RAW_TRANSACTION_DECODER_ENABLED", "false").lower() == "true"
+
+if RAW_TRANSACTION_DECODER_ENABLED and orjson is None:
+    logger.warning("orjson is not installed, the raw transaction decoder falls back to the slower json module")
+
+def _loads(raw_json: Union[bytes, str]) -> Any:
+    return orjson.loads(raw_json) if orjson is not None else json.loads(raw_json)
+
+def _dumps(value: Any) -> str:
+    """Compact JSON, as serialized by solders"""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+class TokenBalance(NamedTuple):
+    account_index: int
+    mint: str
+    owner: Optional[str]
+    amount: str
+
+class TransactionInput(NamedTuple):
+    """Everything the transaction parser reads from a getTransaction result"""
+    slot: int
+    block_time: Optional[int]
+    signer_wallets: Set[str]
+    account_addresses: List[str]
+    fee_payer: str
+    pre_token_balances: List[TokenBalance]
+    post_token_balances: List[TokenBalance]
+    pre_balances: List[int]
+    post_balances: List[int]
+    err: Optional[str]
+    fee: int
+    compute_units_consumed: Optional[int]
+    instructions: List[Parsed_Instruction]
+
+def decode_encoded_transaction(transaction: EncodedTransactionWithStatusMeta, block_time: Optional[int], slot: int) -> TransactionInput:
+    """
+    Decode a solders transaction into the parser input.
+
+    Args:
+        transaction: EncodedTransactionWithStatusMeta from getTransaction with jsonParsed encoding
+        block_time: Block time of the transaction
+        slot: Slot of the transaction
+    """
+    accounts = transaction.transaction.message.account_keys
+    meta = transaction.meta
+
+    err = None
+    if meta.err:
+        # Errors without fields (e.g. AccountInUse) have no to_json, serialize their name as the RPC does
+        err = meta.err.to_json() if hasattr(meta.err, "to_json") else _dumps(str(meta.err).rsplit(".", 1)[-1])
+
+    return TransactionInput(
+        slot=slot,
+        block_time=block_time,
+        signer_wallets={str(account.pubkey) for account in accounts if hasattr(account, 'signer') and account.signer},
+        account_addresses=[str(parsed_account.pubkey) for parsed_account in accounts],
+        fee_payer=str(accounts[0].pubkey),
+        pre_token_balances=[_token_balance(balance) for balance in meta.pre_token_balances or []],
+        post_token_balances=[_token_balance(balance) for balance in meta.post_token_balances or []],
+        pre_balances=list(meta.pre_balances),
+        post_balances=list(meta.post_balances),
+        err=err,
+        fee=meta.fee,
+        compute_units_consumed=meta.compute_units_consumed,
+        instructions=get_instruction_call_stack(transaction),
+    )
+
+def _token_balance(balance) -> TokenBalance:
+    return TokenBalance(
+        account_index=balance.account_index,
+        mint=str(balance.mint),
+        owner=str(balance.owner) if balance.owner else None,
+        amount=balance.ui_token_amount.amount,
+    )
+
+def decode_raw_transaction(raw_transaction: Union[bytes, str]) -> TransactionInput:
+    """
+    Decode the raw JSON of a getTransaction result (jsonParsed encoding) into the parser input.
+
+    Args:
+        raw_transaction: Transaction JSON, as stored in the database or returned by the RPC
+    """
+    encoded_transaction = _loads(raw_transaction)
+    transaction = encoded_transaction["transaction"]
+    meta = encoded_transaction["meta"]
+    accounts = transaction["message"]["accountKeys"]
+
+    err = meta.get("err")
+    if err is not None:
+        # solders serializes the content of the error variant, e.g. [0,{"Custom":6001}] for an InstructionError
+        err = _dumps(err if isinstance(err, str) else next(iter(err.values())))
+
+    return TransactionInput(
+        slot=encoded_transaction["slot"],
+        block_time=encoded_transaction.get("blockTime"),
+        signer_wallets={account["pubkey"] for account in accounts if account.get("signer")},
+        account_addresses=[account["pubkey"] for account in accounts],
+        fee_payer=accounts[0]["pubkey"],
+        pre_token_balances=[_raw_token_balance(balance) for balance in meta.get("preTokenBalances") or []],
+        post_token_balances=[_raw_token_balance(balance) for balance in meta.get("postTokenBalances") or []],
+        pre_balances=meta["preBalances"],
+        post_balances=meta["postBalances"],
+        err=err,
+        fee=meta["fee"],
+        compute_units_consumed=meta.get("computeUnitsConsumed"),
+        instructions=_raw_instruction_call_stack(transaction["message"]["instructions"], meta.get("innerInstructions") or []),
+    )
+
+def _raw_token_balance(balance: Dict[str, Any]) -> TokenBalance:
+    return TokenBalance(
+        account_index=balance["accountIndex"],
+        mint=balance["mint"],
+        owner=balance.get("owner") or None,
+        amount=balance["uiTokenAmount"]["amount"],
+    )
+
+def _raw_instruction(instruction: Dict[str, Any], stack_height: int, parent_instruction: Optional[Parsed_Instruction]) -> Parsed_Instruction:
+    """Parsed_Instruction of a parsed or partially decoded instruction, as get_instruction_call_stack builds it"""
+    if "parsed" in instruction:
+        program_name, parsed, data, accounts = instruction["program"], instruction["parsed"], None, None
+    else:
+        program_name, parsed, data, accounts = None, None, instruction["data"], instruction["accounts"]
+    return Parsed_Instruction(
+        stackHeight=stack_height,
+        program_name=program_name,
+        program_address=instruction["programId"],
+        accounts=accounts,
+        parsed=parsed,
+        data=data,
+        parent_instruction=parent_instruction,
+        inner_instructions=[]
+    )
+
+def _raw_instruction_call_stack(main_instructions: List[Dict[str, Any]], inner_instructions: List[Dict[str, Any]]) -> List[Parsed_Instruction]:
+    """Same call stack as get_instruction_call_stack, built from the raw instruction dicts"""
+    inner_map = {inner["index"]: inner["instructions"] for inner in inner_instructions}
+
+    def build_call_stack(instructions: List[Dict[str, Any]], start_idx: int, min_height: int, parent_instruction: Parsed_Instruction) -> List[Parsed_Instruction]:
+        call_stack = []
+        i = start_idx
+        while i < len(instructions):
+            stack_height = instructions[i].get("stackHeight")
+            if stack_height is None and min_height > 0:
+                raise ValueError(f"Inner instruction at index {i} has no stack_height")
+            if stack_height is not None and stack_height < min_height:
+                break
+
+            effective_height = 0 if stack_height is None else stack_height
+            j = i + 1
+            while j < len(instructions):
+                next_height = instructions[j].get("stackHeight")
+                if next_height is None or next_height <= effective_height:
+                    break
+                j += 1
+
+            parsed_instruction = _raw_instruction(instructions[i], effective_height, parent_instruction)
+            if j > i + 1:
+                parsed_instruction.inner_instructions.extend(build_call_stack(instructions, i + 1, effective_height + 1, parsed_instruction))
+            call_stack.append(parsed_instruction)
+            i = j
+        return call_stack
+
+    call_stack = []
+    for idx, instruction in enumerate(main_instructions):
+        main_instruction = _raw_instruction(instruction, 0, None)
+        if idx in inner_map:
+            main_instruction.inner_instructions.extend(build_call_stack(inner_map[idx], 0, 2, main_instruction))
+        call_stack.append(main_instruction)
+    return call_stack
+
+def comparable_transaction_input(transaction_input: TransactionInput) -> tuple:
+    """
+    Plain tuple form of a TransactionInput, to compare the output of the two decoders.
+    Instructions are compared without their parent_instruction back references.
+    """
+    def comparable_instruction(instruction: Parsed_Instruction) -> tuple:
+        return (
+            instruction.stackHeight,
+            instruction.program_name,
+            instruction.program_address,
+            instruction.accounts,
+            instruction.parsed,
+            instruction.data,
+            [comparable_instruction(inner) for inner in instruction.inner_instructions],
+        )
+
+    return transaction_input._replace(
+        instructions=[comparable_instruction(instruction) for instruction in transaction_input.instructions]
+    )
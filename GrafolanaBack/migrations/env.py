@@ -10,7 +10,6 @@ load_dotenv(dotenv_path=env_path)
 import sys
 from sqlalchemy import engine_from_config, pool
 from logging.config import fileConfig
-from urllib.parse import quote_plus
 
 # Add the parent directory to sys.path so we can import our app
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -26,20 +25,8 @@ from GrafolanaBack.domain.metadata.labeling.models import Label, LabelPriority
 config = context.config
 
 # Override the sqlalchemy.url in the alembic.ini file with environment variables
-def get_database_url():
-    """
-    Builds the database URL from environment variables or uses default values for development
-    """
-    db_user = os.environ.get('DB_USER', 'grafolana')
-    db_password = os.environ.get('DB_PASSWORD', 'grafolana_dev')
-    db_host = os.environ.get('DB_HOST', 'localhost')
-    db_port = os.environ.get('DB_PORT', '5432')
-    db_name = os.environ.get('DB_NAME', 'grafolana')
-    
-    # Safely quote the password to handle special characters
-    quoted_password = quote_plus(db_password)
-    
-    return f"postgresql://{db_user}:{quoted_password}@{db_host}:{db_port}/{db_name}"
+# (same backend selection as the application engine)
+from GrafolanaBack.domain.infrastructure.db.session import get_database_url
 
 config.set_main_option('sqlalchemy.url', get_database_url())
 
@@ -96,7 +83,10 @@ def run_migrations_online():
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite cannot ALTER most constraints in place, batch mode recreates the table instead
+            render_as_batch=connection.dialect.name == 'sqlite'
         )
 
         with context.begin_transaction():
@@ -36,5 +36,6 @@ def downgrade():
     op.drop_index(op.f('ix_labels_address'), table_name='labels')
     op.drop_table('labels')
     
-    # Drop the enum type
-    op.execute('DROP TYPE labelpriority')
\ No newline at end of file
+    # Drop the enum type (only PostgreSQL has named enum types)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('DROP TYPE labelpriority')
\ No newline at end of file
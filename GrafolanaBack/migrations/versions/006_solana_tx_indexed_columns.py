@@ -0,0 +1,103 @@
+"""Add indexed slot/block_time/fee_payer columns to solana_transactions
+
+Revision ID: 006_solana_tx_indexed_columns
+Revises: 005_initial_spam_addresses_table
+Create Date: 2025-05-10
+"""
+import json
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_solana_tx_indexed_columns'
+down_revision = '005_initial_spam_addresses_table'
+branch_labels = None
+depends_on = None
+
+# Number of rows decompressed per backfill batch
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _extract_fields(transaction_json: dict) -> dict:
+    """Mirror of SolanaTransaction.extract_indexed_fields, kept local so the migration stays frozen."""
+    transaction = transaction_json.get('transaction') or {}
+    account_keys = (transaction.get('message') or {}).get('accountKeys') or []
+    fee_payer = None
+    if account_keys:
+        first_key = account_keys[0]
+        fee_payer = first_key.get('pubkey') if isinstance(first_key, dict) else first_key
+
+    meta = transaction_json.get('meta')
+    return {
+        'slot': transaction_json.get('slot'),
+        'block_time': transaction_json.get('blockTime'),
+        'fee_payer': fee_payer,
+        'has_error': (meta.get('err') is not None) if meta is not None else None,
+        'size': len(json.dumps(transaction_json).encode('utf-8')),
+    }
+
+
+def _backfill() -> None:
+    """Decompress existing rows in batches (keyset pagination on the PK) and fill the new columns."""
+    connection = op.get_bind()
+    select_batch = sa.text(
+        "SELECT transaction_signature, transaction_json FROM solana_transactions "
+        "WHERE transaction_signature > :last_signature "
+        "ORDER BY transaction_signature LIMIT :batch_size"
+    )
+    update_row = sa.text(
+        "UPDATE solana_transactions SET slot = :slot, block_time = :block_time, "
+        "fee_payer = :fee_payer, has_error = :has_error, size = :size "
+        "WHERE transaction_signature = :transaction_signature"
+    )
+
+    last_signature = ''
+    while True:
+        rows = connection.execute(
+            select_batch, {'last_signature': last_signature, 'batch_size': BACKFILL_BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            break
+
+        updates = []
+        for signature, blob in rows:
+            try:
+                transaction_json = json.loads(zlib.decompress(blob).decode('utf-8'))
+            except (zlib.error, json.JSONDecodeError, UnicodeDecodeError):
+                # Corrupted rows are left with NULL columns
+                continue
+            fields = _extract_fields(transaction_json)
+            fields['transaction_signature'] = signature
+            updates.append(fields)
+
+        if updates:
+            connection.execute(update_row, updates)
+        last_signature = rows[-1][0]
+
+
+def upgrade() -> None:
+    op.add_column('solana_transactions', sa.Column('slot', sa.BigInteger(), nullable=True))
+    op.add_column('solana_transactions', sa.Column('block_time', sa.BigInteger(), nullable=True))
+    op.add_column('solana_transactions', sa.Column('fee_payer', sa.String(), nullable=True))
+    op.add_column('solana_transactions', sa.Column('has_error', sa.Boolean(), nullable=True))
+    op.add_column('solana_transactions', sa.Column('size', sa.Integer(), nullable=True))
+
+    # Backfill before creating the indexes so they are built once
+    _backfill()
+
+    op.create_index(op.f('ix_solana_transactions_slot'), 'solana_transactions', ['slot'], unique=False)
+    op.create_index(op.f('ix_solana_transactions_block_time'), 'solana_transactions', ['block_time'], unique=False)
+    op.create_index(op.f('ix_solana_transactions_fee_payer'), 'solana_transactions', ['fee_payer'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_solana_transactions_fee_payer'), table_name='solana_transactions')
+    op.drop_index(op.f('ix_solana_transactions_block_time'), table_name='solana_transactions')
+    op.drop_index(op.f('ix_solana_transactions_slot'), table_name='solana_transactions')
+    op.drop_column('solana_transactions', 'size')
+    op.drop_column('solana_transactions', 'has_error')
+    op.drop_column('solana_transactions', 'fee_payer')
+    op.drop_column('solana_transactions', 'block_time')
+    op.drop_column('solana_transactions', 'slot')
@@ -0,0 +1,34 @@
+"""Add hot tier retention columns to solana_transactions
+
+Revision ID: 007_solana_tx_access_tracking
+Revises: 006_solana_tx_indexed_columns
+Create Date: 2025-05-18
+"""
+import time
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_solana_tx_access_tracking'
+down_revision = '006_solana_tx_indexed_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('solana_transactions', sa.Column('stored_at', sa.BigInteger(), nullable=True))
+    op.add_column('solana_transactions', sa.Column('last_accessed_at', sa.BigInteger(), nullable=True))
+
+    # Existing rows start their retention period now
+    op.execute(
+        sa.text("UPDATE solana_transactions SET stored_at = :now, last_accessed_at = :now").bindparams(now=int(time.time()))
+    )
+
+    op.create_index(op.f('ix_solana_transactions_last_accessed_at'), 'solana_transactions', ['last_accessed_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_solana_transactions_last_accessed_at'), table_name='solana_transactions')
+    op.drop_column('solana_transactions', 'last_accessed_at')
+    op.drop_column('solana_transactions', 'stored_at')
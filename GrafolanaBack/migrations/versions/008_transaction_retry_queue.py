@@ -0,0 +1,33 @@
+"""Create transaction_retry_queue table
+
+Revision ID: 008_transaction_retry_queue
+Revises: 007_solana_tx_access_tracking
+Create Date: 2025-05-24
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008_transaction_retry_queue'
+down_revision = '007_solana_tx_access_tracking'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create transaction_retry_queue table
+    op.create_table('transaction_retry_queue',
+        sa.Column('transaction_signature', sa.String(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('next_attempt_at', sa.BigInteger(), nullable=False),
+        sa.Column('last_error', sa.String(), nullable=True),
+        sa.Column('created_at', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('transaction_signature')
+    )
+    op.create_index(op.f('ix_transaction_retry_queue_next_attempt_at'), 'transaction_retry_queue', ['next_attempt_at'], unique=False)
+
+
+def downgrade() -> None:
+    # Drop transaction_retry_queue table
+    op.drop_index(op.f('ix_transaction_retry_queue_next_attempt_at'), table_name='transaction_retry_queue')
+    op.drop_table('transaction_retry_queue')
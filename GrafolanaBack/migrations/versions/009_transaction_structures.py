@@ -0,0 +1,31 @@
+"""Add transaction_structures table
+
+Revision ID: 009_transaction_structures
+Revises: 008_transaction_retry_queue
+Create Date: 2025-06-01
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009_transaction_structures'
+down_revision = '008_transaction_retry_queue'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create transaction_structures table, filled when the transactions are parsed
+    op.create_table('transaction_structures',
+        sa.Column('transaction_signature', sa.String(), nullable=False),
+        sa.Column('structure_fingerprint', sa.String(), nullable=False),
+        sa.Column('slot', sa.BigInteger(), nullable=True),
+        sa.PrimaryKeyConstraint('transaction_signature')
+    )
+    op.create_index(op.f('ix_transaction_structures_structure_fingerprint'), 'transaction_structures', ['structure_fingerprint'], unique=False)
+
+
+def downgrade() -> None:
+    # Drop transaction_structures table
+    op.drop_index(op.f('ix_transaction_structures_structure_fingerprint'), table_name='transaction_structures')
+    op.drop_table('transaction_structures')
@@ -0,0 +1,42 @@
+import pickle
+import unittest
+
+from GrafolanaBack.domain.performance.account_version_benchmark import run_benchmark
+from GrafolanaBack.domain.transaction.models.account import Account, AccountVersion
+from GrafolanaBack.domain.transaction.repositories.account_repository import AccountRepository
+
+class Test_Account_Versioning(unittest.TestCase):
+    def test_new_version_shares_account(self):
+        repository = AccountRepository()
+        first = repository.create_account("sig", "address", "mint", owner="owner", balance_token=5, balance_lamport=7)
+        second = repository.new_account_version("address")
+
+        self.assertEqual((second.version, second.owner, second.balance_token, second.balance_lamport), (1, "owner", 5, 7))
+        self.assertIs(second.account, first.account)
+        second.apply_token_credit(10)
+        self.assertEqual(first.balance_token, 5)
+        self.assertEqual([version.version for version in repository.get_versions("address")], [0, 1])
+
+    def test_authorities_are_copied_on_write(self):
+        repository = AccountRepository()
+        repository.create_account("sig", "address", "mint")
+        other = Account(address="other")
+        self.assertIs(repository.get_account("address").authorities, other.authorities)
+
+        self.assertTrue(repository.add_authority("address", "authority"))
+        self.assertFalse(repository.add_authority("address", "authority"))
+        self.assertEqual(repository.get_account("address").authorities, ("authority",))
+        self.assertEqual(other.authorities, ())
+
+    def test_models_are_slotted_and_picklable(self):
+        version = AccountVersion(0, Account(address="address", authorities=("a",)), "sig", None, 1, 2)
+        self.assertFalse(hasattr(version, "__dict__"))
+        self.assertFalse(hasattr(version.account, "__dict__"))
+        self.assertEqual(pickle.loads(pickle.dumps(version)), version)
+
+    def test_benchmark_shows_less_memory(self):
+        results = run_benchmark(accounts=20, transfers=500)
+        self.assertLess(results["current"]["retained_bytes"], results["legacy"]["retained_bytes"])
+
+if __name__ == '__main__':
+    unittest.main()
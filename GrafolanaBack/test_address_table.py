@@ -0,0 +1,90 @@
+import json
+import pickle
+import unittest
+from unittest.mock import patch
+
+from solders.signature import Signature
+from solders.transaction_status import EncodedConfirmedTransactionWithStatusMeta
+
+from GrafolanaBack.domain.transaction.models import graph as graph_module
+from GrafolanaBack.domain.transaction.models.graphspace import Graphspace
+from GrafolanaBack.domain.transaction.services.transaction_parser_service import TransactionParserService
+from GrafolanaBack.domain.transaction.utils.address_table import AddressTable
+from GrafolanaBack.testing import RECEIVER, SENDER, SYSTEM_PROGRAM, build_transfer_transaction_json, SQLiteTestCase
+
+class Test_Address_Table(unittest.TestCase):
+    def test_addresses_get_compact_ids(self):
+        table = AddressTable()
+        self.assertEqual([table.get_id(address) for address in ("a", "b", "a", "c")], [0, 1, 0, 2])
+        self.assertEqual(table.get_address(1), "b")
+        self.assertEqual(len(table), 3)
+
+    def test_find_id_does_not_add(self):
+        table = AddressTable()
+        self.assertIsNone(table.find_id("a"))
+        self.assertNotIn("a", table)
+        self.assertEqual(len(table), 0)
+
+    def test_table_is_bounded(self):
+        table = AddressTable(max_size=2)
+        table.get_id("a")
+        table.get_id("b")
+        self.assertEqual(table.get_id("a"), 0)
+        with self.assertRaises(OverflowError):
+            table.get_id("c")
+
+    def test_pickled_table_keeps_ids(self):
+        table = AddressTable()
+        for address in ("a", "b", "c"):
+            table.get_id(address)
+        copy = pickle.loads(pickle.dumps(table))
+        self.assertEqual([copy.find_id(address) for address in ("a", "b", "c")], [0, 1, 2])
+        self.assertEqual(copy.get_id("d"), 3)
+
+class Test_Address_Table_Parsing(SQLiteTestCase):
+    def parse(self, lamports: int):
+        transaction = EncodedConfirmedTransactionWithStatusMeta.from_json(json.dumps(build_transfer_transaction_json(lamports)))
+        return TransactionParserService().parse_transaction_call_back(str(Signature.new_unique()), transaction)
+
+    def test_repository_and_graph_share_the_transaction_table(self):
+        context = self.parse(1000)
+        table = context.account_repository.address_table
+
+        self.assertIs(context.graph.address_table, table)
+        self.assertTrue(all(isinstance(address_id, int) for address_id in context.account_repository.accounts))
+        self.assertEqual(len(table), len(context.account_repository.accounts))
+        self.assertLessEqual({SENDER, RECEIVER, SYSTEM_PROGRAM}, set(context.account_repository.get_all_addresses()))
+        for address in (SENDER, RECEIVER):
+            self.assertEqual(context.account_repository.get_account(address).address, address)
+            vertices = context.graph.get_nodes_by_address(address)
+            self.assertTrue(vertices)
+            self.assertTrue(all(vertex.address == address for vertex in vertices))
+        self.assertIsNone(context.account_repository.get_account("unknown"))
+        self.assertEqual(context.graph.get_nodes_by_address("unknown"), [])
+
+    def test_pickled_context_keeps_one_table(self):
+        # Contexts parsed by the parser process pool are pickled back to the parent process
+        context = pickle.loads(pickle.dumps(self.parse(1000)))
+
+        self.assertIs(context.graph.address_table, context.account_repository.address_table)
+        self.assertEqual(context.account_repository.get_account(SENDER).address, SENDER)
+        self.assertTrue(context.graph.get_nodes_by_address(RECEIVER))
+
+    def test_graphspace_numbers_addresses_in_its_own_table(self):
+        for engine in ("networkx", "compact"):
+            with self.subTest(engine=engine), patch.object(graph_module, 'GRAPH_ENGINE', engine):
+                contexts = {context.transaction_signature: context for context in (self.parse(1000), self.parse(2000))}
+                graphspace = Graphspace(contexts)
+
+                for context in contexts.values():
+                    self.assertIsNot(graphspace.graph.address_table, context.graph.address_table)
+                self.assertEqual(len(graphspace.graph.get_nodes_by_address(SENDER)), sum(
+                    len(context.graph.get_nodes_by_address(SENDER)) for context in contexts.values()
+                ))
+                self.assertEqual(
+                    [data["program_address"] for _, _, _, data in graphspace.graph.get_edges()],
+                    [data["program_address"] for context in contexts.values() for _, _, _, data in context.graph.get_edges()]
+                )
+
+if __name__ == '__main__':
+    unittest.main()
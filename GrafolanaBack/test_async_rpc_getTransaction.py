@@ -9,7 +9,7 @@ from solders.signature import Signature
 import unittest
 
 
-from no_cache_unit_test import NoCacheUnitTest
+from GrafolanaBack.no_cache_unit_test import NoCacheUnitTest
 
 
 import logging
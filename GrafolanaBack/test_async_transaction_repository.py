@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+
+from solders.signature import Signature
+
+from GrafolanaBack.domain.infrastructure.db.async_session import dispose_async_engine
+from GrafolanaBack.domain.metadata.spl_token.models.classes import Mint, MintMapper
+from GrafolanaBack.domain.metadata.spl_token.repositories.async_mint_repository import AsyncMintRepository
+from GrafolanaBack.domain.prices.async_repository import AsyncSOLPriceRepository
+from GrafolanaBack.domain.prices.sol_price_utils import round_timestamp_to_minute
+from GrafolanaBack.domain.transaction.repositories.async_transaction_repository import AsyncTransactionRepository
+from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository
+from GrafolanaBack.domain.transaction.services.transaction_service import StoredMetadata, TransactionService
+from GrafolanaBack.testing import FEE_PAYER, SYSTEM_PROGRAM, build_transaction_json, SQLiteTestCase
+
+MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+class AsyncSQLiteTestCase(SQLiteTestCase):
+    def run_async(self, coroutine):
+        async def run():
+            try:
+                return await coroutine
+            finally:
+                await dispose_async_engine()
+        return asyncio.run(run())
+
+class Test_Async_Transaction_Repository(AsyncSQLiteTestCase):
+
+    def test_reads_and_writes_through_aiosqlite(self):
+        tx_json = build_transaction_json()
+        TransactionRepository.save_transactions({"sync_sig": tx_json})
+
+        async def scenario():
+            saved = await AsyncTransactionRepository.save_transaction("async_sig", tx_json)
+            by_signature = await AsyncTransactionRepository.get_transaction("async_sig")
+            streamed = [
+                signature async for signature, _ in
+                AsyncTransactionRepository.iter_transactions_by_signatures(["async_sig", "missing", "sync_sig"], chunk_size=1)
+            ]
+            by_slot = await AsyncTransactionRepository.get_transactions_by_slot_range(0, 10**9, fee_payer=FEE_PAYER)
+            return saved, by_signature, streamed, by_slot, await AsyncTransactionRepository.count_transactions()
+
+        saved, by_signature, streamed, by_slot, count = self.run_async(scenario())
+
+        self.assertTrue(saved)
+        self.assertEqual(by_signature, tx_json)
+        self.assertEqual(streamed, ["async_sig", "sync_sig"])
+        self.assertEqual(set(by_slot), {"async_sig", "sync_sig"})
+        self.assertEqual(count, 2)
+        # Rows written by the async engine are read by the sync one
+        self.assertEqual(TransactionRepository.get_transaction("async_sig"), tx_json)
+
+class Test_Async_Metadata_Repositories(AsyncSQLiteTestCase):
+    def test_mint_and_price_repositories(self):
+        async def scenario():
+            await AsyncMintRepository.create_or_update_mints([MintMapper.to_dto(Mint(mint_address=MINT))])
+            await AsyncSOLPriceRepository().bulk_set_prices([(60_000, 100.0), (120_000, 110.0)])
+            # Stored timestamps are left untouched
+            await AsyncSOLPriceRepository().bulk_set_prices([(60_000, 999.0)])
+            prices = await AsyncSOLPriceRepository().get_prices_by_timestamps([60_000, 180_000])
+            latest = await AsyncSOLPriceRepository().get_latest_price()
+            return await AsyncMintRepository.get_mints_by_addresses([MINT, "missing"]), prices, latest
+
+        mints, prices, latest = self.run_async(scenario())
+
+        self.assertEqual(list(mints), [MINT])
+        self.assertEqual([(price.timestamp, price.price) for price in prices], [(60_000, 100.0)])
+        self.assertEqual(latest.price, 110.0)
+
+class Test_Async_Transaction_Retrieval(AsyncSQLiteTestCase):
+    def test_async_retrieval_reads_stored_mints_and_prices(self):
+        tx_json = build_transaction_json()
+        tx_json["meta"]["preTokenBalances"] = [{
+            "accountIndex": 0, "mint": MINT, "owner": FEE_PAYER, "programId": SYSTEM_PROGRAM,
+            "uiTokenAmount": {"amount": "1", "decimals": 0, "uiAmount": 1.0, "uiAmountString": "1"},
+        }]
+        signature = str(Signature.default())
+        TransactionRepository.save_transactions({signature: tx_json})
+        minute = round_timestamp_to_minute(tx_json["blockTime"] * 1000)
+        stored_metadata = StoredMetadata()
+
+        async def scenario():
+            await AsyncMintRepository.create_or_update_mints([MintMapper.to_dto(Mint(mint_address=MINT))])
+            await AsyncSOLPriceRepository().bulk_set_prices([(minute, 150.0)])
+            return await TransactionService().get_transactions_async([signature], stored_metadata=stored_metadata)
+
+        results = self.run_async(scenario())
+
+        self.assertIsNotNone(results[signature])
+        self.assertEqual(stored_metadata.sol_prices, {minute: 150.0})
+        self.assertEqual(list(stored_metadata.mints), [MINT])
+
+if __name__ == '__main__':
+    unittest.main()
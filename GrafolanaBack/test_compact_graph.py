@@ -0,0 +1,164 @@
+import json
+import random
+import tracemalloc
+import unittest
+from unittest.mock import patch
+
+import networkx as nx
+from solders.signature import Signature
+from solders.transaction_status import EncodedConfirmedTransactionWithStatusMeta
+
+from GrafolanaBack.domain.transaction.models import graph as graph_module
+from GrafolanaBack.domain.transaction.models.account import AccountVertex
+from GrafolanaBack.domain.transaction.models.compact_graph import CompactTransactionGraph
+from GrafolanaBack.domain.transaction.models.graphspace import Graphspace
+from GrafolanaBack.domain.transaction.models.graph import TransactionGraph, TransferProperties, TransferType
+from GrafolanaBack.domain.transaction.models.swap import Swap, TransferAccountAddresses
+from GrafolanaBack.domain.transaction.services.transaction_parser_service import TransactionParserService
+from GrafolanaBack.testing import build_transfer_transaction_json, SQLiteTestCase
+
+SIGNATURE = "5" * 88
+
+def vertex(index: int, version: int = 0) -> AccountVertex:
+    return AccountVertex(address=f"account{index}", version=version, transaction_signature=SIGNATURE)
+
+def random_transfer(rng: random.Random) -> TransferProperties:
+    swap_id = rng.choice([None, 1, 2])
+    return TransferProperties(
+        transfer_type=rng.choice(list(TransferType)),
+        program_address=rng.choice(["program_a", "program_b", None]),
+        amount_source=rng.randint(0, 2**64),
+        amount_destination=rng.randint(0, 2**64),
+        swap_id=swap_id,
+        swap_parent_id=rng.choice([None, swap_id]),
+        parent_router_swap_id=rng.choice([None, 3]),
+    )
+
+def build_swap(swap_id: int, router: bool) -> Swap:
+    addresses = TransferAccountAddresses(source="account0", destination="account1")
+    return Swap(
+        id=swap_id,
+        router=router,
+        program_address="program_a",
+        program_name="Program A",
+        instruction_name="swap",
+        user_addresses=addresses,
+        pool_addresses=addresses,
+        parent_router_swap_id=None,
+    )
+
+class Test_Compact_Graph(unittest.TestCase):
+    def assert_same_graph(self, expected: TransactionGraph, actual: TransactionGraph):
+        self.assertEqual(actual.get_nodes(), expected.get_nodes())
+        self.assertEqual(actual.get_edges(), expected.get_edges())
+        self.assertEqual(actual.number_of_edges(), expected.number_of_edges())
+        self.assertEqual(actual.isolate_nodes(), expected.isolate_nodes())
+
+    def test_random_operations_match_networkx(self):
+        rng = random.Random(3)
+        for _ in range(10):
+            expected, actual = TransactionGraph(), CompactTransactionGraph()
+            vertices = [vertex(i, rng.randint(0, 2)) for i in range(15)]
+            for v in vertices[:10]:
+                expected.add_node(v)
+                actual.add_node(v)
+            for _ in range(50):
+                source, target = rng.sample(vertices, 2)
+                properties = random_transfer(rng)
+                # Reused keys replace the data of an existing edge
+                key = rng.choice([None, None, 10, 20])
+                self.assertEqual(actual.add_edge(source, target, properties, key), expected.add_edge(source, target, properties, key))
+            self.assert_same_graph(expected, actual)
+
+            for source in vertices:
+                self.assertEqual(actual.get_nodes_by_address(source.address), expected.get_nodes_by_address(source.address))
+                for target in vertices:
+                    self.assertEqual(actual.get_edge_data(source, target), expected.get_edge_data(source, target))
+                    if expected.has_node(source) and expected.has_node(target):
+                        self.assertEqual(actual.has_path(source, target), expected.has_path(source, target))
+                        try:
+                            expected_length = len(expected.get_shortest_path(source, target))
+                        except nx.NetworkXNoPath:
+                            self.assertRaises(nx.NetworkXNoPath, actual.get_shortest_path, source, target)
+                        else:
+                            self.assertEqual(len(actual.get_shortest_path(source, target)), expected_length)
+
+            self.assertEqual(actual.get_edges(swap_parent_id=1), expected.get_edges(swap_parent_id=1))
+            self.assertEqual(actual.get_edges(transfer_type=TransferType.SWAP), expected.get_edges(transfer_type=TransferType.SWAP))
+            for swap in (build_swap(1, router=False), build_swap(3, router=True)):
+                expected_subgraph = expected.create_subgraph_for_swap(swap)
+                actual_subgraph = actual.create_subgraph_for_swap(swap)
+                if expected_subgraph is None:
+                    self.assertIsNone(actual_subgraph)
+                    continue
+                self.assertEqual(list(actual_subgraph.nodes()), list(expected_subgraph.nodes()))
+                self.assertEqual(list(actual_subgraph.edges(keys=True, data=True)), list(expected_subgraph.edges(keys=True, data=True)))
+
+            removed = rng.sample(vertices, 3)
+            expected.remove_nodes(removed)
+            actual.remove_nodes(removed)
+            self.assert_same_graph(expected, actual)
+
+    def test_add_graph_merges_graphs(self):
+        first, second = CompactTransactionGraph(), TransactionGraph()
+        first.add_edge(vertex(1), vertex(2), TransferProperties(TransferType.TRANSFER, "program_a", 5, 5))
+        second.add_edge(vertex(3), vertex(4), TransferProperties(TransferType.SWAP, "program_b", 1, 2, swap_id=1, swap_parent_id=1))
+        second.add_node(vertex(5))
+
+        merged = CompactTransactionGraph()
+        merged.add_graph(first)
+        merged.add_graph(second)
+        expected = TransactionGraph()
+        expected.add_graph(first)
+        expected.add_graph(second)
+
+        self.assertEqual(merged.number_of_nodes(), 5)
+        self.assert_same_graph(expected, merged)
+
+    def test_uses_less_memory(self):
+        rng = random.Random(5)
+        edges = [(vertex(rng.randrange(500)), vertex(rng.randrange(500), 1), random_transfer(rng)) for _ in range(5000)]
+
+        def allocated(graph_class) -> int:
+            tracemalloc.start()
+            graph = graph_class()
+            for source, target, properties in edges:
+                graph.add_edge(source, target, properties)
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return size
+
+        self.assertLess(allocated(CompactTransactionGraph) * 2, allocated(TransactionGraph))
+
+class Test_Compact_Graph_Parsing(SQLiteTestCase):
+    def test_parsing_builds_same_graph(self):
+        signature = str(Signature.new_unique())
+        transaction = EncodedConfirmedTransactionWithStatusMeta.from_json(json.dumps(build_transfer_transaction_json(1000)))
+        parser_service = TransactionParserService()
+
+        expected = parser_service.parse_transaction_call_back(signature, transaction)
+        with patch.object(graph_module, 'GRAPH_ENGINE', 'compact'):
+            actual = parser_service.parse_transaction_call_back(signature, transaction)
+
+        self.assertIsInstance(actual.graph, CompactTransactionGraph)
+        self.assertEqual(actual.graph.get_nodes(), expected.graph.get_nodes())
+        self.assertEqual(actual.graph.get_edges(), expected.graph.get_edges())
+
+    def test_graphspace_merges_compact_graphs(self):
+        parser_service = TransactionParserService()
+        with patch.object(graph_module, 'GRAPH_ENGINE', 'compact'):
+            contexts = {
+                signature: parser_service.parse_transaction_call_back(signature, transaction)
+                for signature, transaction in (
+                    (str(Signature.new_unique()), EncodedConfirmedTransactionWithStatusMeta.from_json(json.dumps(build_transfer_transaction_json(lamports))))
+                    for lamports in (1000, 2000)
+                )
+            }
+            graphspace = Graphspace(contexts)
+
+        self.assertIsInstance(graphspace.graph, CompactTransactionGraph)
+        self.assertEqual(graphspace.graph.number_of_nodes(), sum(context.graph.number_of_nodes() for context in contexts.values()))
+        self.assertEqual(graphspace.graph.number_of_edges(), sum(context.graph.number_of_edges() for context in contexts.values()))
+
+if __name__ == '__main__':
+    unittest.main()
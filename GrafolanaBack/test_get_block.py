@@ -3,7 +3,7 @@ from solders.transaction import Transaction
 from GrafolanaBack.domain.transaction.services.transaction_parser_service import TransactionParserService
 import unittest
 
-from no_cache_unit_test import NoCacheUnitTest
+from GrafolanaBack.no_cache_unit_test import NoCacheUnitTest
 from GrafolanaBack.domain.performance.timing_utils import TimingStats
 
 from GrafolanaBack.domain.rpc.rpc_connection_utils import client
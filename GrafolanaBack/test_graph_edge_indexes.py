@@ -0,0 +1,72 @@
+import random
+import unittest
+
+from GrafolanaBack.domain.transaction.models.account import AccountVertex
+from GrafolanaBack.domain.transaction.models.compact_graph import CompactTransactionGraph
+from GrafolanaBack.domain.transaction.models.graph import TransactionGraph, TransferProperties, TransferType
+from GrafolanaBack.domain.transaction.models.swap import Swap, TransferAccountAddresses
+
+def scan_edges(graph: TransactionGraph, **filters):
+    """Edges matching the filters, found by scanning the whole graph"""
+    return sorted(
+        (u, v, k) for u, v, k, data in graph.get_edges()
+        if all(data.get(prop) == value for prop, value in filters.items())
+    )
+
+def edge_keys(edges):
+    return sorted((u, v, k) for u, v, k, *_ in edges)
+
+def build_swap(swap_id: int, router: bool) -> Swap:
+    addresses = TransferAccountAddresses(source="account0", destination="account1")
+    return Swap(id=swap_id, router=router, program_address="program", program_name="Program",
+                instruction_name="swap", user_addresses=addresses, pool_addresses=addresses)
+
+class Test_Graph_Edge_Indexes(unittest.TestCase):
+    def check_indexes(self, graph: TransactionGraph):
+        for swap_id in (1, 2, 3):
+            self.assertEqual(edge_keys(graph.get_edges(swap_parent_id=swap_id)), scan_edges(graph, swap_parent_id=swap_id))
+            self.assertEqual(
+                edge_keys(graph.get_edges(swap_parent_id=swap_id, transfer_type=TransferType.SWAP)),
+                scan_edges(graph, swap_parent_id=swap_id, transfer_type=TransferType.SWAP)
+            )
+            self.assertEqual(edge_keys(graph.get_subgraph_by_swap_id(swap_id).edges(keys=True)), scan_edges(graph, swap_parent_id=swap_id))
+            for router in (False, True):
+                subgraph = graph.create_subgraph_for_swap(build_swap(swap_id, router))
+                expected = scan_edges(graph, **{'parent_router_swap_id' if router else 'swap_parent_id': swap_id})
+                if not expected:
+                    self.assertIsNone(subgraph)
+                else:
+                    self.assertEqual(edge_keys(subgraph.edges(keys=True)), expected)
+        for transfer_type in TransferType:
+            self.assertEqual(edge_keys(graph.get_edges(transfer_type=transfer_type)), scan_edges(graph, transfer_type=transfer_type))
+        for index in range(12):
+            address = f"account{index}"
+            self.assertEqual(graph.get_nodes_by_address(address), [v for v in graph.get_nodes() if v.address == address])
+
+    def test_indexes_follow_graph_changes(self):
+        for graph_class in (TransactionGraph, CompactTransactionGraph):
+            rng = random.Random(11)
+            graph = graph_class()
+            vertices = [AccountVertex(f"account{rng.randrange(12)}", version, "sig") for version in range(30)]
+            for _ in range(200):
+                source, target = rng.sample(vertices, 2)
+                graph.add_edge(source, target, TransferProperties(
+                    transfer_type=rng.choice([TransferType.TRANSFER, TransferType.SWAP, TransferType.FEE]),
+                    program_address="program",
+                    amount_source=1,
+                    amount_destination=1,
+                    swap_parent_id=rng.choice([None, 1, 2, 3]),
+                    parent_router_swap_id=rng.choice([None, 1, 2]),
+                # Reused keys update an existing edge and its index entries
+                ), key=rng.choice([None, 10, 20, 30]))
+            self.check_indexes(graph)
+
+            graph.remove_nodes(rng.sample(vertices, 8))
+            self.check_indexes(graph)
+
+            merged = graph_class()
+            merged.add_graph(graph)
+            self.check_indexes(merged)
+
+if __name__ == '__main__':
+    unittest.main()
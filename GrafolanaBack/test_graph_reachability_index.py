@@ -0,0 +1,62 @@
+import random
+import unittest
+
+import networkx as nx
+
+from GrafolanaBack.domain.transaction.models.account import AccountVertex
+from GrafolanaBack.domain.transaction.models.graph import TransactionGraph, TransferProperties, TransferType
+
+def vertex(index: int) -> AccountVertex:
+    return AccountVertex(address=f"account{index}", version=0, transaction_signature="sig")
+
+def transfer() -> TransferProperties:
+    return TransferProperties(transfer_type=TransferType.TRANSFER, program_address="program", amount_source=1, amount_destination=1)
+
+class Test_Graph_Reachability_Index(unittest.TestCase):
+    def assert_same_reachability(self, graph: TransactionGraph, vertices):
+        for source in vertices:
+            for target in vertices:
+                self.assertEqual(graph.has_path(source, target), nx.has_path(graph.graph, source, target), f"{source} -> {target}")
+
+    def test_random_dags_match_networkx(self):
+        rng = random.Random(7)
+        for _ in range(20):
+            graph = TransactionGraph()
+            vertices = [vertex(i) for i in range(25)]
+            for v in vertices:
+                graph.add_node(v)
+            # Edges in random order, only those keeping the graph acyclic, like the graph builder
+            hidden_order = vertices[:]
+            rng.shuffle(hidden_order)
+            for _ in range(60):
+                a, b = rng.sample(range(len(hidden_order)), 2)
+                graph.add_edge(hidden_order[min(a, b)], hidden_order[max(a, b)], transfer())
+            self.assertIsNotNone(graph._order)
+            for u, v, _, _ in graph.get_edges():
+                self.assertLess(graph._order[u], graph._order[v])
+            self.assert_same_reachability(graph, vertices)
+
+    def test_cycle_falls_back_to_networkx(self):
+        graph = TransactionGraph()
+        a, b, c = vertex(1), vertex(2), vertex(3)
+        graph.add_edge(a, b, transfer())
+        graph.add_edge(b, c, transfer())
+        graph.add_edge(c, a, transfer())
+        self.assertIsNone(graph._order)
+        self.assert_same_reachability(graph, [a, b, c])
+
+        # Removing a vertex of the cycle makes the index usable again
+        graph.remove_nodes([c])
+        self.assertTrue(graph.has_path(a, b))
+        self.assertFalse(graph.has_path(b, a))
+        self.assertIsNotNone(graph._order)
+
+    def test_nodes_added_directly_rebuild_the_index(self):
+        graph = TransactionGraph()
+        a, b = vertex(1), vertex(2)
+        graph.graph.add_edge(b, a)
+        self.assertTrue(graph.has_path(b, a))
+        self.assertFalse(graph.has_path(a, b))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import json
+import unittest
+
+from GrafolanaBack.domain.performance.graph_payload_benchmark import build_graph_data, run_benchmark
+from GrafolanaBack.domain.performance.parse_memory_benchmark import build_account_transactions
+from GrafolanaBack.domain.transaction.services.graph_service import GraphService
+from GrafolanaBack.domain.transaction.services.transaction_parser_service import TransactionParserService
+from GrafolanaBack.domain.transaction.utils.graph_templates import GRAPH_PAYLOAD_TEMPLATES, compress_graph_data, expand_graph_data
+
+def sorted_items(items):
+    return sorted(json.dumps(item, sort_keys=True) for item in items)
+
+class Test_Graph_Templates(unittest.TestCase):
+    def assertExpandsTo(self, compressed, graph_data):
+        expanded = expand_graph_data(compressed)
+        self.assertEqual(expanded["transactions"], graph_data["transactions"])
+        self.assertEqual(sorted_items(expanded["nodes"]), sorted_items(graph_data["nodes"]))
+        self.assertEqual(sorted_items(expanded["links"]), sorted_items(graph_data["links"]))
+
+    def test_same_shape_transactions_share_a_template(self):
+        graph_data = build_graph_data(transactions=8, transfers=3)
+        compressed = compress_graph_data(graph_data)
+
+        self.assertEqual(compressed["graph_payload"], GRAPH_PAYLOAD_TEMPLATES)
+        self.assertEqual(len(compressed["templates"]), 1)
+        self.assertEqual(set(compressed["templated_transactions"]), set(graph_data["transactions"]))
+        self.assertEqual(compressed["nodes"], [])
+        self.assertEqual(compressed["links"], [])
+        self.assertExpandsTo(compressed, graph_data)
+
+    def test_unique_shapes_are_sent_in_full(self):
+        parser = TransactionParserService()
+        graph_data = GraphService._get_empty_graph_data()
+        for transfers in (2, 2, 3):
+            for signature, encoded in build_account_transactions(transactions=1, transfers=transfers).items():
+                GraphService.set_graph_data(parser.parse_transaction_call_back(signature, encoded), graph_data)
+        compressed = compress_graph_data(graph_data)
+
+        self.assertEqual(len(compressed["templates"]), 1)
+        self.assertEqual(len(compressed["templated_transactions"]), 2)
+        full_transactions = {node["account_vertex"]["transaction_signature"] for node in compressed["nodes"]}
+        self.assertEqual(len(full_transactions), 1)
+        self.assertNotIn(full_transactions.pop(), compressed["templated_transactions"])
+        self.assertExpandsTo(compressed, graph_data)
+
+    def test_benchmark_payload_is_smaller(self):
+        results = run_benchmark(transactions=100)
+        self.assertLess(results["current"]["bytes"] * 5, results["legacy"]["bytes"])
+
+if __name__ == '__main__':
+    unittest.main()
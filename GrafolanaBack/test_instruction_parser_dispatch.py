@@ -0,0 +1,81 @@
+import unittest
+
+from GrafolanaBack.domain.transaction.config.constants import COMPUTE_BUDGET_PROGRAM
+from GrafolanaBack.domain.transaction.parsers.instruction_parsers import (
+    ComputeBudgetSetComputeUnitPriceParser,
+    InstructionParser,
+    StakeAuthorizeParser,
+    SystemTransferParser,
+    TokenTransferCheckedParser,
+)
+from GrafolanaBack.domain.transaction.services.instruction_parser_service import InstructionParserService
+from GrafolanaBack.domain.transaction.utils.instruction_utils import Parsed_Instruction
+
+def build_instruction(program_name=None, program_address="11111111111111111111111111111111", parsed=None, data=None):
+    return Parsed_Instruction(
+        stackHeight=0,
+        program_name=program_name,
+        program_address=program_address,
+        accounts=[],
+        parsed=parsed,
+        data=data,
+        inner_instructions=[],
+    )
+
+class MemoParser(InstructionParser):
+    """Predicate-only parser, tried on every instruction"""
+    def can_parse(self, instruction):
+        return instruction.program_name == "spl-memo"
+
+    def parse(self, instruction, context, swap_parent_id=None, parent_router_swap_id=None):
+        return True
+
+class Test_Instruction_Parser_Dispatch(unittest.TestCase):
+    def setUp(self):
+        self.service = InstructionParserService()
+
+    def candidate_types(self, instruction):
+        return [type(parser) for parser in self.service.get_candidate_parsers(instruction)]
+
+    def test_instructions_reach_their_parser_only(self):
+        transfer = build_instruction("system", parsed={"type": "transfer", "info": {}})
+        self.assertEqual(self.candidate_types(transfer), [SystemTransferParser])
+
+        transfer_checked = build_instruction("spl-token", parsed={"type": "transferChecked", "info": {}})
+        self.assertEqual(self.candidate_types(transfer_checked), [TokenTransferCheckedParser])
+
+        # Unparsed instructions are dispatched on the program address
+        compute_budget = build_instruction(program_address=COMPUTE_BUDGET_PROGRAM, data="3")
+        self.assertEqual(self.candidate_types(compute_budget), [ComputeBudgetSetComputeUnitPriceParser])
+
+        self.assertEqual(self.candidate_types(build_instruction("spl-memo", parsed="hello")), [])
+
+    def test_indexed_parsers_still_check_their_predicate(self):
+        authorize = build_instruction("stake", parsed={"type": "authorize", "info": {"authorityType": "Staker"}})
+        self.assertEqual(self.candidate_types(authorize), [StakeAuthorizeParser])
+        self.assertFalse(self.service.parse_transfer(authorize, context=None))
+
+    def test_every_dispatch_key_reaches_its_parser(self):
+        for parser in self.service.transfer_parsers:
+            for program, parsed_type in parser.dispatch_keys:
+                parsed = {"type": parsed_type} if parsed_type is not None else None
+                instruction = build_instruction(program if parsed is not None else None, program, parsed)
+                self.assertIn(parser, self.service.get_candidate_parsers(instruction))
+
+    def test_registered_parsers(self):
+        memo_parser = MemoParser()
+        self.service.register_parser(memo_parser)
+        memo = build_instruction("spl-memo", parsed="hello")
+        self.assertEqual(self.service.get_candidate_parsers(memo), [memo_parser])
+        self.assertTrue(self.service.parse_transfer(memo, context=None))
+
+        # Predicate-only parsers come after the indexed ones
+        transfer = build_instruction("system", parsed={"type": "transfer", "info": {}})
+        self.assertEqual(self.candidate_types(transfer), [SystemTransferParser, MemoParser])
+
+        keyed_parser = MemoParser()
+        self.service.register_parser(keyed_parser, dispatch_keys=(("spl-memo", None),))
+        self.assertEqual(self.service.get_candidate_parsers(memo), [keyed_parser, memo_parser])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from GrafolanaBack.domain.performance.isomorphism_benchmark import build_graphs, group_isomorphic_graphs_legacy, run_benchmark
+from GrafolanaBack.domain.performance.parse_memory_benchmark import build_account_transactions
+from GrafolanaBack.domain.transaction.models.graphspace import Graphspace
+from GrafolanaBack.domain.transaction.services.graph_service import GraphService
+from GrafolanaBack.domain.transaction.services.transaction_parser_service import TransactionParserService
+
+class Test_Isomorphic_Grouping(unittest.TestCase):
+    def test_matches_pairwise_grouping(self):
+        for seed in range(5):
+            graphs = build_graphs(transactions=150, shapes=8, seed=seed)
+            self.assertEqual(GraphService.group_isomorphic_graphs(graphs), group_isomorphic_graphs_legacy(graphs))
+
+    def test_transactions_of_same_shape_share_a_group(self):
+        parser_service = TransactionParserService()
+        contexts = {
+            signature: parser_service.parse_transaction_call_back(signature, encoded)
+            for transfers in (2, 2, 3)
+            for signature, encoded in build_account_transactions(transactions=1, transfers=transfers).items()
+        }
+        GraphService.analyse_isomorphic_transactions(Graphspace(contexts))
+        groups = [context.isomorphic_group for context in contexts.values()]
+        self.assertEqual(groups, [1, 1, None])
+
+    def test_benchmark_is_faster(self):
+        results = run_benchmark(transactions=300)
+        self.assertEqual(results["current"]["grouped"], results["legacy"]["grouped"])
+        self.assertLess(results["current"]["seconds"], results["legacy"]["seconds"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import patch
+
+from GrafolanaBack.domain.caching.negative_cache import (
+    INVALID,
+    NOT_FINALIZED,
+    NOT_FOUND,
+    TRANSACTION_NAMESPACE,
+    NegativeCache,
+    negative_cache,
+)
+from GrafolanaBack.domain.transaction.services.transaction_service import TransactionService
+
+SIGNATURE = "5VERv8NMvzbJMEkV8xnrLkEaWRtSz9CosKDYjCJjBRnbJLgp8uirBgmQpjKhoR4tjF3ZpRzrFmBV6UjKdiSZkQUW"
+
+class Test_Negative_Cache(unittest.TestCase):
+    def test_ttl_depends_on_reason(self):
+        now = [1000.0]
+        cache = NegativeCache(ttls={NOT_FINALIZED: 1, NOT_FOUND: 60}, clock=lambda: now[0])
+        cache.record(TRANSACTION_NAMESPACE, "recent", NOT_FINALIZED)
+        cache.record(TRANSACTION_NAMESPACE, "missing", NOT_FOUND)
+
+        to_lookup, skipped = cache.filter(TRANSACTION_NAMESPACE, ["recent", "missing", "other"])
+        self.assertEqual(to_lookup, ["other"])
+        self.assertEqual(skipped, {"recent": NOT_FINALIZED, "missing": NOT_FOUND})
+
+        now[0] += 1.1
+        self.assertIsNone(cache.get(TRANSACTION_NAMESPACE, "recent"))
+        self.assertEqual(cache.get(TRANSACTION_NAMESPACE, "missing").reason, NOT_FOUND)
+
+    def test_eviction_and_stats(self):
+        cache = NegativeCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.record(TRANSACTION_NAMESPACE, key, NOT_FOUND)
+        cache.get(TRANSACTION_NAMESPACE, "a")
+        cache.get(TRANSACTION_NAMESPACE, "c")
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["namespaces"][TRANSACTION_NAMESPACE]["entries"], {NOT_FOUND: 2})
+        self.assertEqual(stats["namespaces"][TRANSACTION_NAMESPACE]["hits"], 1)
+        self.assertEqual(stats["namespaces"][TRANSACTION_NAMESPACE]["misses"], 1)
+        self.assertEqual(stats["namespaces"][TRANSACTION_NAMESPACE]["recorded"], {NOT_FOUND: 3})
+
+    def test_transaction_lookups_skip_bad_signatures(self):
+        negative_cache.clear()
+        service = TransactionService()
+        cached_signature = SIGNATURE[:-1] + "V"
+        negative_cache.record(TRANSACTION_NAMESPACE, cached_signature, NOT_FOUND)
+
+        lookup = service._filter_lookup_signatures(["not a signature", cached_signature, SIGNATURE, SIGNATURE])
+        self.assertEqual(lookup, [SIGNATURE])
+        self.assertEqual(negative_cache.get(TRANSACTION_NAMESPACE, "not a signature").reason, INVALID)
+
+        # Bad input is answered without any database or RPC lookup
+        self.assertEqual(service.get_transactions(["not a signature", cached_signature]), {
+            "not a signature": None,
+            cached_signature: None,
+        })
+        negative_cache.clear()
+
+    def test_missing_signatures_are_classified_in_the_background(self):
+        negative_cache.clear()
+        service = TransactionService()
+        missing = SIGNATURE[:-1] + "W"
+
+        with patch.object(TransactionService, '_classify_missing_signatures', return_value={missing: NOT_FOUND}), \
+             patch('GrafolanaBack.domain.transaction.services.transaction_service.enqueue_failed_lookups') as enqueue:
+            classification = service._record_failed_lookups({missing: None})
+            classification.result()
+
+        self.assertEqual(negative_cache.get(TRANSACTION_NAMESPACE, missing).reason, NOT_FOUND)
+        enqueue.assert_called_once_with({})
+        negative_cache.clear()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import json
+import os
+import unittest
+
+from solders.signature import Signature
+
+from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository
+from GrafolanaBack.domain.transaction.services import parser_process_pool
+from GrafolanaBack.domain.transaction.services.parser_process_pool import ParserProcessPool
+from GrafolanaBack.domain.transaction.services.transaction_parser_service import TransactionParserService
+from GrafolanaBack.testing import build_transfer_transaction_json, SQLiteTestCase, summarize
+
+class Test_Parser_Process_Pool(SQLiteTestCase):
+    def test_process_pool_matches_thread_parsing(self):
+        signatures = [str(Signature.new_unique()) for _ in range(4)]
+        TransactionRepository.save_transactions({
+            sig: build_transfer_transaction_json(1000 * (i + 1)) for i, sig in enumerate(signatures)
+        })
+        parser_service = TransactionParserService()
+        transaction_service = parser_service.transaction_service
+
+        threaded = transaction_service.get_transactions(signatures, parser_service.parse_transaction_call_back)
+        parser_pool = ParserProcessPool(workers=2)
+        try:
+            parsed = transaction_service.get_transactions(signatures, parser_pool=parser_pool)
+        finally:
+            parser_pool.shutdown()
+
+        self.assertEqual(set(parsed), set(signatures))
+        for sig in signatures:
+            self.assertIsNotNone(parsed[sig])
+            self.assertEqual(summarize(parsed[sig]), summarize(threaded[sig]))
+            # The instruction tree stays in the worker process
+            self.assertEqual(parsed[sig].instructions, [])
+
+    def test_workers_parse_without_transaction_service(self):
+        parser_process_pool._init_worker()
+        self.assertIsNone(parser_process_pool._worker_parser.transaction_service)
+        self.assertIsNone(parser_process_pool._worker_parser.parser_pool)
+
+    def test_dead_workers_fall_back_to_in_process_parsing(self):
+        signature = str(Signature.new_unique())
+        raw_transaction = json.dumps(build_transfer_transaction_json(1000)).encode("utf-8")
+        expected = summarize(TransactionParserService().parse_raw_transaction_call_back(signature, raw_transaction))
+
+        parser_pool = ParserProcessPool(workers=1)
+        try:
+            # The only worker exits before parsing the queued transaction
+            parser_pool._get_executor().submit(os._exit, 1)
+            future = parser_pool.submit(signature, raw_transaction, compressed=False)
+            self.assertEqual(summarize(parser_pool.get_result(future, signature, raw_transaction, compressed=False)), expected)
+
+            # Next submissions go to a fresh pool
+            future = parser_pool.submit(signature, raw_transaction, compressed=False)
+            self.assertEqual(summarize(parser_pool.load_result(future.result(timeout=60))), expected)
+        finally:
+            parser_pool.shutdown()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+
+from GrafolanaBack.domain.performance import parser_profiler
+from GrafolanaBack.domain.performance.parse_memory_benchmark import build_account_transactions, build_wallet_transaction_json
+from GrafolanaBack.domain.performance.parser_profiler import ParserProfile, get_profile_totals, merge_profiles, should_profile
+from GrafolanaBack.domain.transaction.services.transaction_parser_service import TransactionParserService
+from GrafolanaBack.testing import summarize
+
+class Test_Parser_Profiler(unittest.TestCase):
+    def test_profile_counts_parser_hot_paths(self):
+        parser_service = TransactionParserService()
+        signature, encoded = next(iter(build_account_transactions(transactions=1, transfers=4).items()))
+        profiled = parser_service.parse_transaction_call_back(signature, encoded, profile=True)
+        unprofiled = parser_service.parse_transaction_call_back(signature, encoded)
+
+        self.assertIsNone(unprofiled.profile)
+        self.assertEqual(summarize(profiled), summarize(unprofiled))
+        counters = profiled.profile.to_dict()
+        self.assertEqual(set(counters["transaction"]), {"decode", "accounts", "instructions", "fee_transfers", "swap_resolution", "structure_fingerprint"})
+        # 4 direct transfers and 4 inner ones
+        self.assertEqual(counters["parser"]["SystemTransferParser"]["calls"], 8)
+        self.assertIn("unmatched", counters["swap"])
+
+    def test_raw_callback_profile(self):
+        wallet = str(Pubkey.new_unique())
+        raw = json.dumps(build_wallet_transaction_json(wallet, [str(Pubkey.new_unique())], 1)).encode("utf-8")
+        context = TransactionParserService().parse_raw_transaction_call_back(str(Signature.new_unique()), raw, profile=True)
+        self.assertEqual(context.profile.to_dict()["transaction"]["decode"]["calls"], 1)
+
+    def test_merge_and_report(self):
+        first, second = ParserProfile(), ParserProfile()
+        first.record("parser", "SystemTransferParser", 0.002)
+        second.record("parser", "SystemTransferParser", 0.001)
+        second.record("swap", "unmatched", 0.003)
+        merged = merge_profiles([first, None, second])
+        self.assertEqual(merged.to_dict(), {
+            "parser": {"SystemTransferParser": {"calls": 2, "total_ms": 3.0}},
+            "swap": {"unmatched": {"calls": 1, "total_ms": 3.0}},
+        })
+
+        calls = get_profile_totals().get("swap", {}).get("unmatched", {}).get("calls", 0)
+        parser_profiler.report_profile(merged, 2)
+        self.assertEqual(get_profile_totals()["swap"]["unmatched"]["calls"], calls + 1)
+
+    def test_profile_added_to_graph_data_when_requested(self):
+        parser_service = TransactionParserService()
+        contexts = [
+            parser_service.parse_transaction_call_back(signature, encoded, profile=True)
+            for signature, encoded in build_account_transactions(transactions=2, transfers=2).items()
+        ]
+        sampled, requested = {}, {}
+        parser_service._report_profile(sampled, contexts, requested=False)
+        parser_service._report_profile(requested, contexts, requested=True)
+        self.assertNotIn("profile", sampled)
+        self.assertEqual(requested["profile"]["parser"]["SystemTransferParser"]["calls"], 8)
+
+    def test_sampling(self):
+        self.assertTrue(should_profile(True))
+        with patch.object(parser_profiler, 'PARSER_PROFILING_SAMPLE_RATE', 0):
+            self.assertFalse(should_profile())
+        with patch.object(parser_profiler, 'PARSER_PROFILING_SAMPLE_RATE', 1):
+            self.assertTrue(should_profile())
+
+if __name__ == '__main__':
+    unittest.main()
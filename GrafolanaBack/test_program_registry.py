@@ -0,0 +1,44 @@
+import copy
+import pickle
+import unittest
+
+from GrafolanaBack.domain.metadata.program.program_registry import PROGRAM_REGISTRY, ProgramKind
+from GrafolanaBack.domain.metadata.program.programs import _get_program_metadatas
+from GrafolanaBack.domain.metadata.program.system_programs import SYSTEM_PROGRAMS
+from GrafolanaBack.domain.performance.program_registry_benchmark import run_benchmark
+from GrafolanaBack.domain.transaction.config.constants import SYSTEM_PROGRAM
+from GrafolanaBack.domain.transaction.config.dex_programs.dex_program_struct import LABEL
+from GrafolanaBack.domain.transaction.config.dex_programs.swap_programs import SWAP_PROGRAMS
+
+class Test_Program_Registry(unittest.TestCase):
+    def test_registry_classifies_programs(self):
+        self.assertEqual(PROGRAM_REGISTRY.program_addresses, set(SYSTEM_PROGRAMS) | set(SWAP_PROGRAMS.get_map()))
+        self.assertEqual(PROGRAM_REGISTRY.get_kind(SYSTEM_PROGRAM), ProgramKind.SYSTEM)
+        for address, swap_program in SWAP_PROGRAMS.get_map().items():
+            self.assertEqual(PROGRAM_REGISTRY.get_kind(address), ProgramKind.ROUTER if swap_program.router else ProgramKind.SWAP)
+            self.assertIs(PROGRAM_REGISTRY.get_swap_matcher(address), SWAP_PROGRAMS.get_matcher(address))
+            self.assertEqual(PROGRAM_REGISTRY.get_metadata(address)[LABEL], swap_program.label)
+        self.assertFalse(PROGRAM_REGISTRY.is_program("9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"))
+
+    def test_registry_is_immutable(self):
+        with self.assertRaises(TypeError):
+            PROGRAM_REGISTRY.metadata[SYSTEM_PROGRAM] = {}
+        PROGRAM_REGISTRY.get_metadata(SYSTEM_PROGRAM)[LABEL] = "changed"
+        self.assertEqual(PROGRAM_REGISTRY.metadata[SYSTEM_PROGRAM][LABEL], SYSTEM_PROGRAMS[SYSTEM_PROGRAM][LABEL])
+        # Building the metadata no longer adds the swap programs to SYSTEM_PROGRAMS
+        self.assertFalse(set(SWAP_PROGRAMS.get_map()) & set(SYSTEM_PROGRAMS))
+        self.assertIs(pickle.loads(pickle.dumps(PROGRAM_REGISTRY)), PROGRAM_REGISTRY)
+        self.assertIs(copy.deepcopy(PROGRAM_REGISTRY), PROGRAM_REGISTRY)
+
+    def test_program_metadatas_are_json_dicts(self):
+        metadatas = _get_program_metadatas((SYSTEM_PROGRAM, "unknown"))
+        self.assertEqual(metadatas, [SYSTEM_PROGRAMS[SYSTEM_PROGRAM]])
+        self.assertIs(type(metadatas[0]), dict)
+
+    def test_benchmark_counts_same_programs(self):
+        results = run_benchmark(transactions=50, accounts=20)
+        self.assertEqual(results["current"]["programs"], results["legacy"]["programs"])
+        self.assertLess(results["current"]["seconds"], results["legacy"]["seconds"])
+
+if __name__ == '__main__':
+    unittest.main()
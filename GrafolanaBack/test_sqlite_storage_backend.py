@@ -0,0 +1,40 @@
+import unittest
+
+from GrafolanaBack.domain.infrastructure.db import session as db_session
+from GrafolanaBack.domain.prices.repository import SOLPriceRepository
+from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository
+from GrafolanaBack.testing import FEE_PAYER, build_transaction_json, SQLiteTestCase
+
+class Test_SQLite_Storage_Backend(SQLiteTestCase):
+    def test_wal_mode(self):
+        with db_session.get_engine().connect() as connection:
+            journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+        self.assertEqual(journal_mode, 'wal')
+
+    def test_transactions_bulk_upsert_and_queries(self):
+        tx_json = build_transaction_json()
+        failed_tx_json = build_transaction_json(err="AccountInUse")
+
+        self.assertTrue(TransactionRepository.save_transactions({"sig_a": tx_json, "sig_b": tx_json}))
+        # Second upsert overwrites the existing row
+        self.assertTrue(TransactionRepository.save_transactions({"sig_b": failed_tx_json}))
+
+        self.assertEqual(TransactionRepository.get_transaction("sig_b"), failed_tx_json)
+        self.assertEqual(set(TransactionRepository.get_transactions_by_slot(123456)), {"sig_a", "sig_b"})
+        self.assertEqual(
+            set(TransactionRepository.get_signatures_by_fee_payer(FEE_PAYER, start_time=1700000000)),
+            {"sig_a", "sig_b"}
+        )
+        streamed = dict(TransactionRepository.iter_transactions_by_signatures(["sig_a", "sig_b", "missing"], chunk_size=1))
+        self.assertEqual(set(streamed), {"sig_a", "sig_b"})
+
+    def test_prices_bulk_upsert_keeps_existing(self):
+        repository = SOLPriceRepository()
+        repository.bulk_set_prices([(60000, 1.5), (120000, 2.0)])
+        repository.bulk_set_prices([(60000, 9.0)])
+
+        self.assertEqual(repository.get_price_at_timestamp(60000).price, 1.5)
+        self.assertEqual(repository.get_latest_price().timestamp, 120000)
+
+if __name__ == '__main__':
+    unittest.main()
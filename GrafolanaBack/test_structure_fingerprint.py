@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import patch
+
+from GrafolanaBack.domain.performance.parse_memory_benchmark import build_account_transactions
+from GrafolanaBack.domain.transaction.models.graphspace import Graphspace
+from GrafolanaBack.domain.transaction.repositories.structure_repository import TransactionStructureRepository
+from GrafolanaBack.domain.transaction.services.graph_service import STRUCTURE_FINGERPRINT_VERSION, GraphService
+from GrafolanaBack.domain.transaction.services.parser_process_pool import ParserProcessPool, parse_raw_transaction
+from GrafolanaBack.domain.transaction.services.transaction_parser_service import TransactionParserService
+from GrafolanaBack.testing import SQLiteTestCase
+
+class Test_Structure_Fingerprint(SQLiteTestCase):
+    def parse(self, parser_service: TransactionParserService, *transfers: int):
+        return {
+            signature: parser_service.parse_transaction_call_back(signature, encoded)
+            for count in transfers
+            for signature, encoded in build_account_transactions(transactions=1, transfers=count).items()
+        }
+
+    def test_fingerprint_follows_structure(self):
+        contexts = self.parse(TransactionParserService(), 2, 3, 2)
+        GraphService.analyse_isomorphic_transactions(Graphspace(contexts))
+        first, other, second = contexts.values()
+
+        self.assertTrue(first.structure_fingerprint.startswith(f"{STRUCTURE_FINGERPRINT_VERSION}:"))
+        self.assertEqual(first.structure_fingerprint, second.structure_fingerprint)
+        self.assertNotEqual(first.structure_fingerprint, other.structure_fingerprint)
+        self.assertEqual([context.isomorphic_group for context in contexts.values()], [1, None, 1])
+
+    def test_fingerprints_are_computed_at_parse_time(self):
+        contexts = self.parse(TransactionParserService(parse_only=True), 2)
+        context = next(iter(contexts.values()))
+
+        self.assertEqual(context.structure_fingerprint, GraphService.transaction_structure_fingerprint(context.graph))
+
+    def test_parser_processes_return_the_fingerprints(self):
+        signature, encoded = next(iter(build_account_transactions(transactions=1, transfers=2).items()))
+        raw_transaction = encoded.to_json().encode("utf-8")
+
+        context = ParserProcessPool.load_result(parse_raw_transaction(signature, raw_transaction, compressed=False))
+
+        self.assertTrue(context.structure_fingerprint.startswith(f"{STRUCTURE_FINGERPRINT_VERSION}:"))
+
+    def test_only_new_fingerprints_are_stored(self):
+        parser_service = TransactionParserService()
+        contexts = self.parse(parser_service, 2, 2, 3)
+        # The transactions are not stored: fingerprints don't depend on the transaction rows
+        parser_service.transaction_service.save_structure_fingerprints(contexts).result()
+
+        first, second, other = contexts.values()
+        self.assertEqual(
+            set(TransactionStructureRepository.get_signatures_by_structure(first.structure_fingerprint)),
+            {first.transaction_signature, second.transaction_signature}
+        )
+        self.assertEqual(TransactionStructureRepository.get_signatures_by_structure(other.structure_fingerprint), [other.transaction_signature])
+        self.assertEqual(len(TransactionStructureRepository.get_signatures_by_structure(first.structure_fingerprint, limit=1)), 1)
+
+        # In a later request, the stored fingerprints are not written again
+        with patch.object(TransactionStructureRepository, 'save_structure_fingerprints', return_value=True) as save:
+            parser_service.transaction_service.save_structure_fingerprints(contexts).result()
+        save.assert_called_once_with({})
+
+    def test_outdated_fingerprints_are_replaced(self):
+        parser_service = TransactionParserService()
+        contexts = self.parse(parser_service, 2)
+        signature, context = next(iter(contexts.items()))
+        TransactionStructureRepository.save_structure_fingerprints({signature: ("wl3r0-nx3.3:outdated", context.slot)})
+
+        parser_service.transaction_service.save_structure_fingerprints(contexts).result()
+
+        self.assertEqual(TransactionStructureRepository.get_structure_fingerprints([signature]), {signature: context.structure_fingerprint})
+
+if __name__ == '__main__':
+    unittest.main()
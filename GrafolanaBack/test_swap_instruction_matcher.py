@@ -0,0 +1,67 @@
+import math
+import random
+import unittest
+
+from GrafolanaBack.domain.transaction.config.dex_programs.swap_programs import SWAP_PROGRAMS
+from GrafolanaBack.domain.transaction.utils.instruction_utils import decode_discriminator, get_discriminator
+
+def linear_scan(program, instruction_bytes, accounts_length):
+    """The matching SwapParserService.parse_swap did before the compiled matcher"""
+    for param in program.instruction_parse_param:
+        if param.instruction_name is not None:
+            discriminator = get_discriminator(param.instruction_name)
+        elif param.discriminator is not None:
+            discriminator = param.discriminator
+        else:
+            discriminator = []
+        if param.accounts_length is not None and accounts_length != param.accounts_length:
+            continue
+        if param.terminator is not None and instruction_bytes.hex()[-1] != param.terminator:
+            continue
+        if param.byte_value is not None:
+            byte, value = param.byte_value
+            if len(instruction_bytes) < byte / 2:
+                continue
+            if instruction_bytes.hex()[byte] != value:
+                continue
+        if decode_discriminator(instruction_bytes, math.ceil(len(discriminator) / 2)) == discriminator:
+            return param
+    return None
+
+def build_instruction_data(param, rng):
+    """Instruction data carrying the param's discriminator, with random terminator and byte value nibbles"""
+    discriminator = get_discriminator(param.instruction_name) if param.instruction_name else param.discriminator
+    data = bytearray(bytes.fromhex(discriminator.lower()) + rng.randbytes(48))
+    if param.byte_value is not None and rng.random() < 0.5:
+        position, value = param.byte_value
+        hex_data = list(data.hex())
+        hex_data[position] = value
+        data = bytearray.fromhex("".join(hex_data))
+    return bytes(data)
+
+class Test_Swap_Instruction_Matcher(unittest.TestCase):
+    def test_matches_like_linear_scan(self):
+        rng = random.Random(42)
+        checked = 0
+        for program_address, program in SWAP_PROGRAMS.get_map().items():
+            matcher = SWAP_PROGRAMS.get_matcher(program_address)
+            for param in program.instruction_parse_param:
+                for _ in range(8):
+                    data = build_instruction_data(param, rng)
+                    accounts_length = param.accounts_length if param.accounts_length and rng.random() < 0.8 else rng.randint(1, 30)
+                    self.assertIs(
+                        matcher.match(data, accounts_length),
+                        linear_scan(program, data, accounts_length),
+                        f"{program.label} {data.hex()} {accounts_length}"
+                    )
+                    checked += 1
+            for _ in range(20):
+                data = rng.randbytes(rng.randint(1, 40))
+                self.assertIs(matcher.match(data, 10), linear_scan(program, data, 10))
+        self.assertGreater(checked, 1000)
+
+    def test_unknown_program_has_no_matcher(self):
+        self.assertIsNone(SWAP_PROGRAMS.get_matcher("11111111111111111111111111111111"))
+
+if __name__ == '__main__':
+    unittest.main()
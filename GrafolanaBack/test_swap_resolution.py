@@ -0,0 +1,39 @@
+import unittest
+
+from GrafolanaBack.domain.performance.swap_resolution_benchmark import (
+    ADDRESSES,
+    PROGRAM,
+    LegacySwapResolverService,
+    build_swap_context,
+    run_benchmark,
+    summarize_resolution,
+)
+from GrafolanaBack.domain.transaction.models.compact_graph import CompactTransactionGraph
+from GrafolanaBack.domain.transaction.models.graph import TransactionGraph
+from GrafolanaBack.domain.transaction.models.swap import TransferAccountAddresses
+from GrafolanaBack.domain.transaction.services.swap_resolver_service import SwapResolverService
+
+class Test_Swap_Resolution(unittest.TestCase):
+    def test_matches_legacy_resolution(self):
+        for graph_class in (TransactionGraph, CompactTransactionGraph):
+            resolved = 0
+            for seed in range(300):
+                expected, actual = build_swap_context(seed, graph_class), build_swap_context(seed, graph_class)
+                LegacySwapResolverService(expected.account_repository).resolve_swap_paths(expected)
+                SwapResolverService(actual.account_repository).resolve_swap_paths(actual)
+                self.assertEqual(summarize_resolution(actual), summarize_resolution(expected))
+                resolved += len(actual.swaps)
+            self.assertGreater(resolved, 0)
+
+    def test_swap_without_edges_is_dropped(self):
+        context = build_swap_context(0)
+        swap = context.add_swap(False, PROGRAM, "Program", "swap", TransferAccountAddresses(ADDRESSES[0], ADDRESSES[1]), (ADDRESSES[2],), None)
+        self.assertFalse(SwapResolverService(context.account_repository).resolve_swap(context, swap))
+
+    def test_benchmark_is_faster(self):
+        results = run_benchmark(transactions=200)
+        self.assertEqual(results["current"]["resolved_swaps"], results["legacy"]["resolved_swaps"])
+        self.assertLess(results["current"]["seconds"], results["legacy"]["seconds"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+import zlib
+import json
+from unittest.mock import patch
+
+from GrafolanaBack.domain.transaction.repositories import transaction_archive
+from GrafolanaBack.domain.transaction.repositories.transaction_archive import TransactionAccessTracker, TransactionArchive
+from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository
+from GrafolanaBack.domain.transaction.services.transaction_archive_service import archive_cold_transactions
+from GrafolanaBack.testing import build_transaction_json, SQLiteTestCase
+
+def compress(transaction_json):
+    return zlib.compress(json.dumps(transaction_json).encode('utf-8'))
+
+class Test_Transaction_Archive(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_append_and_get(self):
+        archive = TransactionArchive(self.tmp_dir.name)
+        archive.append([("sig_a", compress({"a": 1})), ("sig_b", compress({"b": 2}))])
+
+        self.assertEqual(archive.get("sig_a"), {"a": 1})
+        self.assertEqual(archive.get_many(["sig_b", "missing"]), {"sig_b": {"b": 2}})
+        self.assertIsNone(archive.get("missing"))
+        archive.close()
+
+    def test_segment_rollover_and_reopen(self):
+        archive = TransactionArchive(self.tmp_dir.name, segment_max_bytes=64)
+        archive.append((f"sig_{i}", compress({"i": i, "padding": "x" * 50})) for i in range(10))
+        self.assertGreater(archive.get_stats()["segments"], 1)
+        archive.close()
+
+        reopened = TransactionArchive(self.tmp_dir.name, segment_max_bytes=64)
+        self.assertEqual(reopened.get_stats()["indexed_transactions"], 10)
+        for i in range(10):
+            self.assertEqual(reopened.get(f"sig_{i}")["i"], i)
+        reopened.close()
+
+    def test_newest_record_wins(self):
+        archive = TransactionArchive(self.tmp_dir.name)
+        archive.append([("sig_a", compress({"version": 1}))])
+        archive.append([("sig_a", compress({"version": 2}))])
+
+        self.assertEqual(archive.get("sig_a"), {"version": 2})
+        archive.close()
+
+    def test_segments_written_by_another_process_are_read(self):
+        reader = TransactionArchive(self.tmp_dir.name, segment_max_bytes=64)
+        self.assertIsNone(reader.get("sig_0"))
+
+        writer = TransactionArchive(self.tmp_dir.name, segment_max_bytes=64)
+        writer.append((f"sig_{i}", compress({"i": i, "padding": "x" * 50})) for i in range(5))
+        writer.append([("sig_0", compress({"i": 10}))])
+
+        self.assertEqual(reader.get("sig_0"), {"i": 10})
+        self.assertEqual(reader.get("sig_4")["i"], 4)
+        self.assertEqual(reader.get_stats(), writer.get_stats())
+        writer.close()
+        reader.close()
+
+class Test_Transaction_Access_Tracker(unittest.TestCase):
+    def test_reads_are_flushed_by_the_reading_process(self):
+        flushed = []
+        flush_done = threading.Event()
+
+        def flush(signatures):
+            flushed.extend(signatures)
+            flush_done.set()
+            return len(signatures)
+
+        tracker = TransactionAccessTracker(flush, flush_interval_seconds=0.01)
+        tracker.record(["sig_a", "sig_b", "sig_a"])
+
+        self.assertTrue(flush_done.wait(timeout=5))
+        self.assertEqual(sorted(flushed), ["sig_a", "sig_b"])
+        self.assertEqual(tracker.flush(), 0)
+
+class Test_Transaction_Archive_Mover(SQLiteTestCase):
+    def test_cold_transactions_move_and_reads_fall_through(self):
+        archive = TransactionArchive(os.path.join(self.tmp_dir.name, 'archive'))
+        tx_json = build_transaction_json()
+        TransactionRepository.save_transactions({"cold_sig": tx_json, "hot_sig": tx_json})
+        # cold_sig was last read 60 days ago
+        TransactionRepository.touch_transactions(["cold_sig"], accessed_at=int(time.time()) - 60 * 86400)
+
+        with patch.object(transaction_archive, 'TRANSACTION_ARCHIVE_ENABLED', True), \
+             patch.object(transaction_archive, '_archive', archive):
+            result = archive_cold_transactions(max_age_days=30, max_bytes=0)
+            self.assertEqual(result["moved"], 1)
+            self.assertEqual(TransactionRepository.count_transactions(), 1)
+
+            self.assertEqual(TransactionRepository.get_transaction("cold_sig"), tx_json)
+            streamed = dict(TransactionRepository.iter_transactions_by_signatures(["cold_sig", "hot_sig", "missing"]))
+            self.assertEqual(set(streamed), {"cold_sig", "hot_sig"})
+
+            # The size policy moves the remaining transaction once the hot tier is over its limit
+            result = archive_cold_transactions(max_age_days=30, max_bytes=1)
+            self.assertEqual(result["moved"], 1)
+            self.assertEqual(result["hot_tier_bytes"], 0)
+            self.assertEqual(TransactionRepository.get_transaction("hot_sig"), tx_json)
+        archive.close()
+
+if __name__ == '__main__':
+    unittest.main()
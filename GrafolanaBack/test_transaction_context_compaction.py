@@ -0,0 +1,30 @@
+import unittest
+
+from GrafolanaBack.domain.performance.parse_memory_benchmark import build_account_transactions, run_benchmark
+from GrafolanaBack.domain.transaction.services.transaction_parser_service import TransactionParserService
+from GrafolanaBack.domain.transaction.utils.transaction_decoder import decode_encoded_transaction
+from GrafolanaBack.testing import summarize
+
+class Test_Transaction_Context_Compaction(unittest.TestCase):
+    def test_compaction_keeps_graph(self):
+        parser_service = TransactionParserService()
+        for signature, encoded in build_account_transactions(transactions=3, transfers=4).items():
+            transaction_input = decode_encoded_transaction(encoded.transaction, encoded.block_time, encoded.slot)
+            full = parser_service.parse_transaction_input(signature, transaction_input, compact=False)
+            compacted = parser_service.parse_transaction_call_back(signature, encoded)
+
+            self.assertEqual(len(full.instructions), 5)
+            self.assertEqual(compacted.instructions, [])
+            self.assertEqual(summarize(compacted), summarize(full))
+            self.assertEqual(compacted.account_repository.account_versions.keys(), full.account_repository.account_versions.keys())
+            # The released topological order is rebuilt on demand
+            for source in compacted.graph.get_nodes():
+                for target in compacted.graph.get_nodes():
+                    self.assertEqual(compacted.graph.has_path(source, target), full.graph.has_path(source, target))
+
+    def test_benchmark_shows_less_memory(self):
+        results = run_benchmark(transactions=20, transfers=5)
+        self.assertLess(results["current"]["retained_bytes"], results["legacy"]["retained_bytes"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import json
+import unittest
+
+from solders.signature import Signature
+from solders.transaction_status import EncodedConfirmedTransactionWithStatusMeta
+
+from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository
+from GrafolanaBack.domain.transaction.services.transaction_parser_service import TransactionParserService
+from GrafolanaBack.domain.transaction.utils.transaction_decoder import (
+    comparable_transaction_input,
+    decode_encoded_transaction,
+    decode_raw_transaction,
+)
+from GrafolanaBack.testing import RECEIVER, SENDER, SYSTEM_PROGRAM, build_transfer_transaction_json, SQLiteTestCase, summarize
+
+MEMO_PROGRAM = "MemoSq4gqABAXKb96qnH8TysNcWxMyWCqXgDLGmfcHr"
+TOKEN_PROGRAM = "TokenkegQfeZyiNwAJbNbGqPKTZmrqnbTGMsrEhYNxH"
+MINT = "EPjFWdd5AufqSSqeM2qy1mgCG5JrYgoQiCSNNBSR8yM4"
+
+def token_balance(amount: str) -> dict:
+    return {
+        "accountIndex": 1,
+        "mint": MINT,
+        "owner": SENDER,
+        "programId": TOKEN_PROGRAM,
+        "uiTokenAmount": {"amount": amount, "decimals": 6, "uiAmount": int(amount) / 10**6, "uiAmountString": str(int(amount) / 10**6)},
+    }
+
+def build_nested_transaction_json(err=None) -> dict:
+    """A transfer followed by an unparsed instruction calling nested inner instructions, with token balances"""
+    tx_json = build_transfer_transaction_json(1000)
+    tx_json["transaction"]["message"]["accountKeys"].append(
+        {"pubkey": MEMO_PROGRAM, "writable": False, "signer": False, "source": "transaction"}
+    )
+    tx_json["transaction"]["message"]["instructions"].append({
+        "programId": MEMO_PROGRAM,
+        "accounts": [SENDER],
+        "data": "3Bxs4",
+        "stackHeight": None,
+    })
+    memo_transfer = {"program": "system", "programId": SYSTEM_PROGRAM, "stackHeight": 3,
+                     "parsed": {"type": "transfer", "info": {"source": SENDER, "destination": RECEIVER, "lamports": 7}}}
+    tx_json["meta"].update(
+        err=err,
+        preBalances=tx_json["meta"]["preBalances"] + [1],
+        postBalances=tx_json["meta"]["postBalances"] + [1],
+        status={"Ok": None} if err is None else {"Err": err},
+        computeUnitsConsumed=1200,
+        preTokenBalances=[token_balance("100")],
+        postTokenBalances=[token_balance("90")],
+        innerInstructions=[{"index": 1, "instructions": [
+            {"programId": MEMO_PROGRAM, "accounts": [SENDER, RECEIVER], "data": "2z", "stackHeight": 2},
+            memo_transfer,
+            {"program": "spl-memo", "programId": MEMO_PROGRAM, "parsed": "hello", "stackHeight": 2},
+        ]}],
+    )
+    return tx_json
+
+def decode_both(tx_json: dict):
+    raw_transaction = json.dumps(tx_json).encode("utf-8")
+    encoded = EncodedConfirmedTransactionWithStatusMeta.from_json(raw_transaction.decode("utf-8"))
+    return decode_encoded_transaction(encoded.transaction, encoded.block_time, encoded.slot), decode_raw_transaction(raw_transaction)
+
+class Test_Transaction_Decoder(unittest.TestCase):
+    def test_raw_decoder_matches_solders(self):
+        expected, actual = decode_both(build_nested_transaction_json())
+
+        self.assertEqual(comparable_transaction_input(actual), comparable_transaction_input(expected))
+        self.assertEqual(actual.pre_token_balances[0].amount, "100")
+        self.assertEqual(actual.compute_units_consumed, 1200)
+        unparsed = actual.instructions[1]
+        self.assertEqual([inner.stackHeight for inner in unparsed.inner_instructions], [2, 2])
+        nested = unparsed.inner_instructions[0].inner_instructions[0]
+        self.assertIs(nested.parent_instruction, unparsed.inner_instructions[0])
+        self.assertEqual(nested.parsed["info"]["lamports"], 7)
+
+    def test_errors_match_solders(self):
+        for err in ({"InstructionError": [1, {"Custom": 6001}]}, {"InstructionError": [0, "InvalidArgument"]},
+                    {"InsufficientFundsForRent": {"account_index": 2}}, "AccountInUse"):
+            expected, actual = decode_both(build_nested_transaction_json(err))
+            self.assertEqual(actual.err, expected.err)
+        self.assertEqual(actual.err, '"AccountInUse"')
+
+class Test_Raw_Transaction_Parsing(SQLiteTestCase):
+    def test_raw_parsing_builds_same_context(self):
+        parser_service = TransactionParserService()
+        for tx_json in (build_transfer_transaction_json(1000), build_nested_transaction_json()):
+            signature = str(Signature.new_unique())
+            raw_transaction = json.dumps(tx_json).encode("utf-8")
+            expected = parser_service.parse_transaction_call_back(
+                signature, EncodedConfirmedTransactionWithStatusMeta.from_json(raw_transaction.decode("utf-8"))
+            )
+            actual = parser_service.parse_raw_transaction_call_back(signature, raw_transaction)
+
+            self.assertEqual(summarize(actual), summarize(expected))
+            self.assertEqual(actual.graph.get_nodes(), expected.graph.get_nodes())
+            self.assertEqual((actual.slot, actual.blocktime, actual.signer_wallets), (expected.slot, expected.blocktime, expected.signer_wallets))
+
+    def test_stored_transactions_use_raw_callback(self):
+        signatures = [str(Signature.new_unique()) for _ in range(3)]
+        TransactionRepository.save_transactions({sig: build_nested_transaction_json() for sig in signatures})
+        parser_service = TransactionParserService()
+        transaction_service = parser_service.transaction_service
+
+        expected = transaction_service.get_transactions(signatures, parser_service.parse_transaction_call_back)
+        actual = transaction_service.get_transactions(
+            signatures, parser_service.parse_transaction_call_back,
+            raw_result_callback=parser_service.parse_raw_transaction_call_back
+        )
+
+        for sig in signatures:
+            self.assertIsNotNone(actual[sig])
+            self.assertEqual(summarize(actual[sig]), summarize(expected[sig]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import gzip
+import json
+import os
+import unittest
+import zlib
+from unittest.mock import patch
+
+from GrafolanaBack.domain.transaction.repositories import transaction_archive
+from GrafolanaBack.domain.transaction.repositories.transaction_archive import TransactionArchive
+from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository
+from GrafolanaBack.domain.transaction.services.transaction_dump_service import export_transactions, import_transactions
+from GrafolanaBack.testing import FEE_PAYER, build_transaction_json, SQLiteTestCase
+
+class Test_Transaction_Dump(SQLiteTestCase):
+    def test_import_skips_duplicates_and_export_round_trips(self):
+        tx_json = build_transaction_json()
+        TransactionRepository.save_transactions({"stored_sig": tx_json})
+
+        jsonl_path = os.path.join(self.tmp_dir.name, 'dump.jsonl.gz')
+        with gzip.open(jsonl_path, 'wt', encoding='utf-8') as dump:
+            dump.write(json.dumps({"signature": "stored_sig", "transaction": tx_json}) + "\n")
+            dump.write(json.dumps({"signature": "new_sig", "transaction": tx_json}) + "\n")
+            dump.write(json.dumps({"signature": "new_sig", "transaction": tx_json}) + "\n")
+            dump.write("not json\n")
+
+        stats = import_transactions([jsonl_path], workers=2, batch_size=2)
+        self.assertEqual(stats, {"read": 4, "imported": 1, "duplicates": 2, "invalid": 1})
+        self.assertEqual(TransactionRepository.get_transaction("new_sig"), tx_json)
+        self.assertEqual(set(TransactionRepository.get_signatures_by_fee_payer(FEE_PAYER)), {"stored_sig", "new_sig"})
+
+        for file_name in ('export.seg', 'export.jsonl'):
+            export_path = os.path.join(self.tmp_dir.name, file_name)
+            self.assertEqual(export_transactions(export_path), 2)
+
+            TransactionRepository.delete_transactions(["stored_sig", "new_sig"])
+            stats = import_transactions([export_path], workers=0)
+            self.assertEqual(stats["imported"], 2)
+            self.assertEqual(TransactionRepository.get_transaction("stored_sig"), tx_json)
+
+class Test_Archived_Transaction_Dump(SQLiteTestCase):
+    def test_export_includes_archived_transactions(self):
+        tx_json = build_transaction_json()
+        later_json = dict(tx_json, slot=tx_json["slot"] + 100)
+        compress = lambda transaction_json: zlib.compress(json.dumps(transaction_json).encode('utf-8'))
+        TransactionRepository.save_transactions({"hot_sig": tx_json})
+
+        archive = TransactionArchive(os.path.join(self.tmp_dir.name, 'archive'), segment_max_bytes=64)
+        # hot_sig was read back into the database, archived_sig was archived twice in different segments
+        archive.append([("hot_sig", compress(tx_json)), ("archived_sig", compress(tx_json))])
+        archive.append([("archived_sig", compress(later_json))])
+
+        export_path = os.path.join(self.tmp_dir.name, 'export.jsonl')
+        with patch.object(transaction_archive, 'TRANSACTION_ARCHIVE_ENABLED', True), \
+             patch.object(transaction_archive, '_archive', archive):
+            self.assertEqual(export_transactions(export_path), 2)
+            with open(export_path, encoding='utf-8') as dump:
+                exported = {entry["signature"]: entry["transaction"] for entry in map(json.loads, dump)}
+            self.assertEqual(exported, {"hot_sig": tx_json, "archived_sig": later_json})
+
+            # The slot range applies to archived transactions too
+            self.assertEqual(export_transactions(export_path, end_slot=tx_json["slot"]), 1)
+            self.assertEqual(export_transactions(export_path, include_archive=False), 1)
+        archive.close()
+
+if __name__ == '__main__':
+    unittest.main()
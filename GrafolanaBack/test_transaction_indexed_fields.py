@@ -0,0 +1,45 @@
+import json
+import unittest
+import zlib
+
+from GrafolanaBack.domain.transaction.models.transaction import SolanaTransaction
+from GrafolanaBack.testing import FEE_PAYER, build_transaction_json
+
+class Test_Transaction_Indexed_Fields(unittest.TestCase):
+    def test_extract_fields_from_successful_transaction(self):
+        tx_json = build_transaction_json()
+        fields = SolanaTransaction.extract_indexed_fields(tx_json, json.dumps(tx_json).encode('utf-8'))
+
+        self.assertEqual(fields["slot"], 123456)
+        self.assertEqual(fields["block_time"], 1700000000)
+        self.assertEqual(fields["fee_payer"], FEE_PAYER)
+        self.assertFalse(fields["has_error"])
+        self.assertEqual(fields["size"], len(json.dumps(tx_json).encode('utf-8')))
+
+    def test_extract_fields_from_failed_transaction(self):
+        tx_json = build_transaction_json(err="AccountInUse")
+        fields = SolanaTransaction.extract_indexed_fields(tx_json, json.dumps(tx_json).encode('utf-8'))
+
+        self.assertTrue(fields["has_error"])
+
+    def test_extract_fields_from_partial_json(self):
+        fields = SolanaTransaction.extract_indexed_fields({"slot": 7}, b'{"slot": 7}')
+
+        self.assertEqual(fields["slot"], 7)
+        self.assertIsNone(fields["block_time"])
+        self.assertIsNone(fields["fee_payer"])
+        self.assertIsNone(fields["has_error"])
+
+    def test_build_row_sizes_the_stored_payload(self):
+        tx_json = build_transaction_json()
+        row = SolanaTransaction.build_row("sig", tx_json, 1700000000)
+
+        payload = zlib.decompress(row["transaction_json"])
+        self.assertEqual(json.loads(payload.decode('utf-8')), tx_json)
+        self.assertEqual(row["size"], len(payload))
+        self.assertEqual(row["fee_payer"], FEE_PAYER)
+        self.assertEqual(row["stored_at"], 1700000000)
+        self.assertEqual(row["last_accessed_at"], 1700000000)
+
+if __name__ == '__main__':
+    unittest.main()
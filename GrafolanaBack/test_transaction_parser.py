@@ -2,7 +2,7 @@ import base64
 import struct
 import sys
 import base58
-from no_cache_unit_test import NoCacheUnitTest
+from GrafolanaBack.no_cache_unit_test import NoCacheUnitTest
 from datetime import datetime
 from solana.rpc.api import Client
 import unittest
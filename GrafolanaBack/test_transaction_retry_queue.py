@@ -0,0 +1,109 @@
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from GrafolanaBack.domain.caching.negative_cache import NOT_FOUND, TRANSACTION_NAMESPACE, negative_cache
+from GrafolanaBack.domain.rpc.rpc_acync_transaction_fetcher import FETCH_ACTIVITY_LOCK_FILE, fetcher
+from GrafolanaBack.domain.transaction.repositories.retry_queue_repository import TransactionRetryRepository
+from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository
+from GrafolanaBack.domain.transaction.services import transaction_retry_service
+from GrafolanaBack.domain.transaction.services.transaction_retry_service import (
+    TRANSACTION_RETRY_BASE_DELAY_SECONDS,
+    TRANSACTION_RETRY_MAX_DELAY_SECONDS,
+    TransactionRetryService,
+    get_retry_delay,
+)
+from GrafolanaBack.testing import build_transaction_json, SQLiteTestCase
+
+NOW = 1_700_000_000
+
+class FailingTransactionService:
+    """Transaction service whose RPC fetches always fail"""
+    def __init__(self):
+        self.refetched = []
+
+    def refetch_transactions(self, signature_strs):
+        self.refetched.extend(signature_strs)
+        return {sig: TimeoutError("all endpoints failed") for sig in signature_strs}
+
+class Test_Transaction_Retry_Queue(SQLiteTestCase):
+    def tearDown(self):
+        TransactionRetryRepository.remove(["sig_a", "sig_b", "sig_stored"])
+        negative_cache.clear()
+
+    def test_enqueue_and_schedule(self):
+        TransactionRetryRepository.enqueue({"sig_a": "timeout", "sig_b": None}, next_attempt_at=NOW)
+        # Queuing again keeps the existing schedule
+        TransactionRetryRepository.enqueue({"sig_a": None}, next_attempt_at=NOW + 1000)
+
+        self.assertEqual(TransactionRetryRepository.count(), 2)
+        self.assertEqual(TransactionRetryRepository.get_pending_signatures(["sig_a", "other"]), {"sig_a"})
+        self.assertEqual([entry.transaction_signature for entry in TransactionRetryRepository.get_due(NOW, 10)], ["sig_a", "sig_b"])
+
+        TransactionRetryRepository.reschedule("sig_a", 1, NOW + 60, "timeout")
+        due = TransactionRetryRepository.get_due(NOW, 10)
+        self.assertEqual([entry.transaction_signature for entry in due], ["sig_b"])
+
+        self.assertEqual(TransactionRetryRepository.remove(["sig_a", "sig_b"]), 2)
+        self.assertEqual(TransactionRetryRepository.count(), 0)
+
+    def test_retry_delay_backs_off_exponentially(self):
+        self.assertEqual(get_retry_delay(0), TRANSACTION_RETRY_BASE_DELAY_SECONDS)
+        self.assertEqual(get_retry_delay(3), TRANSACTION_RETRY_BASE_DELAY_SECONDS * 8)
+        self.assertEqual(get_retry_delay(50), TRANSACTION_RETRY_MAX_DELAY_SECONDS)
+
+    def test_retrier_reschedules_then_gives_up(self):
+        TransactionRepository.save_transactions({"sig_stored": build_transaction_json()})
+        TransactionRetryRepository.enqueue({"sig_a": None, "sig_stored": None}, next_attempt_at=NOW)
+        transaction_service = FailingTransactionService()
+        retry_service = TransactionRetryService(transaction_service)
+
+        with patch.object(fetcher, 'is_idle', return_value=True), \
+             patch.object(transaction_retry_service, 'TRANSACTION_RETRY_MAX_ATTEMPTS', 2):
+            stats = retry_service.retry_pending_transactions(now=NOW)
+            # The stored transaction leaves the queue without an RPC call
+            self.assertEqual(stats, {"fetched": 1, "rescheduled": 1, "abandoned": 0})
+            self.assertEqual(transaction_service.refetched, ["sig_a"])
+
+            entry, = TransactionRetryRepository.get_due(NOW + get_retry_delay(1), 10)
+            self.assertEqual((entry.transaction_signature, entry.attempts), ("sig_a", 1))
+            self.assertEqual(entry.next_attempt_at, NOW + get_retry_delay(1))
+
+            stats = retry_service.retry_pending_transactions(now=entry.next_attempt_at)
+            self.assertEqual(stats, {"fetched": 0, "rescheduled": 0, "abandoned": 1})
+            self.assertEqual(TransactionRetryRepository.count(), 0)
+            self.assertEqual(negative_cache.get(TRANSACTION_NAMESPACE, "sig_a").reason, NOT_FOUND)
+
+    def test_retrier_waits_for_idle_fetcher(self):
+        TransactionRetryRepository.enqueue({"sig_a": None}, next_attempt_at=NOW)
+        transaction_service = FailingTransactionService()
+
+        with patch.object(fetcher, 'is_idle', return_value=False):
+            TransactionRetryService(transaction_service).retry_pending_transactions(now=NOW)
+        self.assertEqual(transaction_service.refetched, [])
+        self.assertEqual(TransactionRetryRepository.count(), 1)
+
+    def test_fetcher_sees_fetches_of_other_processes(self):
+        self.assertTrue(fetcher.is_idle())
+
+        # Another worker process holding the activity lock, as during one of its fetches
+        worker = subprocess.Popen(
+            [sys.executable, "-c", (
+                "import portalocker, sys\n"
+                f"handle = open({FETCH_ACTIVITY_LOCK_FILE!r}, 'a')\n"
+                "portalocker.lock(handle, portalocker.LOCK_SH)\n"
+                "print('fetching', flush=True)\n"
+                "sys.stdin.readline()\n"
+            )],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+        )
+        try:
+            self.assertEqual(worker.stdout.readline().strip(), "fetching")
+            self.assertFalse(fetcher.is_idle())
+        finally:
+            worker.communicate("done\n")
+        self.assertTrue(fetcher.is_idle())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy.exc import OperationalError
+
+from GrafolanaBack.domain.infrastructure.db.session import get_session
+from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository
+from GrafolanaBack.testing import build_transaction_json, SQLiteTestCase
+
+class Test_Transaction_Streaming(SQLiteTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.tx_json = build_transaction_json()
+        cls.stored = [f"sig_{i}" for i in range(7)]
+        TransactionRepository.save_transactions({sig: cls.tx_json for sig in cls.stored})
+
+    def test_chunks_follow_the_caller_order(self):
+        # Duplicates are dropped, missing signatures fall on both sides of chunk boundaries
+        requested = ["sig_6", "missing_a", "sig_2", "sig_6", "sig_0", "sig_5", "missing_b", "sig_1", "sig_3"]
+        unique = list(dict.fromkeys(requested))
+
+        for chunk_size in (1, 2, 3, 4, len(unique), len(unique) + 1):
+            streamed = list(TransactionRepository.iter_transactions_by_signatures(requested, chunk_size=chunk_size))
+            signatures = [signature for signature, _ in streamed]
+
+            self.assertEqual(sorted(signatures), sorted(sig for sig in unique if sig in self.stored), chunk_size)
+            self.assertTrue(all(transaction_json == self.tx_json for _, transaction_json in streamed))
+            chunk_of = {sig: position // chunk_size for position, sig in enumerate(unique)}
+            self.assertEqual([chunk_of[sig] for sig in signatures], sorted(chunk_of[sig] for sig in signatures), chunk_size)
+
+    def test_raw_blobs_are_streamed_as_stored(self):
+        streamed = dict(TransactionRepository.iter_transactions_by_signatures(self.stored, chunk_size=3, raw=True))
+
+        self.assertEqual(set(streamed), set(self.stored))
+        self.assertTrue(all(isinstance(blob, bytes) for blob in streamed.values()))
+
+    def test_errors_are_raised_after_the_rows_already_read(self):
+        iterator = TransactionRepository.iter_transactions_by_signatures(["sig_0", "sig_1", "sig_2"], chunk_size=1)
+        self.assertEqual(next(iterator)[0], "sig_0")
+
+        # The iterator holds the session of this thread
+        with patch.object(get_session(), 'query', side_effect=OperationalError("SELECT", {}, Exception("database is locked"))):
+            with self.assertRaises(OperationalError):
+                next(iterator)
+            # The dict helper keeps returning what it could read
+            self.assertEqual(TransactionRepository.get_transactions_by_signatures(["sig_0"]), {})
+
+if __name__ == '__main__':
+    unittest.main()
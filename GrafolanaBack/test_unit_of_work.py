@@ -0,0 +1,83 @@
+import sqlite3
+import unittest
+
+from sqlalchemy import event
+
+from GrafolanaBack.domain.infrastructure.db import session as db_session
+from GrafolanaBack.domain.infrastructure.db.session import begin_unit_of_work, close_session, end_unit_of_work, get_session, unit_of_work
+from GrafolanaBack.domain.transaction.models.transaction import SolanaTransaction
+from GrafolanaBack.domain.transaction.repositories.transaction_repository import TransactionRepository
+from GrafolanaBack.testing import build_transaction_json, SQLiteTestCase
+
+class Test_Unit_Of_Work(SQLiteTestCase):
+    def checked_out(self) -> int:
+        return db_session.get_engine().pool.checkedout()
+
+    def add_transaction(self, signature: str):
+        session = get_session()
+        session.add(SolanaTransaction(transaction_signature=signature, transaction_json=build_transaction_json()))
+        close_session(session)
+
+    def stored_signatures(self, signatures):
+        return list(TransactionRepository.get_transactions_by_signatures(signatures))
+
+    def test_connection_is_checked_out_on_first_use(self):
+        with unit_of_work():
+            self.assertEqual(self.checked_out(), 0)
+            session = get_session()
+            self.assertEqual(self.checked_out(), 1)
+            # Every repository call of the unit of work shares the same session and connection
+            self.stored_signatures(["unknown"])
+            self.assertIs(get_session(), session)
+            self.assertEqual(self.checked_out(), 1)
+        self.assertEqual(self.checked_out(), 0)
+
+    def test_pending_changes_are_committed_at_the_end(self):
+        begin_unit_of_work()
+        self.add_transaction("committed")
+        end_unit_of_work()
+
+        self.assertEqual(self.stored_signatures(["committed"]), ["committed"])
+
+    def test_pending_changes_are_rolled_back_on_error(self):
+        with self.assertRaises(ValueError):
+            with unit_of_work():
+                self.add_transaction("rolled_back")
+                raise ValueError("request failed")
+
+        self.assertEqual(self.stored_signatures(["rolled_back"]), [])
+        self.assertEqual(self.checked_out(), 0)
+
+    def test_closed_sessions_stay_open_until_the_end(self):
+        tx_json = build_transaction_json()
+        TransactionRepository.save_transactions({"loaded": tx_json})
+        with unit_of_work():
+            session = get_session()
+            transaction = session.get(SolanaTransaction, "loaded")
+            close_session(session)
+            # A later repository commit neither detaches nor expires the loaded object
+            TransactionRepository.save_transactions({"other": tx_json})
+            self.assertIn(transaction, get_session())
+            self.assertEqual(transaction.__dict__["slot"], tx_json["slot"])
+        self.assertEqual(self.checked_out(), 0)
+
+    def test_failed_read_does_not_poison_later_reads(self):
+        tx_json = build_transaction_json()
+        TransactionRepository.save_transactions({"stored": tx_json})
+
+        def fail_once(cursor, statement, parameters, context):
+            event.remove(db_session.get_engine(), 'do_execute', fail_once)
+            raise sqlite3.OperationalError("canceling statement due to statement timeout")
+
+        with unit_of_work():
+            self.assertEqual(TransactionRepository.get_transaction("stored"), tx_json)
+            event.listen(db_session.get_engine(), 'do_execute', fail_once)
+            self.assertIsNone(TransactionRepository.get_transaction("stored"))
+            # The failed statement rolled back the shared transaction before the next call
+            self.assertFalse(get_session().in_transaction())
+            self.assertEqual(TransactionRepository.get_transaction("stored"), tx_json)
+            self.assertEqual(self.stored_signatures(["stored", "missing"]), ["stored"])
+        self.assertEqual(self.checked_out(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Shared builders and base classes of the unit tests.
+
+Imported by absolute path, so the tests run the same from GrafolanaBack and from the repository root.
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from solders.transaction_status import (
+    EncodedConfirmedTransactionWithStatusMeta,
+    EncodedTransactionWithStatusMeta,
+    UiTransaction,
+    UiTransactionStatusMeta,
+)
+
+from GrafolanaBack.domain.infrastructure.db import session as db_session
+from GrafolanaBack.domain.infrastructure.db.migration_service import check_and_run_migrations
+
+FEE_PAYER = "So11111111111111111111111111111111111111112"
+SENDER = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+RECEIVER = "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
+SYSTEM_PROGRAM = "11111111111111111111111111111111"
+
+def build_transaction_json(err=None) -> dict:
+    """A stored transaction JSON without instructions, paid by FEE_PAYER"""
+    message = {
+        "accountKeys": [
+            {"pubkey": FEE_PAYER, "writable": True, "signer": True, "source": "transaction"},
+            {"pubkey": SYSTEM_PROGRAM, "writable": False, "signer": False, "source": "transaction"},
+        ],
+        "recentBlockhash": SYSTEM_PROGRAM,
+        "instructions": [],
+    }
+    status = {"Ok": None} if err is None else {"Err": err}
+    transaction = UiTransaction.from_json(json.dumps({"signatures": ["1" * 64], "message": message}))
+    meta = UiTransactionStatusMeta.from_json(json.dumps(
+        {"err": err, "status": status, "fee": 5000, "preBalances": [1, 1], "postBalances": [1, 1]}
+    ))
+    encoded = EncodedConfirmedTransactionWithStatusMeta(
+        123456, EncodedTransactionWithStatusMeta(transaction, meta, 0), 1700000000
+    )
+    return json.loads(encoded.to_json())
+
+def build_transfer_transaction_json(lamports: int) -> dict:
+    """A transaction with a single system transfer from SENDER to RECEIVER"""
+    tx_json = build_transaction_json()
+    tx_json["transaction"]["message"]["accountKeys"] = [
+        {"pubkey": SENDER, "writable": True, "signer": True, "source": "transaction"},
+        {"pubkey": RECEIVER, "writable": True, "signer": False, "source": "transaction"},
+        {"pubkey": SYSTEM_PROGRAM, "writable": False, "signer": False, "source": "transaction"},
+    ]
+    tx_json["transaction"]["message"]["instructions"] = [{
+        "program": "system",
+        "programId": SYSTEM_PROGRAM,
+        "parsed": {"type": "transfer", "info": {"source": SENDER, "destination": RECEIVER, "lamports": lamports}},
+        "stackHeight": None,
+    }]
+    tx_json["meta"].update(
+        preBalances=[10_000_000, 0, 1],
+        postBalances=[10_000_000 - lamports - 5000, lamports, 1],
+        preTokenBalances=[],
+        postTokenBalances=[],
+        innerInstructions=[],
+        logMessages=[],
+    )
+    return tx_json
+
+def summarize(context):
+    """Comparable summary of a parsed transaction context"""
+    return (
+        context.transaction_signature,
+        context.fee,
+        sorted(str(edge) for edge in context.graph.get_edges()),
+    )
+
+class SQLiteTestCase(unittest.TestCase):
+    """Test case running against a migrated SQLite database in a temporary directory"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.original_env = {key: os.environ.get(key) for key in ('DB_BACKEND', 'SQLITE_PATH')}
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        os.environ['DB_BACKEND'] = 'sqlite'
+        os.environ['SQLITE_PATH'] = os.path.join(cls.tmp_dir.name, 'grafolana.db')
+        # Drop sessions bound to an engine created by earlier tests
+        db_session.Session.remove()
+        db_session._engine = None
+        check_and_run_migrations()
+
+    @classmethod
+    def tearDownClass(cls):
+        db_session.Session.remove()
+        db_session.get_engine().dispose()
+        db_session._engine = None
+        for key, value in cls.original_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        cls.tmp_dir.cleanup()